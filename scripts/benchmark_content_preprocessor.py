@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ContentPreprocessor.
+
+Compares the per-page CPU time of the legacy multi-parse flow (clean, then
+re-parse the cleaned HTML for tables, lists and main text) against the
+single-parse preprocess() pipeline.
+
+Pages are rendered from the articles in sample-data/news_articles and the HTML
+sample in tests/samples.
+
+Usage:
+    python scripts/benchmark_content_preprocessor.py
+    python scripts/benchmark_content_preprocessor.py --rounds 20 --parser html.parser
+"""
+
+import argparse
+import html as html_lib
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.crawl4ai.content_preprocessor import ContentPreprocessor  # noqa: E402
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>{title}</title>
+  <style>body {{ font-family: sans-serif; }} .ad {{ display: none; }}</style>
+  <script>window.analytics = {{ page: "{article_id}" }};</script>
+</head>
+<body>
+  <nav><ul><li><a href="/">Home</a></li><li><a href="/markets">Markets</a></li><li><a href="/defi">DeFi</a></li></ul></nav>
+  <!-- article body -->
+  <article>
+    <h1>{title}</h1>
+    <p class="byline">By {author} | {published}</p>
+    {paragraphs}
+    <table>
+      <caption>Mentioned assets</caption>
+      <thead><tr><th>Tag</th><th>Category</th><th>Source</th></tr></thead>
+      <tbody>{rows}</tbody>
+    </table>
+    <h2>Tags</h2>
+    <ol>{tags}</ol>
+  </article>
+  <div style="display:none">Hidden tracking block</div>
+  <footer><p>&copy; {source}</p></footer>
+</body>
+</html>
+"""
+
+
+def load_sample_pages() -> Dict[str, str]:
+    """Load benchmark pages from sample data.
+
+    Returns:
+        Mapping of page name to HTML
+    """
+    pages = {}
+
+    articles_path = PROJECT_ROOT / "sample-data" / "news_articles" / "crypto_news_sample.json"
+    with open(articles_path) as f:
+        articles = json.load(f)
+
+    for article in articles:
+        sentences = [s.strip() for s in article["content"].split(". ") if s.strip()]
+        paragraphs = "\n    ".join(f"<p>{html_lib.escape(s)}.</p>" for s in sentences)
+        rows = "".join(
+            f"<tr><td>{html_lib.escape(tag)}</td><td>{html_lib.escape(article['category'])}</td>"
+            f"<td>{html_lib.escape(article['source'])}</td></tr>"
+            for tag in article.get("tags", [])
+        )
+        tags = "".join(f"<li>{html_lib.escape(tag)}</li>" for tag in article.get("tags", []))
+        pages[article["id"]] = PAGE_TEMPLATE.format(
+            title=html_lib.escape(article["title"]),
+            article_id=article["id"],
+            author=html_lib.escape(article.get("author", "")),
+            published=article.get("published_date", ""),
+            source=html_lib.escape(article.get("source", "")),
+            paragraphs=paragraphs,
+            rows=rows,
+            tags=tags,
+        )
+
+    html_sample = PROJECT_ROOT / "tests" / "samples" / "html_content.html"
+    if html_sample.exists():
+        pages[html_sample.name] = html_sample.read_text()
+
+    return pages
+
+
+def legacy_preprocess(preprocessor: ContentPreprocessor, html: str) -> None:
+    """Run the legacy flow: clean, serialize, then parse again for each step."""
+    cleaned_html = preprocessor.clean_html(html)
+    preprocessor.extract_tables(cleaned_html)
+    preprocessor.extract_lists(cleaned_html)
+    preprocessor.extract_main_content(cleaned_html)
+
+
+def measure(func: Callable[[str], None], html: str, rounds: int) -> float:
+    """Measure the median CPU time of a function over several rounds.
+
+    Returns:
+        Median CPU time in milliseconds
+    """
+    timings = []
+    for _ in range(rounds):
+        start = time.process_time()
+        func(html)
+        timings.append((time.process_time() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(rounds: int, parser: str) -> List[Dict[str, float]]:
+    """Benchmark every sample page.
+
+    Returns:
+        Per-page results with before/after CPU time in milliseconds
+    """
+    legacy = ContentPreprocessor(parser="html.parser")
+    single_parse = ContentPreprocessor(parser=parser)
+
+    results = []
+    for name, html in load_sample_pages().items():
+        before = measure(lambda page: legacy_preprocess(legacy, page), html, rounds)
+        after = measure(single_parse.preprocess, html, rounds)
+        results.append({"page": name, "bytes": len(html), "before_ms": before, "after_ms": after})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ContentPreprocessor per-page CPU time")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds per page (median is reported)")
+    parser.add_argument("--parser", default="auto", choices=["auto", "lxml", "html.parser"],
+                        help="Parser for the single-parse pipeline")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = run_benchmark(args.rounds, args.parser)
+    backend = ContentPreprocessor(parser=args.parser).backend
+
+    print(f"Single-parse backend: {backend.name if backend else 'none'}")
+    print(f"{'page':<22}{'bytes':>8}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for row in results:
+        speedup = row["before_ms"] / row["after_ms"] if row["after_ms"] else float("inf")
+        print(f"{row['page']:<22}{row['bytes']:>8}{row['before_ms']:>12.2f}{row['after_ms']:>12.2f}{speedup:>9.1f}x")
+
+    total_before = sum(row["before_ms"] for row in results)
+    total_after = sum(row["after_ms"] for row in results)
+    print(f"{'total':<22}{'':>8}{total_before:>12.2f}{total_after:>12.2f}{total_before / total_after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark for URL-to-extractor and URL-to-strategy matching.
+
+Compares the legacy linear scan (every mapping's ``matches`` in priority order)
+against the compiled ``URLMatcherIndex`` lookups used by ``URLMappingManager``
+and ``URLMappingStrategy``.
+
+Usage:
+    python scripts/benchmark_url_matching.py
+    python scripts/benchmark_url_matching.py --mappings 10000 --urls 2000
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Strategy registration logs on import
+logging.disable(logging.WARNING)
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_mapping import (  # noqa: E402
+    ExtractorConfig,
+    URLExtractorMapping,
+    URLMappingManager,
+)
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_matcher import URLMatcherIndex  # noqa: E402
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_strategy_mapper import (  # noqa: E402
+    DomainMatcher,
+    PatternMatcher,
+    StrategyMapping,
+    _host_of,
+)
+
+TLDS = ["com", "io", "org", "net", "xyz"]
+SECTIONS = ["news", "markets", "defi", "nft", "price", "research", "blog", "tokens"]
+
+
+def make_mappings(count: int, rng: random.Random) -> Tuple[List[URLExtractorMapping], List[str]]:
+    """Generate extractor mappings and a pool of site domains.
+
+    Returns:
+        The mappings and the domains they were generated for
+    """
+    domains = [f"site{i}.{rng.choice(TLDS)}" for i in range(count // 2)]
+    mappings = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            pattern, pattern_type = rng.choice(domains), "domain"
+        elif kind < 0.9:
+            pattern, pattern_type = f"/{rng.choice(SECTIONS)}/{i}/", "path"
+        else:
+            pattern, pattern_type = f"https://{rng.choice(domains)}/page-{i}.html", "exact"
+        mappings.append(URLExtractorMapping(
+            url_pattern=pattern,
+            pattern_type=pattern_type,
+            extractors=[ExtractorConfig(extractor_id=f"Extractor{i}", target_group="group")],
+            priority=rng.randint(0, 100),
+        ))
+    return mappings, domains
+
+
+def make_urls(count: int, domains: List[str], rng: random.Random) -> List[str]:
+    """Generate URLs that hit a mix of domain, path and exact rules."""
+    urls = []
+    for i in range(count):
+        domain = rng.choice(domains)
+        prefix = rng.choice(["", "www.", "news."])
+        urls.append(f"https://{prefix}{domain}/{rng.choice(SECTIONS)}/{rng.randint(0, 20000)}/article-{i}")
+    return urls
+
+
+def measure(func, urls: List[str]) -> float:
+    """Measure the median per-URL time in microseconds."""
+    timings = []
+    for url in urls:
+        start = time.perf_counter()
+        func(url)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+def benchmark_extractor_mappings(mapping_count: int, url_count: int, rng: random.Random) -> Tuple[float, float, float]:
+    """Benchmark URLMappingManager lookups.
+
+    Returns:
+        Median legacy time, median indexed time (microseconds) and index build time (seconds)
+    """
+    mappings, domains = make_mappings(mapping_count, rng)
+    urls = make_urls(url_count, domains, rng)
+
+    start = time.perf_counter()
+    manager = URLMappingManager()
+    for mapping in mappings:
+        manager.add_mapping(mapping)
+    build_time = time.perf_counter() - start
+
+    def legacy_lookup(url: str) -> list:
+        extractors = []
+        for mapping in manager.mappings:
+            if mapping.matches(url):
+                extractors.extend(mapping.extractors)
+        return extractors
+
+    for url in urls[:50]:
+        assert legacy_lookup(url) == manager.get_extractors_for_url(url), url
+
+    return measure(legacy_lookup, urls), measure(manager.get_extractors_for_url, urls), build_time
+
+
+def benchmark_strategy_mappings(mapping_count: int, url_count: int, rng: random.Random) -> Tuple[float, float]:
+    """Benchmark first-match strategy selection as done by URLMappingStrategy.
+
+    Returns:
+        Median legacy and indexed times in microseconds
+    """
+    domains = [f"site{i}.{rng.choice(TLDS)}" for i in range(mapping_count)]
+    mappings = []
+    for i in range(mapping_count):
+        if rng.random() < 0.8:
+            matcher = DomainMatcher(rng.choice(domains), include_subdomains=rng.random() < 0.7)
+        else:
+            matcher = PatternMatcher(f"/{rng.choice(SECTIONS)}/{i}/")
+        mappings.append(StrategyMapping(matcher, f"Strategy{i}", rng.randint(0, 100)))
+    urls = make_urls(url_count, domains, rng)
+
+    index = URLMatcherIndex()
+    for mapping in mappings:
+        if isinstance(mapping.matcher, DomainMatcher):
+            index.add("domain", mapping.matcher.domain, mapping, mapping.priority,
+                      include_subdomains=mapping.matcher.include_subdomains)
+        else:
+            index.add("substring", mapping.matcher.pattern.pattern, mapping, mapping.priority)
+
+    def legacy_lookup(url: str):
+        for mapping in sorted(mappings, key=lambda m: m.priority, reverse=True):
+            if mapping.matches(url):
+                return mapping
+        return None
+
+    def indexed_lookup(url: str):
+        return index.match_first(url, _host_of(url))
+
+    for url in urls[:50]:
+        assert legacy_lookup(url) is indexed_lookup(url), url
+
+    return measure(legacy_lookup, urls), measure(indexed_lookup, urls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark URL mapping lookups")
+    parser.add_argument("--mappings", type=int, default=10000, help="Number of mappings")
+    parser.add_argument("--urls", type=int, default=1000, help="Number of URLs to look up")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    legacy, indexed, build = benchmark_extractor_mappings(args.mappings, args.urls, rng)
+    print(f"URLMappingManager.get_extractors_for_url ({args.mappings} mappings, index built in {build:.2f}s)")
+    print(f"  linear scan: {legacy:10.1f} us/url")
+    print(f"  indexed:     {indexed:10.1f} us/url  ({legacy / indexed:.0f}x)")
+
+    legacy, indexed = benchmark_strategy_mappings(args.mappings, args.urls, rng)
+    print(f"URLMappingStrategy.get_strategy_for_url selection ({args.mappings} mappings)")
+    print(f"  sort + scan: {legacy:10.1f} us/url")
+    print(f"  indexed:     {indexed:10.1f} us/url  ({legacy / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,20 @@ import json
 
 # Conditionally import BeautifulSoup if available
 try:
-    from bs4 import BeautifulSoup, NavigableString, Tag
+    from bs4 import BeautifulSoup, Comment, NavigableString, Tag
     BEAUTIFULSOUP_AVAILABLE = True
 except ImportError:
     BEAUTIFULSOUP_AVAILABLE = False
     logging.warning("BeautifulSoup not installed. HTML preprocessing will be limited.")
 
+# Conditionally import lxml if available (preferred single-parse backend)
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 # Conditionally import html2text if available
 try:
     import html2text
@@ -190,11 +198,230 @@ class PreprocessedContent:
         return combined
 
 
+def _is_hidden_style(style: Optional[str]) -> bool:
+    """Check whether an inline style hides its element."""
+    return bool(style) and ("display:none" in style or "visibility:hidden" in style)
+
+
+def _build_table(caption: Optional[str], headers: List[str], rows: List[List[str]]) -> Optional[TableData]:
+    """Apply the shared table rules and build a TableData if it has content."""
+    # If no headers were found but we have rows, use the first row as headers
+    if not headers and rows:
+        headers = rows[0]
+        rows = rows[1:]
+    
+    # Only keep tables with actual content
+    if headers or rows:
+        return TableData(headers=headers, rows=rows, caption=caption)
+    return None
+
+
+class _LxmlBackend:
+    """Single-parse visitors over an lxml tree."""
+    
+    name = "lxml"
+    
+    @staticmethod
+    def _strip_text(element) -> str:
+        """Equivalent of BeautifulSoup's get_text(strip=True)."""
+        return "".join(part.strip() for part in element.itertext())
+    
+    def parse(self, html: str):
+        """Parse HTML into an lxml tree."""
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+    
+    def clean(self, tree) -> None:
+        """Remove scripts, styles, comments and hidden elements in place."""
+        for element in list(tree.iter("script", "style", etree.Comment)):
+            element.drop_tree()
+        for element in list(tree.iter()):
+            if isinstance(element.tag, str) and _is_hidden_style(element.get("style")):
+                element.drop_tree()
+    
+    def tables(self, tree) -> List[TableData]:
+        """Extract tables from the tree."""
+        tables = []
+        for table_elem in tree.iter("table"):
+            caption_elem = next(table_elem.iter("caption"), None)
+            caption = self._strip_text(caption_elem) if caption_elem is not None else None
+            
+            headers = []
+            header_row = next(table_elem.iter("thead"), None)
+            if header_row is not None:
+                headers = [self._strip_text(cell) for cell in header_row.iter("th", "td")]
+            
+            rows = []
+            for tr in table_elem.iter("tr"):
+                # Skip header rows
+                parent = tr.getparent()
+                if parent is not None and parent.tag == "thead":
+                    continue
+                row = [self._strip_text(cell) for cell in tr.iter("td", "th")]
+                if row:  # Skip empty rows
+                    rows.append(row)
+            
+            table = _build_table(caption, headers, rows)
+            if table:
+                tables.append(table)
+        return tables
+    
+    def lists(self, tree) -> List[ListData]:
+        """Extract top-level lists from the tree."""
+        lists = []
+        for list_elem in tree.iter("ul", "ol"):
+            # Skip nested lists (they'll be processed with their parent)
+            parent = list_elem.getparent()
+            if parent is not None and parent.tag in ("ul", "ol", "li"):
+                continue
+            
+            nested = False
+            items = []
+            for li in list_elem.iterchildren("li"):
+                # Check if this list item contains a nested list
+                if next(li.iter("ul", "ol"), None) is not None:
+                    nested = True
+                
+                # Get the text of this list item, excluding nested lists
+                item_text = (li.text or "").strip()
+                for child in li:
+                    if isinstance(child.tag, str) and child.tag not in ("ul", "ol"):
+                        item_text += self._strip_text(child)
+                    item_text += (child.tail or "").strip()
+                items.append(item_text.strip())
+            
+            # Only add lists with actual content
+            if items:
+                lists.append(ListData(items=items, ordered=list_elem.tag == "ol", nested=nested))
+        return lists
+    
+    def text(self, tree) -> str:
+        """Plain text of the tree, one line per text node."""
+        return "\n".join(part.strip() for part in tree.itertext() if part.strip())
+    
+    def serialize(self, tree) -> str:
+        """Serialize the tree back to HTML."""
+        return lxml.html.tostring(tree, encoding="unicode")
+
+
+class _SoupBackend:
+    """Single-parse visitors over a BeautifulSoup tree (html.parser)."""
+    
+    name = "html.parser"
+    
+    def parse(self, html: str):
+        """Parse HTML into a BeautifulSoup tree."""
+        return BeautifulSoup(html, "html.parser")
+    
+    def clean(self, tree) -> None:
+        """Remove scripts, styles, comments and hidden elements in place."""
+        for script in tree(["script", "style"]):
+            script.decompose()
+        
+        for comment in tree.find_all(string=lambda text: isinstance(text, Comment)):
+            comment.extract()
+        
+        for hidden in tree.find_all(style=_is_hidden_style):
+            hidden.decompose()
+    
+    def tables(self, tree) -> List[TableData]:
+        """Extract tables from the tree."""
+        tables = []
+        for table_elem in tree.find_all("table"):
+            caption = None
+            caption_elem = table_elem.find("caption")
+            if caption_elem:
+                caption = caption_elem.get_text(strip=True)
+            
+            headers = []
+            header_row = table_elem.find("thead")
+            if header_row:
+                headers = [th.get_text(strip=True) for th in header_row.find_all(["th", "td"])]
+            
+            rows = []
+            for tr in table_elem.find_all("tr"):
+                # Skip header rows
+                if tr.parent and tr.parent.name == "thead":
+                    continue
+                row = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+                if row:  # Skip empty rows
+                    rows.append(row)
+            
+            table = _build_table(caption, headers, rows)
+            if table:
+                tables.append(table)
+        return tables
+    
+    def lists(self, tree) -> List[ListData]:
+        """Extract top-level lists from the tree."""
+        lists = []
+        for list_elem in tree.find_all(["ul", "ol"]):
+            # Skip nested lists (they'll be processed with their parent)
+            if list_elem.parent and list_elem.parent.name in ["ul", "ol", "li"]:
+                continue
+            
+            nested = False
+            items = []
+            for li in list_elem.find_all("li", recursive=False):
+                # Check if this list item contains a nested list
+                if li.find(["ul", "ol"]):
+                    nested = True
+                
+                # Get the text of this list item, excluding nested lists
+                item_text = ""
+                for content in li.contents:
+                    if isinstance(content, NavigableString):
+                        item_text += content.strip()
+                    elif isinstance(content, Tag) and content.name not in ["ul", "ol"]:
+                        item_text += content.get_text(strip=True)
+                items.append(item_text.strip())
+            
+            # Only add lists with actual content
+            if items:
+                lists.append(ListData(items=items, ordered=list_elem.name == "ol", nested=nested))
+        return lists
+    
+    def text(self, tree) -> str:
+        """Plain text of the tree, one line per text node."""
+        return tree.get_text(separator="\n", strip=True)
+    
+    def serialize(self, tree) -> str:
+        """Serialize the tree back to HTML."""
+        return str(tree)
+
+
+def _get_backend(parser: str = "auto"):
+    """Get the HTML backend for a parser name, or None if none is installed.
+    
+    Args:
+        parser: "auto" (lxml when installed), "lxml" or "html.parser"
+        
+    Returns:
+        Backend instance or None
+    """
+    if parser in ("auto", "lxml") and LXML_AVAILABLE:
+        return _LxmlBackend()
+    if parser == "lxml":
+        logger.warning("lxml not installed, falling back to html.parser")
+    if BEAUTIFULSOUP_AVAILABLE:
+        return _SoupBackend()
+    return None
+
+
 class ContentPreprocessor:
-    """Preprocessor for HTML content before extraction."""
+    """Preprocessor for HTML content before extraction.
+    
+    ``preprocess`` parses each page once (with lxml when installed) and runs
+    cleaning, table extraction, list extraction and text extraction as visitors
+    over that single tree.
+    """
 
     def __init__(self, max_segment_length: int = 4000, extract_tables: bool = True,
-                 extract_lists: bool = True, use_trafilatura: bool = True):
+                 extract_lists: bool = True, use_trafilatura: bool = True,
+                 parser: str = "auto"):
         """Initialize the content preprocessor.
         
         Args:
@@ -202,10 +429,12 @@ class ContentPreprocessor:
             extract_tables: Whether to extract tables from the content
             extract_lists: Whether to extract lists from the content
             use_trafilatura: Whether to use trafilatura for content extraction
+            parser: HTML parser to use: "auto" (lxml when installed), "lxml" or "html.parser"
         """
         self.max_segment_length = max_segment_length
-        self.extract_tables = extract_tables and BEAUTIFULSOUP_AVAILABLE
-        self.extract_lists = extract_lists and BEAUTIFULSOUP_AVAILABLE
+        self.backend = _get_backend(parser)
+        self.tables_enabled = extract_tables and self.backend is not None
+        self.lists_enabled = extract_lists and self.backend is not None
         self.use_trafilatura = use_trafilatura and TRAFILATURA_AVAILABLE
         
         # Initialize html2text converter if available
@@ -216,6 +445,76 @@ class ContentPreprocessor:
             self.html2text_converter.ignore_tables = False
             self.html2text_converter.body_width = 0  # No wrapping
 
+    def _parse(self, html: str):
+        """Parse HTML with the configured backend, returning None on failure."""
+        if self.backend is None or not html or not html.strip():
+            return None
+        try:
+            return self.backend.parse(html)
+        except Exception as e:
+            logger.warning(f"Error parsing HTML with {self.backend.name}: {str(e)}")
+            return None
+
+    def _clean_tree(self, tree) -> None:
+        """Visitor: remove scripts, styles, comments and hidden elements."""
+        try:
+            self.backend.clean(tree)
+        except Exception as e:
+            logger.warning(f"Error cleaning HTML: {str(e)}")
+
+    def _extract_tables_from_tree(self, tree) -> List[TableData]:
+        """Visitor: extract tables from a parsed tree."""
+        try:
+            return self.backend.tables(tree)
+        except Exception as e:
+            logger.warning(f"Error extracting tables: {str(e)}")
+            return []
+
+    def _extract_lists_from_tree(self, tree) -> List[ListData]:
+        """Visitor: extract lists from a parsed tree."""
+        try:
+            return self.backend.lists(tree)
+        except Exception as e:
+            logger.warning(f"Error extracting lists: {str(e)}")
+            return []
+
+    def _extract_text_from_tree(self, tree) -> str:
+        """Visitor: extract the main text from a parsed tree.
+        
+        trafilatura reads lxml trees directly (it works on its own copy);
+        other fallbacks serialize the tree at most once.
+        """
+        html = None
+        
+        if self.use_trafilatura:
+            try:
+                if self.backend.name != "lxml":
+                    html = self.backend.serialize(tree)
+                extracted_text = trafilatura.extract(
+                    tree if html is None else html,
+                    include_tables=True, include_links=True, include_images=True
+                )
+                if extracted_text:
+                    return extracted_text
+            except Exception as e:
+                logger.warning(f"Error extracting content with trafilatura: {str(e)}")
+        
+        # Fallback to html2text if available
+        if HTML2TEXT_AVAILABLE:
+            try:
+                if html is None:
+                    html = self.backend.serialize(tree)
+                return self.html2text_converter.handle(html)
+            except Exception as e:
+                logger.warning(f"Error converting HTML to text: {str(e)}")
+        
+        # Fallback to the parsed tree's text nodes
+        try:
+            return self.backend.text(tree)
+        except Exception as e:
+            logger.warning(f"Error extracting text from parsed HTML: {str(e)}")
+            return ""
+
     def clean_html(self, html: str) -> str:
         """Clean HTML content by removing scripts, styles, and comments.
         
@@ -225,34 +524,16 @@ class ContentPreprocessor:
         Returns:
             Cleaned HTML content
         """
-        if not BEAUTIFULSOUP_AVAILABLE:
-            # Basic cleaning with regex if BeautifulSoup is not available
+        tree = self._parse(html)
+        if tree is None:
+            # Basic cleaning with regex if no parser is available
             html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL)
             html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL)
             html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
             return html
         
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove scripts, styles, and comments
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            for comment in soup.find_all(text=lambda text: isinstance(text, NavigableString) and text.strip().startswith('<!--')):
-                comment.extract()
-            
-            # Remove hidden elements
-            for hidden in soup.find_all(style=lambda value: value and "display:none" in value):
-                hidden.decompose()
-            
-            for hidden in soup.find_all(style=lambda value: value and "visibility:hidden" in value):
-                hidden.decompose()
-            
-            return str(soup)
-        except Exception as e:
-            logger.warning(f"Error cleaning HTML: {str(e)}")
-            return html
+        self._clean_tree(tree)
+        return self.backend.serialize(tree)
 
     def extract_main_content(self, html: str) -> str:
         """Extract the main content from HTML using trafilatura if available.
@@ -263,13 +544,9 @@ class ContentPreprocessor:
         Returns:
             Extracted main content as text
         """
-        if self.use_trafilatura:
-            try:
-                extracted_text = trafilatura.extract(html, include_tables=True, include_links=True, include_images=True)
-                if extracted_text:
-                    return extracted_text
-            except Exception as e:
-                logger.warning(f"Error extracting content with trafilatura: {str(e)}")
+        tree = self._parse(html)
+        if tree is not None:
+            return self._extract_text_from_tree(tree)
         
         # Fallback to html2text if available
         if HTML2TEXT_AVAILABLE:
@@ -278,14 +555,6 @@ class ContentPreprocessor:
             except Exception as e:
                 logger.warning(f"Error converting HTML to text: {str(e)}")
         
-        # Fallback to BeautifulSoup if available
-        if BEAUTIFULSOUP_AVAILABLE:
-            try:
-                soup = BeautifulSoup(html, 'html.parser')
-                return soup.get_text(separator='\n', strip=True)
-            except Exception as e:
-                logger.warning(f"Error extracting text with BeautifulSoup: {str(e)}")
-        
         # Last resort: strip HTML tags with regex
         return re.sub(r'<[^>]+>', ' ', html)
 
@@ -298,47 +567,10 @@ class ContentPreprocessor:
         Returns:
             List of extracted tables
         """
-        if not self.extract_tables or not BEAUTIFULSOUP_AVAILABLE:
+        if not self.tables_enabled:
             return []
-        
-        tables = []
-        
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            for table_elem in soup.find_all('table'):
-                caption = None
-                caption_elem = table_elem.find('caption')
-                if caption_elem:
-                    caption = caption_elem.get_text(strip=True)
-                
-                headers = []
-                header_row = table_elem.find('thead')
-                if header_row:
-                    headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
-                
-                rows = []
-                for tr in table_elem.find_all('tr'):
-                    # Skip header rows
-                    if tr.parent and tr.parent.name == 'thead':
-                        continue
-                    
-                    row = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
-                    if row:  # Skip empty rows
-                        rows.append(row)
-                
-                # If no headers were found but we have rows, use the first row as headers
-                if not headers and rows:
-                    headers = rows[0]
-                    rows = rows[1:]
-                
-                # Only add tables with actual content
-                if headers or rows:
-                    tables.append(TableData(headers=headers, rows=rows, caption=caption))
-        except Exception as e:
-            logger.warning(f"Error extracting tables: {str(e)}")
-        
-        return tables
+        tree = self._parse(html)
+        return self._extract_tables_from_tree(tree) if tree is not None else []
 
     def extract_lists(self, html: str) -> List[ListData]:
         """Extract lists from HTML content.
@@ -349,45 +581,10 @@ class ContentPreprocessor:
         Returns:
             List of extracted lists
         """
-        if not self.extract_lists or not BEAUTIFULSOUP_AVAILABLE:
+        if not self.lists_enabled:
             return []
-        
-        lists = []
-        
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            for list_elem in soup.find_all(['ul', 'ol']):
-                # Skip nested lists (they'll be processed with their parent)
-                if list_elem.parent and list_elem.parent.name in ['ul', 'ol', 'li']:
-                    continue
-                
-                ordered = list_elem.name == 'ol'
-                nested = False
-                
-                items = []
-                for li in list_elem.find_all('li', recursive=False):
-                    # Check if this list item contains a nested list
-                    if li.find(['ul', 'ol']):
-                        nested = True
-                    
-                    # Get the text of this list item, excluding nested lists
-                    item_text = ''
-                    for content in li.contents:
-                        if isinstance(content, NavigableString):
-                            item_text += content.strip()
-                        elif isinstance(content, Tag) and content.name not in ['ul', 'ol']:
-                            item_text += content.get_text(strip=True)
-                    
-                    items.append(item_text.strip())
-                
-                # Only add lists with actual content
-                if items:
-                    lists.append(ListData(items=items, ordered=ordered, nested=nested))
-        except Exception as e:
-            logger.warning(f"Error extracting lists: {str(e)}")
-        
-        return lists
+        tree = self._parse(html)
+        return self._extract_lists_from_tree(tree) if tree is not None else []
 
     def segment_content(self, text: str) -> List[ContentSegment]:
         """Segment content into manageable chunks.
@@ -452,15 +649,20 @@ class ContentPreprocessor:
         Returns:
             Preprocessed content
         """
-        # Clean HTML
-        cleaned_html = self.clean_html(html)
-        
-        # Extract tables and lists before main content extraction
-        tables = self.extract_tables(cleaned_html) if self.extract_tables else []
-        lists = self.extract_lists(cleaned_html) if self.extract_lists else []
+        # Parse once and run every visitor over the same tree
+        tree = self._parse(html)
         
-        # Extract main content
-        main_content = self.extract_main_content(cleaned_html)
+        if tree is not None:
+            self._clean_tree(tree)
+            
+            # Extract tables and lists before main content extraction
+            tables = self._extract_tables_from_tree(tree) if self.tables_enabled else []
+            lists = self._extract_lists_from_tree(tree) if self.lists_enabled else []
+            
+            main_content = self._extract_text_from_tree(tree)
+        else:
+            tables, lists = [], []
+            main_content = self.extract_main_content(self.clean_html(html))
         
         # Segment content
         segments = self.segment_content(main_content)
@@ -471,7 +673,8 @@ class ContentPreprocessor:
             "content_length": len(main_content),
             "segment_count": len(segments),
             "table_count": len(tables),
-            "list_count": len(lists)
+            "list_count": len(lists),
+            "parser": self.backend.name if self.backend else None
         }
         
         return PreprocessedContent(
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Environment overrides for the cry_a_4mcp.crawl4ai package defaults.
+
+Module-level defaults such as the HTTP pool size or LLM rate limits can be
+tuned through ``CRAWL4AI_*`` environment variables. Invalid values are logged
+and ignored so a typo never prevents the package from importing.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or invalid
+
+    Returns:
+        The configured integer
+    """
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value for {name}: {value!r}")
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or invalid
+
+    Returns:
+        The configured float
+    """
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value for {name}: {value!r}")
+        return default
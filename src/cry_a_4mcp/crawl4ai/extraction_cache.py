@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for LLM extraction results.
+
+This module provides a two-tier cache for extraction results keyed on a hash of
+the model, instruction, schema and the content sent to the LLM. The first tier
+is an in-memory LRU; the optional second tier is a SQLite database that
+survives restarts. Both tiers honour a TTL and a maximum entry count.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .env_settings import env_float, env_int
+from .metrics import default_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, instruction: str, schema: Optional[Dict[str, Any]], content: str) -> str:
+    """Build a content-addressed cache key.
+
+    Args:
+        model: The model used for extraction
+        instruction: The instruction sent to the model
+        schema: The JSON schema sent to the model, if any
+        content: The (possibly truncated) content sent to the model
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        model or "",
+        instruction or "",
+        json.dumps(schema, sort_keys=True, default=str) if schema else "",
+        content or "",
+    ):
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so field boundaries cannot collide
+        hasher.update(len(encoded).to_bytes(8, "big"))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU + SQLite) cache for extraction results.
+
+    Values are stored as JSON strings so every hit returns a fresh copy that
+    callers are free to mutate.
+    """
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 ttl: float = 3600.0,
+                 db_path: Optional[str] = None,
+                 max_db_entries: int = 100000,
+                 name: str = "extraction"):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory
+            ttl: Time-to-live for entries in seconds
+            db_path: Optional SQLite file for the persistent tier
+            max_db_entries: Maximum number of entries kept in SQLite
+            name: Cache name used to label metrics
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.max_db_entries = max_db_entries
+        self.name = name
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            self._init_db()
+
+    def _init_db(self) -> None:
+        """Open the SQLite tier and create its table."""
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_access "
+            "ON extraction_cache (last_access)"
+        )
+        self._db.commit()
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        """Look up a key in the memory tier, dropping it if expired."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return value
+
+    def _memory_set(self, key: str, value: str, expires_at: float) -> None:
+        """Store a value in the memory tier, evicting least recently used."""
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # SQLite tier
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, str]]:
+        """Look up a key in the SQLite tier."""
+        now = time.time()
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM extraction_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < now:
+                self._db.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute(
+                "UPDATE extraction_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            return expires_at, value
+
+    def _db_set(self, key: str, value: str, expires_at: float) -> None:
+        """Store a value in the SQLite tier and enforce the size limit."""
+        now = time.time()
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._db.execute("DELETE FROM extraction_cache WHERE expires_at < ?", (now,))
+            count = self._db.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+            if count > self.max_db_entries:
+                self._db.execute(
+                    "DELETE FROM extraction_cache WHERE key IN ("
+                    "SELECT key FROM extraction_cache ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_db_entries,),
+                )
+            self._db.commit()
+
+    # Public API
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached extraction result.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+
+        Returns:
+            A fresh copy of the cached result with ``_metadata.cache_hit`` set,
+            or None on a miss
+        """
+        tier = "memory"
+        value = self._memory_get(key)
+
+        if value is None and self._db is not None:
+            entry = await asyncio.to_thread(self._db_get, key)
+            if entry is not None:
+                tier = "disk"
+                expires_at, value = entry
+                self._memory_set(key, value, expires_at)
+
+        if value is None:
+            self.misses += 1
+            default_metrics_registry.track_cache_miss(self.name)
+            return None
+
+        result = json.loads(value)
+        metadata = result.setdefault("_metadata", {})
+        metadata["cache_hit"] = True
+        metadata["cache_tier"] = tier
+
+        self.hits += 1
+        tokens_saved = (metadata.get("usage") or {}).get("total_tokens", 0)
+        default_metrics_registry.track_cache_hit(self.name, tier, tokens_saved)
+        return result
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store an extraction result.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+            result: The extraction result to cache
+        """
+        try:
+            value = json.dumps(result, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Extraction result is not cacheable: {str(e)}")
+            return
+
+        expires_at = time.time() + self.ttl
+        self._memory_set(key, value, expires_at)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, value, expires_at)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM extraction_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and tier sizes
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+        if self._db is not None:
+            with self._db_lock:
+                stats["disk_entries"] = self._db.execute(
+                    "SELECT COUNT(*) FROM extraction_cache"
+                ).fetchone()[0]
+        return stats
+
+
+# Global extraction cache instance
+default_extraction_cache = ExtractionCache(
+    max_entries=env_int("CRAWL4AI_CACHE_MAX_ENTRIES", 1024),
+    ttl=env_float("CRAWL4AI_CACHE_TTL", 3600.0),
+    db_path=os.environ.get("CRAWL4AI_CACHE_DB") or None,
+)
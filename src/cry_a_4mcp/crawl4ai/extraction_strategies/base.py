@@ -16,6 +16,17 @@ from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 from functools import wraps
 from abc import ABC, abstractmethod
 
+from ..http_session import get_session
+from ..extraction_cache import ExtractionCache, default_extraction_cache, make_cache_key
+from ..llm_scheduler import LLMBudgetExceededError, LLMScheduler, default_llm_scheduler, parse_retry_after
+from .chunking import (
+    DEFAULT_CONTEXT_WINDOW,
+    PROMPT_OVERHEAD_TOKENS,
+    chunk_content,
+    estimate_tokens,
+    merge_extraction_results,
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,6 +34,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger('extraction_strategy')
 
+# Smallest content budget per request, even when the prompt nearly fills the context window
+MIN_CHUNK_TOKENS = 512
+
 # Define custom exceptions for better error handling
 class ExtractionError(Exception):
     """Base exception for extraction errors."""
@@ -39,6 +53,12 @@ class APIResponseError(ExtractionError):
         self.message = message
         super().__init__(f"API returned error {status_code}: {message}")
 
+class APIRateLimitError(APIResponseError):
+    """Exception raised when the provider rejects a request for rate limiting."""
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(status_code, message)
+
 class ContentParsingError(ExtractionError):
     """Exception raised for content parsing errors."""
     pass
@@ -81,8 +101,10 @@ async def retry_async(func, retries=3, backoff_factor=1.5, exceptions=(APIConnec
             if retry_count >= max_retries:
                 break
                 
-            # Calculate backoff time
-            backoff_time = backoff_factor ** (retry_count - 1)
+            # Calculate backoff time, deferring to the provider's Retry-After if given
+            backoff_time = getattr(e, "retry_after", None)
+            if backoff_time is None:
+                backoff_time = backoff_factor ** (retry_count - 1)
             logger.warning(f"Retry {retry_count}/{max_retries} after {backoff_time:.2f}s due to: {str(e)}")
             await asyncio.sleep(backoff_time)
     
@@ -96,19 +118,19 @@ PROVIDER_CONFIGS = {
         "base_url": "https://api.openai.com/v1",
         "default_model": "gpt-3.5-turbo",
         "models": {
-            "gpt-3.5-turbo": {"max_tokens": 4096, "supports_json": True},
-            "gpt-4": {"max_tokens": 8192, "supports_json": True},
-            "gpt-4-turbo": {"max_tokens": 16384, "supports_json": True}
+            "gpt-3.5-turbo": {"max_tokens": 4096, "context_window": 16385, "supports_json": True},
+            "gpt-4": {"max_tokens": 8192, "context_window": 8192, "supports_json": True},
+            "gpt-4-turbo": {"max_tokens": 16384, "context_window": 128000, "supports_json": True}
         }
     },
     "openrouter": {
         "base_url": "https://openrouter.ai/api/v1",
         "default_model": "moonshotai/kimi-k2:free",
         "models": {
-            "moonshotai/kimi-k2:free": {"max_tokens": 4096, "supports_json": True},
-            "qwen/qwen-2.5-72b-instruct:free": {"max_tokens": 4096, "supports_json": True},
-            "mistralai/mistral-small-24b-instruct-2501:free": {"max_tokens": 4096, "supports_json": True},
-            "anthropic/claude-3-opus:beta": {"max_tokens": 8192, "supports_json": True}
+            "moonshotai/kimi-k2:free": {"max_tokens": 4096, "context_window": 32768, "supports_json": True},
+            "qwen/qwen-2.5-72b-instruct:free": {"max_tokens": 4096, "context_window": 32768, "supports_json": True},
+            "mistralai/mistral-small-24b-instruct-2501:free": {"max_tokens": 4096, "context_window": 32768, "supports_json": True},
+            "anthropic/claude-3-opus:beta": {"max_tokens": 8192, "context_window": 200000, "supports_json": True}
         },
         "headers": {
             "HTTP-Referer": "https://crypto-news-crawler.com",
@@ -119,9 +141,9 @@ PROVIDER_CONFIGS = {
         "base_url": "https://api.groq.com/openai/v1",
         "default_model": "llama3-8b-8192",
         "models": {
-            "llama3-8b-8192": {"max_tokens": 4096, "supports_json": True},
-            "llama3-70b-8192": {"max_tokens": 4096, "supports_json": True},
-            "mixtral-8x7b-32768": {"max_tokens": 4096, "supports_json": True}
+            "llama3-8b-8192": {"max_tokens": 4096, "context_window": 8192, "supports_json": True},
+            "llama3-70b-8192": {"max_tokens": 4096, "context_window": 8192, "supports_json": True},
+            "mixtral-8x7b-32768": {"max_tokens": 4096, "context_window": 32768, "supports_json": True}
         }
     }
 }
@@ -154,6 +176,9 @@ class LLMExtractionStrategy(ExtractionStrategy):
     - Performance monitoring and optimization
     - Flexible model and provider support
     - Automatic retries with exponential backoff
+    - Shared request scheduling with rate limits, priorities and cost budgets
+    - Pooled HTTP connections and a content-addressed result cache
+    - Map-reduce extraction for content longer than the model's context window
     - Detailed logging
     """
     
@@ -180,7 +205,10 @@ class LLMExtractionStrategy(ExtractionStrategy):
             extra_args: Additional arguments to pass to the API
             max_retries: Maximum number of retries for API calls
             timeout: Timeout for API calls in seconds
-            **kwargs: Additional configuration options
+            **kwargs: Additional configuration options, including http_pool_config,
+                use_cache, cache, extraction_mode ("auto" or "truncate"),
+                max_concurrent_chunks, max_chunks, chunk_token_limit, context_window,
+                scheduler and priority
         """
         self.provider = provider.lower()
         self.api_token = api_token or os.environ.get(f"{self.provider.upper()}_API_KEY", "")
@@ -191,6 +219,27 @@ class LLMExtractionStrategy(ExtractionStrategy):
         self.max_retries = max_retries
         self.timeout = timeout
         
+        # Connection pool overrides for the shared HTTP session
+        self.http_pool_config = self.config.pop("http_pool_config", None) or {}
+        
+        # Result cache; pass use_cache=False to always call the LLM
+        self.use_cache = self.config.pop("use_cache", True)
+        self.cache: ExtractionCache = self.config.pop("cache", None) or default_extraction_cache
+        
+        # Long content handling: "auto" splits content that does not fit the context
+        # window into chunks and merges the results, "truncate" keeps the legacy cut-off
+        self.extraction_mode = self.config.pop("extraction_mode", "auto")
+        self.max_concurrent_chunks = self.config.pop("max_concurrent_chunks", 4)
+        self.max_chunks = self.config.pop("max_chunks", 16)
+        self.chunk_token_limit = self.config.pop("chunk_token_limit", None)
+        if self.extraction_mode not in ("auto", "truncate"):
+            raise ValueError(f"Unknown extraction_mode: {self.extraction_mode}")
+        
+        # Every request waits for a slot from the shared scheduler; priority None
+        # follows the surrounding llm_priority() context
+        self.scheduler: LLMScheduler = self.config.pop("scheduler", None) or default_llm_scheduler
+        self.priority = self.config.pop("priority", None)
+        
         # Get provider configuration
         provider_config = PROVIDER_CONFIGS.get(self.provider, {})
         
@@ -211,6 +260,15 @@ class LLMExtractionStrategy(ExtractionStrategy):
         model_config = provider_config.get("models", {}).get(self.model, {})
         self.max_tokens = self.extra_args.get("max_tokens", model_config.get("max_tokens", 1500))
         self.temperature = self.extra_args.get("temperature", 0.0)  # Low temperature for factual extraction
+        self.context_window = self.config.pop("context_window", None) or model_config.get("context_window", DEFAULT_CONTEXT_WINDOW)
+        if self.extraction_mode == "auto" and self.max_tokens > self.context_window // 2:
+            # Models such as gpt-4 allow as many output tokens as their whole context window,
+            # which would leave no room for the content; keep half the window for input
+            logger.warning(
+                f"max_tokens of {self.max_tokens} fills the {self.context_window}-token context window "
+                f"of {self.model}; capping it at {self.context_window // 2}"
+            )
+            self.max_tokens = self.context_window // 2
         
         # Set provider-specific headers
         self.headers = provider_config.get("headers", {})
@@ -254,6 +312,132 @@ class LLMExtractionStrategy(ExtractionStrategy):
         if schema_obj:
             system_message += f"\n\nOutput should conform to this JSON schema:\n{json.dumps(schema_obj, indent=2)}"
         
+        if self.extraction_mode == "truncate":
+            # Legacy behaviour: send only the first content_limit characters
+            content_limit = 15000
+            if len(content) > content_limit:
+                logger.info(f"Content truncated from {len(content)} to {content_limit} characters")
+                content = content[:content_limit]
+            return await self._extract_single(url, content, instruction_text, schema_obj, system_message)
+        
+        # Split content into chunks that fit the model's context window
+        chunk_budget = self._get_chunk_token_budget(url, system_message)
+        chunks = chunk_content(content, chunk_budget, self.model)
+        
+        if len(chunks) <= 1:
+            return await self._extract_single(url, content, instruction_text, schema_obj, system_message)
+        
+        logger.info(f"Content split into {len(chunks)} chunks of up to {chunk_budget} tokens")
+        return await self._extract_map_reduce(url, chunks, instruction_text, schema_obj, system_message)
+    
+    def _get_chunk_token_budget(self, url: str, system_message: str) -> int:
+        """Calculate how many content tokens fit in one request.
+        
+        Args:
+            url: The URL of the content
+            system_message: The system message sent with every request
+            
+        Returns:
+            Maximum number of content tokens per request
+        """
+        reserved = (
+            self.max_tokens
+            + estimate_tokens(system_message, self.model)
+            + estimate_tokens(url, self.model)
+            + PROMPT_OVERHEAD_TOKENS
+        )
+        budget = self.context_window - reserved
+        if budget < MIN_CHUNK_TOKENS:
+            logger.warning(
+                f"Context window of {self.context_window} tokens leaves only {budget} tokens for content; "
+                f"using {MIN_CHUNK_TOKENS}"
+            )
+            budget = MIN_CHUNK_TOKENS
+        if self.chunk_token_limit:
+            budget = min(budget, self.chunk_token_limit)
+        return budget
+    
+    async def _extract_map_reduce(self, url: str, chunks: List[str], instruction_text: str,
+                                  schema_obj: Optional[Dict[str, Any]], system_message: str) -> Dict[str, Any]:
+        """Extract each chunk concurrently and merge the partial results.
+        
+        Args:
+            url: The URL of the content
+            chunks: Content chunks in document order
+            instruction_text: The extraction instruction
+            schema_obj: The extraction schema, if any
+            system_message: The system message sent with every request
+            
+        Returns:
+            Merged dictionary of extracted information
+        """
+        chunks_dropped = 0
+        if len(chunks) > self.max_chunks:
+            chunks_dropped = len(chunks) - self.max_chunks
+            logger.warning(f"Dropping {chunks_dropped} chunks beyond max_chunks={self.max_chunks}")
+            chunks = chunks[:self.max_chunks]
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+        
+        async def extract_chunk(index: int, chunk: str) -> Dict[str, Any]:
+            async with semaphore:
+                chunk_url = f"{url} (part {index + 1} of {len(chunks)})"
+                return await self._extract_single(chunk_url, chunk, instruction_text, schema_obj, system_message)
+        
+        outcomes = await asyncio.gather(
+            *(extract_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
+        
+        partials = [outcome for outcome in outcomes if isinstance(outcome, dict)]
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if not partials:
+            raise errors[0]
+        for error in errors:
+            logger.warning(f"Chunk extraction failed: {str(error)}")
+        
+        merged = merge_extraction_results(partials, schema_obj)
+        
+        # Aggregate metadata across chunks
+        usage: Dict[str, int] = {}
+        for partial in partials:
+            for key, value in (partial.get("_metadata", {}).get("usage") or {}).items():
+                if isinstance(value, int):
+                    usage[key] = usage.get(key, 0) + value
+        
+        metadata = {
+            "extraction_mode": "map_reduce",
+            "chunk_count": len(chunks),
+            "chunks_failed": len(errors),
+            "chunks_dropped": chunks_dropped,
+            "chunk_tokens": [estimate_tokens(chunk, self.model) for chunk in chunks],
+            "timestamp": time.time(),
+            "cache_hit": all(partial.get("_metadata", {}).get("cache_hit") for partial in partials)
+        }
+        model = next((p["_metadata"]["model"] for p in partials if "model" in p.get("_metadata", {})), None)
+        if model:
+            metadata["model"] = model
+        if usage:
+            metadata["usage"] = usage
+        merged["_metadata"] = metadata
+        
+        logger.info(f"Merged {len(partials)} chunk results for URL: {url}")
+        return merged
+    
+    async def _extract_single(self, url: str, content: str, instruction_text: str,
+                              schema_obj: Optional[Dict[str, Any]], system_message: str) -> Dict[str, Any]:
+        """Extract information from content with a single LLM request.
+        
+        Args:
+            url: The URL of the content
+            content: The content to send to the LLM
+            instruction_text: The extraction instruction
+            schema_obj: The extraction schema, if any
+            system_message: The system message for the request
+            
+        Returns:
+            Dictionary of extracted information
+        """
         # Prepare the API request
         headers = {
             "Content-Type": "application/json",
@@ -267,19 +451,23 @@ class LLMExtractionStrategy(ExtractionStrategy):
         api_url = f"{self.base_url}/chat/completions" if self.base_url else "https://api.openai.com/v1/chat/completions"
         logger.debug(f"API URL: {api_url}")
         
-        # Truncate content if too long to optimize token usage
-        # This is a simple approach - more sophisticated content truncation could be implemented
-        content_limit = 15000  # Adjust based on model context window and needs
-        truncated_content = content[:content_limit] if len(content) > content_limit else content
-        if len(content) > content_limit:
-            logger.info(f"Content truncated from {len(content)} to {content_limit} characters")
+        user_message = f"URL: {url}\n\nContent:\n{content}"
+        
+        # Serve repeated requests for identical content from the cache
+        cache_key = None
+        if self.use_cache:
+            cache_key = make_cache_key(self.model, instruction_text, schema_obj, user_message)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Extraction cache hit for URL: {url}")
+                return cached
         
         # Prepare the request payload
         payload = {
             "model": self.model,
             "messages": [
                 {"role": "system", "content": system_message},
-                {"role": "user", "content": f"URL: {url}\n\nContent:\n{truncated_content}"}
+                {"role": "user", "content": user_message}
             ],
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
@@ -289,34 +477,50 @@ class LLMExtractionStrategy(ExtractionStrategy):
         # Add any extra arguments from self.extra_args, excluding 'headers' which we handled separately
         extra_args_copy = self.extra_args.copy()
         extra_args_copy.pop("headers", None)
+        # max_tokens may have been capped to fit the context window
+        extra_args_copy.pop("max_tokens", None)
         payload.update(extra_args_copy)
         
         logger.debug(f"Payload prepared with model: {payload.get('model')}")
         
+        # Reserve the expected prompt and completion tokens with the scheduler
+        estimated_tokens = estimate_tokens(system_message + user_message, self.model) + self.max_tokens
+        
         # Define the API call function for retry mechanism
         async def make_api_call():
-            try:
-                logger.debug(f"Sending request to LLM API...")
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(api_url, headers=headers, json=payload, timeout=self.timeout) as response:
+            async with self.scheduler.slot(self.provider, self.model, estimated_tokens, self.priority) as slot:
+                try:
+                    logger.debug(f"Sending request to LLM API...")
+                    session = get_session(api_url, **self.http_pool_config)
+                    async with session.post(api_url, headers=headers, json=payload,
+                                            timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
                         logger.debug(f"Response status: {response.status}")
                         
+                        if response.status == 429 or (response.status == 503 and "Retry-After" in response.headers):
+                            error_text = await response.text()
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            slot.retry_after(retry_after)
+                            logger.warning(f"API rate limited: {response.status}, retry after {retry_after}s")
+                            raise APIRateLimitError(response.status, error_text, retry_after)
+                        
                         if response.status != 200:
                             error_text = await response.text()
                             logger.error(f"API error: {response.status} - {error_text[:500]}")
                             raise APIResponseError(response.status, error_text)
                         
-                        return await response.json()
-            except aiohttp.ClientError as e:
-                logger.error(f"API connection error: {str(e)}")
-                raise APIConnectionError(f"API request failed: {str(e)}")
+                        data = await response.json()
+                        slot.report_usage(data.get("usage") if isinstance(data, dict) else None)
+                        return data
+                except aiohttp.ClientError as e:
+                    logger.error(f"API connection error: {str(e)}")
+                    raise APIConnectionError(f"API request failed: {str(e)}")
         
         # Make the API call with retries
         try:
             result = await retry_async(
                 make_api_call,
                 retries=self.max_retries,
-                exceptions=(APIConnectionError,)
+                exceptions=(APIConnectionError, APIRateLimitError)
             )
             
             logger.debug(f"Received response from API")
@@ -347,6 +551,10 @@ class LLMExtractionStrategy(ExtractionStrategy):
                         
                     # Add extraction timestamp
                     extracted_data["_metadata"]["timestamp"] = time.time()
+                    extracted_data["_metadata"]["cache_hit"] = False
+                    
+                    if cache_key is not None:
+                        await self.cache.set(cache_key, extracted_data)
                     
                     logger.info(f"Extraction completed successfully")
                     return extracted_data
@@ -358,8 +566,8 @@ class LLMExtractionStrategy(ExtractionStrategy):
                 logger.error(f"No choices in response: {result}")
                 raise APIResponseError(200, "No choices found in API response")
                 
-        except ExtractionError as e:
-            # Re-raise extraction errors
+        except (ExtractionError, LLMBudgetExceededError) as e:
+            # Re-raise extraction and budget errors
             raise
         except Exception as e:
             logger.error(f"Unexpected error during extraction: {str(e)}")
@@ -389,16 +597,17 @@ class LLMExtractionStrategy(ExtractionStrategy):
             api_url = f"{self.base_url}/models" if self.base_url else "https://api.openai.com/v1/models"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, headers=headers, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Provider validation failed: {response.status} - {error_text[:500]}")
-                        return False, f"API returned error {response.status}: {error_text}"
-                    
-                    # Successfully connected
-                    logger.info(f"Successfully validated connection to {self.provider}")
-                    return True, None
+            session = get_session(api_url, **self.http_pool_config)
+            async with session.get(api_url, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Provider validation failed: {response.status} - {error_text[:500]}")
+                    return False, f"API returned error {response.status}: {error_text}"
+                
+                # Successfully connected
+                logger.info(f"Successfully validated connection to {self.provider}")
+                return True, None
         except Exception as e:
             logger.error(f"Provider validation failed: {str(e)}")
             return False, str(e)
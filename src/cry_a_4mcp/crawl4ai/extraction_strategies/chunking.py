@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Token-aware chunking and result merging for map-reduce LLM extraction.
+
+This module splits long content into chunks that fit a model's context window
+and merges the partial JSON results extracted from each chunk back into a
+single result, using the extraction schema to decide how fields combine.
+"""
+
+import json
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+from ..content_preprocessor import ContentPreprocessor
+
+# Conditionally import tiktoken if available
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger('extraction_strategy_chunking')
+
+# Average characters per token for English prose with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+# Context window used when a model's window is unknown
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Tokens reserved for chat formatting and the URL/content preamble
+PROMPT_OVERHEAD_TOKENS = 64
+
+_encoders: Dict[str, Any] = {}
+
+
+def _get_encoder(model: Optional[str]):
+    """Get a cached tiktoken encoder for a model, or None if unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    key = model or ""
+    if key not in _encoders:
+        try:
+            _encoders[key] = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            _encoders[key] = tiktoken.get_encoding("cl100k_base")
+    return _encoders[key]
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Estimate the number of tokens in a text.
+
+    Uses tiktoken when installed and a characters-per-token heuristic otherwise.
+
+    Args:
+        text: The text to measure
+        model: Optional model name used to pick the tokenizer
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    encoder = _get_encoder(model)
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_oversized(text: str, max_tokens: int, model: Optional[str]) -> List[str]:
+    """Split a single block that exceeds the token budget.
+
+    Splits on sentence boundaries first and falls back to hard character cuts
+    for sentences that are still too long.
+    """
+    pieces = []
+    current = ""
+    for sentence in re.split(r'(?<=[.!?])\s+', text):
+        candidate = f"{current} {sentence}" if current else sentence
+        if estimate_tokens(candidate, model) <= max_tokens:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        if estimate_tokens(sentence, model) <= max_tokens:
+            current = sentence
+            continue
+        # Hard split a sentence that is longer than the whole budget
+        step = max(1, max_tokens * CHARS_PER_TOKEN)
+        while sentence:
+            part = sentence[:step]
+            while len(part) > 1 and estimate_tokens(part, model) > max_tokens:
+                part = part[:len(part) * 3 // 4]
+            pieces.append(part)
+            sentence = sentence[len(part):]
+        current = ""
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_content(text: str, max_tokens: int, model: Optional[str] = None) -> List[str]:
+    """Split content into chunks that each fit within a token budget.
+
+    The text is segmented with ``ContentPreprocessor.segment_content`` and the
+    segments are packed greedily so chunks stay as full as the budget allows.
+
+    Args:
+        text: The content to split
+        max_tokens: Maximum number of tokens per chunk
+        model: Optional model name used to pick the tokenizer
+
+    Returns:
+        List of chunk texts in document order
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    if estimate_tokens(text, model) <= max_tokens:
+        return [text] if text else []
+
+    preprocessor = ContentPreprocessor(max_segment_length=max_tokens * CHARS_PER_TOKEN)
+    blocks = []
+    for segment in preprocessor.segment_content(text):
+        if estimate_tokens(segment.text, model) <= max_tokens:
+            blocks.append(segment.text)
+        else:
+            blocks.extend(_split_oversized(segment.text, max_tokens, model))
+
+    chunks = []
+    current = ""
+    current_tokens = 0
+    separator_tokens = estimate_tokens("\n\n", model)
+    for block in blocks:
+        block_tokens = estimate_tokens(block, model)
+        if current and current_tokens + separator_tokens + block_tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = "", 0
+        if current:
+            current += "\n\n" + block
+            current_tokens += separator_tokens + block_tokens
+        else:
+            current, current_tokens = block, block_tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _freeze(value: Any) -> str:
+    """Build a hashable identity for deduplicating merged list items."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a partial value carries no information."""
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _merge_values(values: List[Any], schema: Optional[Dict[str, Any]] = None) -> Any:
+    """Merge the values one field took across chunks.
+
+    Arrays are concatenated and deduplicated, objects are merged field by
+    field, numbers marked as scores are averaged and other scalars keep the
+    first non-empty value (the earliest chunk is usually the most salient).
+    """
+    present = [value for value in values if not _is_empty(value)]
+    if not present:
+        return values[0] if values else None
+
+    schema = schema or {}
+    field_type = schema.get("type")
+    if isinstance(field_type, list):
+        field_type = next((t for t in field_type if t != "null"), None)
+
+    if field_type == "array" or (field_type is None and all(isinstance(v, list) for v in present)):
+        merged, seen = [], set()
+        for value in present:
+            for item in value if isinstance(value, list) else [value]:
+                key = _freeze(item)
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        max_items = schema.get("maxItems")
+        return merged[:max_items] if max_items else merged
+
+    if field_type == "object" or (field_type is None and all(isinstance(v, dict) for v in present)):
+        return merge_extraction_results([v for v in present if isinstance(v, dict)], schema)
+
+    if field_type in ("number", "integer") and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        # Bounded numbers are scores, so average them across chunks
+        if "minimum" in schema and "maximum" in schema:
+            average = sum(present) / len(present)
+            return round(average) if field_type == "integer" else average
+
+    return present[0]
+
+
+def merge_extraction_results(results: List[Dict[str, Any]],
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge partial extraction results from several chunks into one.
+
+    Args:
+        results: Partial results in document order
+        schema: Optional JSON schema describing the result
+
+    Returns:
+        Merged result (without ``_metadata``)
+    """
+    properties = (schema or {}).get("properties", {})
+    merged: Dict[str, Any] = {}
+    keys: List[str] = []
+    for result in results:
+        for key in result:
+            if key != "_metadata" and key not in keys:
+                keys.append(key)
+
+    for key in keys:
+        values = [result.get(key) for result in results if key in result]
+        merged[key] = _merge_values(values, properties.get(key))
+    return merged
@@ -7,7 +7,6 @@ that may span multiple domains.
 
 import logging
 from typing import Dict, Any, List, Optional, Union, Tuple
-import asyncio
 from datetime import datetime
 
 from ..factory import CompositeExtractionStrategy
@@ -134,21 +133,15 @@ class ComprehensiveLLMExtractionStrategy(CompositeExtractionStrategy):
         results = []
         errors = []
         
-        extraction_tasks = []
-        for strategy in selected_strategies:
-            task = asyncio.create_task(
-                self._safe_extract(strategy, url, content, **kwargs)
-            )
-            extraction_tasks.append(task)
+        # Run the selected strategies concurrently, bounded by the composite's
+        # timeout and deadline settings; outcomes come back in strategy order
+        outcomes = await self._run_strategies(selected_strategies, url, content, **kwargs)
         
-        # Wait for all extraction tasks to complete
-        completed_tasks = await asyncio.gather(*extraction_tasks)
-        
-        for result, error in completed_tasks:
-            if result:
-                results.append(result)
-            if error:
-                errors.append(error)
+        for outcome in outcomes:
+            if outcome["result"]:
+                results.append(outcome["result"])
+            if outcome["error"]:
+                errors.append(outcome["error"])
         
         if not results:
             if errors:
@@ -177,25 +170,6 @@ class ComprehensiveLLMExtractionStrategy(CompositeExtractionStrategy):
         
         return merged_result
     
-    async def _safe_extract(self, strategy, url, content, **kwargs) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-        """Safely extract information using a strategy, catching any exceptions.
-        
-        Args:
-            strategy: The extraction strategy to use.
-            url: The URL of the content.
-            content: The content to extract information from.
-            **kwargs: Additional keyword arguments.
-            
-        Returns:
-            A tuple containing the extraction result (or None) and an error message (or None).
-        """
-        try:
-            result = await strategy.extract(url, content, **kwargs)
-            return result, None
-        except Exception as e:
-            logger.error(f"Extraction failed with strategy {strategy.__class__.__name__}: {e}")
-            return None, str(e)
-    
     def _classify_content(self, content: str) -> Tuple[List[str], Dict[str, float]]:
         """Classify content to determine its type and domain.
         
@@ -10,9 +10,21 @@ for different target groups.
 
 import re
 import json
-from typing import List, Dict, Optional, Any
+import bisect
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
 
+from ..url_matcher import URLMatcherIndex
+
+# Host as seen by "domain" patterns: everything after the scheme and an optional "www."
+_HOST_RE = re.compile(r'https?://(?:www\.)?([^/]+)')
+
+
+def _domain_of(url: str) -> Optional[str]:
+    """Extract the host part that "domain" patterns are matched against."""
+    domain_match = _HOST_RE.search(url)
+    return domain_match.group(1) if domain_match else None
+
 
 @dataclass
 class ExtractorConfig:
@@ -55,9 +67,8 @@ class URLExtractorMapping:
         """
         if self.pattern_type == "domain":
             # Extract domain from URL and check if it contains or matches the pattern
-            domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
-            if domain_match:
-                domain = domain_match.group(1)
+            domain = _domain_of(url)
+            if domain is not None:
                 return self.url_pattern in domain
             return False
         
@@ -91,11 +102,71 @@ class URLExtractorMapping:
 
 
 class URLMappingManager:
-    """Manages URL-to-extractor mappings and provides lookup functionality."""
+    """Manages URL-to-extractor mappings and provides lookup functionality.
+    
+    Mappings are compiled into a ``URLMatcherIndex`` as they are added, so a
+    lookup costs time proportional to the URL length rather than the number
+    of mappings. Exact patterns use a hash lookup and domain/path patterns
+    (which are substring rules) use Aho-Corasick automata.
+    """
     
     def __init__(self):
         """Initialize a new URL mapping manager."""
         self.mappings: List[URLExtractorMapping] = []
+        # Negated priority of each mapping, parallel to self.mappings, for bisecting
+        self._priority_keys: List[int] = []
+        self._index = URLMatcherIndex()
+        self._handles: Dict[int, List[int]] = {}
+        # Bumped by every change made through the manager
+        self._version = 0
+        # Mapping list, its length and the version the index reflects
+        self._indexed: Tuple[List[URLExtractorMapping], int, int] = (self.mappings, 0, 0)
+    
+    def _index_mapping(self, mapping: URLExtractorMapping) -> None:
+        """Register a mapping's pattern in the matcher index."""
+        pattern = mapping.url_pattern
+        if mapping.pattern_type == "exact":
+            kind = "exact"
+        elif mapping.pattern_type in ("domain", "path") and not pattern:
+            # An empty substring matches everything the pattern type applies to
+            kind, pattern = "custom", (lambda url, host, m=mapping: m.matches(url))
+        elif mapping.pattern_type == "domain":
+            kind = "host_substring"
+        elif mapping.pattern_type == "path":
+            kind = "substring"
+        else:
+            # Unknown pattern types never match
+            return
+        handle = self._index.add(kind, pattern, mapping, mapping.priority)
+        self._handles.setdefault(id(mapping), []).append(handle)
+    
+    def _unindex_mapping(self, mapping: URLExtractorMapping) -> None:
+        """Remove a mapping's pattern from the matcher index."""
+        handles = self._handles.get(id(mapping))
+        if handles:
+            self._index.remove(handles.pop())
+            if not handles:
+                del self._handles[id(mapping)]
+    
+    def _changed(self) -> None:
+        """Bump the version after a change that kept the index in step."""
+        self._version += 1
+        self._indexed = (self.mappings, len(self.mappings), self._version)
+    
+    def _index_is_current(self) -> bool:
+        """Whether the index reflects the mapping list, which may also be replaced or edited directly."""
+        mappings, count, version = self._indexed
+        return mappings is self.mappings and count == len(self.mappings) and version == self._version
+    
+    def _rebuild_index(self) -> None:
+        """Recompile the matcher index from the current mapping list."""
+        self.mappings.sort(key=lambda m: -m.priority)
+        self._priority_keys = [-m.priority for m in self.mappings]
+        self._index = URLMatcherIndex()
+        self._handles = {}
+        for mapping in self.mappings:
+            self._index_mapping(mapping)
+        self._changed()
     
     def add_mapping(self, mapping: URLExtractorMapping) -> None:
         """Add a new URL-to-extractor mapping.
@@ -103,9 +174,14 @@ class URLMappingManager:
         Args:
             mapping: The mapping to add.
         """
-        self.mappings.append(mapping)
-        # Sort mappings by priority (highest first)
-        self.mappings.sort(key=lambda m: m.priority, reverse=True)
+        if not self._index_is_current():
+            self._rebuild_index()
+        # Keep mappings sorted by priority (highest first, ties in insertion order)
+        position = bisect.bisect_right(self._priority_keys, -mapping.priority)
+        self.mappings.insert(position, mapping)
+        self._priority_keys.insert(position, -mapping.priority)
+        self._index_mapping(mapping)
+        self._changed()
     
     def remove_mapping(self, mapping: URLExtractorMapping) -> None:
         """Remove a URL-to-extractor mapping.
@@ -113,8 +189,30 @@ class URLMappingManager:
         Args:
             mapping: The mapping to remove.
         """
+        if not self._index_is_current():
+            self._rebuild_index()
         if mapping in self.mappings:
-            self.mappings.remove(mapping)
+            position = self.mappings.index(mapping)
+            removed = self.mappings.pop(position)
+            del self._priority_keys[position]
+            self._unindex_mapping(removed)
+            self._changed()
+    
+    def update_mapping(self, mapping: URLExtractorMapping) -> None:
+        """Re-index a mapping after its pattern, type or priority was edited in place.
+        
+        Args:
+            mapping: The edited mapping (already managed by this manager).
+        """
+        if not self._index_is_current():
+            self._rebuild_index()
+        for position, existing in enumerate(self.mappings):
+            if existing is mapping:
+                del self.mappings[position]
+                del self._priority_keys[position]
+                self._unindex_mapping(mapping)
+                self.add_mapping(mapping)
+                return
     
     def get_extractors_for_url(self, url: str) -> List[ExtractorConfig]:
         """Get all extractors that should be applied to the given URL.
@@ -125,11 +223,14 @@ class URLMappingManager:
         Returns:
             List of extractor configurations that match the URL.
         """
+        # Recompile if the mapping list was replaced or modified directly
+        if not self._index_is_current():
+            self._rebuild_index()
+        
         matching_extractors = []
         
-        for mapping in self.mappings:
-            if mapping.matches(url):
-                matching_extractors.extend(mapping.extractors)
+        for mapping in self._index.match_all(url, _domain_of(url) or ""):
+            matching_extractors.extend(mapping.extractors)
         
         return matching_extractors
     
@@ -156,8 +257,8 @@ class URLMappingManager:
             config = json.load(f)
         
         self.mappings = [URLExtractorMapping.from_dict(m) for m in config.get("mappings", [])]
-        # Sort mappings by priority
-        self.mappings.sort(key=lambda m: m.priority, reverse=True)
+        # Sorts the mappings by priority
+        self._rebuild_index()
 
 
 async def extract_from_url(url: str, mapping_manager: URLMappingManager, extractor_factory: Any) -> Dict[str, Any]:
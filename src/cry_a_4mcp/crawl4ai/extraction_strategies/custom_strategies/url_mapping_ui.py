@@ -516,6 +516,7 @@ class URLMappingUI(ttk.Frame):
         Args:
             mapping: The saved mapping.
         """
+        self.mapping_manager.update_mapping(mapping)
         self._refresh_list()
         self.notebook.select(0)  # Switch to list tab
         
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Compiled URL matching index for URL-to-extractor and URL-to-strategy mappings.
+
+Matching a URL against thousands of mappings one by one is linear in the number
+of mappings. This module compiles the mappings into lookup structures so a URL
+is matched in time proportional to its own length:
+
+- exact URLs live in a hash map,
+- domain and subdomain rules live in a trie keyed on reversed host labels,
+- substring rules (on the host or on the full URL) live in an Aho-Corasick
+  automaton that finds every contained pattern in a single pass,
+- arbitrary regexes and custom predicates are kept in a priority-sorted list
+  and only consulted when they could still beat the best indexed match.
+
+All structures are updated in place when mappings are added or removed.
+"""
+
+import bisect
+import itertools
+import logging
+import re
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple
+
+logger = logging.getLogger('url_matcher')
+
+
+class AhoCorasickAutomaton:
+    """Multi-pattern substring matcher.
+
+    Patterns are inserted into a trie as they are added. Failure links are
+    recomputed lazily on the first search after a change, so a burst of
+    additions only pays for one rebuild.
+    """
+
+    def __init__(self):
+        """Initialize an empty automaton."""
+        self._children: List[Dict[str, int]] = [{}]
+        self._outputs: List[Set[int]] = [set()]
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]
+        self._dirty = False
+
+    def add(self, pattern: str, value: int) -> None:
+        """Add a pattern that reports ``value`` when found.
+
+        Args:
+            pattern: The substring to search for
+            value: Identifier reported for matches of this pattern
+        """
+        node = 0
+        for char in pattern:
+            child = self._children[node].get(char)
+            if child is None:
+                child = len(self._children)
+                self._children.append({})
+                self._outputs.append(set())
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._children[node][char] = child
+            node = child
+        self._outputs[node].add(value)
+        self._dirty = True
+
+    def remove(self, pattern: str, value: int) -> None:
+        """Remove a previously added pattern/value pair.
+
+        Args:
+            pattern: The substring that was added
+            value: Identifier that was added with it
+        """
+        node = 0
+        for char in pattern:
+            node = self._children[node].get(char)
+            if node is None:
+                return
+        self._outputs[node].discard(value)
+        # Failure links stay valid; only the dictionary links need refreshing
+        self._dirty = True
+
+    def _build(self) -> None:
+        """Compute failure and dictionary links breadth-first."""
+        queue = deque()
+        for child in self._children[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._children[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._children[fail]:
+                    fail = self._fail[fail]
+                target = self._children[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                # Nearest proper suffix node that ends at least one pattern
+                fail_node = self._fail[child]
+                self._dict_link[child] = fail_node if self._outputs[fail_node] else self._dict_link[fail_node]
+                queue.append(child)
+        self._dirty = False
+
+    def search(self, text: str) -> Set[int]:
+        """Find every pattern contained in a text.
+
+        Args:
+            text: The text to scan
+
+        Returns:
+            Set of identifiers whose pattern occurs in the text
+        """
+        if self._dirty:
+            self._build()
+
+        found: Set[int] = set()
+        children, fail, outputs, dict_link = self._children, self._fail, self._outputs, self._dict_link
+        node = 0
+        for char in text:
+            while node and char not in children[node]:
+                node = fail[node]
+            node = children[node].get(char, 0)
+            match = node if outputs[node] else dict_link[node]
+            while match:
+                found |= outputs[match]
+                match = dict_link[match]
+        return found
+
+
+class DomainTrie:
+    """Trie of domain rules keyed on reversed host labels.
+
+    A rule for ``example.com`` is stored under ``com -> example``. Looking up
+    ``news.example.com`` walks ``com -> example -> news`` and collects exact
+    rules at the final node plus subdomain rules at every node on the way.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: Dict[str, Any] = {}
+
+    @staticmethod
+    def _labels(domain: str) -> List[str]:
+        """Split a domain into reversed, lower-cased labels."""
+        return [label for label in reversed(domain.lower().strip('.').split('.')) if label]
+
+    def add(self, domain: str, value: int, include_subdomains: bool = True) -> None:
+        """Add a domain rule.
+
+        Args:
+            domain: The domain to match (e.g., "example.com")
+            value: Identifier reported for matching hosts
+            include_subdomains: Whether subdomains match as well
+        """
+        node = self._root
+        for label in self._labels(domain):
+            node = node.setdefault(label, {})
+        node.setdefault(None, {})[value] = include_subdomains
+
+    def remove(self, domain: str, value: int) -> None:
+        """Remove a domain rule, pruning empty branches.
+
+        Args:
+            domain: The domain that was added
+            value: Identifier that was added with it
+        """
+        path = [self._root]
+        for label in self._labels(domain):
+            node = path[-1].get(label)
+            if node is None:
+                return
+            path.append(node)
+
+        rules = path[-1].get(None)
+        if rules is None:
+            return
+        rules.pop(value, None)
+        if not rules:
+            del path[-1][None]
+
+        labels = self._labels(domain)
+        for depth in range(len(labels), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][labels[depth - 1]]
+
+    def match(self, host: str) -> Set[int]:
+        """Find every rule matching a host.
+
+        Args:
+            host: Host name without port
+
+        Returns:
+            Set of identifiers whose rule matches the host
+        """
+        found: Set[int] = set()
+        labels = self._labels(host)
+        node = self._root
+        for depth, label in enumerate(labels, 1):
+            node = node.get(label)
+            if node is None:
+                break
+            rules = node.get(None)
+            if rules:
+                last = depth == len(labels)
+                found.update(value for value, include_subdomains in rules.items()
+                             if last or include_subdomains)
+        return found
+
+
+class URLMatcherIndex:
+    """Priority-ordered index over URL matching rules.
+
+    Each rule is registered with a priority and an opaque value and gets a
+    handle back for removal. Ties in priority are broken by registration order.
+    """
+
+    # Rule kinds served by the compiled structures
+    INDEXED_KINDS = ("exact", "domain", "host_substring", "substring")
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._exact: Dict[str, Set[int]] = {}
+        self._domains = DomainTrie()
+        self._host_substrings = AhoCorasickAutomaton()
+        self._substrings = AhoCorasickAutomaton()
+        # Rules that can only be evaluated one by one, sorted by (-priority, seq)
+        self._scan: List[Tuple[int, int, Callable[[str, str], bool]]] = []
+        self._rules: Dict[int, Tuple[str, Any, int, Any, Any]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of registered rules."""
+        return len(self._rules)
+
+    def add(self, kind: str, pattern: Any, value: Any, priority: int = 0,
+            include_subdomains: bool = True) -> int:
+        """Register a rule.
+
+        Args:
+            kind: One of "exact", "domain", "host_substring", "substring",
+                "regex" (compiled pattern or string searched in the URL) or
+                "custom" (callable taking ``(url, host)``)
+            pattern: The rule pattern for the given kind
+            value: Value returned when the rule matches
+            priority: Rule priority (higher values take precedence)
+            include_subdomains: For "domain" rules, whether subdomains match
+
+        Returns:
+            Handle identifying the rule for ``remove``
+        """
+        handle = next(self._counter)
+        sort_key = (-priority, handle)
+
+        if kind == "exact":
+            self._exact.setdefault(pattern, set()).add(handle)
+        elif kind == "domain":
+            self._domains.add(pattern, handle, include_subdomains)
+        elif kind == "host_substring":
+            self._host_substrings.add(pattern, handle)
+        elif kind == "substring":
+            self._substrings.add(pattern, handle)
+        elif kind in ("regex", "custom"):
+            if kind == "regex":
+                predicate = (lambda url, host, p=pattern: bool(p.search(url)))
+            else:
+                predicate = pattern
+            bisect.insort(self._scan, (sort_key[0], sort_key[1], predicate))
+        else:
+            raise ValueError(f"Unknown rule kind: {kind}")
+
+        self._rules[handle] = (kind, pattern, priority, value, sort_key)
+        return handle
+
+    def remove(self, handle: int) -> None:
+        """Unregister a rule.
+
+        Args:
+            handle: Handle returned by ``add``
+        """
+        rule = self._rules.pop(handle, None)
+        if rule is None:
+            return
+        kind, pattern, priority, _, sort_key = rule
+
+        if kind == "exact":
+            handles = self._exact.get(pattern)
+            if handles is not None:
+                handles.discard(handle)
+                if not handles:
+                    del self._exact[pattern]
+        elif kind == "domain":
+            self._domains.remove(pattern, handle)
+        elif kind == "host_substring":
+            self._host_substrings.remove(pattern, handle)
+        elif kind == "substring":
+            self._substrings.remove(pattern, handle)
+        else:
+            # Handles are unique, so (-priority, seq) sorts just before its own entry
+            position = bisect.bisect_left(self._scan, sort_key)
+            if position < len(self._scan) and self._scan[position][:2] == sort_key:
+                del self._scan[position]
+
+    def _indexed_matches(self, url: str, host: str) -> Set[int]:
+        """Collect handles matched by the compiled structures."""
+        found = set(self._exact.get(url, ()))
+        if host:
+            found |= self._domains.match(host)
+            found |= self._host_substrings.search(host)
+        found |= self._substrings.search(url)
+        return found
+
+    def _scan_matches(self, url: str, host: str, bound: Optional[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
+        """Evaluate scanned rules that sort before ``bound``."""
+        matched = []
+        for neg_priority, handle, predicate in self._scan:
+            if bound is not None and (neg_priority, handle) >= bound:
+                break
+            try:
+                if predicate(url, host):
+                    matched.append((neg_priority, handle))
+                    if bound is not None:
+                        break
+            except Exception as e:
+                logger.error(f"Error matching rule for URL {url}: {e}")
+        return matched
+
+    def match_all(self, url: str, host: str = "") -> List[Any]:
+        """Get the values of every rule matching a URL.
+
+        Args:
+            url: The URL to match
+            host: The URL's host as the caller defines it (used by "domain"
+                and "host_substring" rules)
+
+        Returns:
+            Matching values ordered by priority (highest first)
+        """
+        keys = [self._rules[handle][4] for handle in self._indexed_matches(url, host)]
+        keys.extend(self._scan_matches(url, host))
+        keys.sort()
+        return [self._rules[handle][3] for _, handle in keys]
+
+    def match_first(self, url: str, host: str = "") -> Optional[Any]:
+        """Get the value of the highest-priority rule matching a URL.
+
+        Scanned rules are only evaluated while they could still outrank the
+        best indexed match.
+
+        Args:
+            url: The URL to match
+            host: The URL's host as the caller defines it
+
+        Returns:
+            The matching value, or None if no rule matches
+        """
+        keys = [self._rules[handle][4] for handle in self._indexed_matches(url, host)]
+        best = min(keys) if keys else None
+        scanned = self._scan_matches(url, host, bound=best if best is not None else (float('inf'), 0))
+        if scanned:
+            best = scanned[0]
+        return self._rules[best[1]][3] if best is not None else None
+
+
+def is_literal_pattern(pattern: Pattern) -> Optional[str]:
+    """Return the literal text of a regex that contains no metacharacters.
+
+    Such patterns can be matched as plain substrings instead of regexes.
+
+    Args:
+        pattern: A compiled regex
+
+    Returns:
+        The literal string, or None if the regex is not a plain literal
+    """
+    # Flags such as IGNORECASE change what a literal matches
+    if pattern.flags & ~re.UNICODE:
+        return None
+    source = pattern.pattern
+    if not isinstance(source, str) or not source:
+        return None
+    if any(char in source for char in ".^$*+?{}[]\\|()"):
+        return None
+    return source
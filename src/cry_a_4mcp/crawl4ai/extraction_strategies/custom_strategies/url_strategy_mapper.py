@@ -14,11 +14,23 @@ from urllib.parse import urlparse
 from ..base import ExtractionStrategy
 from ..registry import register_strategy, StrategyRegistry
 from ..factory import StrategyFactory, CompositeExtractionStrategy
+from ..instance_pool import default_strategy_pool
+from .url_matcher import URLMatcherIndex, is_literal_pattern
 
 # Configure logging
 logger = logging.getLogger('url_strategy_mapper')
 
 
+def _host_of(url: str) -> str:
+    """Get the lower-cased host of a URL without its port."""
+    url_domain = urlparse(url).netloc.lower()
+    
+    # Remove port if present
+    if ':' in url_domain:
+        url_domain = url_domain.split(':', 1)[0]
+    return url_domain
+
+
 class StrategyMatcher:
     """Base class for strategy matchers.
     
@@ -63,12 +75,7 @@ class DomainMatcher(StrategyMatcher):
             True if the domain matches, False otherwise
         """
         try:
-            parsed_url = urlparse(url)
-            url_domain = parsed_url.netloc.lower()
-            
-            # Remove port if present
-            if ':' in url_domain:
-                url_domain = url_domain.split(':', 1)[0]
+            url_domain = _host_of(url)
             
             if self.include_subdomains:
                 return url_domain == self.domain or url_domain.endswith('.' + self.domain)
@@ -154,6 +161,10 @@ class URLMappingStrategy(CompositeExtractionStrategy):
     This strategy selects appropriate extraction strategies based on URL patterns,
     domains, or other criteria. It then delegates the extraction to the selected
     strategies and merges the results.
+    
+    Mappings are compiled into a ``URLMatcherIndex``: domain matchers go into a
+    reversed-label trie, literal patterns into an Aho-Corasick automaton, and
+    only true regexes that could outrank the best indexed match are evaluated.
     """
     
     def __init__(
@@ -184,8 +195,14 @@ class URLMappingStrategy(CompositeExtractionStrategy):
         # Initialize the strategy factory
         self.factory = StrategyFactory()
         
-        # Initialize the strategy mappings
+        # Initialize the strategy mappings and their matcher index
         self.strategy_mappings = []
+        self._matcher_index = URLMatcherIndex()
+        self._mapping_handles: Dict[int, List[int]] = {}
+        # Bumped by every change made through this strategy
+        self._version = 0
+        # Mapping list, its length and the version the index reflects
+        self._indexed: Tuple[List[StrategyMapping], int, int] = (self.strategy_mappings, 0, 0)
         if mappings:
             for mapping in mappings:
                 self._add_mapping_from_config(mapping)
@@ -193,19 +210,21 @@ class URLMappingStrategy(CompositeExtractionStrategy):
         # Set the fallback strategy
         self.fallback_strategy_name = fallback_strategy
         
+        # Configuration shared by every strategy this selector creates
+        self.strategy_config = {
+            "api_token": api_token,
+            "model": model,
+            "max_retries": max_retries,
+            "retry_delay": retry_delay,
+            "timeout": timeout,
+            **kwargs
+        }
+        
         # Create the fallback strategy instance
         fallback_strategy_instance = None
         if fallback_strategy:
             try:
-                fallback_strategy_instance = self.factory.create(
-                    fallback_strategy,
-                    api_token=api_token,
-                    model=model,
-                    max_retries=max_retries,
-                    retry_delay=retry_delay,
-                    timeout=timeout,
-                    **kwargs
-                )
+                fallback_strategy_instance = self._create_strategy(fallback_strategy)
             except Exception as e:
                 logger.warning(f"Failed to initialize fallback strategy {fallback_strategy}: {e}")
         
@@ -251,7 +270,7 @@ class URLMappingStrategy(CompositeExtractionStrategy):
                 matcher = PatternMatcher(pattern)
         
         if matcher:
-            self.strategy_mappings.append(StrategyMapping(matcher, strategy_name, priority))
+            self._register_mapping(StrategyMapping(matcher, strategy_name, priority))
         else:
             logger.warning(f"Failed to create matcher for config: {config}")
     
@@ -265,7 +284,7 @@ class URLMappingStrategy(CompositeExtractionStrategy):
             priority: The priority of this mapping
         """
         matcher = DomainMatcher(domain, include_subdomains)
-        self.strategy_mappings.append(StrategyMapping(matcher, strategy_name, priority))
+        self._register_mapping(StrategyMapping(matcher, strategy_name, priority))
     
     def add_pattern_mapping(self, pattern: Union[str, Pattern], strategy_name: str, priority: int = 0) -> None:
         """Add a pattern-based strategy mapping.
@@ -276,7 +295,72 @@ class URLMappingStrategy(CompositeExtractionStrategy):
             priority: The priority of this mapping
         """
         matcher = PatternMatcher(pattern)
-        self.strategy_mappings.append(StrategyMapping(matcher, strategy_name, priority))
+        self._register_mapping(StrategyMapping(matcher, strategy_name, priority))
+    
+    def _register_mapping(self, mapping: StrategyMapping) -> None:
+        """Add a strategy mapping and compile it into the matcher index.
+        
+        Args:
+            mapping: The mapping to add
+        """
+        self._ensure_index()
+        self.strategy_mappings.append(mapping)
+        self._index_mapping(mapping)
+        self._changed()
+    
+    def remove_mapping(self, mapping: StrategyMapping) -> None:
+        """Remove a strategy mapping and drop it from the matcher index.
+        
+        Args:
+            mapping: The mapping to remove
+        """
+        self._ensure_index()
+        if mapping in self.strategy_mappings:
+            self.strategy_mappings.remove(mapping)
+            handles = self._mapping_handles.get(id(mapping))
+            if handles:
+                self._matcher_index.remove(handles.pop())
+                if not handles:
+                    del self._mapping_handles[id(mapping)]
+            self._changed()
+    
+    def _index_mapping(self, mapping: StrategyMapping) -> None:
+        """Compile a single mapping into the matcher index."""
+        matcher = mapping.matcher
+        if isinstance(matcher, DomainMatcher) and matcher.domain:
+            handle = self._matcher_index.add("domain", matcher.domain, mapping, mapping.priority,
+                                             include_subdomains=matcher.include_subdomains)
+        elif isinstance(matcher, PatternMatcher) and is_literal_pattern(matcher.pattern):
+            handle = self._matcher_index.add("substring", matcher.pattern.pattern, mapping, mapping.priority)
+        else:
+            # Regexes and custom matchers are evaluated one by one
+            handle = self._matcher_index.add("custom", lambda url, host, m=mapping: m.matches(url),
+                                             mapping, mapping.priority)
+        self._mapping_handles.setdefault(id(mapping), []).append(handle)
+    
+    def _changed(self) -> None:
+        """Bump the version after a change that kept the index in step."""
+        self._version += 1
+        self._indexed = (self.strategy_mappings, len(self.strategy_mappings), self._version)
+    
+    def _ensure_index(self) -> None:
+        """Recompile the matcher index if ``strategy_mappings`` was replaced or modified directly."""
+        mappings, count, version = self._indexed
+        if mappings is self.strategy_mappings and count == len(mappings) and version == self._version:
+            return
+        self._matcher_index = URLMatcherIndex()
+        self._mapping_handles = {}
+        for mapping in self.strategy_mappings:
+            self._index_mapping(mapping)
+        self._changed()
+    
+    def _create_strategy(self, strategy_name: str) -> ExtractionStrategy:
+        """Get a pooled strategy instance with this selector's configuration.
+        
+        Instances are shared through the strategy instance pool, so dispatching
+        many URLs to the same strategy constructs it only once.
+        """
+        return default_strategy_pool.get(strategy_name, self.strategy_config, self.factory.create)
     
     def get_strategy_for_url(self, url: str) -> Tuple[Optional[ExtractionStrategy], str]:
         """Get the appropriate strategy for a URL.
@@ -287,38 +371,30 @@ class URLMappingStrategy(CompositeExtractionStrategy):
         Returns:
             A tuple containing the strategy instance and its name, or (None, None) if no strategy matches
         """
-        # Sort mappings by priority (descending)
-        sorted_mappings = sorted(self.strategy_mappings, key=lambda m: m.priority, reverse=True)
+        self._ensure_index()
+        host = _host_of(url)
         
-        # Find the first matching mapping
-        for mapping in sorted_mappings:
-            if mapping.matches(url):
+        # Find the highest-priority matching mapping
+        best = self._matcher_index.match_first(url, host)
+        if best is not None:
+            try:
+                return self._create_strategy(best.strategy_name), best.strategy_name
+            except Exception as e:
+                logger.error(f"Failed to create strategy {best.strategy_name}: {e}")
+            
+            # Fall through the remaining matches in priority order
+            for mapping in self._matcher_index.match_all(url, host):
+                if mapping is best:
+                    continue
                 try:
-                    strategy = self.factory.create(
-                        mapping.strategy_name,
-                        api_token=self.api_token,
-                        model=self.model,
-                        max_retries=self.max_retries,
-                        retry_delay=self.retry_delay,
-                        timeout=self.timeout,
-                        **self.kwargs
-                    )
-                    return strategy, mapping.strategy_name
+                    return self._create_strategy(mapping.strategy_name), mapping.strategy_name
                 except Exception as e:
                     logger.error(f"Failed to create strategy {mapping.strategy_name}: {e}")
         
         # If no mapping matches, use the fallback strategy
         if self.fallback_strategy_name:
             try:
-                strategy = self.factory.create(
-                    self.fallback_strategy_name,
-                    api_token=self.api_token,
-                    model=self.model,
-                    max_retries=self.max_retries,
-                    retry_delay=self.retry_delay,
-                    timeout=self.timeout,
-                    **self.kwargs
-                )
+                strategy = self._create_strategy(self.fallback_strategy_name)
                 return strategy, self.fallback_strategy_name
             except Exception as e:
                 logger.error(f"Failed to create fallback strategy {self.fallback_strategy_name}: {e}")
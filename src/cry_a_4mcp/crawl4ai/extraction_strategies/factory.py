@@ -6,6 +6,7 @@ This module provides a factory for creating extraction strategy instances
 based on configuration, supporting dynamic strategy creation and composition.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, Optional, List, Type, Union
 import json
@@ -56,6 +57,27 @@ class StrategyFactory:
             logger.error(f"Failed to create strategy instance: {strategy_name} - {str(e)}")
             raise ValueError(f"Failed to create strategy '{strategy_name}': {str(e)}")
     
+    @classmethod
+    def get_or_create(cls, strategy_name: str, config: Optional[Dict[str, Any]] = None) -> ExtractionStrategy:
+        """Get a shared strategy instance from the instance pool.
+        
+        Instances are keyed on the strategy name and configuration, so repeated
+        calls with the same arguments return the same object instead of
+        rebuilding the strategy.
+        
+        Args:
+            strategy_name: Name of the strategy
+            config: Optional configuration for the strategy
+            
+        Returns:
+            Strategy instance
+            
+        Raises:
+            ValueError: If the strategy is not registered
+        """
+        from .instance_pool import default_strategy_pool
+        return default_strategy_pool.get(strategy_name, config, cls.create)
+    
     @classmethod
     def create_from_config(cls, config: Dict[str, Any]) -> ExtractionStrategy:
         """Create a strategy instance from a configuration dictionary.
@@ -123,11 +145,12 @@ class StrategyFactory:
         return SyncExtractionStrategyWrapper(strategy)
     
     @classmethod
-    def create_composite_sync(cls, strategies: List[Dict[str, Any]]) -> ExtractionStrategy:
+    def create_composite_sync(cls, strategies: List[Dict[str, Any]], **options) -> ExtractionStrategy:
         """Create a synchronized composite strategy from a list of strategy configurations.
         
         Args:
             strategies: List of strategy configurations
+            **options: Execution options passed to CompositeExtractionStrategy
             
         Returns:
             Synchronized composite strategy instance
@@ -135,7 +158,7 @@ class StrategyFactory:
         Raises:
             ValueError: If any of the strategies are invalid or not registered
         """
-        strategy = cls.create_composite(strategies)
+        strategy = cls.create_composite(strategies, **options)
         return SyncExtractionStrategyWrapper(strategy)
     
     @classmethod
@@ -176,11 +199,13 @@ class StrategyFactory:
             raise ValueError(f"Invalid JSON configuration: {str(e)}")
     
     @classmethod
-    def create_composite(cls, strategies: List[Dict[str, Any]]) -> 'CompositeExtractionStrategy':
+    def create_composite(cls, strategies: List[Dict[str, Any]], **options) -> 'CompositeExtractionStrategy':
         """Create a composite strategy from a list of strategy configurations.
         
         Args:
             strategies: List of strategy configurations
+            **options: Execution options passed to CompositeExtractionStrategy
+                (execution_mode, child_timeout, deadline, min_successes)
             
         Returns:
             Composite strategy instance
@@ -195,28 +220,64 @@ class StrategyFactory:
             strategy_instances.append(strategy_instance)
         
         # Create the composite strategy
-        return CompositeExtractionStrategy(strategy_instances)
+        return CompositeExtractionStrategy(strategy_instances, **options)
 
 class CompositeExtractionStrategy(ExtractionStrategy):
     """Composite extraction strategy that combines multiple strategies.
     
-    This strategy applies multiple extraction strategies in sequence and
-    combines their results.
+    By default the child strategies are independent and run concurrently.
+    Each child can be bounded by a timeout, the whole extraction by a
+    deadline, and the extraction can return early once enough children have
+    succeeded. Results are always combined in the order the strategies were
+    given, regardless of which finished first.
+    
+    Use ``execution_mode="sequential"`` when children must run one after
+    another (for example when they share rate-limited resources).
     """
     
-    def __init__(self, strategies: List[ExtractionStrategy]):
+    EXECUTION_MODES = ("concurrent", "sequential")
+    
+    def __init__(
+        self,
+        strategies: List[ExtractionStrategy],
+        merge_mode: str = "smart",
+        execution_mode: str = "concurrent",
+        child_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        min_successes: Optional[int] = None
+    ):
         """Initialize the composite strategy.
         
         Args:
             strategies: List of extraction strategies to apply
+            merge_mode: How subclasses merge results from multiple strategies
+            execution_mode: "concurrent" to run all children at once or
+                "sequential" to run them one at a time
+            child_timeout: Maximum seconds a single child may run; None for no limit
+            deadline: Maximum seconds for the whole extraction; children still
+                running when it passes are cancelled and their results dropped
+            min_successes: Return as soon as this many children have succeeded,
+                cancelling the rest; None waits for every child
+            
+        Raises:
+            ValueError: If the execution mode is unknown
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
+        
         self.strategies = strategies
-        logger.info(f"Created composite strategy with {len(strategies)} strategies")
+        self.merge_mode = merge_mode
+        self.execution_mode = execution_mode
+        self.child_timeout = child_timeout
+        self.deadline = deadline
+        self.min_successes = min_successes
+        logger.info(f"Created composite strategy with {len(strategies)} strategies ({execution_mode})")
     
     async def extract(self, url: str, content: str, **kwargs) -> Dict[str, Any]:
         """Extract information from content using multiple strategies.
         
-        This method applies each strategy in sequence and combines their results.
+        This method applies every strategy according to the execution mode and
+        combines their results in strategy order.
         
         Args:
             url: The URL of the content
@@ -228,23 +289,182 @@ class CompositeExtractionStrategy(ExtractionStrategy):
         """
         logger.info(f"Starting composite extraction for URL: {url}")
         
-        # Apply each strategy in sequence
-        results = []
-        for i, strategy in enumerate(self.strategies):
-            try:
-                logger.info(f"Applying strategy {i+1}/{len(self.strategies)}: {strategy.__class__.__name__}")
-                result = await strategy.extract(url, content, **kwargs)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Strategy {i+1}/{len(self.strategies)} failed: {str(e)}")
-                # Continue with other strategies even if one fails
+        outcomes = await self._run_strategies(self.strategies, url, content, **kwargs)
+        results = [outcome["result"] for outcome in outcomes if outcome["status"] == "success"]
         
         # Combine the results
         combined_result = self._combine_results(results)
+        if combined_result:
+            combined_result["_metadata"]["execution"] = self._summarize_outcomes(outcomes)
         
         logger.info(f"Completed composite extraction for URL: {url}")
         return combined_result
     
+    async def _run_strategies(
+        self,
+        strategies: List[ExtractionStrategy],
+        url: str,
+        content: str,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Run child strategies according to the execution options.
+        
+        Args:
+            strategies: The strategies to run
+            url: The URL of the content
+            content: The content to extract information from
+            **kwargs: Additional extraction parameters
+            
+        Returns:
+            One outcome per strategy, in strategy order. Each outcome has the
+            strategy name, a status ("success", "error", "timeout" or
+            "cancelled"), the result (None unless successful), the error
+            message and the elapsed time in seconds.
+        """
+        outcomes = [
+            {"strategy": strategy.__class__.__name__, "status": "cancelled",
+             "result": None, "error": None, "elapsed": 0.0}
+            for strategy in strategies
+        ]
+        if not strategies:
+            return outcomes
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline_at = started + self.deadline if self.deadline is not None else None
+        
+        def remaining() -> Optional[float]:
+            return None if deadline_at is None else deadline_at - loop.time()
+        
+        def enough() -> bool:
+            if self.min_successes is None:
+                return False
+            successes = sum(1 for outcome in outcomes if outcome["status"] == "success")
+            return successes >= self.min_successes
+        
+        if self.execution_mode == "sequential":
+            for i, strategy in enumerate(strategies):
+                time_left = remaining()
+                if (time_left is not None and time_left <= 0) or enough():
+                    break
+                logger.info(f"Applying strategy {i+1}/{len(strategies)}: {strategy.__class__.__name__}")
+                outcomes[i] = await self._run_child(strategy, url, content, time_left, **kwargs)
+            return outcomes
+        
+        tasks = {
+            asyncio.create_task(self._run_child(strategy, url, content, None, **kwargs)): i
+            for i, strategy in enumerate(strategies)
+        }
+        pending = set(tasks)
+        try:
+            while pending and not enough():
+                time_left = remaining()
+                if time_left is not None and time_left <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=time_left, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    i = tasks[task]
+                    try:
+                        outcomes[i] = task.result()
+                    except Exception as e:
+                        # A failure outside the strategy only fails that strategy
+                        name = strategies[i].__class__.__name__
+                        logger.error(f"Strategy {name} failed: {str(e)}")
+                        outcomes[i] = {"strategy": name, "status": "error", "result": None,
+                                       "error": str(e), "elapsed": loop.time() - started}
+        finally:
+            # Cancel stragglers after a deadline, an early return or our own cancellation
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if pending:
+            logger.info(f"Cancelled {len(pending)}/{len(strategies)} strategies for URL: {url}")
+        return outcomes
+    
+    async def _run_child(
+        self,
+        strategy: ExtractionStrategy,
+        url: str,
+        content: str,
+        time_left: Optional[float],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Run one child strategy, capturing its outcome instead of raising.
+        
+        Args:
+            strategy: The strategy to run
+            url: The URL of the content
+            content: The content to extract information from
+            time_left: Seconds left before the overall deadline, if any
+            **kwargs: Additional extraction parameters
+            
+        Returns:
+            The outcome dictionary described in ``_run_strategies``
+        """
+        name = strategy.__class__.__name__
+        limits = [limit for limit in (self.child_timeout, time_left) if limit is not None]
+        timeout = min(limits) if limits else None
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        outcome = {"strategy": name, "status": "success", "result": None, "error": None}
+        try:
+            outcome["result"] = await asyncio.wait_for(strategy.extract(url, content, **kwargs), timeout)
+        except asyncio.TimeoutError:
+            # Strategies can raise TimeoutError themselves when no limit is set
+            message = "Timed out" if timeout is None else f"Timed out after {timeout:.1f}s"
+            logger.error(f"Strategy {name}: {message}")
+            outcome.update(status="timeout", error=message)
+        except Exception as e:
+            logger.error(f"Strategy {name} failed: {str(e)}")
+            outcome.update(status="error", error=str(e))
+        outcome["elapsed"] = loop.time() - started
+        return outcome
+    
+    @staticmethod
+    def _merge_unique(first: List[Any], second: List[Any]) -> List[Any]:
+        """Concatenate two lists, dropping duplicates but keeping first-seen order.
+        
+        Args:
+            first: Items from earlier strategies
+            second: Items from a later strategy
+            
+        Returns:
+            The merged list
+        """
+        merged = []
+        seen = set()
+        for item in first + second:
+            try:
+                if item in seen:
+                    continue
+                seen.add(item)
+            except TypeError:
+                # Unhashable items (e.g. dicts) fall back to equality checks
+                if item in merged:
+                    continue
+            merged.append(item)
+        return merged
+    
+    @staticmethod
+    def _summarize_outcomes(outcomes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Strip results from outcomes for inclusion in metadata.
+        
+        Args:
+            outcomes: Outcomes returned by ``_run_strategies``
+            
+        Returns:
+            Per-strategy status, error and elapsed time
+        """
+        return [
+            {key: value for key, value in outcome.items() if key != "result"}
+            for outcome in outcomes
+        ]
+    
     def _combine_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Combine multiple extraction results into a single result.
         
@@ -288,8 +508,8 @@ class CompositeExtractionStrategy(ExtractionStrategy):
                 if key not in combined or not combined[key]:
                     combined[key] = value
                 elif isinstance(value, list) and isinstance(combined[key], list):
-                    # Combine lists, avoiding duplicates
-                    combined[key] = list(set(combined[key] + value))
+                    # Combine lists, avoiding duplicates and keeping strategy order
+                    combined[key] = self._merge_unique(combined[key], value)
                 elif isinstance(value, dict) and isinstance(combined[key], dict):
                     # Recursively merge dictionaries
                     combined[key].update(value)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Keyed instance pool for extraction strategies.
+
+Several strategies build large schema and instruction blobs in ``__init__``.
+Creating one per URL repeats that work for every page. This module keeps
+constructed strategies in an LRU pool keyed on the strategy name and a frozen
+copy of its configuration, so repeated dispatch to the same strategy reuses
+one instance.
+
+Strategies are shared between concurrent extractions, so ``extract`` must not
+keep per-call state on the instance.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..env_settings import env_int
+from .base import ExtractionStrategy
+from .registry import StrategyRegistry
+
+logger = logging.getLogger('extraction_strategy_pool')
+
+
+def freeze_config(value: Any) -> Hashable:
+    """Convert a configuration value into a hashable, order-independent key.
+
+    Dictionaries become sorted item tuples, lists and tuples become tuples and
+    sets become frozensets. Unhashable objects are keyed on their identity.
+
+    Args:
+        value: The configuration value
+
+    Returns:
+        A hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(sorted(
+            ((str(k), freeze_config(v)) for k, v in value.items()), key=lambda item: item[0]
+        ))
+    if isinstance(value, (list, tuple)):
+        return ("__seq__",) + tuple(freeze_config(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return ("__set__", frozenset(freeze_config(v) for v in value))
+    if isinstance(value, bool):
+        # Keep True/False distinct from 1/0, which hash the same
+        return ("__bool__", value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return ("__id__", id(value))
+
+
+class StrategyInstancePool:
+    """Thread-safe LRU pool of extraction strategy instances.
+
+    Entries remember the strategy class they were built from. A lookup whose
+    registered class has changed (for example after a strategy file was edited
+    and re-registered) rebuilds the instance, and the pool is cleared
+    whenever ``StrategyRegistry`` reloads or unregisters strategies.
+    """
+
+    def __init__(self, max_size: int = 128):
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of instances kept
+        """
+        self.max_size = max_size
+        self._instances: "OrderedDict[Tuple[str, Hashable], Tuple[type, ExtractionStrategy]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        StrategyRegistry.add_invalidation_listener(self.invalidate)
+
+    def get(self, strategy_name: str, config: Optional[Dict[str, Any]] = None,
+            create: Optional[Callable[[str, Dict[str, Any]], ExtractionStrategy]] = None) -> ExtractionStrategy:
+        """Get a pooled strategy instance, creating it on first use.
+
+        Args:
+            strategy_name: Name of the registered strategy
+            config: Configuration passed to the strategy constructor
+            create: Constructor called as ``create(strategy_name, config)``;
+                defaults to ``StrategyFactory.create``
+
+        Returns:
+            Strategy instance
+
+        Raises:
+            ValueError: If the strategy is not registered or cannot be created
+        """
+        config = config or {}
+        if create is None:
+            from .factory import StrategyFactory
+            create = StrategyFactory.create
+
+        strategy_class = StrategyRegistry.get(strategy_name)
+
+        key = (strategy_name, freeze_config(config))
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None and entry[0] is strategy_class:
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Build outside the lock; constructors can be slow
+        instance = create(strategy_name, config)
+
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None and entry[0] is strategy_class:
+                # Another caller built the same strategy first; share theirs
+                return entry[1]
+            self._instances[key] = (strategy_class, instance)
+            self._instances.move_to_end(key)
+            while len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+                self.evictions += 1
+        return instance
+
+    def invalidate(self, strategy_name: Optional[str] = None) -> None:
+        """Drop pooled instances.
+
+        Args:
+            strategy_name: Only drop instances of this strategy; None drops all
+        """
+        with self._lock:
+            if strategy_name is None:
+                self._instances.clear()
+            else:
+                for key in [key for key in self._instances if key[0] == strategy_name]:
+                    del self._instances[key]
+        logger.debug(f"Invalidated pooled strategies: {strategy_name or 'all'}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with size and hit/miss/eviction counters
+        """
+        return {
+            "size": len(self._instances),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Global strategy pool instance
+default_strategy_pool = StrategyInstancePool(
+    max_size=env_int("CRAWL4AI_STRATEGY_POOL_SIZE", 128)
+)
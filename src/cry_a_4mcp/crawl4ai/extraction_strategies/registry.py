@@ -9,6 +9,7 @@ themselves, enabling dynamic discovery and management of available strategies.
 import logging
 import importlib
 import os
+import weakref
 from pathlib import Path
 from typing import Dict, Type, List, Any, Optional, Callable, Union
 import inspect
@@ -37,6 +38,38 @@ class StrategyRegistry:
     
     _strategies: Dict[str, Type[ExtractionStrategy]] = {}
     _metadata: Dict[str, Dict[str, Any]] = {}
+    _invalidation_listeners: List[Callable[[], Optional[Callable[[Optional[str]], None]]]] = []
+    
+    @classmethod
+    def add_invalidation_listener(cls, callback: Callable[[Optional[str]], None]) -> None:
+        """Register a callback run when registered strategy classes change.
+        
+        The callback receives the affected strategy name, or None when every
+        strategy was reloaded. Bound methods are held weakly so listeners do not
+        keep their owners alive.
+        
+        Args:
+            callback: Function or bound method to call
+        """
+        if inspect.ismethod(callback):
+            cls._invalidation_listeners.append(weakref.WeakMethod(callback))
+        else:
+            cls._invalidation_listeners.append(lambda: callback)
+    
+    @classmethod
+    def _notify_invalidation(cls, name: Optional[str] = None) -> None:
+        """Run invalidation listeners, dropping ones whose owner is gone."""
+        alive = []
+        for ref in cls._invalidation_listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback(name)
+            except Exception as e:
+                logger.error(f"Strategy invalidation listener failed: {e}")
+        cls._invalidation_listeners = alive
     
     @classmethod
     def register(cls, name: str = None, description: str = None, 
@@ -65,7 +98,10 @@ class StrategyRegistry:
             strategy_name = name or strategy_class.__name__
             
             # Register the strategy class
+            replaced = cls._strategies.get(strategy_name)
             cls._strategies[strategy_name] = strategy_class
+            if replaced is not None and replaced is not strategy_class:
+                cls._notify_invalidation(strategy_name)
             
             # Extract init parameters for configuration schema if not provided
             derived_config_schema = config_schema
@@ -230,6 +266,7 @@ class StrategyRegistry:
             if name in cls._metadata:
                 del cls._metadata[name]
             logger.info(f"Unregistered extraction strategy: {name}")
+            cls._notify_invalidation(name)
             return True
         return False
 
@@ -390,6 +427,9 @@ class StrategyRegistry:
         cls._strategies = {}
         cls._metadata = {}
         
+        # Drop cached strategy instances built from the old classes
+        cls._notify_invalidation(None)
+        
         logger.info("Reloading all strategies...")
         
         try:
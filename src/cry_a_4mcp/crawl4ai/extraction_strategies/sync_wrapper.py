@@ -12,6 +12,7 @@ from typing import Dict, Any, Optional, List, Union
 from functools import wraps
 
 from .base import ExtractionStrategy
+from ..http_session import close_sessions
 
 # Configure logging
 logging.basicConfig(
@@ -46,10 +47,12 @@ def sync_extract(strategy: ExtractionStrategy, url: str, content: str, **kwargs)
         asyncio.set_event_loop(loop)
         
         # Run the extract method in the event loop
-        result = loop.run_until_complete(strategy.extract(url, content, **kwargs))
-        
-        # Close the event loop
-        loop.close()
+        try:
+            result = loop.run_until_complete(strategy.extract(url, content, **kwargs))
+        finally:
+            # Release pooled HTTP sessions bound to this loop, then close it
+            loop.run_until_complete(close_sessions())
+            loop.close()
         
         return result
     except Exception as e:
@@ -101,10 +104,12 @@ class SyncExtractionStrategyWrapper:
             asyncio.set_event_loop(loop)
             
             # Run the validate_provider_connection method in the event loop
-            result = loop.run_until_complete(self.strategy.validate_provider_connection())
-            
-            # Close the event loop
-            loop.close()
+            try:
+                result = loop.run_until_complete(self.strategy.validate_provider_connection())
+            finally:
+                # Release pooled HTTP sessions bound to this loop, then close it
+                loop.run_until_complete(close_sessions())
+                loop.close()
             
             return result
         except Exception as e:
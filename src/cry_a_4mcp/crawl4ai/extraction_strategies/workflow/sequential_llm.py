@@ -3,6 +3,10 @@
 This module provides a workflow extraction strategy that processes content
 through a sequence of extraction steps, where each step can use the results
 of previous steps to improve extraction quality.
+
+Steps may declare which earlier steps they depend on. The workflow is then
+scheduled as a dependency graph: steps whose inputs are ready run in parallel,
+and each step only waits for the steps it actually consumes.
 """
 
 import logging
@@ -28,9 +32,17 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
     This strategy processes content through a sequence of extraction steps,
     where each step can use the results of previous steps to improve extraction quality.
     
+    Without explicit dependencies each step depends on every earlier step (or
+    on none when ``pass_results`` is False), which reproduces a plain
+    sequence. With ``dependencies`` a step only waits for, and only receives
+    ``previous_results`` from, the steps it names. Results are always merged
+    in step order, so the output does not depend on completion order.
+    
     Attributes:
         strategies (List[ExtractionStrategy]): Ordered list of extraction strategies to apply.
         pass_results (bool): Whether to pass results from previous steps to subsequent steps.
+        step_names (List[str]): Strategy name of each step.
+        step_dependencies (List[List[int]]): Indices of the steps each step depends on.
     """
     
     def __init__(
@@ -42,6 +54,7 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: float = 60.0,
+        dependencies: Optional[Dict[str, List[str]]] = None,
         **kwargs
     ):
         """Initialize the SequentialLLMExtractionStrategy.
@@ -54,7 +67,14 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
             max_retries: Maximum number of retries for API calls.
             retry_delay: Delay between retries in seconds.
             timeout: Timeout for API calls in seconds.
+            dependencies: Mapping from a step's strategy name to the names of
+                earlier steps whose results it consumes. Steps not listed keep
+                the default of depending on every earlier step.
             **kwargs: Additional keyword arguments.
+            
+        Raises:
+            ValueError: If no strategy could be initialized or a dependency
+                does not name an earlier step
         """
         # Define default strategies if none provided
         default_strategies = [
@@ -68,6 +88,7 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
         # Initialize strategy instances using the factory
         factory = StrategyFactory()
         strategy_instances = []
+        step_names = []
         
         for strategy_name in strategy_names:
             try:
@@ -81,6 +102,7 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
                     **kwargs
                 )
                 strategy_instances.append(strategy)
+                step_names.append(strategy_name)
             except Exception as e:
                 logger.warning(f"Failed to initialize strategy {strategy_name}: {e}")
         
@@ -91,12 +113,51 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
         super().__init__(strategies=strategy_instances)
         
         self.pass_results = pass_results
+        self.step_names = step_names
+        self.step_dependencies = self._resolve_dependencies(step_names, dependencies or {})
+    
+    def _resolve_dependencies(self, step_names: List[str], dependencies: Dict[str, List[str]]) -> List[List[int]]:
+        """Resolve dependency names into indices of earlier steps.
+        
+        A dependency name refers to the closest earlier step with that strategy
+        name. Dependencies on steps that failed to initialize are dropped.
+        
+        Args:
+            step_names: Strategy name of each initialized step.
+            dependencies: Mapping from step name to the names it depends on.
+            
+        Returns:
+            For each step, the sorted indices of the steps it depends on.
+            
+        Raises:
+            ValueError: If a dependency does not name an earlier step.
+        """
+        resolved = []
+        for index, name in enumerate(step_names):
+            if name not in dependencies:
+                # Default: a plain sequence when results are passed, otherwise independent
+                resolved.append(list(range(index)) if self.pass_results else [])
+                continue
+            
+            step_deps = set()
+            for dependency in dependencies[name]:
+                earlier = [i for i in range(index) if step_names[i] == dependency]
+                if earlier:
+                    step_deps.add(earlier[-1])
+                elif dependency in step_names:
+                    raise ValueError(f"Step {name} cannot depend on later step {dependency}")
+                else:
+                    logger.warning(f"Ignoring dependency of {name} on unavailable step {dependency}")
+            resolved.append(sorted(step_deps))
+        return resolved
     
     async def extract(self, url: str, content: str, **kwargs) -> Dict[str, Any]:
         """Extract structured information from content using sequential strategies.
         
-        This method applies each strategy in sequence, optionally passing results
-        from previous steps to subsequent steps.
+        This method schedules the steps by their dependencies, running steps
+        whose inputs are ready in parallel and optionally passing the results
+        of a step's dependencies to it. The per-step schedule and the critical
+        path are reported in ``_metadata``.
         
         Args:
             url: The URL of the content.
@@ -111,33 +172,37 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
         """
         logger.info(f"Starting sequential extraction for URL: {url}")
         
-        # Apply each strategy in sequence
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        
+        # Steps only depend on earlier steps, so creating tasks in order means
+        # every dependency already has a task to wait on
+        tasks: List[asyncio.Task] = []
+        for i in range(len(self.strategies)):
+            dependency_tasks = [tasks[j] for j in self.step_dependencies[i]]
+            tasks.append(asyncio.create_task(
+                self._run_step(i, dependency_tasks, url, content, started_at, **kwargs)
+            ))
+        
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # Merge in step order so conflicts resolve as they would sequentially
         combined_result = {}
         errors = []
-        
-        for i, strategy in enumerate(self.strategies):
-            try:
-                logger.info(f"Applying strategy {i+1}/{len(self.strategies)}: {strategy.__class__.__name__}")
-                
-                # Pass combined results to subsequent strategies if enabled
-                if self.pass_results and combined_result and i > 0:
-                    # Create a copy of kwargs and add previous results
-                    step_kwargs = kwargs.copy()
-                    step_kwargs["previous_results"] = combined_result
-                    result = await strategy.extract(url, content, **step_kwargs)
-                else:
-                    result = await strategy.extract(url, content, **kwargs)
-                
-                # Merge the result with the combined result
-                combined_result = self._merge_step_result(combined_result, result, i)
-                
-            except Exception as e:
-                logger.error(f"Strategy {i+1}/{len(self.strategies)} failed: {str(e)}")
+        for i, outcome in enumerate(outcomes):
+            if outcome["status"] == "success":
+                combined_result = self._merge_step_result(combined_result, outcome["result"], i)
+            else:
                 errors.append({
-                    "strategy": strategy.__class__.__name__,
-                    "error": str(e)
+                    "strategy": outcome["strategy"],
+                    "error": outcome["error"]
                 })
-                # Continue with other strategies even if one fails
+        
+        critical_path = self._critical_path(outcomes)
         
         # Add metadata about the extraction process
         if "_metadata" not in combined_result:
@@ -149,12 +214,94 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
             "extraction_timestamp": datetime.utcnow().isoformat(),
             "source_url": url,
             "strategies_used": [strategy.__class__.__name__ for strategy in self.strategies],
-            "errors": errors
+            "errors": errors,
+            "schedule": [
+                {
+                    "step_index": i,
+                    "strategy": self.step_names[i],
+                    "depends_on": self.step_dependencies[i],
+                    "status": outcome["status"],
+                    "started": round(outcome["started"], 4),
+                    "finished": round(outcome["finished"], 4)
+                }
+                for i, outcome in enumerate(outcomes)
+            ],
+            "critical_path": [self.step_names[i] for i in critical_path],
+            "critical_path_seconds": round(outcomes[critical_path[-1]]["finished"], 4) if critical_path else 0.0
         })
         
         logger.info(f"Completed sequential extraction for URL: {url}")
         return combined_result
     
+    async def _run_step(
+        self,
+        step_index: int,
+        dependency_tasks: List[asyncio.Task],
+        url: str,
+        content: str,
+        started_at: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Wait for a step's dependencies, then run the step.
+        
+        Args:
+            step_index: The index of the step.
+            dependency_tasks: Tasks of the steps this step depends on.
+            url: The URL of the content.
+            content: The content to extract information from.
+            started_at: Loop time at which the workflow started.
+            **kwargs: Additional keyword arguments.
+            
+        Returns:
+            The step outcome from ``_run_child`` with ``started`` and
+            ``finished`` times relative to the workflow start.
+        """
+        if dependency_tasks:
+            await asyncio.wait(dependency_tasks)
+        
+        step_kwargs = kwargs
+        if self.pass_results and dependency_tasks:
+            # Previous results are the merged outputs of this step's own inputs
+            previous_results = {}
+            for j, task in zip(self.step_dependencies[step_index], dependency_tasks):
+                outcome = task.result()
+                if outcome["status"] == "success":
+                    previous_results = self._merge_step_result(previous_results, outcome["result"], j)
+            if previous_results:
+                step_kwargs = kwargs.copy()
+                step_kwargs["previous_results"] = previous_results
+        
+        strategy = self.strategies[step_index]
+        logger.info(f"Applying strategy {step_index+1}/{len(self.strategies)}: {strategy.__class__.__name__}")
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time() - started_at
+        outcome = await self._run_child(strategy, url, content, None, **step_kwargs)
+        outcome["started"] = started
+        outcome["finished"] = loop.time() - started_at
+        return outcome
+    
+    def _critical_path(self, outcomes: List[Dict[str, Any]]) -> List[int]:
+        """Find the chain of steps that determined the total latency.
+        
+        Starting from the step that finished last, each step is traced back to
+        the dependency that finished last, since that dependency gated its start.
+        
+        Args:
+            outcomes: Step outcomes with ``finished`` times.
+            
+        Returns:
+            Step indices on the critical path, in execution order.
+        """
+        if not outcomes:
+            return []
+        
+        path = [max(range(len(outcomes)), key=lambda i: outcomes[i]["finished"])]
+        while self.step_dependencies[path[-1]]:
+            path.append(max(self.step_dependencies[path[-1]], key=lambda i: outcomes[i]["finished"]))
+        path.reverse()
+        return path
+    
     def _merge_step_result(self, combined_result: Dict[str, Any], step_result: Dict[str, Any], step_index: int) -> Dict[str, Any]:
         """Merge the result of a step with the combined result.
         
@@ -172,8 +319,13 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
         if not combined_result:
             return step_result.copy()
         
-        # Create a copy of the combined result
+        # Create a copy of the combined result; metadata is copied too since
+        # step results are merged more than once (as inputs and into the output)
         merged = combined_result.copy()
+        if "_metadata" in merged:
+            merged["_metadata"] = dict(merged["_metadata"])
+            if "steps" in merged["_metadata"]:
+                merged["_metadata"]["steps"] = list(merged["_metadata"]["steps"])
         
         # Merge metadata
         if "_metadata" in step_result:
@@ -208,11 +360,11 @@ class SequentialLLMExtractionStrategy(CompositeExtractionStrategy):
             if key not in merged:
                 merged[key] = value
             elif isinstance(value, list) and isinstance(merged[key], list):
-                # Combine lists, avoiding duplicates
-                merged[key] = list(set(merged[key] + value))
+                # Combine lists, avoiding duplicates and keeping step order
+                merged[key] = self._merge_unique(merged[key], value)
             elif isinstance(value, dict) and isinstance(merged[key], dict):
-                # Recursively merge dictionaries
-                merged[key].update(value)
+                # Merge dictionaries without modifying the step's own result
+                merged[key] = {**merged[key], **value}
             else:
                 # For conflicts, prefer the result from the later step
                 merged[key] = value
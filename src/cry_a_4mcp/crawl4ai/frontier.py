@@ -0,0 +1,32 @@
+"""Crawl frontier with global and per-host politeness limits.
+
+The frontier is shared with the starter MCP server's crypto crawler. Its only
+implementation is starter-mcp-server/src/cry_a_4mcp/crypto_crawler/frontier.py,
+which depends on the standard library alone; this module loads that file so
+both crawlers run the same politeness rules.
+"""
+
+import importlib.util
+import os
+import sys
+
+_FRONTIER_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "..",
+    "starter-mcp-server", "src", "cry_a_4mcp", "crypto_crawler", "frontier.py",
+))
+_MODULE_NAME = "cry_a_4mcp_shared_frontier"
+
+_module = sys.modules.get(_MODULE_NAME)
+if _module is None:
+    _spec = importlib.util.spec_from_file_location(_MODULE_NAME, _FRONTIER_PATH)
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules[_MODULE_NAME] = _module
+    _spec.loader.exec_module(_module)
+
+PRIORITY_RANKS = _module.PRIORITY_RANKS
+priority_rank = _module.priority_rank
+host_of = _module.host_of
+FrontierResult = _module.FrontierResult
+CrawlFrontier = _module.CrawlFrontier
+
+__all__ = ["PRIORITY_RANKS", "priority_rank", "host_of", "FrontierResult", "CrawlFrontier"]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP session management for the cry_a_4mcp.crawl4ai package.
+
+This module provides a process-wide manager that hands out one shared
+``aiohttp.ClientSession`` per (event loop, base URL, pool settings) triple. Reusing the same
+session keeps TCP/TLS connections alive between LLM requests instead of paying
+for a new handshake on every extraction and every retry.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .env_settings import env_int
+
+logger = logging.getLogger(__name__)
+
+
+# Default connection pool settings, overridable through the environment
+DEFAULT_POOL_CONFIG = {
+    "limit": env_int("CRAWL4AI_HTTP_POOL_LIMIT", 100),
+    "limit_per_host": env_int("CRAWL4AI_HTTP_LIMIT_PER_HOST", 20),
+    "ttl_dns_cache": env_int("CRAWL4AI_HTTP_DNS_TTL", 300),
+    "keepalive_timeout": env_int("CRAWL4AI_HTTP_KEEPALIVE", 60),
+}
+
+
+def normalize_base_url(url: Optional[str]) -> str:
+    """Reduce a URL to the scheme and host used as the pool key.
+
+    Args:
+        url: A base URL or full endpoint URL
+
+    Returns:
+        The ``scheme://host[:port]`` origin of the URL
+    """
+    if not url:
+        return "default"
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url.rstrip("/")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class HTTPSessionManager:
+    """Manager for pooled, keep-alive ``aiohttp`` sessions.
+
+    Sessions are keyed on the running event loop, the origin of the base URL
+    and the effective pool settings, because an ``aiohttp.ClientSession``
+    cannot be shared across loops and its connector limits are fixed once it
+    is created. Each session owns a ``TCPConnector`` with DNS caching and
+    per-host connection limits.
+
+    Note that ``aiohttp`` speaks HTTP/1.1 only; multiplexing is approximated by
+    keeping a pool of persistent connections per host.
+    """
+
+    def __init__(self, **pool_config: Any):
+        """Initialize the session manager.
+
+        Args:
+            **pool_config: Overrides for ``DEFAULT_POOL_CONFIG`` (``limit``,
+                ``limit_per_host``, ``ttl_dns_cache``, ``keepalive_timeout``)
+        """
+        self.pool_config = {**DEFAULT_POOL_CONFIG, **pool_config}
+        self._sessions: Dict[Tuple[int, str, Tuple], aiohttp.ClientSession] = {}
+        self._loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        # Closes of sessions left behind by closed loops, kept alive until done
+        self._closing: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self.sessions_created = 0
+        self.sessions_reused = 0
+
+    def _create_session(self, config: Dict[str, Any]) -> aiohttp.ClientSession:
+        """Create a new pooled session with a connector for the given pool settings."""
+        connector = aiohttp.TCPConnector(
+            limit=config["limit"],
+            limit_per_host=config["limit_per_host"],
+            ttl_dns_cache=config["ttl_dns_cache"],
+            use_dns_cache=True,
+            keepalive_timeout=config["keepalive_timeout"],
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _prune_closed_loops(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close and forget sessions whose event loop has already been closed.
+
+        Their connectors hold no live transports once the loop is gone, so
+        closing them on the running loop performs no I/O; it releases the
+        session and avoids "Unclosed client session" warnings.
+
+        Args:
+            loop: The running event loop, used to schedule the closes
+        """
+        stale = [loop_id for loop_id, stale_loop in self._loops.items() if stale_loop.is_closed()]
+        for loop_id in stale:
+            del self._loops[loop_id]
+            for key in [key for key in self._sessions if key[0] == loop_id]:
+                session = self._sessions.pop(key)
+                if not session.closed:
+                    task = loop.create_task(session.close())
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+
+    def get_session(self, base_url: Optional[str] = None, **overrides: Any) -> aiohttp.ClientSession:
+        """Get the shared session for a base URL on the running event loop.
+
+        Must be called from within a coroutine.
+
+        Args:
+            base_url: Base URL (or full endpoint URL) of the API being called
+            **overrides: Pool settings for this call; calls with different
+                settings get separate sessions
+
+        Returns:
+            A pooled ``aiohttp.ClientSession``
+        """
+        loop = asyncio.get_running_loop()
+        config = {**self.pool_config, **overrides}
+        key = (id(loop), normalize_base_url(base_url), tuple(sorted(config.items())))
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and not session.closed and self._loops.get(key[0]) is loop:
+                self.sessions_reused += 1
+                return session
+
+            self._prune_closed_loops(loop)
+            session = self._create_session(config)
+            self._sessions[key] = session
+            self._loops[key[0]] = loop
+            self.sessions_created += 1
+
+        logger.debug(f"Created pooled HTTP session for {key[1]}")
+        return session
+
+    async def close_loop_sessions(self) -> None:
+        """Close every session bound to the running event loop.
+
+        Call this before closing an event loop that used pooled sessions.
+        """
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            keys = [key for key in self._sessions if key[0] == loop_id]
+            sessions = [self._sessions.pop(key) for key in keys]
+            self._loops.pop(loop_id, None)
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    async def close_all(self) -> None:
+        """Close sessions on the running loop and forget all others."""
+        await self.close_loop_sessions()
+        with self._lock:
+            self._sessions.clear()
+            self._loops.clear()
+
+    def _close_at_exit(self) -> None:
+        """Best-effort synchronous shutdown hook registered with ``atexit``."""
+        with self._lock:
+            items = list(self._sessions.items())
+            self._sessions.clear()
+            loops = dict(self._loops)
+            self._loops.clear()
+
+        for key, session in items:
+            loop = loops.get(key[0])
+            if session.closed or loop is None or loop.is_closed() or loop.is_running():
+                continue
+            try:
+                loop.run_until_complete(session.close())
+            except Exception as e:
+                logger.debug(f"Failed to close HTTP session at exit: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about pooled sessions.
+
+        Returns:
+            Dictionary with open session count and reuse counters
+        """
+        with self._lock:
+            open_sessions = sum(1 for session in self._sessions.values() if not session.closed)
+        return {
+            "open_sessions": open_sessions,
+            "sessions_created": self.sessions_created,
+            "sessions_reused": self.sessions_reused,
+            "pool_config": dict(self.pool_config),
+        }
+
+
+# Global session manager instance
+default_session_manager = HTTPSessionManager()
+atexit.register(default_session_manager._close_at_exit)
+
+
+def get_session(base_url: Optional[str] = None, **overrides: Any) -> aiohttp.ClientSession:
+    """Get a pooled session from the default session manager.
+
+    Args:
+        base_url: Base URL (or full endpoint URL) of the API being called
+        **overrides: Pool settings for this call; calls with different
+            settings get separate sessions
+
+    Returns:
+        A pooled ``aiohttp.ClientSession``
+    """
+    return default_session_manager.get_session(base_url, **overrides)
+
+
+async def close_sessions() -> None:
+    """Close the default manager's sessions on the running event loop."""
+    await default_session_manager.close_loop_sessions()
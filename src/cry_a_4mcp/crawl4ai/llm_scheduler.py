@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Central request scheduler for LLM API calls in the cry_a_4mcp.crawl4ai package.
+
+Every ``LLMExtractionStrategy`` request acquires a slot from the process-wide
+scheduler before it is sent. Requests are grouped into lanes per provider and
+model, and each lane enforces:
+
+- token buckets for requests per minute and tokens per minute,
+- a cap on requests in flight,
+- a pause after the provider answers with ``Retry-After``,
+- an optional cost budget in USD, estimated from reported token usage.
+
+Waiting requests are served in priority order, so interactive calls made inside
+``llm_priority("interactive")`` overtake queued batch work. Queue depth per
+lane and priority is published through the metrics registry.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from .env_settings import env_float, env_int
+from .metrics import default_metrics_registry, estimate_cost
+
+logger = logging.getLogger(__name__)
+
+
+# Named priorities; lower values are served first
+PRIORITIES = {
+    "interactive": 0,
+    "default": 5,
+    "batch": 10,
+}
+
+# Default lane limits, overridable through the environment. Zero disables a limit.
+DEFAULT_LIMITS = {
+    "requests_per_minute": env_int("CRAWL4AI_LLM_RPM", 0),
+    "tokens_per_minute": env_int("CRAWL4AI_LLM_TPM", 0),
+    "max_concurrent": env_int("CRAWL4AI_LLM_MAX_CONCURRENT", 16),
+    "max_cost": env_float("CRAWL4AI_LLM_COST_BUDGET", 0.0),
+}
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "crawl4ai_llm_priority", default=PRIORITIES["default"]
+)
+
+
+class LLMBudgetExceededError(RuntimeError):
+    """Raised when a lane has spent its cost budget."""
+
+    def __init__(self, provider: str, model: str, spent: float, budget: float):
+        self.provider = provider
+        self.model = model
+        self.spent = spent
+        self.budget = budget
+        super().__init__(f"Cost budget of ${budget:.2f} for {provider}/{model} exhausted (spent ${spent:.2f})")
+
+
+def resolve_priority(priority: Union[int, str, None]) -> int:
+    """Convert a priority name or number into a numeric priority.
+
+    Args:
+        priority: A name from ``PRIORITIES``, a number, or None for the
+            priority of the current context
+
+    Returns:
+        Numeric priority (lower is served first)
+
+    Raises:
+        ValueError: If the priority name is unknown
+    """
+    if priority is None:
+        return _current_priority.get()
+    if isinstance(priority, str):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        return PRIORITIES[priority]
+    return int(priority)
+
+
+@contextmanager
+def llm_priority(priority: Union[int, str]) -> Iterator[None]:
+    """Run LLM requests made in this context (and tasks it creates) at a priority.
+
+    Args:
+        priority: A name from ``PRIORITIES`` or a number
+    """
+    token = _current_priority.set(resolve_priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid Retry-After header: {value!r}")
+        return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    The bucket holds at most one minute's worth of tokens. Requests larger than
+    the capacity are clamped to it so they can still be served.
+    """
+
+    def __init__(self, per_minute: float, clock=time.monotonic):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate and capacity
+            clock: Monotonic time source
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Take tokens; the balance may go negative to record overspending."""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        """Return tokens that were reserved but not used."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _Lane:
+    """Queue and limits for one provider/model pair."""
+
+    def __init__(self, provider: str, model: str, limits: Dict[str, Any], clock):
+        self.provider = provider
+        self.model = model
+        self.clock = clock
+        self.set_limits(limits)
+        self.queue: List[List[Any]] = []
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.spent = 0.0
+        self.granted = 0
+        self.rate_limited = 0
+
+    def set_limits(self, limits: Dict[str, Any]) -> None:
+        """Apply limits, starting with full buckets."""
+        self.limits = limits
+        self.requests = TokenBucket(limits["requests_per_minute"], self.clock) if limits["requests_per_minute"] else None
+        self.tokens = TokenBucket(limits["tokens_per_minute"], self.clock) if limits["tokens_per_minute"] else None
+
+    def ready_in(self, tokens: int) -> Optional[float]:
+        """Seconds until a request can start, or None if blocked on concurrency."""
+        if self.in_flight >= self.limits["max_concurrent"] > 0:
+            return None
+        delay = max(0.0, self.paused_until - self.clock())
+        if self.requests is not None:
+            delay = max(delay, self.requests.delay_for(1))
+        if self.tokens is not None and tokens:
+            delay = max(delay, self.tokens.delay_for(tokens))
+        return delay
+
+    def head(self) -> Optional[List[Any]]:
+        """Highest-priority live waiter."""
+        while self.queue and self.queue[0][4]:
+            heapq.heappop(self.queue)
+        return self.queue[0] if self.queue else None
+
+
+class LLMRequestSlot:
+    """Handle for a scheduled request, used to report its outcome."""
+
+    def __init__(self, scheduler: "LLMScheduler", lane: _Lane, reserved_tokens: int):
+        self._scheduler = scheduler
+        self._lane = lane
+        self.reserved_tokens = reserved_tokens
+        self.usage: Optional[Dict[str, Any]] = None
+
+    def report_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """Record the token usage returned by the provider.
+
+        The difference between reserved and used tokens is settled with the
+        tokens-per-minute bucket, and the estimated cost is charged to the
+        lane's budget.
+
+        Args:
+            usage: The ``usage`` object of the API response
+        """
+        if not usage:
+            return
+        self.usage = usage
+        prompt_tokens = usage.get("prompt_tokens", 0) or 0
+        completion_tokens = usage.get("completion_tokens", 0) or 0
+        used = usage.get("total_tokens") or prompt_tokens + completion_tokens
+        with self._scheduler._lock:
+            if self._lane.tokens is not None:
+                if used < self.reserved_tokens:
+                    self._lane.tokens.refund(self.reserved_tokens - used)
+                elif used > self.reserved_tokens:
+                    self._lane.tokens.consume(used - self.reserved_tokens)
+            self._lane.spent += estimate_cost(self._lane.provider, self._lane.model, prompt_tokens, completion_tokens)
+        self.reserved_tokens = used
+
+    def retry_after(self, seconds: Optional[float]) -> None:
+        """Pause the lane after a rate-limit response.
+
+        Args:
+            seconds: Delay requested by the provider; None uses a one second pause
+        """
+        self._scheduler.pause(self._lane.provider, self._lane.model, 1.0 if seconds is None else seconds)
+
+
+class LLMScheduler:
+    """Priority scheduler enforcing per-provider/model rate limits.
+
+    Lanes are created on first use with the default limits, or with limits set
+    through ``configure`` for the provider or the provider/model pair.
+    Waiters may live on different event loops; wake-ups are delivered with
+    ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, clock=time.monotonic, **default_limits: Any):
+        """Initialize the scheduler.
+
+        Args:
+            clock: Monotonic time source
+            **default_limits: Overrides for ``DEFAULT_LIMITS``
+                (``requests_per_minute``, ``tokens_per_minute``,
+                ``max_concurrent``, ``max_cost``)
+        """
+        self.default_limits = {**DEFAULT_LIMITS, **default_limits}
+        self._limits: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._lanes: Dict[Tuple[str, str], _Lane] = {}
+        self._lock = threading.RLock()
+        self._counter = itertools.count()
+        self._clock = clock
+
+    def configure(self, provider: str, model: Optional[str] = None, **limits: Any) -> None:
+        """Set limits for a provider, or for one model of a provider.
+
+        Existing lanes pick up the new limits; their buckets start full.
+
+        Args:
+            provider: Provider name (e.g., "openrouter")
+            model: Model name, or None for every model of the provider
+            **limits: Limit overrides, see ``DEFAULT_LIMITS``
+
+        Raises:
+            ValueError: If a limit name is unknown
+        """
+        unknown = set(limits) - set(DEFAULT_LIMITS)
+        if unknown:
+            raise ValueError(f"Unknown scheduler limits: {sorted(unknown)}")
+        with self._lock:
+            self._limits[(provider.lower(), model)] = limits
+            for (lane_provider, lane_model), lane in self._lanes.items():
+                if lane_provider == provider.lower() and model in (None, lane_model):
+                    lane.set_limits(self._limits_for(lane_provider, lane_model))
+                    self._wake_head(lane)
+
+    def _limits_for(self, provider: str, model: str) -> Dict[str, Any]:
+        return {
+            **self.default_limits,
+            **self._limits.get((provider, None), {}),
+            **self._limits.get((provider, model), {}),
+        }
+
+    def _lane(self, provider: str, model: str) -> _Lane:
+        key = (provider.lower(), model)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(key[0], model, self._limits_for(*key), self._clock)
+        return lane
+
+    @asynccontextmanager
+    async def slot(self, provider: str, model: str, estimated_tokens: int = 0,
+                   priority: Union[int, str, None] = None) -> AsyncIterator[LLMRequestSlot]:
+        """Wait for permission to send a request and hold it while in flight.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            estimated_tokens: Expected prompt plus completion tokens, reserved
+                from the tokens-per-minute bucket until usage is reported
+            priority: Request priority; None uses the current ``llm_priority``
+
+        Yields:
+            A slot for reporting usage and rate-limit responses
+
+        Raises:
+            LLMBudgetExceededError: If the lane's cost budget is spent
+        """
+        lane = await self.acquire(provider, model, estimated_tokens, priority)
+        request_slot = LLMRequestSlot(self, lane, estimated_tokens)
+        try:
+            yield request_slot
+        finally:
+            self._release(lane)
+
+    async def acquire(self, provider: str, model: str, estimated_tokens: int = 0,
+                      priority: Union[int, str, None] = None) -> _Lane:
+        """Wait for a request slot. Prefer ``slot``, which releases it again."""
+        priority = resolve_priority(priority)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lane = self._lane(provider, model)
+            self._check_budget(lane)
+            # [priority, sequence, tokens, wake-up future, cancelled]
+            entry = [priority, next(self._counter), estimated_tokens, None, False]
+            heapq.heappush(lane.queue, entry)
+            self._publish_depth(lane, priority)
+
+        try:
+            while True:
+                with self._lock:
+                    self._check_budget(lane)
+                    delay = lane.ready_in(estimated_tokens) if lane.head() is entry else None
+                    if delay is not None and delay <= 0:
+                        heapq.heappop(lane.queue)
+                        entry[4] = True
+                        lane.in_flight += 1
+                        lane.granted += 1
+                        if lane.requests is not None:
+                            lane.requests.consume(1)
+                        if lane.tokens is not None and estimated_tokens:
+                            lane.tokens.consume(estimated_tokens)
+                        self._publish_depth(lane, priority)
+                        self._wake_head(lane)
+                        return lane
+                    entry[3] = loop.create_future()
+                    wake = entry[3]
+                await asyncio.wait({wake}, timeout=delay)
+        except BaseException:
+            with self._lock:
+                if not entry[4]:
+                    entry[4] = True
+                    self._publish_depth(lane, priority)
+                    self._wake_head(lane)
+            raise
+
+    def _release(self, lane: _Lane) -> None:
+        with self._lock:
+            lane.in_flight -= 1
+            self._wake_head(lane)
+
+    def _check_budget(self, lane: _Lane) -> None:
+        budget = lane.limits["max_cost"]
+        if budget and lane.spent >= budget:
+            raise LLMBudgetExceededError(lane.provider, lane.model, lane.spent, budget)
+
+    def _wake_head(self, lane: _Lane) -> None:
+        head = lane.head()
+        if head is None or head[3] is None or head[3].done():
+            return
+        wake = head[3]
+        wake.get_loop().call_soon_threadsafe(lambda: wake.done() or wake.set_result(None))
+
+    def _publish_depth(self, lane: _Lane, priority: int) -> None:
+        depth = sum(1 for entry in lane.queue if entry[0] == priority and not entry[4])
+        default_metrics_registry.set_llm_queue_depth(lane.provider, lane.model, priority, depth)
+
+    def pause(self, provider: str, model: str, seconds: float) -> None:
+        """Stop starting requests on a lane for a while, e.g. after HTTP 429.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            seconds: Pause length
+        """
+        with self._lock:
+            lane = self._lane(provider, model)
+            lane.paused_until = max(lane.paused_until, self._clock() + seconds)
+            lane.rate_limited += 1
+        default_metrics_registry.track_llm_rate_limited(lane.provider, model)
+        logger.warning(f"Pausing {provider}/{model} requests for {seconds:.1f}s")
+
+    def queue_depth(self, provider: Optional[str] = None, model: Optional[str] = None) -> int:
+        """Number of requests waiting, optionally for one provider or model.
+
+        Args:
+            provider: Only count this provider
+            model: Only count this model
+
+        Returns:
+            Number of queued requests
+        """
+        with self._lock:
+            return sum(
+                1 for (lane_provider, lane_model), lane in self._lanes.items()
+                if (provider is None or lane_provider == provider.lower()) and (model is None or lane_model == model)
+                for entry in lane.queue if not entry[4]
+            )
+
+    def reset_budget(self, provider: Optional[str] = None) -> None:
+        """Reset spent cost, e.g. at the start of a billing period.
+
+        Args:
+            provider: Only reset this provider's lanes
+        """
+        with self._lock:
+            for (lane_provider, _), lane in self._lanes.items():
+                if provider is None or lane_provider == provider.lower():
+                    lane.spent = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-lane statistics.
+
+        Returns:
+            Dictionary keyed on "provider/model"
+        """
+        with self._lock:
+            return {
+                f"{lane.provider}/{lane.model}": {
+                    "queued": sum(1 for entry in lane.queue if not entry[4]),
+                    "in_flight": lane.in_flight,
+                    "granted": lane.granted,
+                    "rate_limited": lane.rate_limited,
+                    "spent": lane.spent,
+                    "limits": dict(lane.limits),
+                }
+                for lane in self._lanes.values()
+            }
+
+
+# Global scheduler instance
+default_llm_scheduler = LLMScheduler()
@@ -25,6 +25,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Prometheus collectors created by MetricsRegistry, keyed by metric name
+_prometheus_collectors: Dict[str, Any] = {}
+
 
 class MetricsRegistry:
     """Registry for tracking metrics related to extraction operations."""
@@ -56,32 +59,61 @@ class MetricsRegistry:
         self.model_usage = {}
         self.content_type_counts = {}
         self.validation_error_counts = {}
+        self.cache_hits = {}
+        self.cache_misses = {}
+        self.cache_tokens_saved = {}
+        self.llm_queue_depth = {}
+        self.llm_rate_limited = {}
         
         logger.info(f"Metrics registry initialized with Prometheus {'enabled' if self.enable_prometheus else 'disabled'}")
 
+    @staticmethod
+    def _metric(metric_class, name: str, documentation: str, labelnames: List[str], **kwargs):
+        """Create a Prometheus metric, reusing the collector created earlier under that name.
+        
+        Collectors are registered globally, so a second registry instance must
+        share them instead of registering duplicates. If this module is loaded a
+        second time under another import path, the name is already taken by the
+        first copy; that copy keeps exporting and this one records into an
+        unregistered collector.
+        """
+        collector = _prometheus_collectors.get(name)
+        if collector is None:
+            try:
+                collector = metric_class(name, documentation, labelnames, **kwargs)
+            except ValueError:
+                logger.warning(f"Prometheus metric {name} is already registered by another copy of {__name__}")
+                collector = metric_class(name, documentation, labelnames, registry=None, **kwargs)
+            _prometheus_collectors[name] = collector
+        return collector
+
     def _init_prometheus_metrics(self):
         """Initialize Prometheus metrics."""
         # Extraction counters
-        self.prom_extraction_count = Counter(
+        self.prom_extraction_count = self._metric(
+            Counter,
             'crawl4ai_extraction_total',
             'Total number of extraction attempts',
             ['provider', 'model', 'content_type']
         )
         
-        self.prom_extraction_success = Counter(
+        self.prom_extraction_success = self._metric(
+            Counter,
             'crawl4ai_extraction_success_total',
             'Total number of successful extractions',
             ['provider', 'model', 'content_type']
         )
         
-        self.prom_extraction_failure = Counter(
+        self.prom_extraction_failure = self._metric(
+            Counter,
             'crawl4ai_extraction_failure_total',
             'Total number of failed extractions',
             ['provider', 'model', 'content_type', 'error_type']
         )
         
         # Extraction time histogram
-        self.prom_extraction_time = Histogram(
+        self.prom_extraction_time = self._metric(
+            Histogram,
             'crawl4ai_extraction_duration_seconds',
             'Time taken for extraction operations',
             ['provider', 'model', 'content_type'],
@@ -89,39 +121,81 @@ class MetricsRegistry:
         )
         
         # Token usage counters
-        self.prom_token_usage = Counter(
+        self.prom_token_usage = self._metric(
+            Counter,
             'crawl4ai_token_usage_total',
             'Total number of tokens used',
             ['provider', 'model', 'token_type']
         )
         
         # Cost tracking (estimated)
-        self.prom_estimated_cost = Counter(
+        self.prom_estimated_cost = self._metric(
+            Counter,
             'crawl4ai_estimated_cost_total',
             'Estimated cost of API usage in USD',
             ['provider', 'model']
         )
         
         # Quality metrics
-        self.prom_extraction_quality = Gauge(
+        self.prom_extraction_quality = self._metric(
+            Gauge,
             'crawl4ai_extraction_quality',
             'Quality score of extraction results',
             ['provider', 'model', 'content_type']
         )
         
         # Validation errors
-        self.prom_validation_errors = Counter(
+        self.prom_validation_errors = self._metric(
+            Counter,
             'crawl4ai_validation_errors_total',
             'Total number of validation errors',
             ['error_type', 'content_type']
         )
         
         # Content size metrics
-        self.prom_content_size = Summary(
+        self.prom_content_size = self._metric(
+            Summary,
             'crawl4ai_content_size_bytes',
             'Size of content being processed',
             ['content_type']
         )
+        
+        # Cache metrics
+        self.prom_cache_hits = self._metric(
+            Counter,
+            'crawl4ai_cache_hits_total',
+            'Total number of cache hits',
+            ['cache', 'tier']
+        )
+        
+        self.prom_cache_misses = self._metric(
+            Counter,
+            'crawl4ai_cache_misses_total',
+            'Total number of cache misses',
+            ['cache']
+        )
+        
+        self.prom_cache_tokens_saved = self._metric(
+            Counter,
+            'crawl4ai_cache_tokens_saved_total',
+            'Total number of LLM tokens avoided by cache hits',
+            ['cache']
+        )
+        
+        # LLM scheduler metrics
+        self.prom_llm_queue_depth = self._metric(
+            Gauge,
+            'crawl4ai_llm_queue_depth',
+            'Number of LLM requests waiting for a scheduler slot',
+            ['provider', 'model', 'priority']
+        )
+        
+        self.prom_llm_rate_limited = self._metric(
+            Counter,
+            'crawl4ai_llm_rate_limited_total',
+            'Total number of rate-limit responses from LLM providers',
+            ['provider', 'model']
+        )
 
     def track_extraction_attempt(self, provider: str, model: str, content_type: str):
         """Track an extraction attempt.
@@ -215,32 +289,7 @@ class MetricsRegistry:
             prompt_tokens: The number of prompt tokens used
             completion_tokens: The number of completion tokens used
         """
-        # Simplified cost estimation based on common pricing models
-        # These are approximate and should be updated based on actual pricing
-        cost_per_1k_tokens = {
-            "openai": {
-                "gpt-3.5-turbo": {"prompt": 0.0015, "completion": 0.002},
-                "gpt-4": {"prompt": 0.03, "completion": 0.06},
-                "gpt-4-turbo": {"prompt": 0.01, "completion": 0.03}
-            },
-            "openrouter": {
-                # Simplified - actual costs vary by model
-                "default": {"prompt": 0.005, "completion": 0.01}
-            },
-            "groq": {
-                "llama2-70b": {"prompt": 0.0007, "completion": 0.0007},
-                "mixtral-8x7b": {"prompt": 0.0007, "completion": 0.0007}
-            }
-        }
-        
-        # Get cost rates for the provider and model
-        provider_costs = cost_per_1k_tokens.get(provider.lower(), {})
-        model_costs = provider_costs.get(model, provider_costs.get("default", {"prompt": 0.001, "completion": 0.002}))
-        
-        # Calculate cost
-        prompt_cost = (prompt_tokens / 1000) * model_costs.get("prompt", 0.001)
-        completion_cost = (completion_tokens / 1000) * model_costs.get("completion", 0.002)
-        total_cost = prompt_cost + completion_cost
+        total_cost = estimate_cost(provider, model, prompt_tokens, completion_tokens)
         
         # Update Prometheus metrics if enabled
         if self.enable_prometheus:
@@ -286,6 +335,65 @@ class MetricsRegistry:
         if self.enable_prometheus:
             self.prom_content_size.labels(content_type=content_type).observe(size_bytes)
 
+    def track_cache_hit(self, cache: str, tier: str, tokens_saved: int = 0):
+        """Track a cache hit.
+        
+        Args:
+            cache: The name of the cache
+            tier: The cache tier that served the hit (e.g. "memory", "disk")
+            tokens_saved: LLM tokens that were not spent because of the hit
+        """
+        hit_key = f"{cache}:{tier}"
+        self.cache_hits[hit_key] = self.cache_hits.get(hit_key, 0) + 1
+        self.cache_tokens_saved[cache] = self.cache_tokens_saved.get(cache, 0) + tokens_saved
+        
+        # Update Prometheus metrics if enabled
+        if self.enable_prometheus:
+            self.prom_cache_hits.labels(cache=cache, tier=tier).inc()
+            if tokens_saved:
+                self.prom_cache_tokens_saved.labels(cache=cache).inc(tokens_saved)
+
+    def track_cache_miss(self, cache: str):
+        """Track a cache miss.
+        
+        Args:
+            cache: The name of the cache
+        """
+        self.cache_misses[cache] = self.cache_misses.get(cache, 0) + 1
+        
+        # Update Prometheus metrics if enabled
+        if self.enable_prometheus:
+            self.prom_cache_misses.labels(cache=cache).inc()
+
+    def set_llm_queue_depth(self, provider: str, model: str, priority: int, depth: int):
+        """Record the number of LLM requests waiting in the scheduler.
+        
+        Args:
+            provider: The provider of the queued requests
+            model: The model of the queued requests
+            priority: The scheduler priority of the queued requests
+            depth: The number of waiting requests
+        """
+        self.llm_queue_depth[f"{provider}:{model}:{priority}"] = depth
+        
+        # Update Prometheus metrics if enabled
+        if self.enable_prometheus:
+            self.prom_llm_queue_depth.labels(provider=provider, model=model, priority=str(priority)).set(depth)
+
+    def track_llm_rate_limited(self, provider: str, model: str):
+        """Track a rate-limit response from an LLM provider.
+        
+        Args:
+            provider: The provider that rate-limited the request
+            model: The model of the request
+        """
+        key = f"{provider}:{model}"
+        self.llm_rate_limited[key] = self.llm_rate_limited.get(key, 0) + 1
+        
+        # Update Prometheus metrics if enabled
+        if self.enable_prometheus:
+            self.prom_llm_rate_limited.labels(provider=provider, model=model).inc()
+
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get a summary of tracked metrics.
         
@@ -307,7 +415,16 @@ class MetricsRegistry:
             "provider_usage": self.provider_usage,
             "model_usage": self.model_usage,
             "content_types": self.content_type_counts,
-            "validation_errors": self.validation_error_counts
+            "validation_errors": self.validation_error_counts,
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "tokens_saved": self.cache_tokens_saved
+            },
+            "llm_scheduler": {
+                "queue_depth": self.llm_queue_depth,
+                "rate_limited": self.llm_rate_limited
+            }
         }
 
     def save_metrics_to_file(self, filename: Optional[str] = None) -> None:
@@ -334,6 +451,44 @@ class MetricsRegistry:
             logger.error(f"Failed to save metrics to {filepath}: {str(e)}")
 
 
+# Approximate USD prices per 1K tokens; update these based on actual pricing
+COST_PER_1K_TOKENS = {
+    "openai": {
+        "gpt-3.5-turbo": {"prompt": 0.0015, "completion": 0.002},
+        "gpt-4": {"prompt": 0.03, "completion": 0.06},
+        "gpt-4-turbo": {"prompt": 0.01, "completion": 0.03}
+    },
+    "openrouter": {
+        # Simplified - actual costs vary by model
+        "default": {"prompt": 0.005, "completion": 0.01}
+    },
+    "groq": {
+        "llama2-70b": {"prompt": 0.0007, "completion": 0.0007},
+        "mixtral-8x7b": {"prompt": 0.0007, "completion": 0.0007}
+    }
+}
+
+
+def estimate_cost(provider: str, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the cost of an LLM request in USD.
+    
+    Args:
+        provider: The provider used for the request
+        model: The model used for the request
+        prompt_tokens: The number of prompt tokens used
+        completion_tokens: The number of completion tokens used
+        
+    Returns:
+        Estimated cost in USD
+    """
+    provider_costs = COST_PER_1K_TOKENS.get(provider.lower(), {})
+    model_costs = provider_costs.get(model, provider_costs.get("default", {"prompt": 0.001, "completion": 0.002}))
+    
+    prompt_cost = (prompt_tokens / 1000) * model_costs.get("prompt", 0.001)
+    completion_cost = (completion_tokens / 1000) * model_costs.get("completion", 0.002)
+    return prompt_cost + completion_cost
+
+
 # Global metrics registry instance
 default_metrics_registry = MetricsRegistry(
     enable_prometheus=True,
@@ -604,63 +604,84 @@ class UniversalNewsCrawler:
             "articles": []
         } for source in rss_sources]
     
+    def _index_sources_by_url(self) -> Dict[str, Dict]:
+        """Map page and RSS feed URLs to their source configuration.
+        
+        Returns:
+            Dictionary from URL to source; page URLs win over feed URLs
+        """
+        index = {}
+        for source in self.get_all_sources():
+            if "rss_feed" in source:
+                index.setdefault(source["rss_feed"], source)
+        for source in self.get_all_sources():
+            if source.get("url"):
+                index[source["url"]] = source
+        return index
+    
     async def crawl_web_pages(self, urls: List[str]) -> List[Dict]:
         """Crawl web pages using the CryptoCrawler.
         
+        Pages are crawled concurrently in order of their source priority, with
+        the crawler's per-host rate limits. LLM extraction starts as soon as
+        each page arrives.
+        
         Args:
             urls: List of URLs to crawl
             
         Returns:
-            List of crawl results
+            List of crawl results, in the order of ``urls``
         """
         print(f"Crawling {len(urls)} web pages...")
         
-        results = []
+        # Initialize the crawler if needed
+        if not self.crawler.initialized:
+            await self.crawler.initialize()
+        
+        # Look up content type and priority once instead of rescanning sources per URL
+        sources = self._index_sources_by_url()
+        websites = []
         for url in urls:
-            try:
-                # Initialize the crawler if needed
-                if not self.crawler.initialized:
-                    await self.crawler.initialize()
-                
-                # Determine content type based on URL
-                content_type = "news"
-                for source in self.get_all_sources():
-                    if url == source.get("url") or ("rss_feed" in source and url == source["rss_feed"]):
-                        content_type = source.get("content_type", "news")
-                        break
-                
-                # Crawl the web page
-                result = await self.crawler.crawl_crypto_website(
-                    url=url,
-                    content_type=content_type,
-                    extract_entities=True,
-                    generate_triples=True
-                )
-                
-                # Add LLM extraction if available
-                llm_extraction = None
-                if self.llm_strategy and result.metadata.success and result.markdown:
-                    try:
-                        llm_extraction = await self.llm_strategy.extract(
-                            url=url,
-                            html=result.markdown,
-                            instruction=self.llm_strategy.instruction,
-                            schema=self.llm_strategy.schema
-                        )
-                    except Exception as e:
-                        print(f"Error during LLM extraction for {url}: {str(e)}")
-                
-                # Combine crawl result and LLM extraction
-                combined_result = {
-                    "crawl_result": result,
-                    "llm_extraction": llm_extraction
-                }
-                
-                results.append(combined_result)
-                self.crawled_content.append(combined_result)
-                
-            except Exception as e:
-                print(f"Error crawling {url}: {str(e)}")
+            source = sources.get(url, {})
+            websites.append({
+                "name": source.get("name", url),
+                "url": url,
+                "content_type": source.get("content_type", "news"),
+                "priority": source.get("priority")
+            })
+        positions = {id(website): index for index, website in enumerate(websites)}
+        
+        async def add_llm_extraction(url: str, result) -> Dict:
+            llm_extraction = None
+            if self.llm_strategy and result.metadata.success and result.markdown:
+                try:
+                    llm_extraction = await self.llm_strategy.extract(
+                        url=url,
+                        html=result.markdown,
+                        instruction=self.llm_strategy.instruction,
+                        schema=self.llm_strategy.schema
+                    )
+                except Exception as e:
+                    print(f"Error during LLM extraction for {url}: {str(e)}")
+            
+            # Combine crawl result and LLM extraction
+            return {
+                "crawl_result": result,
+                "llm_extraction": llm_extraction
+            }
+        
+        tasks = []
+        try:
+            async for website, result in self.crawler.crawl_websites_stream(websites):
+                tasks.append((positions[id(website)], asyncio.create_task(add_llm_extraction(website["url"], result))))
+        except Exception as e:
+            print(f"Error crawling web pages: {str(e)}")
+        
+        results = []
+        for _, task in sorted(tasks, key=lambda pair: pair[0]):
+            combined_result = await task
+            results.append(combined_result)
+            self.crawled_content.append(combined_result)
         
         return results
     
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the vectorized backtest engine.
+
+Backtests random-walk 1-minute prices for several symbols over multiple
+years:
+
+- loop: a per-bar Python loop over a slice of the data, as a baseline,
+- vectorized: ``run_backtest`` for the MA crossover and indicator vote
+  strategies over all of it,
+- sweep: an MA crossover parameter grid, serially and across a process pool.
+
+Usage:
+    python scripts/benchmark_backtest.py
+    python scripts/benchmark_backtest.py --symbols 10 --years 2 --workers 4
+"""
+
+import argparse
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.processing.backtest import (  # noqa: E402
+    indicator_vote,
+    ma_crossover,
+    parameter_sweep,
+    run_backtest,
+)
+from src.cry_a_4mcp.processing.trading_signals import VOTE_THRESHOLDS  # noqa: E402
+
+MINUTES_PER_YEAR = 365 * 24 * 60
+
+
+def make_prices(symbols: int, bars: int, seed: int = 7):
+    """Generate random-walk high, low and close arrays."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.0005, size=(symbols, bars)), axis=1))
+    spread = np.abs(rng.normal(0.0, 0.0003, size=close.shape))
+    return close * (1 + spread), close * (1 - spread), close
+
+
+def loop_backtest(close: np.ndarray, positions: np.ndarray, cost_rate: float) -> float:
+    """Per-bar equity loop; returns final capital."""
+    symbols, bars = close.shape
+    equity = 10000.0
+    held = [0.0] * symbols
+    for t in range(bars):
+        total = 0.0
+        for s in range(symbols):
+            ret = held[s] * (close[s, t] / close[s, t - 1] - 1) if t else 0.0
+            if positions[s, t] != held[s]:
+                ret -= (abs(held[s]) + abs(positions[s, t])) * cost_rate
+                held[s] = positions[s, t]
+            total += ret / symbols
+        equity *= 1 + total
+    return equity
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized backtest engine")
+    parser.add_argument("--symbols", type=int, default=10, help="Number of symbols")
+    parser.add_argument("--years", type=float, default=2.0, help="Years of 1-minute bars")
+    parser.add_argument("--loop-bars", type=int, default=50000, help="Bars for the per-bar loop baseline")
+    parser.add_argument("--workers", type=int, default=None, help="Sweep worker processes")
+    args = parser.parse_args()
+
+    bars = int(args.years * MINUTES_PER_YEAR)
+    high, low, close = make_prices(args.symbols, bars)
+    print(f"{args.symbols} symbols x {bars} 1-minute bars ({args.years:g} years)")
+
+    positions, signal_seconds = timed(lambda: ma_crossover(high, low, close))
+    metrics, backtest_seconds = timed(lambda: run_backtest(close, positions, periods_per_year=MINUTES_PER_YEAR))
+    print(f"  ma_crossover signals:   {signal_seconds:>7.2f} s")
+    print(f"  run_backtest:           {backtest_seconds:>7.2f} s  "
+          f"({metrics.total_trades} trades, return {metrics.total_return:.1f}%)")
+
+    vote = partial(indicator_vote, thresholds=VOTE_THRESHOLDS)
+    _, vote_seconds = timed(lambda: run_backtest(close, vote(high, low, close), periods_per_year=MINUTES_PER_YEAR))
+    print(f"  indicator_vote + run:   {vote_seconds:>7.2f} s")
+
+    loop_bars = min(args.loop_bars, bars)
+    _, loop_seconds = timed(lambda: loop_backtest(close[:, :loop_bars], positions[:, :loop_bars], 0.0015))
+    print(f"  per-bar loop:           {loop_seconds:>7.2f} s for {loop_bars} bars, "
+          f"~{loop_seconds * bars / loop_bars:.0f} s for all")
+
+    grid = [{"fast": fast, "slow": slow} for fast in (5, 10, 20, 50) for slow in (100, 200)]
+    serial_start = time.perf_counter()
+    for params in grid:
+        run_backtest(close, ma_crossover(high, low, close, **params), periods_per_year=MINUTES_PER_YEAR)
+    serial_seconds = time.perf_counter() - serial_start
+    _, pool_seconds = timed(lambda: parameter_sweep(high, low, close, ma_crossover, grid,
+                                                    max_workers=args.workers, periods_per_year=MINUTES_PER_YEAR))
+    print(f"  sweep of {len(grid)} (serial):   {serial_seconds:>7.2f} s")
+    print(f"  sweep of {len(grid)} (pool):     {pool_seconds:>7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark for cryptocurrency entity extraction on large markdown pages.
+
+Compares the legacy approach (lower-casing the page and running a substring
+test for every dictionary entry) against the compiled ``EntityMatcher`` used
+by ``CryptoEntityExtractor``, which scans each page once.
+
+Usage:
+    python scripts/benchmark_entity_extraction.py
+    python scripts/benchmark_entity_extraction.py --pages 20 --page-kb 500 --synthetic 5000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.crypto_crawler.entity_matcher import DEFAULT_DICTIONARY_PATH, EntityMatcher  # noqa: E402
+
+FILLER = (
+    "the market moved sharply as traders reacted to the latest method of "
+    "settlement and a new solution for liquidity across several chains while "
+    "analysts said volume and volatility would stay elevated this week"
+).split()
+
+
+def make_page(size_kb: int, names: List[str], rng: random.Random) -> str:
+    """Generate a markdown page mentioning dictionary entities."""
+    parts = ["# Market update\n\n"]
+    length = 0
+    while length < size_kb * 1024:
+        words = [rng.choice(FILLER) for _ in range(rng.randint(20, 60))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(names))
+        paragraph = " ".join(words) + ".\n\n"
+        if rng.random() < 0.1:
+            paragraph = f"## {rng.choice(names)} outlook\n\n" + paragraph
+        parts.append(paragraph)
+        length += len(paragraph)
+    return "".join(parts)
+
+
+def legacy_extract(matcher: EntityMatcher) -> Callable[[str], int]:
+    """Build the legacy substring scan over the matcher's dictionary."""
+    entries = [(entity.name, entity.symbol) for entity in matcher.entities]
+
+    def extract(text: str) -> int:
+        found = 0
+        for name, symbol in entries:
+            if name.lower() in text.lower():
+                found += 1
+            elif symbol and symbol.lower() in text.lower():
+                found += 1
+        return found
+
+    return extract
+
+
+def measure(function: Callable[[str], object], pages: List[str]) -> float:
+    """Return the median milliseconds per page."""
+    timings = []
+    for page in pages:
+        start = time.perf_counter()
+        function(page)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark crypto entity extraction")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages")
+    parser.add_argument("--page-kb", type=int, default=200, help="Size of each page in KB")
+    parser.add_argument("--synthetic", type=int, default=3000,
+                        help="Synthetic tokens added to the bundled dictionary")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    start = time.perf_counter()
+    matcher = EntityMatcher.from_files([DEFAULT_DICTIONARY_PATH])
+    for i in range(args.synthetic):
+        matcher.add_entity(f"Synthetic Token {i}", "token", symbol=f"SYN{i}")
+    matcher.compile()
+    build = time.perf_counter() - start
+
+    names = [entity.name for entity in matcher.entities]
+    pages = [make_page(args.page_kb, names, rng) for _ in range(args.pages)]
+
+    legacy = measure(legacy_extract(matcher), pages)
+    compiled = measure(matcher.find, pages)
+    mentions = sum(len(matcher.find(page)) for page in pages)
+
+    print(f"{len(matcher.entities)} entities (compiled in {build:.2f}s), "
+          f"{args.pages} pages of {args.page_kb} KB, {mentions} mentions")
+    print(f"  substring scan: {legacy:10.1f} ms/page")
+    print(f"  compiled:       {compiled:10.1f} ms/page  ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
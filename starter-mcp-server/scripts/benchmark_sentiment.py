@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batch sentiment scoring in ``SentimentAnalyzer``.
+
+Scores synthetic headlines two ways:
+
+- per text: the previous heuristic, rescanning each text once per keyword,
+- batch: ``SentimentAnalyzer.analyze_batch`` with the compiled lexicon.
+
+Usage:
+    python scripts/benchmark_sentiment.py
+    python scripts/benchmark_sentiment.py --headlines 100000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.config import Settings  # noqa: E402
+from src.cry_a_4mcp.processing.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+
+SUBJECTS = ["Bitcoin", "ETH", "Solana", "Binance coin", "XRP", "Dogecoin", "Cardano", "Crypto markets"]
+EVENTS = [
+    "surges past resistance", "drops after exchange hack", "is not bullish yet", "rallies on ETF approval",
+    "slumps as traders fear regulation", "holds steady", "hits record high", "sees no crash despite risk",
+]
+SUFFIXES = ["", " 🚀", " 📉", ", analysts say", " amid rising volume", " as liquidations climb"]
+
+POSITIVE_WORDS = ["bullish", "surge", "gain", "rise", "up", "high", "growth", "profit", "success"]
+NEGATIVE_WORDS = ["bearish", "crash", "drop", "fall", "down", "low", "loss", "fail", "risk"]
+
+
+def make_headlines(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)}{rng.choice(SUFFIXES)}" for _ in range(count)]
+
+
+def keyword_scan(text: str):
+    """The previous per-text heuristic; returns (score, confidence)."""
+    positive = sum(1 for word in POSITIVE_WORDS if word in text.lower())
+    negative = sum(1 for word in NEGATIVE_WORDS if word in text.lower())
+    if positive > negative:
+        return min(0.5 + (positive - negative) * 0.1, 1.0), 0.5 + (positive / (len(text.split()) + 1)) * 0.5
+    if negative > positive:
+        return max(-0.5 - (negative - positive) * 0.1, -1.0), 0.5 + (negative / (len(text.split()) + 1)) * 0.5
+    return 0.0, 0.5
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch sentiment scoring")
+    parser.add_argument("--headlines", type=int, default=100000, help="Number of headlines")
+    args = parser.parse_args()
+
+    headlines = make_headlines(args.headlines)
+    analyzer = SentimentAnalyzer(Settings())
+
+    started = time.perf_counter()
+    for text in headlines:
+        keyword_scan(text)
+    scan_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    asyncio.run(analyzer.analyze_batch(headlines))
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    analyzer._score_texts(headlines)
+    score_seconds = time.perf_counter() - started
+
+    print(f"{args.headlines} headlines")
+    print(f"  per-text keyword scan (scores only): {scan_seconds:>6.2f} s")
+    print(f"  analyze_batch (results):             {batch_seconds:>6.2f} s")
+    print(f"  of which tokenize + score + entity:  {score_seconds:>6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the SQLite-backed URL configuration and URL mapping stores.
+
+Replays the database calls behind the ``/api/url-configurations`` and
+``/api/url-mappings`` endpoints (listing and fetching by id, plus a mix with
+10% updates) from concurrent clients, and reports request throughput and
+latency for:
+
+- per-call: a new aiosqlite connection for every call, as before pooling,
+- pool: the shared ``SQLitePool`` the stores now use.
+
+Usage:
+    python scripts/benchmark_sqlite_storage.py
+    python scripts/benchmark_sqlite_storage.py --requests 5000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import aiosqlite
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.storage.sqlite_pool import close_pools  # noqa: E402
+from src.cry_a_4mcp.storage.url_configuration_db import URLConfigurationDatabase  # noqa: E402
+from src.cry_a_4mcp.storage.url_mappings_db import URLMappingsDatabase  # noqa: E402
+
+MODES = ["per-call", "pool"]
+
+
+class PerCallConnections:
+    """Drop-in for ``SQLitePool`` opening a connection per call, as before."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+
+    @asynccontextmanager
+    async def read(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            yield db
+
+    @asynccontextmanager
+    async def write(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            yield db
+            await db.commit()
+
+
+async def seed(directory: Path, configs: int, mappings: int) -> Dict[str, List[str]]:
+    """Create both databases and fill them with generated rows."""
+    config_db = URLConfigurationDatabase(str(directory / "url_configurations.db"))
+    mappings_db = URLMappingsDatabase(str(directory / "url_mappings.db"))
+    await config_db.initialize()
+    await mappings_db.initialize()
+
+    config_ids = []
+    for i in range(configs):
+        config_ids.append(await config_db.create_configuration(
+            name=f"Source {i}",
+            url=f"https://source-{i}.example.com",
+            profile_type=random.choice(["trader", "researcher", "investor"]),
+            category=random.choice(["news", "prices", "defi", "nft"]),
+            business_priority=random.randint(1, 10),
+            key_data_points=["price", "volume", "market cap"],
+            target_data={"fields": ["title", "body", "published_at"]},
+        ))
+
+    mapping_ids = []
+    for i in range(mappings):
+        mapping_ids.append(await mappings_db.create_mapping(
+            url_config_id=random.choice(config_ids),
+            url=f"https://source-{i % configs}.example.com/page/{i}",
+            extractor_ids=[f"extractor-{i % 7}"],
+            name=f"Mapping {i}",
+            crawler_settings={"max_depth": 2, "delay": 1.0},
+        ))
+
+    await config_db.close()
+    await mappings_db.close()
+    await close_pools()
+    return {"configs": config_ids, "mappings": mapping_ids}
+
+
+def scenarios(config_db: URLConfigurationDatabase, mappings_db: URLMappingsDatabase,
+              ids: Dict[str, List[str]]) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    """Build one request function per benchmarked endpoint."""
+    async def mixed() -> Any:
+        if random.random() < 0.1:
+            return await config_db.update_configuration(
+                random.choice(ids["configs"]), business_priority=random.randint(1, 10)
+            )
+        return await config_db.get_configuration(random.choice(ids["configs"]))
+
+    return {
+        "GET /api/url-configurations": lambda: config_db.get_all_configurations(),
+        "GET /api/url-configurations/{id}": lambda: config_db.get_configuration(random.choice(ids["configs"])),
+        "GET /api/url-mappings": lambda: mappings_db.get_all_mappings(active_only=False),
+        "GET /api/url-mappings/{id}": lambda: mappings_db.get_mapping(random.choice(ids["mappings"])),
+        "url-configurations 90% GET / 10% PUT": mixed,
+    }
+
+
+async def run_load(request: Callable[[], Awaitable[Any]], total: int, concurrency: int) -> Dict[str, float]:
+    """Issue ``total`` requests from ``concurrency`` clients."""
+    latencies: List[float] = []
+    remaining = iter(range(total))
+
+    async def client() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await request()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_second": total / elapsed,
+        "mean_ms": statistics.mean(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Dict[str, Dict[str, float]]]:
+    random.seed(args.seed)
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        ids = await seed(Path(directory), args.configs, args.mappings)
+
+        for mode in MODES:
+            config_db = URLConfigurationDatabase(str(Path(directory) / "url_configurations.db"))
+            mappings_db = URLMappingsDatabase(str(Path(directory) / "url_mappings.db"))
+            if mode == "per-call":
+                pooled = [config_db.pool, mappings_db.pool]
+                config_db.pool = PerCallConnections(config_db.db_path)
+                mappings_db.pool = PerCallConnections(mappings_db.db_path)
+
+            for name, request in scenarios(config_db, mappings_db, ids).items():
+                await run_load(request, min(args.requests, 50), args.concurrency)  # Warm up
+                report.setdefault(name, {})[mode] = await run_load(request, args.requests, args.concurrency)
+
+            if mode == "per-call":
+                config_db.pool, mappings_db.pool = pooled
+            await config_db.close()
+            await mappings_db.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite storage request throughput")
+    parser.add_argument("--configs", type=int, default=200, help="URL configurations to seed")
+    parser.add_argument("--mappings", type=int, default=400, help="URL mappings to seed")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint and mode")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+
+    print(f"{'endpoint':<40} {'mode':<9} {'req/s':>9} {'mean ms':>9} {'p95 ms':>8}")
+    for name, modes in report.items():
+        for mode, metrics in modes.items():
+            print(f"{name:<40} {mode:<9} {metrics['requests_per_second']:>9.1f} "
+                  f"{metrics['mean_ms']:>9.2f} {metrics['p95_ms']:>8.2f}")
+        speedup = modes["pool"]["requests_per_second"] / modes["per-call"]["requests_per_second"]
+        print(f"{'':<40} {'speedup':<9} {speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the technical indicators behind ``TradingSignalsGenerator``.
+
+Computes RSI, MACD, Bollinger %B, the moving average ratio and stochastic
+%K for a batch of random-walk symbols two ways:
+
+- loop: a per-symbol, per-bar Python loop for each indicator,
+- vectorized: ``compute_indicators`` over one ``(symbols, bars)`` array.
+
+Also times a one-bar update of ``StreamingIndicators`` state for the same
+symbols, and ``TradingSignalsGenerator.get_signals`` across all of them.
+
+Usage:
+    python scripts/benchmark_trading_indicators.py
+    python scripts/benchmark_trading_indicators.py --symbols 1000 --bars 500
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.config import Settings  # noqa: E402
+from src.cry_a_4mcp.processing import indicators  # noqa: E402
+from src.cry_a_4mcp.processing.streaming_indicators import StreamingIndicators  # noqa: E402
+from src.cry_a_4mcp.processing.trading_signals import SignalType, TimeFrame, TradingSignalsGenerator  # noqa: E402
+
+
+def make_prices(symbols: int, bars: int, seed: int = 7):
+    """Generate random-walk high, low and close arrays."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, size=(symbols, bars)), axis=1))
+    spread = np.abs(rng.normal(0.0, 0.005, size=close.shape))
+    return close * (1 + spread), close * (1 - spread), close
+
+
+def loop_indicators(high: List[float], low: List[float], close: List[float]) -> Dict[str, float]:
+    """Compute the latest indicator values with per-bar loops."""
+    n = len(close)
+
+    def ema(values, period):
+        alpha = 2.0 / (period + 1)
+        out = [values[0]]
+        for value in values[1:]:
+            out.append(alpha * value + (1 - alpha) * out[-1])
+        return out
+
+    def sma(values, window, i):
+        return sum(values[i - window + 1:i + 1]) / window
+
+    # RSI with Wilder smoothing
+    period = indicators.RSI_PERIOD
+    avg_gain = avg_loss = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss else 100.0
+
+    # MACD
+    fast, slow = ema(close, indicators.MACD_FAST), ema(close, indicators.MACD_SLOW)
+    line = [f - s for f, s in zip(fast, slow)]
+
+    # Bollinger %B at every bar, as an indicator series would be
+    window = indicators.BOLLINGER_PERIOD
+    percent_b = math.nan
+    for i in range(window - 1, n):
+        mean = sma(close, window, i)
+        std = math.sqrt(sum((c - mean) ** 2 for c in close[i - window + 1:i + 1]) / window)
+        lower, upper = mean - 2 * std, mean + 2 * std
+        percent_b = (close[i] - lower) / (upper - lower) if upper > lower else 0.5
+
+    # Moving average ratio and stochastic %K at every bar
+    ma_ratio = stoch = math.nan
+    for i in range(indicators.MA_PERIOD - 1, n):
+        ma_ratio = close[i] / sma(close, indicators.MA_PERIOD, i)
+    for i in range(indicators.STOCHASTIC_PERIOD - 1, n):
+        highest = max(high[i - indicators.STOCHASTIC_PERIOD + 1:i + 1])
+        lowest = min(low[i - indicators.STOCHASTIC_PERIOD + 1:i + 1])
+        stoch = 100 * (close[i] - lowest) / (highest - lowest) if highest > lowest else 50.0
+
+    return {
+        "RSI": rsi,
+        "MACD": 100.0 * line[-1] / close[-1],
+        "Bollinger Bands": percent_b,
+        "Moving Average": ma_ratio,
+        "Stochastic": stoch,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark vectorized technical indicators")
+    parser.add_argument("--symbols", type=int, default=500, help="Number of symbols")
+    parser.add_argument("--bars", type=int, default=200, help="Bars of history per symbol")
+    args = parser.parse_args()
+
+    high, low, close = make_prices(args.symbols, args.bars)
+
+    started = time.perf_counter()
+    looped = [
+        loop_indicators(h.tolist(), l.tolist(), c.tolist())
+        for h, l, c in zip(high, low, close)
+    ]
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vectorized = indicators.compute_indicators(high, low, close, last_only=True)
+    vector_seconds = time.perf_counter() - started
+
+    max_error = max(
+        abs(row[name] - vectorized[name][i])
+        for i, row in enumerate(looped)
+        for name in indicators.INDICATOR_NAMES
+    )
+
+    keys = [f"SYM{i}:1h" for i in range(args.symbols)]
+    state = StreamingIndicators()
+    state.seed(keys, high[:, :-1], low[:, :-1], close[:, :-1])
+    started = time.perf_counter()
+    state.update(keys, high[:, -1], low[:, -1], close[:, -1])
+    stream_seconds = time.perf_counter() - started
+
+    generator = TradingSignalsGenerator(Settings())
+    generator.history_bars = args.bars
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+    started = time.perf_counter()
+    signals = asyncio.run(generator.get_signals(
+        symbols=symbols,
+        timeframes=[TimeFrame.HOUR_1, TimeFrame.DAY_1],
+        signal_types=list(SignalType),
+        min_confidence=0.0,
+        limit=len(symbols) * 2,
+    ))
+    signals_seconds = time.perf_counter() - started
+
+    # A second call only adds one bar to each pair
+    started = time.perf_counter()
+    asyncio.run(generator.get_signals(
+        symbols=symbols,
+        timeframes=[TimeFrame.HOUR_1, TimeFrame.DAY_1],
+        signal_types=list(SignalType),
+        min_confidence=0.0,
+        limit=len(symbols) * 2,
+    ))
+    repeat_seconds = time.perf_counter() - started
+
+    print(f"{args.symbols} symbols x {args.bars} bars (lfilter: {indicators.lfilter is not None})")
+    print(f"  per-bar loop:      {loop_seconds * 1000:>9.2f} ms")
+    print(f"  vectorized:        {vector_seconds * 1000:>9.2f} ms  ({loop_seconds / vector_seconds:.0f}x)")
+    print(f"  max difference:    {max_error:.2e}")
+    print(f"  streaming update:  {stream_seconds * 1000:>9.2f} ms  (one new bar per symbol)")
+    print(f"  get_signals ({len(signals)} signals, 2 timeframes): {signals_seconds * 1000:.2f} ms first call, "
+          f"{repeat_seconds * 1000:.2f} ms next call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Build a large entity dictionary from full token and exchange listings.
+
+The bundled ``entity_dictionary.json`` is a hand-curated seed set of a few
+hundred entities. This script converts full listings, such as the CoinGecko
+``/coins/list`` (or ``/coins/markets``) and ``/exchanges/list`` responses,
+into a dictionary file in the same format. Load the result through the
+``entity_dictionaries`` configuration key.
+
+Entities already in the bundled dictionary are skipped, so the seed set keeps
+its curated aliases, and new tokens reusing a seed ticker are added without
+the ticker. Symbols shared by several tokens, symbols of one or two
+characters and symbols from the seed's ``ambiguous_symbols`` are marked as
+ambiguous and only match with a dollar prefix (``$ONE``).
+
+Usage:
+    curl -o coins.json https://api.coingecko.com/api/v3/coins/list
+    curl -o exchanges.json https://api.coingecko.com/api/v3/exchanges/list
+    python scripts/build_entity_dictionary.py --coins coins.json --exchanges exchanges.json \\
+        --output data/entity_dictionary_full.json
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.cry_a_4mcp.crypto_crawler.entity_matcher import DEFAULT_DICTIONARY_PATH  # noqa: E402
+
+# Symbols this short collide with ordinary words and abbreviations
+MAX_AMBIGUOUS_SYMBOL_LENGTH = 2
+
+
+def load_listing(path: Optional[str]) -> List[Dict[str, Any]]:
+    """Load a JSON listing of ``{"name": ..., "symbol": ...}`` objects."""
+    if not path:
+        return []
+    with open(path, "r") as f:
+        listing = json.load(f)
+    if not isinstance(listing, list):
+        raise ValueError(f"{path} does not contain a JSON list")
+    # Ranked listings (/coins/markets) keep the largest assets first
+    if any("market_cap_rank" in item for item in listing):
+        listing.sort(key=lambda item: item.get("market_cap_rank") or float("inf"))
+    return listing
+
+
+def build_dictionary(coins: List[Dict[str, Any]], exchanges: List[Dict[str, Any]],
+                     seed: Dict[str, Any], limit: Optional[int] = None) -> Dict[str, Any]:
+    """Convert listings into the ``entity_dictionary.json`` format.
+
+    Args:
+        coins: Token listing entries with ``name`` and ``symbol``
+        exchanges: Exchange listing entries with ``name``
+        seed: The bundled dictionary, whose entities are skipped
+        limit: Maximum number of tokens to include
+
+    Returns:
+        Dictionary with ``ambiguous_symbols``, ``tokens`` and ``exchanges``
+    """
+    known_tokens = {entry["name"].lower() for entry in seed.get("tokens", [])}
+    known_exchanges = {entry["name"].lower() for entry in seed.get("exchanges", [])}
+    seed_symbols = {entry["symbol"].upper() for entry in seed.get("tokens", []) if entry.get("symbol")}
+    seed_ambiguous = {symbol.upper() for symbol in seed.get("ambiguous_symbols", [])}
+
+    symbol_counts = Counter((coin.get("symbol") or "").upper() for coin in coins)
+
+    tokens, seen = [], set(known_tokens)
+    for coin in coins:
+        name = (coin.get("name") or "").strip()
+        symbol = (coin.get("symbol") or "").strip().upper()
+        if not name or name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        entry = {"name": name}
+        # A seed token's ticker keeps pointing at the seed token only
+        if symbol and symbol not in seed_symbols:
+            entry["symbol"] = symbol
+        tokens.append(entry)
+        if limit and len(tokens) >= limit:
+            break
+
+    ambiguous = {
+        entry["symbol"] for entry in tokens
+        if "symbol" in entry and (
+            symbol_counts[entry["symbol"]] > 1
+            or len(entry["symbol"]) <= MAX_AMBIGUOUS_SYMBOL_LENGTH
+            or entry["symbol"] in seed_ambiguous
+        )
+    }
+
+    exchange_entries, seen = [], set(known_exchanges)
+    for exchange in exchanges:
+        name = (exchange.get("name") or "").strip()
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            exchange_entries.append({"name": name})
+
+    return {
+        "ambiguous_symbols": sorted(ambiguous),
+        "tokens": tokens,
+        "exchanges": exchange_entries,
+    }
+
+
+def main() -> None:
+    """Parse arguments and write the generated dictionary."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--coins", help="JSON token listing (CoinGecko /coins/list or /coins/markets)")
+    parser.add_argument("--exchanges", help="JSON exchange listing (CoinGecko /exchanges/list)")
+    parser.add_argument("--output", required=True, help="Path of the dictionary file to write")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of tokens to include")
+    args = parser.parse_args()
+
+    with open(DEFAULT_DICTIONARY_PATH, "r") as f:
+        seed = json.load(f)
+
+    dictionary = build_dictionary(load_listing(args.coins), load_listing(args.exchanges), seed, args.limit)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(dictionary, f, indent=2)
+    print(f"Wrote {len(dictionary['tokens'])} tokens and {len(dictionary['exchanges'])} exchanges "
+          f"({len(dictionary['ambiguous_symbols'])} ambiguous symbols) to {output}")
+
+
+if __name__ == "__main__":
+    main()
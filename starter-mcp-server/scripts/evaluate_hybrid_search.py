@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Offline evaluation of hybrid search ranking.
+
+Loads a fixture corpus into an in-process Qdrant collection and an in-memory
+stand-in for the Neo4j driver, then runs every fixture query through
+``HybridSearchEngine`` and reports recall, reciprocal rank and latency for:
+
+- vector_only and graph_only search,
+- the previous hybrid merge (interleaving both backends without over-fetch),
+- hybrid search with reciprocal rank fusion.
+
+Documents are embedded with a hashing embedder by default so the harness
+runs without downloading a model; pass ``--model`` to use a
+sentence-transformers model instead.
+
+Usage:
+    python scripts/evaluate_hybrid_search.py
+    python scripts/evaluate_hybrid_search.py --top-k 5 --repeat 20
+    python scripts/evaluate_hybrid_search.py --model sentence-transformers/all-MiniLM-L6-v2
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import structlog
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from qdrant_client import QdrantClient  # noqa: E402
+from qdrant_client.http import models as qdrant_models  # noqa: E402
+
+from src.cry_a_4mcp.config import Settings  # noqa: E402
+from src.cry_a_4mcp.retrieval.hybrid_search import (  # noqa: E402
+    HybridSearchEngine,
+    SearchResult,
+    content_key,
+)
+from src.cry_a_4mcp.storage.graph_store import GraphStore  # noqa: E402
+from src.cry_a_4mcp.storage.vector_store import VectorStore  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "fixtures" / "hybrid_search_eval.json"
+STRATEGIES = ["vector_only", "graph_only", "interleave", "hybrid"]
+
+
+class HashingEmbedder:
+    """Bag-of-words embedder hashing words into a fixed number of dimensions."""
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for word in re.findall(r"\w+", text.lower()):
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            index = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[index] += 1.0 if digest[4] % 2 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode(self, texts, batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+        if isinstance(texts, str):
+            return self._embed(texts)
+        return np.stack([self._embed(text) for text in texts])
+
+
+class _Node(dict):
+    """Neo4j node stand-in: properties plus labels."""
+
+    def __init__(self, labels: List[str], properties: Dict[str, Any]) -> None:
+        super().__init__(properties)
+        self.labels = frozenset(labels)
+
+
+class _Path:
+    def __init__(self, nodes: List[_Node]) -> None:
+        self.nodes = nodes
+
+
+class _Records:
+    def __init__(self, records: List[Dict[str, Any]]) -> None:
+        self.records = records
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self.records:
+            yield record
+
+
+class _Session:
+    def __init__(self, driver: "InMemoryGraphDriver") -> None:
+        self.driver = driver
+
+    async def __aenter__(self) -> "_Session":
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        return False
+
+    async def run(self, query: str, entities: List[str], limit: int,
+                  default_confidence: float, **kwargs) -> _Records:
+        """Answer the relationship query issued by ``GraphStore.search``."""
+        matches = [
+            match for match in self.driver.matches
+            if match["c"]["symbol"] in entities
+        ]
+        matches.sort(key=lambda match: match["r"].get("confidence", default_confidence), reverse=True)
+        return _Records(matches[:limit])
+
+
+class InMemoryGraphDriver:
+    """Stand-in for the Neo4j driver, holding the fixture graph in memory.
+
+    Every relationship touching a Cryptocurrency node is expanded once per
+    cryptocurrency endpoint, like the undirected pattern in ``GraphStore.search``.
+    """
+
+    def __init__(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> None:
+        self.nodes = {node["id"]: _Node(node["labels"], node["properties"]) for node in nodes}
+        relationship_types: Dict[str, type] = {}
+        self.matches: List[Dict[str, Any]] = []
+        self.edge_ids: List[str] = []
+        for edge in edges:
+            # The driver exposes the relationship type as the class name
+            relationship_type = relationship_types.setdefault(edge["type"], type(edge["type"], (dict,), {}))
+            relation = relationship_type({"confidence": edge["confidence"]})
+            source, target = self.nodes[edge["source"]], self.nodes[edge["target"]]
+            for crypto, related in ((source, target), (target, source)):
+                if "Cryptocurrency" in crypto.labels:
+                    self.matches.append({
+                        "path": _Path([crypto, related]),
+                        "c": crypto,
+                        "r": relation,
+                        "related": related,
+                    })
+                    self.edge_ids.append(edge["id"])
+
+    def session(self, **kwargs) -> _Session:
+        return _Session(self)
+
+    async def close(self) -> None:
+        pass
+
+
+def interleave(vector_results: List[SearchResult], graph_results: List[SearchResult],
+               max_results: int) -> List[SearchResult]:
+    """The hybrid merge used before rank fusion, kept as the baseline."""
+    merged = []
+    seen = set()
+    vector_idx = graph_idx = 0
+    while len(merged) < max_results and (vector_idx < len(vector_results) or graph_idx < len(graph_results)):
+        if vector_idx < len(vector_results):
+            result = vector_results[vector_idx]
+            if result.content not in seen:
+                merged.append(result)
+                seen.add(result.content)
+            vector_idx += 1
+        if graph_idx < len(graph_results) and len(merged) < max_results:
+            result = graph_results[graph_idx]
+            if result.content not in seen:
+                merged.append(result)
+                seen.add(result.content)
+            graph_idx += 1
+    merged.sort(key=lambda result: result.confidence, reverse=True)
+    return merged
+
+
+async def build_engine(corpus: Dict[str, Any], embedder, dimensions: int,
+                       cache: bool) -> HybridSearchEngine:
+    """Load the corpus into in-process stores behind a search engine."""
+    settings = Settings(
+        qdrant_collection_name="hybrid_search_eval",
+        qdrant_vector_size=dimensions,
+        query_embedding_cache_size=2048 if cache else 0,
+        search_result_cache_size=512 if cache else 0,
+    )
+
+    vector_store = VectorStore(settings)
+    vector_store.client = QdrantClient(":memory:")
+    vector_store.embedding_model = embedder
+    vector_store.client.create_collection(
+        collection_name=settings.qdrant_collection_name,
+        vectors_config=qdrant_models.VectorParams(size=dimensions, distance=qdrant_models.Distance.COSINE),
+    )
+    await vector_store.add_documents(
+        (document["content"], {
+            "id": str(uuid.uuid5(uuid.NAMESPACE_URL, document["id"])),
+            "title": document["title"],
+            "url": document["url"],
+            "source": "fixture",
+        })
+        for document in corpus["documents"]
+    )
+
+    graph_store = GraphStore(settings)
+    graph_store.driver = InMemoryGraphDriver(corpus["nodes"], corpus["edges"])
+
+    engine = HybridSearchEngine(settings)
+    engine.vector_store = vector_store
+    engine.graph_store = graph_store
+    return engine
+
+
+def result_ids(corpus: Dict[str, Any], engine: HybridSearchEngine) -> Dict[str, str]:
+    """Map the content key of every possible result to its fixture id."""
+    ids = {content_key(document["content"]): f"doc:{document['id']}" for document in corpus["documents"]}
+    driver = engine.graph_store.driver
+    for match, edge_id in zip(driver.matches, driver.edge_ids):
+        description = engine.graph_store._format_path(match["c"], match["r"], match["related"])
+        ids[content_key(description)] = f"edge:{edge_id}"
+    return ids
+
+
+async def run_strategy(engine: HybridSearchEngine, strategy: str, query: str, top_k: int) -> List[SearchResult]:
+    """Run one query with one ranking strategy, without a confidence threshold."""
+    if strategy == "interleave":
+        vector_results, graph_results = await asyncio.gather(
+            engine._vector_search(query, top_k, 0.0),
+            engine._graph_search(query, top_k, 0.0),
+        )
+        return interleave(vector_results, graph_results, top_k)
+    return await engine.search(query, mode=strategy, max_results=top_k, confidence_threshold=0.0)
+
+
+async def evaluate(corpus: Dict[str, Any], engine: HybridSearchEngine, top_k: int,
+                   repeat: int) -> Dict[str, Dict[str, float]]:
+    """Measure recall@k, reciprocal rank and latency of every strategy."""
+    ids = result_ids(corpus, engine)
+    report = {}
+    for strategy in STRATEGIES:
+        recalls, reciprocal_ranks, timings = [], [], []
+        for item in corpus["queries"]:
+            relevant = set(item["relevant"])
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results = await run_strategy(engine, strategy, item["query"], top_k)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            found = [ids.get(content_key(result.content)) for result in results]
+            recalls.append(len(relevant.intersection(found)) / len(relevant))
+            first_hit = next((rank for rank, found_id in enumerate(found, 1) if found_id in relevant), None)
+            reciprocal_ranks.append(1.0 / first_hit if first_hit else 0.0)
+
+        timings.sort()
+        report[strategy] = {
+            "recall": statistics.mean(recalls),
+            "mrr": statistics.mean(reciprocal_ranks),
+            "mean_ms": statistics.mean(timings),
+            "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        }
+    return report
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    with open(args.corpus, "r") as f:
+        corpus = json.load(f)
+
+    if args.model:
+        from sentence_transformers import SentenceTransformer
+        embedder = SentenceTransformer(args.model)
+        dimensions = embedder.get_sentence_embedding_dimension()
+    else:
+        dimensions = args.dimensions
+        embedder = HashingEmbedder(dimensions)
+
+    engine = await build_engine(corpus, embedder, dimensions, args.cache)
+    return await evaluate(corpus, engine, args.top_k, args.repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate hybrid search ranking offline")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="Fixture corpus JSON file")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per query")
+    parser.add_argument("--model", help="sentence-transformers model instead of the hashing embedder")
+    parser.add_argument("--dimensions", type=int, default=384, help="Hashing embedder dimensions")
+    parser.add_argument("--cache", action="store_true", help="Enable the query and result caches")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    # Per-query info logs would drown the report and skew the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    report = asyncio.run(main_async(args))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'strategy':<12} {'recall@' + str(args.top_k):>9} {'MRR':>6} {'mean ms':>9} {'p95 ms':>8}")
+    for strategy, metrics in report.items():
+        print(f"{strategy:<12} {metrics['recall']:>9.3f} {metrics['mrr']:>6.3f} "
+              f"{metrics['mean_ms']:>9.2f} {metrics['p95_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,21 @@
 
 This module implements RESTful API endpoints for URL mapping management,
 including CRUD operations, filtering, pagination, and statistics.
+
+Handlers await ``AsyncURLMappingService``, so a request waiting on the
+database does not hold up the other requests on the event loop.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-
-from ..database import get_db
-from ..services.url_mapping_service import URLMappingService
-from ..models.url_mappings import (
-    URLMappingCreate, URLMappingUpdate, URLMappingResponse, 
-    URLMappingListResponse, URLMappingStats
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from ..url_mapping_service.async_service import AsyncURLMappingService, get_async_service
+from ..url_mapping_service.models import (
+    URLMappingCreate, URLMappingUpdate, URLMappingResponse,
+    URLMappingListResponse, URLMappingStats,
+    BulkStatusUpdate, BulkStatusUpdateResponse
 )
-from ..exceptions import (
+from ..url_mapping_service.exceptions import (
     URLMappingNotFoundError, URLMappingValidationError,
     URLMappingDuplicateError, DatabaseError
 )
@@ -24,9 +25,9 @@ from ..exceptions import (
 router = APIRouter(prefix="/api/url-mappings", tags=["URL Mappings"])
 
 
-def get_url_mapping_service(db: Session = Depends(get_db)) -> URLMappingService:
+def get_url_mapping_service() -> AsyncURLMappingService:
     """Dependency to get URL mapping service."""
-    return URLMappingService(db)
+    return get_async_service()
 
 
 @router.get(
@@ -36,29 +37,23 @@ def get_url_mapping_service(db: Session = Depends(get_db)) -> URLMappingService:
     description="Retrieve a paginated list of URL mappings with optional filtering"
 )
 async def list_url_mappings(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    category: Optional[str] = Query(None, description="Filter by category"),
-    url_config_id: Optional[int] = Query(None, ge=1, description="Filter by URL config ID"),
-    extractor_id: Optional[int] = Query(None, ge=1, description="Filter by extractor ID"),
-    search: Optional[str] = Query(None, description="Search in name and notes"),
-    sort_by: str = Query("created_at", description="Field to sort by"),
-    sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
-    service: URLMappingService = Depends(get_url_mapping_service)
+    url_config_id: Optional[str] = Query(None, description="Filter by URL config ID"),
+    extractor_id: Optional[str] = Query(None, description="Filter by extractor ID"),
+    search: Optional[str] = Query(None, description="Search in extractor and URL config IDs"),
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """List URL mappings with filtering and pagination."""
     try:
-        return service.list_url_mappings(
-            skip=skip,
-            limit=limit,
-            is_active=is_active,
-            category=category,
+        return await service.list_mappings(
+            page=page,
+            size=size,
             url_config_id=url_config_id,
             extractor_id=extractor_id,
-            search=search,
-            sort_by=sort_by,
-            sort_order=sort_order
+            is_active=is_active,
+            search=search
         )
     except Exception as e:
         raise HTTPException(
@@ -72,138 +67,34 @@ async def list_url_mappings(
     response_model=URLMappingResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create URL mapping",
-    description="Create a new URL mapping with multiple extractors"
+    description="Create a new URL mapping for a URL configuration and extractor"
 )
 async def create_url_mapping(
     mapping_data: URLMappingCreate,
-    service: URLMappingService = Depends(get_url_mapping_service)
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Create a new URL mapping."""
     try:
-        print(f"🔍 CREATE URL MAPPING - Received data: {mapping_data.dict()}")
-        print(f"🔍 Field validation:")
-        print(f"  - name: {mapping_data.name} (type: {type(mapping_data.name)})")
-        print(f"  - url_config_id: {mapping_data.url_config_id} (type: {type(mapping_data.url_config_id)})")
-        print(f"  - extractor_ids: {mapping_data.extractor_ids} (type: {type(mapping_data.extractor_ids)})")
-        print(f"  - rate_limit: {mapping_data.rate_limit} (type: {type(mapping_data.rate_limit)})")
-        print(f"  - priority: {mapping_data.priority} (type: {type(mapping_data.priority)})")
-        print(f"  - is_active: {mapping_data.is_active} (type: {type(mapping_data.is_active)})")
-        
-        result = service.create_url_mapping(mapping_data)
-        print(f"🔍 CREATE URL MAPPING - Success: {result.dict()}")
-        return result
+        return await service.create_mapping(mapping_data)
     except URLMappingDuplicateError as e:
-        print(f"❌ CREATE URL MAPPING - Duplicate error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     except URLMappingValidationError as e:
-        print(f"❌ CREATE URL MAPPING - Validation error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e)
         )
     except DatabaseError as e:
-        print(f"❌ CREATE URL MAPPING - Database error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
-    except Exception as e:
-        print(f"❌ CREATE URL MAPPING - Unexpected error: {str(e)}")
-        print(f"❌ Error type: {type(e)}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}"
-        )
 
 
-@router.get(
-    "/{mapping_id}",
-    response_model=URLMappingResponse,
-    summary="Get URL mapping",
-    description="Retrieve a specific URL mapping by ID"
-)
-async def get_url_mapping(
-    mapping_id: int,
-    service: URLMappingService = Depends(get_url_mapping_service)
-):
-    """Get URL mapping by ID."""
-    try:
-        return service.get_url_mapping(mapping_id)
-    except URLMappingNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-
-
-@router.put(
-    "/{mapping_id}",
-    response_model=URLMappingResponse,
-    summary="Update URL mapping",
-    description="Update an existing URL mapping"
-)
-async def update_url_mapping(
-    mapping_id: int,
-    mapping_data: URLMappingUpdate,
-    service: URLMappingService = Depends(get_url_mapping_service)
-):
-    """Update URL mapping."""
-    try:
-        return service.update_url_mapping(mapping_id, mapping_data)
-    except URLMappingNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except URLMappingDuplicateError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except URLMappingValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
-
-
-@router.delete(
-    "/{mapping_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete URL mapping",
-    description="Delete a URL mapping and all its extractor associations"
-)
-async def delete_url_mapping(
-    mapping_id: int,
-    service: URLMappingService = Depends(get_url_mapping_service)
-):
-    """Delete URL mapping."""
-    try:
-        service.delete_url_mapping(mapping_id)
-        return JSONResponse(
-            status_code=status.HTTP_204_NO_CONTENT,
-            content=None
-        )
-    except URLMappingNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+# Fixed paths are registered before "/{mapping_id}" so they are not taken
+# for mapping IDs
 
 
 @router.get(
@@ -213,11 +104,11 @@ async def delete_url_mapping(
     description="Retrieve statistics about URL mappings"
 )
 async def get_url_mapping_stats(
-    service: URLMappingService = Depends(get_url_mapping_service)
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Get URL mapping statistics."""
     try:
-        return service.get_url_mapping_stats()
+        return await service.get_stats()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -232,12 +123,12 @@ async def get_url_mapping_stats(
     description="Retrieve all URL mappings that use a specific extractor"
 )
 async def get_mappings_by_extractor(
-    extractor_id: int,
-    service: URLMappingService = Depends(get_url_mapping_service)
+    extractor_id: str,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Get mappings by extractor ID."""
     try:
-        return service.get_mappings_by_extractor(extractor_id)
+        return await service.get_mappings_by_extractor(extractor_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -252,12 +143,12 @@ async def get_mappings_by_extractor(
     description="Retrieve all URL mappings for a specific URL configuration"
 )
 async def get_mappings_by_url_config(
-    url_config_id: int,
-    service: URLMappingService = Depends(get_url_mapping_service)
+    url_config_id: str,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Get mappings by URL config ID."""
     try:
-        return service.get_mappings_by_url_config(url_config_id)
+        return await service.get_mappings_by_url_config(url_config_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -267,32 +158,29 @@ async def get_mappings_by_url_config(
 
 @router.patch(
     "/bulk-status",
-    response_model=List[URLMappingResponse],
+    response_model=BulkStatusUpdateResponse,
     summary="Bulk update status",
     description="Update the active status of multiple URL mappings"
 )
 async def bulk_update_status(
-    mapping_ids: List[int],
-    is_active: bool,
-    service: URLMappingService = Depends(get_url_mapping_service)
+    bulk_update: BulkStatusUpdate,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Bulk update the active status of URL mappings."""
+    if not bulk_update.mapping_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one mapping ID must be provided"
+        )
+
+    if len(bulk_update.mapping_ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot update more than 100 mappings at once"
+        )
+
     try:
-        if not mapping_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="At least one mapping ID must be provided"
-            )
-        
-        if len(mapping_ids) > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot update more than 100 mappings at once"
-            )
-        
-        return service.bulk_update_status(mapping_ids, is_active)
-    except HTTPException:
-        raise
+        return await service.bulk_update_status(bulk_update)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -306,15 +194,15 @@ async def bulk_update_status(
     description="Check if the URL mapping service is healthy"
 )
 async def health_check(
-    service: URLMappingService = Depends(get_url_mapping_service)
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
 ):
     """Health check endpoint."""
     try:
-        # Try to perform a simple database operation
-        stats = service.get_url_mapping_stats()
+        health = await service.health_check()
+        stats = await service.get_stats()
         return {
-            "status": "healthy",
-            "timestamp": "2024-01-01T00:00:00Z",
+            "status": health.status,
+            "timestamp": health.timestamp,
             "total_mappings": stats.total_mappings
         }
     except Exception as e:
@@ -324,5 +212,92 @@ async def health_check(
         )
 
 
+@router.get(
+    "/{mapping_id}",
+    response_model=URLMappingResponse,
+    summary="Get URL mapping",
+    description="Retrieve a specific URL mapping by ID"
+)
+async def get_url_mapping(
+    mapping_id: str,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
+):
+    """Get URL mapping by ID."""
+    try:
+        return await service.get_mapping(mapping_id)
+    except URLMappingNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.put(
+    "/{mapping_id}",
+    response_model=URLMappingResponse,
+    summary="Update URL mapping",
+    description="Update an existing URL mapping"
+)
+async def update_url_mapping(
+    mapping_id: str,
+    mapping_data: URLMappingUpdate,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
+):
+    """Update URL mapping."""
+    try:
+        return await service.update_mapping(mapping_id, mapping_data)
+    except URLMappingNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except URLMappingDuplicateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except URLMappingValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete(
+    "/{mapping_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete URL mapping",
+    description="Delete a URL mapping"
+)
+async def delete_url_mapping(
+    mapping_id: str,
+    service: AsyncURLMappingService = Depends(get_url_mapping_service)
+):
+    """Delete URL mapping."""
+    try:
+        await service.delete_mapping(mapping_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except URLMappingNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except DatabaseError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 # Note: Exception handlers are defined in main.py for the FastAPI app
-# APIRouter doesn't support exception_handler decorator
\ No newline at end of file
+# APIRouter doesn't support exception_handler decorator
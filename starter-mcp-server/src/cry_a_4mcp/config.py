@@ -41,16 +41,36 @@ class Settings(BaseSettings):
     qdrant_api_key: Optional[str] = None
     qdrant_collection_name: str = "crypto_documents"
     qdrant_vector_size: int = 384  # sentence-transformers/all-MiniLM-L6-v2
+    qdrant_upsert_batch_size: int = 256  # Points per upsert request in bulk ingestion
+    qdrant_max_inflight_upserts: int = 4  # Concurrent upsert requests in bulk ingestion
     
     # Knowledge Graph (Neo4j)
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_username: str = "neo4j"
     neo4j_password: str = "password"
     neo4j_database: str = "neo4j"
+    neo4j_batch_size: int = 1000  # Rows per UNWIND transaction in bulk writes
     
     # Embedding Model
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_device: str = "cpu"
+    embedding_batch_size: Optional[int] = None  # Texts per encode call, None picks one for the device
+    embedding_chunk_words: int = 200  # Longer documents are split into overlapping chunks
+    embedding_chunk_overlap: int = 40
+    
+    # Sentiment model
+    sentiment_model_path: Optional[Path] = None  # ONNX sentiment classifier, None uses the lexicon
+    sentiment_tokenizer: str = "ProsusAI/finbert"
+    sentiment_max_batch_tokens: int = 8192  # Padded tokens per model call
+    
+    # Search caches
+    query_embedding_cache_size: int = 2048  # Query embeddings kept in memory, 0 disables
+    search_result_cache_size: int = 512  # Cached search result lists, 0 disables
+    search_result_cache_ttl: float = 30.0  # Seconds before a cached result list expires
+    
+    # Hybrid search ranking
+    search_overfetch_factor: int = 3  # Candidates fetched per backend, as a multiple of max_results
+    search_rrf_k: int = 60  # Reciprocal rank fusion damping constant
     
     # Rate Limiting
     rate_limit_requests_per_minute: int = 60
@@ -60,6 +80,9 @@ class Settings(BaseSettings):
     coinmarketcap_api_key: Optional[str] = None
     coingecko_api_key: Optional[str] = None
     
+    # Market data
+    market_data_dir: Path = Field(default_factory=lambda: Path("./data/ohlcv"))  # Local OHLCV store
+    
     # Security
     api_key: Optional[str] = None
     cors_origins: list[str] = ["*"]
@@ -1,12 +1,15 @@
 """Core dependencies for CRY-A-4MCP."""
 
-from typing import Generator
+from typing import AsyncGenerator
 from ..storage.url_configuration_db import URLConfigurationDatabase
 
 
-def get_url_config_db() -> Generator[URLConfigurationDatabase, None, None]:
+async def get_url_config_db() -> AsyncGenerator[URLConfigurationDatabase, None]:
     """Get URL configuration database instance.
     
+    The instance shares the database file's connection pool and releases it
+    when the request is done.
+    
     Yields:
         URLConfigurationDatabase: Database instance for URL configurations.
     """
@@ -14,5 +17,4 @@ def get_url_config_db() -> Generator[URLConfigurationDatabase, None, None]:
     try:
         yield db
     finally:
-        # Clean up if needed
-        pass
\ No newline at end of file
+        await db.close()
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""Pool of warmed, reusable browser instances.
+
+Starting a Crawl4AI browser takes seconds, so paying it for every URL
+dominates crawl latency. This module keeps a fixed number of started
+crawlers that live as long as their owner. Crawls check a browser out and
+return it afterwards. Browsers are health-checked on checkout and recycled
+after a number of pages, when memory grows past a limit, or when a crawl
+fails with a browser or connection error.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple, Type
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    PlaywrightError = PlaywrightTimeoutError = None
+
+logger = logging.getLogger(__name__)
+
+# Exceptions that mean the browser or its connection is broken
+BROWSER_ERRORS: Tuple[Type[BaseException], ...] = (ConnectionError, EOFError) + (
+    (PlaywrightError,) if PlaywrightError is not None else ()
+)
+
+# Page timeouts subclass the Playwright error but leave the browser usable
+TIMEOUT_ERRORS: Tuple[Type[BaseException], ...] = (
+    (PlaywrightTimeoutError,) if PlaywrightTimeoutError is not None else ()
+)
+
+
+class BrowserPoolClosedError(RuntimeError):
+    """Raised when a browser is requested from a closed pool."""
+
+
+# Wakes checkouts waiting on the idle queue when the pool closes
+_CLOSED = object()
+
+
+def process_tree_rss_mb() -> Optional[float]:
+    """Get the resident memory of this process and its children.
+
+    Browser processes are children of the crawler process, so this is the
+    memory the pool is responsible for.
+
+    Returns:
+        Resident set size in megabytes, or None if psutil is unavailable
+    """
+    if psutil is None:
+        return None
+    try:
+        process = psutil.Process(os.getpid())
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+async def _start_crawler(crawler: Any) -> None:
+    """Start a crawler using whichever lifecycle method it provides."""
+    for name in ("start", "astart"):
+        method = getattr(crawler, name, None)
+        if method is not None:
+            await method()
+            return
+    await crawler.__aenter__()
+
+
+async def _stop_crawler(crawler: Any) -> None:
+    """Stop a crawler using whichever lifecycle method it provides."""
+    for name in ("close", "aclose"):
+        method = getattr(crawler, name, None)
+        if method is not None:
+            await method()
+            return
+    await crawler.__aexit__(None, None, None)
+
+
+class _PooledBrowser:
+    """A started browser and its usage counters."""
+
+    __slots__ = ("crawler", "pages", "healthy")
+
+    def __init__(self, crawler: Any):
+        self.crawler = crawler
+        self.pages = 0
+        self.healthy = True
+
+
+class BrowserPool:
+    """Fixed-size pool of started crawlers.
+
+    Example:
+        pool = BrowserPool(lambda: AsyncWebCrawler(config=browser_config), size=3)
+        await pool.start()
+        async with pool.acquire() as crawler:
+            result = await crawler.arun(url=url, config=run_config)
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 2,
+        max_pages_per_browser: int = 100,
+        max_memory_growth_mb: Optional[float] = None,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        memory_probe: Callable[[], Optional[float]] = process_tree_rss_mb,
+        memory_check_interval: int = 10,
+        browser_errors: Tuple[Type[BaseException], ...] = BROWSER_ERRORS,
+        timeout_errors: Tuple[Type[BaseException], ...] = TIMEOUT_ERRORS,
+    ):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable returning a new, not yet started crawler
+            size: Number of browsers kept warm
+            max_pages_per_browser: Pages served before a browser is recycled
+                (0 disables page-based recycling)
+            max_memory_growth_mb: Recycle a browser on release when the memory
+                of the process tree has grown by more than this since the
+                pool was started (None disables memory-based recycling)
+            health_check: Callable returning False for a browser that must be
+                replaced before use; defaults to checking the crawler's
+                ``ready`` flag when it has one
+            memory_probe: Callable returning the current memory in megabytes;
+                it runs in a thread
+            memory_check_interval: Probe memory on every this many releases
+            browser_errors: Exception types raised inside ``acquire`` that
+                mark the browser as broken; other exceptions propagate and
+                the browser is reused
+            timeout_errors: Exception types that propagate without marking
+                the browser as broken, even when they subclass one of
+                ``browser_errors``
+        """
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_pages_per_browser = max(0, int(max_pages_per_browser))
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.health_check = health_check or self._default_health_check
+        self.memory_probe = memory_probe
+        self.memory_check_interval = max(1, int(memory_check_interval))
+        self.browser_errors = tuple(browser_errors)
+        self.timeout_errors = tuple(timeout_errors)
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._in_use = 0
+        self._waiting = 0
+        self._releases = 0
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._memory_baseline: Optional[float] = None
+        self._closed = False
+        self._stats = {
+            "pages_served": 0,
+            "browsers_started": 0,
+            "recycled_pages": 0,
+            "recycled_memory": 0,
+            "recycled_unhealthy": 0,
+        }
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has been started and not closed."""
+        return self._idle is not None and not self._closed
+
+    @staticmethod
+    def _default_health_check(crawler: Any) -> bool:
+        """Treat crawlers that report themselves as not ready as unhealthy."""
+        return getattr(crawler, "ready", True) is not False
+
+    async def _launch(self) -> _PooledBrowser:
+        """Create and start a new browser."""
+        crawler = self.factory()
+        await _start_crawler(crawler)
+        self._stats["browsers_started"] += 1
+        return _PooledBrowser(crawler)
+
+    async def _shutdown(self, browser: _PooledBrowser) -> None:
+        """Close a browser, logging rather than raising errors."""
+        try:
+            await _stop_crawler(browser.crawler)
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {e}")
+
+    async def start(self) -> None:
+        """Start and warm all browsers. Calling it again has no effect."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:
+                return
+            self._closed = False
+            idle: asyncio.Queue = asyncio.Queue()
+            browsers = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+            for browser in browsers:
+                idle.put_nowait(browser)
+            self._idle = idle
+            self._memory_baseline = await self._probe_memory()
+            logger.info(f"Browser pool started with {self.size} browsers")
+
+    async def _recycle(self, browser: _PooledBrowser, reason: str) -> _PooledBrowser:
+        """Replace a browser with a freshly started one."""
+        self._stats[f"recycled_{reason}"] += 1
+        logger.info(f"Recycling pooled browser ({reason}) after {browser.pages} pages")
+        await self._shutdown(browser)
+        return await self._launch()
+
+    async def _probe_memory(self) -> Optional[float]:
+        """Measure memory in a thread, or None if memory recycling is off."""
+        if self.max_memory_growth_mb is None:
+            return None
+        return await asyncio.to_thread(self.memory_probe)
+
+    async def _memory_exceeded(self) -> bool:
+        """Check, every ``memory_check_interval`` releases, whether memory has grown past the limit."""
+        if self.max_memory_growth_mb is None or self._memory_baseline is None:
+            return False
+        self._releases += 1
+        if self._releases % self.memory_check_interval:
+            return False
+        current = await self._probe_memory()
+        return current is not None and current - self._memory_baseline > self.max_memory_growth_mb
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Check out a started browser.
+
+        Waits while all browsers are in use. A browser whose crawl raised one
+        of ``browser_errors`` is replaced instead of being reused, unless the
+        error is one of ``timeout_errors``.
+
+        Yields:
+            A started crawler
+
+        Raises:
+            BrowserPoolClosedError: If the pool is closed before or while waiting
+            Exception: If an unhealthy browser could not be replaced
+        """
+        if self._closed:
+            raise BrowserPoolClosedError("Browser pool is closed")
+        if not self.started:
+            await self.start()
+
+        idle = self._idle
+        self._waiting += 1
+        try:
+            browser = await idle.get()
+        finally:
+            self._waiting -= 1
+        if browser is _CLOSED:
+            raise BrowserPoolClosedError("Browser pool was closed while waiting for a browser")
+        if not (browser.healthy and self.health_check(browser.crawler)):
+            try:
+                browser = await self._recycle(browser, "unhealthy")
+            except BaseException:
+                # Keep the slot so a later checkout retries the replacement
+                browser.healthy = False
+                await asyncio.shield(self._put_back(browser))
+                raise
+
+        self._in_use += 1
+        try:
+            yield browser.crawler
+        except self.timeout_errors:
+            raise
+        except self.browser_errors:
+            browser.healthy = False
+            raise
+        finally:
+            self._in_use -= 1
+            browser.pages += 1
+            self._stats["pages_served"] += 1
+            await asyncio.shield(self._release(browser))
+
+    async def _release(self, browser: _PooledBrowser) -> None:
+        """Return a browser to the pool, recycling it if needed."""
+        if self._closed:
+            await self._shutdown(browser)
+            return
+
+        reason = None
+        if not browser.healthy:
+            reason = "unhealthy"
+        elif self.max_pages_per_browser and browser.pages >= self.max_pages_per_browser:
+            reason = "pages"
+        elif await self._memory_exceeded():
+            reason = "memory"
+
+        if reason is not None:
+            try:
+                browser = await self._recycle(browser, reason)
+                if reason == "memory":
+                    self._memory_baseline = await self._probe_memory()
+            except Exception as e:
+                logger.error(f"Failed to replace pooled browser: {e}")
+                browser.healthy = False
+        await self._put_back(browser)
+
+    async def _put_back(self, browser: _PooledBrowser) -> None:
+        """Return a browser to the idle queue, or close it if the pool closed meanwhile."""
+        if self._closed or self._idle is None:
+            await self._shutdown(browser)
+        else:
+            self._idle.put_nowait(browser)
+
+    async def close(self) -> None:
+        """Close all idle browsers; browsers in use are closed on release.
+
+        Checkouts still waiting for a browser fail with ``BrowserPoolClosedError``.
+        """
+        if self._idle is None:
+            return
+        self._closed = True
+        idle, self._idle = self._idle, None
+        while not idle.empty():
+            await self._shutdown(idle.get_nowait())
+        for _ in range(self._waiting):
+            idle.put_nowait(_CLOSED)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool usage statistics.
+
+        Returns:
+            Dictionary with pool size, idle count and recycling counters
+        """
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "in_use": self._in_use,
+            **self._stats,
+        }
@@ -7,7 +7,7 @@ Implemented following Crawl4AI best practices for efficient web crawling
 and data extraction optimized for cryptocurrency content.
 """
 
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import asyncio
 import os
@@ -157,9 +157,13 @@ CRAWL4AI_AVAILABLE = CRAWL4AI_CORE_AVAILABLE
 
 from .models import CrawlResult, CryptoEntity, CryptoTriple, CrawlMetadata
 from .extractors import CryptoEntityExtractor, CryptoTripleExtractor
+from .frontier import CrawlFrontier
+from .browser_pool import BrowserPool
 from ..services.adaptive_strategy_service import AdaptiveStrategyService
 from ..models.adaptive_models import AdaptiveStrategyConfig, AdaptiveMetrics, LearnedPattern
 
+logger = logging.getLogger(__name__)
+
 
 class CryptoCrawler:
     """Cryptocurrency-specific web crawler using Crawl4AI.
@@ -188,7 +192,7 @@ class CryptoCrawler:
         self.entity_extractor = CryptoEntityExtractor(self.config)
         self.triple_extractor = CryptoTripleExtractor(self.config)
         self.initialized = False
-        self.crawler = None
+        self.browser_pool = None
         
         # Initialize adaptive strategy service
         self.adaptive_service = AdaptiveStrategyService()
@@ -239,12 +243,33 @@ class CryptoCrawler:
     async def initialize(self) -> None:
         """Initialize the crawler resources.
         
-        This method prepares the AsyncWebCrawler instance for crawling.
+        This method starts a pool of warmed AsyncWebCrawler instances that is
+        reused by every crawl until ``close`` is called. The pool is configured
+        by the optional ``browser_pool`` section of the configuration:
+        ``size`` (defaults to ``concurrent_crawlers``), ``max_pages_per_browser``,
+        ``max_memory_growth_mb`` and ``memory_check_interval``.
         """
-        # Initialize the AsyncWebCrawler with minimal configuration
-        # Pass any additional kwargs that AsyncWebCrawler accepts
-        self.crawler = AsyncWebCrawler(verbose=True)
+        if self.initialized:
+            return
+        
+        pool_config = self.config.get("browser_pool") or {}
+        self.browser_pool = BrowserPool(
+            self._create_browser,
+            size=pool_config.get("size", self.config.get("concurrent_crawlers", 5)),
+            max_pages_per_browser=pool_config.get("max_pages_per_browser", 100),
+            max_memory_growth_mb=pool_config.get("max_memory_growth_mb"),
+            memory_check_interval=pool_config.get("memory_check_interval", 10)
+        )
+        await self.browser_pool.start()
         self.initialized = True
+    
+    def _create_browser(self) -> AsyncWebCrawler:
+        """Create an AsyncWebCrawler for the browser pool."""
+        browser_config = BrowserConfig(
+            headless=self.headless,
+            user_agent=self.user_agent
+        )
+        return AsyncWebCrawler(config=browser_config, verbose=True)
         
     async def crawl_crypto_website(self, url: str, content_type: str, extract_entities: bool = True, generate_triples: bool = True) -> CrawlResult:
         """Crawl a cryptocurrency website or content source.
@@ -258,14 +283,14 @@ class CryptoCrawler:
         Returns:
             CrawlResult object containing the extracted content and entities
         """
-        if not self.initialized or not self.crawler:
+        if not self.initialized or not self.browser_pool:
             raise RuntimeError("Crawler not initialized. Call initialize() first.")
         
         start_time = datetime.utcnow()
         
         try:
-            # Use Crawl4AI to crawl the website with async context manager
-            async with self.crawler as crawler:
+            # Use a warmed browser from the pool
+            async with self.browser_pool.acquire() as crawler:
                 # Use imported classes from crawl4ai 0.7.0
                 
                 # Create crawler run config for crawl4ai 0.7.0
@@ -297,7 +322,7 @@ class CryptoCrawler:
             # Generate triples if requested
             triples = []
             if generate_triples and markdown_content:
-                triples = self.extract_triples(markdown_content)
+                triples = self.extract_triples(markdown_content, entities=entities if extract_entities else None)
             
             # Create metadata
             content_length = len(markdown_content) if markdown_content else 0
@@ -427,8 +452,9 @@ class CryptoCrawler:
     
     async def close(self) -> None:
         """Close the crawler and release resources."""
-        # Resources are automatically released by the async context manager
-        # in the crawl_crypto_website method
+        if self.browser_pool:
+            await self.browser_pool.close()
+            self.browser_pool = None
         self.initialized = False
     
     def extract_entities(self, text: str) -> List[CryptoEntity]:
@@ -442,16 +468,17 @@ class CryptoCrawler:
         """
         return self.entity_extractor.extract(text)
     
-    def extract_triples(self, text: str) -> List[CryptoTriple]:
+    def extract_triples(self, text: str, entities: Optional[List[CryptoEntity]] = None) -> List[CryptoTriple]:
         """Extract cryptocurrency relationship triples from text.
         
         Args:
             text: The text to analyze
+            entities: Entities already extracted from the text, if available
             
         Returns:
             List of extracted CryptoTriple objects
         """
-        return self.triple_extractor.extract(text)
+        return self.triple_extractor.extract(text, entities=entities)
     
     def get_website_by_name(self, name: str) -> Optional[Dict]:
         """Get website configuration by name.
@@ -514,8 +541,8 @@ class CryptoCrawler:
         """
         return [website for website in self.websites if website.get('crawl_frequency') == frequency]
     
-    async def crawl_all_websites(self, priority: Optional[str] = None, content_type: Optional[str] = None, frequency: Optional[str] = None) -> List[CrawlResult]:
-        """Crawl all websites matching the specified filters.
+    def _filter_websites(self, priority: Optional[str] = None, content_type: Optional[str] = None, frequency: Optional[str] = None) -> List[Dict]:
+        """Get the configured websites matching the specified filters.
         
         Args:
             priority: Optional priority filter (high, medium, low)
@@ -523,38 +550,104 @@ class CryptoCrawler:
             frequency: Optional crawl frequency filter (hourly, daily, weekly)
             
         Returns:
-            List of CrawlResult objects
+            List of website configuration dictionaries
         """
-        if not self.initialized or not self.crawler:
-            raise RuntimeError("Crawler not initialized. Call initialize() first.")
-        
-        # Filter websites based on provided criteria
-        websites_to_crawl = self.websites
+        websites = self.websites
         
         if priority:
-            websites_to_crawl = [w for w in websites_to_crawl if w.get('priority') == priority]
+            websites = [w for w in websites if w.get('priority') == priority]
         
         if content_type:
-            websites_to_crawl = [w for w in websites_to_crawl if w.get('content_type') == content_type]
+            websites = [w for w in websites if w.get('content_type') == content_type]
         
         if frequency:
-            websites_to_crawl = [w for w in websites_to_crawl if w.get('crawl_frequency') == frequency]
+            websites = [w for w in websites if w.get('crawl_frequency') == frequency]
         
-        # Crawl each website
-        results = []
-        for website in websites_to_crawl:
-            try:
-                result = await self.crawl_crypto_website(
-                    url=website['url'],
-                    content_type=website['content_type'],
-                    extract_entities=True,
-                    generate_triples=True
+        return websites
+    
+    def _create_frontier(self) -> CrawlFrontier:
+        """Create a crawl frontier from the concurrency and rate limiting configuration.
+        
+        ``concurrent_crawlers`` caps the total number of parallel crawls, and
+        ``rate_limiting.delay_between_requests`` and
+        ``rate_limiting.max_concurrent_per_host`` keep each host polite.
+        
+        Returns:
+            An empty CrawlFrontier
+        """
+        rate_limiting = self.config.get("rate_limiting") or {}
+        return CrawlFrontier(
+            max_concurrent=self.config.get("concurrent_crawlers", 5),
+            max_per_host=rate_limiting.get("max_concurrent_per_host", 1),
+            host_delay=rate_limiting.get("delay_between_requests", 0)
+        )
+    
+    async def crawl_websites_stream(self, websites: Optional[List[Dict]] = None, priority: Optional[str] = None, content_type: Optional[str] = None, frequency: Optional[str] = None) -> AsyncIterator[Tuple[Dict, CrawlResult]]:
+        """Crawl websites concurrently, yielding results as they finish.
+        
+        Websites are started in order of their ``priority`` field. Different
+        hosts are crawled in parallel up to ``concurrent_crawlers``, while
+        requests to the same host respect the rate limiting configuration.
+        
+        Args:
+            websites: Website configurations to crawl (each needs ``url`` and
+                ``content_type``); defaults to the configured websites
+            priority: Optional priority filter (high, medium, low)
+            content_type: Optional content type filter
+            frequency: Optional crawl frequency filter (hourly, daily, weekly)
+            
+        Yields:
+            Tuples of (website configuration, CrawlResult) in completion order
+        """
+        if not self.initialized or not self.browser_pool:
+            raise RuntimeError("Crawler not initialized. Call initialize() first.")
+        
+        if websites is None:
+            websites = self._filter_websites(priority, content_type, frequency)
+        
+        frontier = self._create_frontier()
+        for website in websites:
+            frontier.add(website['url'], website.get('priority'), website)
+        
+        async def fetch(url: str, website: Dict) -> CrawlResult:
+            return await self.crawl_crypto_website(
+                url=url,
+                content_type=website.get('content_type', 'news'),
+                extract_entities=True,
+                generate_triples=True
+            )
+        
+        async for outcome in frontier.run(fetch):
+            if outcome.error is not None:
+                logger.error(
+                    f"Error crawling {outcome.item.get('name', outcome.url)}: {outcome.error}",
+                    exc_info=outcome.error,
                 )
-                results.append(result)
-            except Exception as e:
-                print(f"Error crawling {website.get('name', website.get('url'))}: {str(e)}")
+                continue
+            yield outcome.item, outcome.result
+    
+    async def crawl_all_websites(self, priority: Optional[str] = None, content_type: Optional[str] = None, frequency: Optional[str] = None) -> List[CrawlResult]:
+        """Crawl all websites matching the specified filters.
+        
+        Websites are crawled concurrently (see ``crawl_websites_stream``); the
+        results are returned in configuration order.
+        
+        Args:
+            priority: Optional priority filter (high, medium, low)
+            content_type: Optional content type filter
+            frequency: Optional crawl frequency filter (hourly, daily, weekly)
+            
+        Returns:
+            List of CrawlResult objects
+        """
+        websites_to_crawl = self._filter_websites(priority, content_type, frequency)
+        positions = {id(website): index for index, website in enumerate(websites_to_crawl)}
+        
+        collected = []
+        async for website, result in self.crawl_websites_stream(websites_to_crawl):
+            collected.append((positions[id(website)], result))
         
-        return results
+        return [result for _, result in sorted(collected, key=lambda pair: pair[0])]
     
     async def crawl_with_adaptive_intelligence(self, url: str, strategy_config: Optional[AdaptiveStrategyConfig] = None, **kwargs) -> Dict:
         """Enhanced crawling with adaptive intelligence features from Crawl4AI v0.7.0.
@@ -567,7 +660,7 @@ class CryptoCrawler:
         Returns:
             Dictionary containing crawl results with adaptive intelligence metadata
         """
-        if not self.initialized or not self.crawler:
+        if not self.initialized or not self.browser_pool:
             raise RuntimeError("Crawler not initialized. Call initialize() first.")
         
         start_time = datetime.utcnow()
@@ -610,7 +703,7 @@ class CryptoCrawler:
             )
             
             # Perform adaptive crawling
-            async with self.crawler as crawler:
+            async with self.browser_pool.acquire() as crawler:
                 result = await crawler.arun(
                     url=url,
                     config=run_config
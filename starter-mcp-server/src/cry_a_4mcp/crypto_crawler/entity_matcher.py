@@ -0,0 +1,380 @@
+"""Compiled dictionary matcher for cryptocurrency entities.
+
+This module compiles a dictionary of tokens, symbols, exchanges, protocols
+and metrics into a single Aho-Corasick automaton. A document is scanned once,
+in time linear in its length regardless of the dictionary size, and every
+mention is reported with its position. Matches must start and end on word
+boundaries, so "eth" does not match inside "method" and "sol" does not match
+inside "solution".
+
+The default dictionary ships as ``entity_dictionary.json`` next to this module.
+Larger dictionaries can be loaded from additional JSON files in the same format:
+
+    {
+        "ambiguous_symbols": ["ONE", "NOT"],
+        "ambiguous_names": ["Optimism", "Curve"],
+        "context_words": ["crypto", "token", "defi"],
+        "tokens": [{"name": "Bitcoin", "symbol": "BTC", "aliases": ["XBT"]}],
+        "exchanges": [{"name": "Kraken", "case_sensitive": true}],
+        "protocols": [...],
+        "metrics": [...]
+    }
+
+Names and aliases match case-insensitively unless the entry is marked
+``case_sensitive``. Symbols match in upper case (``BTC``) or with a dollar
+prefix in any case (``$btc``). Symbols listed in ``ambiguous_symbols`` are
+common words and only match with the dollar prefix. Names and aliases listed
+in ``ambiguous_names`` are common words too ("optimism", "curve"); they only
+match when the same sentence also contains the entity's ticker or one of the
+``context_words``.
+"""
+
+import json
+import logging
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "entity_dictionary.json")
+
+# Dictionary section -> entity type
+SECTION_TYPES = {
+    "tokens": "token",
+    "exchanges": "exchange",
+    "protocols": "protocol",
+    "metrics": "metric",
+}
+
+# Confidence of a name or alias match per entity type
+DEFAULT_CONFIDENCE = {
+    "token": 0.9,
+    "exchange": 0.85,
+    "protocol": 0.85,
+    "metric": 0.95,
+}
+
+# Symbols are more ambiguous than full names
+SYMBOL_CONFIDENCE_PENALTY = 0.1
+
+# Characters that end the sentence an ambiguous name must find its context in
+SENTENCE_BREAKS = ".!?\n"
+
+
+class EntityEntry(NamedTuple):
+    """A dictionary entity."""
+
+    name: str
+    entity_type: str
+    symbol: Optional[str]
+
+
+class EntityMention(NamedTuple):
+    """One occurrence of an entity in a text."""
+
+    entity: EntityEntry
+    start: int
+    end: int
+    matched_symbol: bool
+    confidence: float
+
+
+class _Pattern(NamedTuple):
+    """A compiled surface form of an entity."""
+
+    entity_index: int
+    length: int
+    # Exact text the match must have, or None for case-insensitive matches
+    exact: Optional[str]
+    is_symbol: bool
+    # Whether the match needs the entity's ticker or a context word nearby
+    needs_context: bool = False
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class EntityMatcher:
+    """Aho-Corasick matcher over an entity dictionary.
+
+    Example:
+        matcher = EntityMatcher.from_files([DEFAULT_DICTIONARY_PATH])
+        for mention in matcher.find(text):
+            print(mention.entity.name, mention.start, mention.end)
+    """
+
+    def __init__(self):
+        """Initialize an empty matcher."""
+        self.entities: List[EntityEntry] = []
+        self._entity_index: Dict[Tuple[str, str], int] = {}
+        self._patterns: List[_Pattern] = []
+        self._pattern_keys: set = set()
+        self._ambiguous_symbols: set = set()
+        self._ambiguous_names: set = set()
+        self._context_words: set = set()
+        self._context_regex: Optional["re.Pattern"] = None
+        self._children: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[int]] = [[]]
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]
+        self._dirty = False
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> "EntityMatcher":
+        """Build a matcher from dictionary files.
+
+        Args:
+            paths: JSON dictionary files, loaded in order
+
+        Returns:
+            A compiled EntityMatcher
+        """
+        matcher = cls()
+        for path in paths:
+            matcher.load(path)
+        matcher.compile()
+        return matcher
+
+    def load(self, path: str) -> None:
+        """Add every entity from a JSON dictionary file.
+
+        Args:
+            path: Path to the dictionary file
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+        self.load_dict(data)
+        logger.debug(f"Loaded entity dictionary {path} ({len(self.entities)} entities)")
+
+    def load_dict(self, data: Dict) -> None:
+        """Add every entity from a parsed dictionary.
+
+        Args:
+            data: Dictionary in the ``entity_dictionary.json`` format
+        """
+        self._ambiguous_symbols.update(symbol.upper() for symbol in data.get("ambiguous_symbols", []))
+        self._ambiguous_names.update(name.lower() for name in data.get("ambiguous_names", []))
+        context_words = {word.lower() for word in data.get("context_words", [])}
+        if not context_words <= self._context_words:
+            self._context_words |= context_words
+            self._context_regex = re.compile(
+                r"(?<!\w)(?:" + "|".join(map(re.escape, sorted(self._context_words, key=len, reverse=True)))
+                + r")(?!\w)",
+                re.IGNORECASE,
+            )
+        for section, entity_type in SECTION_TYPES.items():
+            for entry in data.get(section, []):
+                self.add_entity(
+                    entry["name"],
+                    entity_type,
+                    symbol=entry.get("symbol"),
+                    aliases=entry.get("aliases", []),
+                    case_sensitive=entry.get("case_sensitive", False),
+                )
+
+    def add_entity(self, name: str, entity_type: str, symbol: Optional[str] = None,
+                   aliases: Iterable[str] = (), case_sensitive: bool = False) -> None:
+        """Add an entity and its surface forms.
+
+        Adding an entity that already exists only adds the new surface forms.
+
+        Args:
+            name: Canonical entity name
+            entity_type: Entity type (token, exchange, protocol, metric, ...)
+            symbol: Ticker symbol, if any
+            aliases: Other names for the entity
+            case_sensitive: Whether the name and aliases must match exactly
+        """
+        key = (entity_type, name.lower())
+        index = self._entity_index.get(key)
+        if index is None:
+            index = len(self.entities)
+            self.entities.append(EntityEntry(name, entity_type, symbol.upper() if symbol else None))
+            self._entity_index[key] = index
+
+        for form in (name, *aliases):
+            key = form.lower()
+            self._add_pattern(key, index, form if case_sensitive else None, False,
+                              needs_context=key in self._ambiguous_names)
+        if symbol:
+            symbol = symbol.upper()
+            # "$btc" and "$BTC" always refer to the ticker
+            self._add_pattern("$" + symbol.lower(), index, None, True)
+            if symbol not in self._ambiguous_symbols:
+                self._add_pattern(symbol.lower(), index, symbol, True)
+
+    def _add_pattern(self, key: str, entity_index: int, exact: Optional[str], is_symbol: bool,
+                     needs_context: bool = False) -> None:
+        """Insert a lower-cased surface form into the trie."""
+        if not key or (key, entity_index, exact) in self._pattern_keys:
+            return
+        self._pattern_keys.add((key, entity_index, exact))
+        pattern_id = len(self._patterns)
+        self._patterns.append(_Pattern(entity_index, len(key), exact, is_symbol, needs_context))
+
+        node = 0
+        for char in key:
+            child = self._children[node].get(char)
+            if child is None:
+                child = len(self._children)
+                self._children.append({})
+                self._outputs.append([])
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._children[node][char] = child
+            node = child
+        self._outputs[node].append(pattern_id)
+        self._dirty = True
+
+    def compile(self) -> None:
+        """Compute failure and dictionary links breadth-first."""
+        children, fail, outputs, dict_link = self._children, self._fail, self._outputs, self._dict_link
+        queue = deque(children[0].values())
+        for child in queue:
+            fail[child] = 0
+            dict_link[child] = 0
+
+        while queue:
+            node = queue.popleft()
+            for char, child in children[node].items():
+                target = fail[node]
+                while target and char not in children[target]:
+                    target = fail[target]
+                target = children[target].get(char, 0)
+                fail[child] = target if target != child else 0
+                # Nearest proper suffix node that ends at least one pattern
+                fail_node = fail[child]
+                dict_link[child] = fail_node if outputs[fail_node] else dict_link[fail_node]
+                queue.append(child)
+        self._dirty = False
+
+    def _scan(self, text: str) -> List[Tuple[int, int, int]]:
+        """Find every boundary-aligned pattern occurrence.
+
+        Returns:
+            (start, end, pattern_id) tuples in order of their end position
+        """
+        if self._dirty:
+            self.compile()
+
+        lowered = text.lower()
+        # Lower-casing can change the length of a few non-ASCII characters;
+        # positions are only exact when it does not
+        if len(lowered) != len(text):
+            lowered = "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+        children, fail, outputs, dict_link, patterns = (
+            self._children, self._fail, self._outputs, self._dict_link, self._patterns
+        )
+        length = len(text)
+        found = []
+        node = 0
+        for position, char in enumerate(lowered):
+            while node and char not in children[node]:
+                node = fail[node]
+            node = children[node].get(char, 0)
+            match = node if outputs[node] else dict_link[node]
+            if not match:
+                continue
+
+            end = position + 1
+            if end < length and _is_word_char(text[end]):
+                continue
+            while match:
+                for pattern_id in outputs[match]:
+                    pattern = patterns[pattern_id]
+                    start = end - pattern.length
+                    if start > 0 and _is_word_char(text[start - 1]) and text[start] != "$":
+                        continue
+                    if pattern.exact is not None and text[start:end] != pattern.exact:
+                        continue
+                    found.append((start, end, pattern_id))
+                match = dict_link[match]
+        return found
+
+    def find(self, text: str) -> List[EntityMention]:
+        """Find entity mentions in a text.
+
+        Overlapping matches are resolved leftmost-longest, so "Bitcoin Cash"
+        is one mention rather than "Bitcoin" plus "Bitcoin Cash". Ambiguous
+        names without context in their sentence are dropped.
+
+        Args:
+            text: The text to scan
+
+        Returns:
+            Non-overlapping mentions in order of position
+        """
+        if not text:
+            return []
+
+        candidates = self._scan(text)
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+
+        mentions = []
+        covered_until = 0
+        for start, end, pattern_id in candidates:
+            if start < covered_until:
+                continue
+            pattern = self._patterns[pattern_id]
+            entity = self.entities[pattern.entity_index]
+            if pattern.needs_context and not self._has_context(text, start, end, entity):
+                continue
+            confidence = DEFAULT_CONFIDENCE.get(entity.entity_type, 0.8)
+            if pattern.is_symbol:
+                confidence -= SYMBOL_CONFIDENCE_PENALTY
+            mentions.append(EntityMention(entity, start, end, pattern.is_symbol, confidence))
+            covered_until = end
+        return mentions
+
+    def _has_context(self, text: str, start: int, end: int, entity: EntityEntry) -> bool:
+        """Check whether an ambiguous name's sentence shows it is the crypto entity.
+
+        Args:
+            text: The scanned text
+            start: Start of the ambiguous match
+            end: End of the ambiguous match
+            entity: The entity the match would refer to
+
+        Returns:
+            True if the sentence contains the entity's ticker or a context word
+        """
+        sentence_start = max(text.rfind(char, 0, start) for char in SENTENCE_BREAKS) + 1
+        sentence_end = min((pos for pos in (text.find(char, end) for char in SENTENCE_BREAKS) if pos >= 0),
+                           default=len(text))
+        sentence = text[sentence_start:sentence_end]
+        symbol = re.escape(entity.symbol) if entity.symbol else None
+        if symbol and re.search(r"(?<!\w)(?:\$(?i:" + symbol + ")|" + symbol + r")(?!\w)", sentence):
+            return True
+        return self._context_regex is not None and self._context_regex.search(sentence) is not None
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Count mentions of each entity in a text.
+
+        Args:
+            text: The text to scan
+
+        Returns:
+            Mapping of entity name to number of mentions
+        """
+        counts: Dict[str, int] = {}
+        for mention in self.find(text):
+            counts[mention.entity.name] = counts.get(mention.entity.name, 0) + 1
+        return counts
+
+
+@lru_cache(maxsize=8)
+def get_entity_matcher(paths: Tuple[str, ...] = (DEFAULT_DICTIONARY_PATH,)) -> EntityMatcher:
+    """Get a compiled matcher, shared by every caller using the same files.
+
+    Args:
+        paths: Dictionary files to load, in order
+
+    Returns:
+        A compiled EntityMatcher
+    """
+    return EntityMatcher.from_files(paths)
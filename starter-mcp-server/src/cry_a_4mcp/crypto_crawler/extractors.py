@@ -4,8 +4,11 @@ This module provides specialized extractors for cryptocurrency entities
 and relationships from web content and other sources.
 """
 
+import bisect
+import re
 from typing import Dict, List, Optional, Tuple
 
+from .entity_matcher import DEFAULT_DICTIONARY_PATH, EntityEntry, EntityMention, get_entity_matcher
 from .models import CryptoEntity, CryptoTriple
 
 
@@ -14,8 +17,15 @@ class CryptoEntityExtractor:
     
     This class implements methods to identify and extract cryptocurrency-specific
     entities like tokens, exchanges, protocols, addresses, etc. from text content.
+    
+    Entities are found with a compiled dictionary matcher (see
+    ``entity_matcher``) in a single pass over the text. Additional dictionary
+    files can be listed in the ``entity_dictionaries`` configuration key.
     """
     
+    # Characters of surrounding text kept as context for each entity
+    CONTEXT_WINDOW = 60
+    
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the cryptocurrency entity extractor.
         
@@ -23,71 +33,61 @@ class CryptoEntityExtractor:
             config: Optional configuration dictionary for the extractor
         """
         self.config = config or {}
+        paths = (DEFAULT_DICTIONARY_PATH, *self.config.get("entity_dictionaries", []))
+        self.matcher = get_entity_matcher(tuple(paths))
+    
+    def find_mentions(self, text: str) -> List[EntityMention]:
+        """Find every entity mention in text.
+        
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            List of EntityMention tuples with positions, in text order
+        """
+        return self.matcher.find(text)
     
     def extract(self, text: str) -> List[CryptoEntity]:
         """Extract cryptocurrency entities from text.
         
+        Each entity is returned once, in order of its first mention. The
+        ``properties`` of an entity hold its mention count and positions.
+        
         Args:
             text: The text to analyze
             
         Returns:
             List of extracted CryptoEntity objects
         """
-        entities = []
-        
-        # Common cryptocurrency tokens to look for
-        crypto_tokens = {
-            "Bitcoin": "BTC",
-            "Ethereum": "ETH",
-            "Binance Coin": "BNB",
-            "Cardano": "ADA",
-            "Solana": "SOL",
-            "XRP": "XRP",
-            "Polkadot": "DOT",
-            "Dogecoin": "DOGE",
-            "Avalanche": "AVAX",
-            "Chainlink": "LINK"
-        }
-        
-        # Look for token names and symbols in the text
-        for token_name, symbol in crypto_tokens.items():
-            if token_name.lower() in text.lower():
-                entities.append(CryptoEntity(
-                    name=token_name,
-                    entity_type="token",
-                    symbol=symbol,
-                    confidence=0.9,
-                    context=f"Found in crawled content"
-                ))
-            elif symbol.lower() in text.lower():
-                entities.append(CryptoEntity(
-                    name=token_name,
-                    entity_type="token",
-                    symbol=symbol,
-                    confidence=0.8,
-                    context=f"Symbol found in crawled content"
-                ))
+        grouped: Dict[EntityEntry, List[EntityMention]] = {}
+        for mention in self.find_mentions(text):
+            grouped.setdefault(mention.entity, []).append(mention)
         
-        # Look for specific terms related to Altcoin Season Index
-        if "altcoin season" in text.lower() or "altseason" in text.lower():
+        entities = []
+        for entry, mentions in grouped.items():
+            first = mentions[0]
+            start = max(0, first.start - self.CONTEXT_WINDOW)
+            end = min(len(text), first.end + self.CONTEXT_WINDOW)
+            context = " ".join(text[start:end].split())
+            properties = {
+                "mention_count": len(mentions),
+                "positions": [[mention.start, mention.end] for mention in mentions],
+                "symbol_only": all(mention.matched_symbol for mention in mentions)
+            }
+            # CryptoEntity only accepts alphabetic symbols; keep others (e.g. 1INCH) as a property
+            symbol = entry.symbol
+            if symbol and not (symbol.isalpha() and 2 <= len(symbol) <= 10):
+                properties["ticker"] = symbol
+                symbol = None
             entities.append(CryptoEntity(
-                name="Altcoin Season Index",
-                entity_type="metric",
-                confidence=0.95,
-                context="Market indicator for altcoin performance"
+                name=entry.name,
+                entity_type=entry.entity_type,
+                symbol=symbol,
+                confidence=max(mention.confidence for mention in mentions),
+                context=context,
+                properties=properties
             ))
         
-        # Look for exchanges
-        exchanges = ["Binance", "Coinbase", "Kraken", "FTX", "Huobi", "KuCoin"]
-        for exchange in exchanges:
-            if exchange.lower() in text.lower():
-                entities.append(CryptoEntity(
-                    name=exchange,
-                    entity_type="exchange",
-                    confidence=0.85,
-                    context=f"Exchange mentioned in content"
-                ))
-        
         return entities
 
 
@@ -96,8 +96,15 @@ class CryptoTripleExtractor:
     
     This class implements methods to identify and extract subject-predicate-object
     triples related to cryptocurrency from text content.
+    
+    Pairwise relationships such as ``trades_on`` are only created for entities
+    mentioned in the same sentence, or within ``triple_sentence_window``
+    neighbouring sentences when that configuration key is set.
     """
     
+    # Sentence ends, paragraph breaks and the start of markdown headings, lists and tables
+    SENTENCE_BREAK = re.compile(r"[.!?](?=\s)|\n\s*\n|\n(?=\s*[#*\-|>])")
+    
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the cryptocurrency triple extractor.
         
@@ -106,12 +113,14 @@ class CryptoTripleExtractor:
         """
         self.config = config or {}
         self.entity_extractor = CryptoEntityExtractor(config)
+        self.sentence_window = max(0, int(self.config.get("triple_sentence_window", 0)))
     
-    def extract(self, text: str) -> List[CryptoTriple]:
+    def extract(self, text: str, entities: Optional[List[CryptoEntity]] = None) -> List[CryptoTriple]:
         """Extract cryptocurrency relationship triples from text.
         
         Args:
             text: The text to analyze
+            entities: Entities already extracted from the text, if available
             
         Returns:
             List of extracted CryptoTriple objects
@@ -119,15 +128,20 @@ class CryptoTripleExtractor:
         triples = []
         
         # First extract entities to use as subjects and objects
-        entities = self.entity_extractor.extract(text)
+        if entities is None:
+            entities = self.entity_extractor.extract(text)
         
-        # Create a mapping of entity names to their types
-        entity_types = {entity.name: entity.entity_type for entity in entities}
+        # Group entities by type in one pass
+        by_type: Dict[str, List[CryptoEntity]] = {}
+        for entity in entities:
+            by_type.setdefault(entity.entity_type, []).append(entity)
+        tokens = by_type.get("token", [])
+        names = {entity.name for entity in entities}
         
         # Look for specific relationships in the Altcoin Season Index context
-        if "Altcoin Season Index" in entity_types:
+        if "Altcoin Season Index" in names:
             # If Bitcoin is mentioned, create a relationship with Altcoin Season Index
-            if "Bitcoin" in entity_types:
+            if "Bitcoin" in names:
                 triples.append(CryptoTriple(
                     subject="Altcoin Season Index",
                     predicate="compares_with",
@@ -137,8 +151,8 @@ class CryptoTripleExtractor:
                 ))
             
             # For each altcoin mentioned, create a relationship
-            for entity in entities:
-                if entity.entity_type == "token" and entity.name != "Bitcoin":
+            for entity in tokens:
+                if entity.name != "Bitcoin":
                     triples.append(CryptoTriple(
                         subject=entity.name,
                         predicate="measured_by",
@@ -147,18 +161,80 @@ class CryptoTripleExtractor:
                         source="Altcoin Season Index page"
                     ))
         
-        # Look for exchange relationships
+        # Look for exchange relationships between tokens and exchanges mentioned together
+        if tokens and by_type.get("exchange"):
+            pairs = self._cooccurring_pairs(text, tokens, by_type["exchange"])
+            for (token, exchange), count in pairs.items():
+                triples.append(CryptoTriple(
+                    subject=token,
+                    predicate="trades_on",
+                    object=exchange,
+                    confidence=min(0.9, 0.7 + 0.05 * (count - 1)),
+                    source="Inferred from content",
+                    properties={"cooccurrences": count}
+                ))
+        
+        return triples
+    
+    def _sentence_index(self, text: str) -> List[int]:
+        """Get the offsets at which each sentence after the first starts."""
+        return [match.end() for match in self.SENTENCE_BREAK.finditer(text)]
+    
+    def _mention_starts(self, text: str, entities: List[CryptoEntity]) -> List[Tuple[int, str]]:
+        """Get (start offset, entity name) for every mention of the given entities.
+        
+        Positions recorded by ``CryptoEntityExtractor`` are used when present;
+        entities without them are located with one extra scan of the text.
+        """
+        starts = []
+        missing = set()
         for entity in entities:
-            if entity.entity_type == "exchange":
-                # For each token, create a relationship with the exchange
-                for other_entity in entities:
-                    if other_entity.entity_type == "token":
-                        triples.append(CryptoTriple(
-                            subject=other_entity.name,
-                            predicate="trades_on",
-                            object=entity.name,
-                            confidence=0.7,
-                            source="Inferred from content"
-                        ))
-        
-        return triples
\ No newline at end of file
+            positions = entity.properties.get("positions")
+            if positions is None:
+                missing.add(entity.name)
+            else:
+                starts.extend((start, entity.name) for start, _ in positions)
+        
+        if missing:
+            for mention in self.entity_extractor.find_mentions(text):
+                if mention.entity.name in missing:
+                    starts.append((mention.start, mention.entity.name))
+        return starts
+    
+    def _cooccurring_pairs(self, text: str, subjects: List[CryptoEntity], objects: List[CryptoEntity]) -> Dict[Tuple[str, str], int]:
+        """Count the sentences in which subject and object entities appear together.
+        
+        Args:
+            text: The text the entities were extracted from
+            subjects: Entities used as triple subjects
+            objects: Entities used as triple objects
+            
+        Returns:
+            Mapping of (subject name, object name) to the number of sentences
+            (or sentence windows) in which both are mentioned, in order of
+            first co-occurrence
+        """
+        sentence_starts = self._sentence_index(text)
+        
+        def bucket(entities: List[CryptoEntity]) -> Dict[int, List[str]]:
+            sentences: Dict[int, List[str]] = {}
+            for start, name in sorted(self._mention_starts(text, entities)):
+                names = sentences.setdefault(bisect.bisect_right(sentence_starts, start), [])
+                if name not in names:
+                    names.append(name)
+            return sentences
+        
+        subject_sentences = bucket(subjects)
+        object_sentences = bucket(objects)
+        
+        pairs: Dict[Tuple[str, str], int] = {}
+        for sentence in sorted(subject_sentences):
+            nearby = []
+            for offset in range(sentence - self.sentence_window, sentence + self.sentence_window + 1):
+                for name in object_sentences.get(offset, ()):
+                    if name not in nearby:
+                        nearby.append(name)
+            for subject in subject_sentences[sentence]:
+                for obj in nearby:
+                    pairs[(subject, obj)] = pairs.get((subject, obj), 0) + 1
+        return pairs
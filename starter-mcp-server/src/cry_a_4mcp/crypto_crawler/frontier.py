@@ -0,0 +1,205 @@
+"""Crawl frontier with global and per-host politeness limits.
+
+This module provides a priority queue of URLs that is drained by a bounded
+pool of workers. Different hosts are crawled in parallel, while each host is
+limited to a few concurrent requests with a delay between them, so a full
+crawl cycle takes roughly as long as the slowest host instead of the sum of
+all hosts.
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Rank of the website ``priority`` values; lower ranks are crawled first
+PRIORITY_RANKS = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+
+def priority_rank(priority: Union[str, int, float, None]) -> float:
+    """Convert a website priority into a sortable rank.
+
+    Args:
+        priority: A name from ``PRIORITY_RANKS``, a number (lower first) or None
+
+    Returns:
+        Rank used for ordering; unknown names and None rank as "medium"
+    """
+    if isinstance(priority, (int, float)) and not isinstance(priority, bool):
+        return float(priority)
+    if isinstance(priority, str):
+        return float(PRIORITY_RANKS.get(priority.lower(), PRIORITY_RANKS["medium"]))
+    return float(PRIORITY_RANKS["medium"])
+
+
+def host_of(url: str) -> str:
+    """Get the politeness key (lower-cased host name) for a URL."""
+    return (urlparse(url).hostname or url).lower()
+
+
+class FrontierResult(NamedTuple):
+    """Outcome of one crawled URL."""
+
+    url: str
+    item: Any
+    result: Any
+    error: Optional[BaseException]
+
+
+class _HostState:
+    """Concurrency and pacing state for one host."""
+
+    __slots__ = ("active", "next_start")
+
+    def __init__(self):
+        self.active = 0
+        self.next_start = 0.0
+
+
+class CrawlFrontier:
+    """Priority crawl queue drained by a bounded pool of workers.
+
+    URLs are taken in priority order, skipping URLs whose host is at its
+    concurrency limit or still inside its politeness delay. Results are
+    streamed back in completion order.
+
+    Example:
+        frontier = CrawlFrontier(max_concurrent=10, host_delay=1.0)
+        for website in websites:
+            frontier.add(website["url"], website.get("priority"), website)
+        async for outcome in frontier.run(fetch):
+            ...
+    """
+
+    def __init__(self, max_concurrent: int = 5, max_per_host: int = 1, host_delay: float = 0.0):
+        """Initialize the frontier.
+
+        Args:
+            max_concurrent: Maximum number of URLs crawled at the same time
+            max_per_host: Maximum number of concurrent requests per host
+            host_delay: Seconds between the end of one request to a host and
+                the start of the next one
+        """
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_per_host = max(1, int(max_per_host))
+        self.host_delay = max(0.0, float(host_delay))
+        # Sorted by (rank, sequence) so ties keep insertion order
+        self._pending: List[Tuple[float, int, str, Any]] = []
+        self._hosts: Dict[str, _HostState] = {}
+        self._counter = itertools.count()
+        self._changed: Optional[asyncio.Condition] = None
+
+    def __len__(self) -> int:
+        """Number of URLs waiting to be crawled."""
+        return len(self._pending)
+
+    def add(self, url: str, priority: Union[str, int, float, None] = None, item: Any = None) -> None:
+        """Queue a URL.
+
+        Args:
+            url: The URL to crawl
+            priority: Website priority (e.g., "high"); see ``priority_rank``
+            item: Value passed to the fetch function and returned with the result
+        """
+        bisect.insort(self._pending, (priority_rank(priority), next(self._counter), url, item))
+
+    def _take_ready(self, now: float) -> Tuple[Optional[Tuple[float, int, str, Any]], Optional[float]]:
+        """Remove the best URL whose host may be crawled now.
+
+        Returns:
+            The queue entry (or None) and, when nothing is ready, the seconds
+            until a host's delay expires (None if all waiting hosts are busy)
+        """
+        wait = None
+        blocked = set()
+        for position, entry in enumerate(self._pending):
+            host = host_of(entry[2])
+            if host in blocked:
+                continue
+            state = self._hosts.get(host)
+            if state is None:
+                return self._pending.pop(position), None
+            if state.active >= self.max_per_host:
+                blocked.add(host)
+                continue
+            if state.next_start <= now:
+                return self._pending.pop(position), None
+            delay = state.next_start - now
+            wait = delay if wait is None else min(wait, delay)
+            blocked.add(host)
+        return None, wait
+
+    async def _worker(self, fetch: Callable[[str, Any], Awaitable[Any]], results: asyncio.Queue) -> None:
+        """Crawl URLs until the frontier is empty."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            async with self._changed:
+                entry, wait = self._take_ready(loop.time())
+                if entry is None:
+                    if self._pending:
+                        try:
+                            await asyncio.wait_for(self._changed.wait(), wait)
+                        except asyncio.TimeoutError:
+                            pass
+                    continue
+
+            _, _, url, item = entry
+            state = self._hosts.setdefault(host_of(url), _HostState())
+            state.active += 1
+            result, error = None, None
+            try:
+                result = await fetch(url, item)
+            except Exception as e:
+                logger.error(f"Error crawling {url}: {e}")
+                error = e
+            finally:
+                state.active -= 1
+                state.next_start = loop.time() + self.host_delay
+                async with self._changed:
+                    self._changed.notify_all()
+            await results.put(FrontierResult(url, item, result, error))
+
+        # Let idle workers notice that the frontier is empty
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def run(self, fetch: Callable[[str, Any], Awaitable[Any]]) -> AsyncIterator[FrontierResult]:
+        """Crawl every queued URL, yielding results as they finish.
+
+        URLs must be added before calling ``run``. Leaving the loop early
+        cancels the URLs still in progress.
+
+        Args:
+            fetch: Coroutine function called as ``fetch(url, item)``
+
+        Yields:
+            A ``FrontierResult`` per URL, in completion order
+        """
+        remaining = len(self._pending)
+        if not remaining:
+            return
+
+        self._changed = asyncio.Condition()
+        results: asyncio.Queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._worker(fetch, results))
+            for _ in range(min(self.max_concurrent, remaining))
+        ]
+        try:
+            while remaining:
+                outcome = await results.get()
+                remaining -= 1
+                yield outcome
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
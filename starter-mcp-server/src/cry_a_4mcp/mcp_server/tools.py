@@ -241,6 +241,9 @@ class HybridSearchTool(BaseTool):
             if include_sources:
                 formatted_result["sources"] = result.sources
                 formatted_result["reasoning_path"] = result.reasoning_path
+                if result.provenance is not None:
+                    formatted_result["fusion_score"] = result.fusion_score
+                    formatted_result["provenance"] = result.provenance
             
             formatted_results.append(formatted_result)
         
@@ -250,6 +253,7 @@ class HybridSearchTool(BaseTool):
             "search_mode": search_mode,
             "results_count": len(formatted_results),
             "results": formatted_results,
+            "cache_stats": self.search_engine.get_cache_stats(),
         }
 
 
@@ -438,11 +442,17 @@ class UpdateKnowledgeGraphTool(BaseTool):
         )
         
         return {
-            "success": True,
+            "success": result.failed_batches == 0,
             "entities_added": result.entities_added,
             "entities_updated": result.entities_updated,
+            "entities_skipped": result.entities_skipped,
             "relationships_added": result.relationships_added,
             "relationships_updated": result.relationships_updated,
+            "relationships_skipped": result.relationships_skipped,
+            "failed_batches": result.failed_batches,
+            "elapsed_seconds": round(result.elapsed_seconds, 3),
+            "entities_per_second": round(result.entities_per_second, 1),
+            "relationships_per_second": round(result.relationships_per_second, 1),
             "source_url": source_url,
             "update_mode": update_mode,
         }
@@ -0,0 +1,286 @@
+"""Vectorized backtest engine for CRY-A-4MCP.
+
+Backtests take price arrays shaped ``(symbols, bars)`` and a matching array
+of target positions, and compute fills, costs, the equity curve and trade
+statistics as whole-array NumPy operations. Strategies are plain functions
+from prices to positions, so parameter sweeps can fan out across a process
+pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .indicators import INDICATOR_NAMES, classify, compute_indicators, rsi, sma
+
+# Costs as a fraction of traded notional
+DEFAULT_FEE_RATE = 0.001
+DEFAULT_SLIPPAGE = 0.0005
+
+# Strategy signature: (high, low, close, **params) -> target positions
+Strategy = Callable[..., np.ndarray]
+
+
+@dataclass
+class BacktestMetrics:
+    """Result of a vectorized backtest."""
+    positions: np.ndarray  # (symbols, bars) position held after each bar
+    returns: np.ndarray  # (bars,) portfolio return of each bar, after costs
+    equity: np.ndarray  # (bars,) portfolio value after each bar
+    drawdown: np.ndarray  # (bars,) fraction below the running peak
+    initial_capital: float
+    total_return: float  # Percentage
+    annualized_return: float  # Percentage
+    max_drawdown: float  # Percentage
+    sharpe_ratio: float
+    win_rate: float  # Percentage
+    profit_factor: float
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    avg_win: float  # Percentage return per winning trade
+    avg_loss: float  # Percentage return per losing trade
+    avg_holding_bars: float
+    total_costs: float  # Costs paid, in capital units
+
+    @property
+    def final_capital(self) -> float:
+        return float(self.equity[-1])
+
+    def summary(self) -> Dict[str, float]:
+        """Scalar metrics, without the per-bar arrays."""
+        return {
+            "final_capital": self.final_capital,
+            "total_return": self.total_return,
+            "annualized_return": self.annualized_return,
+            "max_drawdown": self.max_drawdown,
+            "sharpe_ratio": self.sharpe_ratio,
+            "win_rate": self.win_rate,
+            "profit_factor": self.profit_factor,
+            "total_trades": self.total_trades,
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "avg_win": self.avg_win,
+            "avg_loss": self.avg_loss,
+            "avg_holding_bars": self.avg_holding_bars,
+            "total_costs": self.total_costs,
+        }
+
+
+def run_backtest(close: np.ndarray, positions: np.ndarray, initial_capital: float = 10000.0,
+                 fee_rate: float = DEFAULT_FEE_RATE, slippage: float = DEFAULT_SLIPPAGE,
+                 periods_per_year: float = 365 * 24) -> BacktestMetrics:
+    """Backtest target positions against close prices.
+
+    The position for bar ``t`` is filled at its close and earns the return to
+    bar ``t + 1``, so signals never see the bar they profit from. Capital is
+    split equally across symbols. Each fill pays ``fee_rate + slippage`` on
+    the notional closed and on the notional opened.
+
+    Args:
+        close: Close prices shaped ``(symbols, bars)``.
+        positions: Target positions shaped like ``close``, from -1 (short)
+            to 1 (long); NaN means flat.
+        initial_capital: Starting portfolio value.
+        fee_rate: Exchange fee per unit of notional traded.
+        slippage: Price slippage per unit of notional traded.
+        periods_per_year: Bars per year, used to annualize returns and Sharpe.
+
+    Returns:
+        Backtest metrics.
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=np.float64))
+    positions = np.clip(np.nan_to_num(np.atleast_2d(np.asarray(positions, dtype=np.float64))), -1.0, 1.0)
+    if positions.shape != close.shape:
+        raise ValueError(f"Positions shape {positions.shape} does not match prices shape {close.shape}")
+    symbols, bars = close.shape
+    cost_rate = fee_rate + slippage
+
+    # Position held coming into each bar, flat before the first
+    held = np.zeros_like(positions)
+    held[:, 1:] = positions[:, :-1]
+
+    price_returns = np.zeros_like(close)
+    price_returns[:, 1:] = close[:, 1:] / close[:, :-1] - 1.0
+
+    # A changed position closes the held notional and opens the new one
+    changed = positions != held
+    exit_costs = np.where(changed, np.abs(held), 0.0) * cost_rate
+    entry_costs = np.where(changed, np.abs(positions), 0.0) * cost_rate
+    symbol_returns = held * price_returns - exit_costs - entry_costs
+
+    returns = symbol_returns.mean(axis=0)
+    equity = initial_capital * np.cumprod(1.0 + returns)
+    peak = np.maximum.accumulate(np.maximum(equity, initial_capital))
+    drawdown = 1.0 - equity / peak
+
+    total_growth = equity[-1] / initial_capital
+    std = returns.std()
+    sharpe_ratio = float(returns.mean() / std * np.sqrt(periods_per_year)) if std > 0 else 0.0
+    annualized_return = (total_growth ** (periods_per_year / bars) - 1.0) * 100 if total_growth > 0 else -100.0
+
+    trade_returns, holding_bars = _trade_returns(positions, held, price_returns, exit_costs, entry_costs)
+    wins = trade_returns[trade_returns > 0]
+    losses = trade_returns[trade_returns <= 0]
+    gross_loss = -losses.sum()
+
+    # Costs are charged on the capital allocated to each symbol
+    allocated = np.empty_like(close)
+    allocated[:, 0] = initial_capital
+    allocated[:, 1:] = equity[np.newaxis, :-1]
+    total_costs = float(((exit_costs + entry_costs) * allocated).sum() / symbols)
+
+    return BacktestMetrics(
+        positions=positions,
+        returns=returns,
+        equity=equity,
+        drawdown=drawdown,
+        initial_capital=initial_capital,
+        total_return=float((total_growth - 1.0) * 100),
+        annualized_return=float(annualized_return),
+        max_drawdown=float(drawdown.max() * 100),
+        sharpe_ratio=sharpe_ratio,
+        win_rate=float(len(wins) / len(trade_returns) * 100) if len(trade_returns) else 0.0,
+        profit_factor=float(wins.sum() / gross_loss) if gross_loss > 0 else 0.0,
+        total_trades=int(len(trade_returns)),
+        winning_trades=int(len(wins)),
+        losing_trades=int(len(losses)),
+        avg_win=float(wins.mean() * 100) if len(wins) else 0.0,
+        avg_loss=float(losses.mean() * 100) if len(losses) else 0.0,
+        avg_holding_bars=float(holding_bars.mean()) if len(holding_bars) else 0.0,
+        total_costs=total_costs,
+    )
+
+
+def _trade_returns(positions: np.ndarray, held: np.ndarray, price_returns: np.ndarray,
+                   exit_costs: np.ndarray, entry_costs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return and length of every trade.
+
+    A trade is a run of bars holding the same non-zero position. Its return
+    sums the bar returns earned while held, the cost of entering it and the
+    cost of leaving it. Trades still open at the end are marked to market.
+
+    Returns:
+        Tuple of (return of each trade, bars each trade was held).
+    """
+    symbols, bars = positions.shape
+    starts = positions != held
+    starts[:, 0] = True  # Each symbol starts a new run
+    run_ids = np.cumsum(starts.ravel()).reshape(positions.shape) - 1
+    runs = int(run_ids[-1, -1]) + 1
+
+    # Bar t earns the return of the run held coming into it, which also pays
+    # the exit cost, while the entry cost belongs to the run starting at t
+    held_runs = np.empty_like(run_ids)
+    held_runs[:, 1:] = run_ids[:, :-1]
+    held_runs[:, 0] = run_ids[:, 0]
+    earned = held * price_returns - exit_costs
+    run_returns = (np.bincount(held_runs.ravel(), weights=earned.ravel(), minlength=runs)
+                   - np.bincount(run_ids.ravel(), weights=entry_costs.ravel(), minlength=runs))
+    run_lengths = np.bincount(run_ids.ravel(), minlength=runs)
+
+    run_positions = positions.ravel()[np.flatnonzero(starts.ravel())]
+    is_trade = run_positions != 0
+    return run_returns[is_trade], run_lengths[is_trade]
+
+
+def forward_fill(events: np.ndarray, initial: float = 0.0) -> np.ndarray:
+    """Hold each non-NaN event until the next one, along the last axis.
+
+    Args:
+        events: Target positions where a signal fires, NaN elsewhere.
+        initial: Position before the first event.
+
+    Returns:
+        Positions shaped like ``events``.
+    """
+    events = np.asarray(events, dtype=np.float64)
+    bars = events.shape[-1]
+    index = np.where(np.isnan(events), -1, np.arange(bars))
+    last = np.maximum.accumulate(index, axis=-1)
+    filled = np.take_along_axis(events, np.maximum(last, 0), axis=-1)
+    return np.where(last >= 0, filled, initial)
+
+
+def ma_crossover(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 fast: int = 20, slow: int = 50) -> np.ndarray:
+    """Long while the fast moving average is above the slow one."""
+    return (sma(close, fast) > sma(close, slow)).astype(np.float64)
+
+
+def rsi_reversion(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                  period: int = 14, lower: float = 30.0, upper: float = 70.0) -> np.ndarray:
+    """Buy when RSI drops below ``lower`` and sell when it rises above ``upper``."""
+    values = rsi(close, period)
+    events = np.where(values < lower, 1.0, np.where(values > upper, 0.0, np.nan))
+    return forward_fill(events)
+
+
+def indicator_vote(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   thresholds: Dict[str, Tuple[float, float, int, int]],
+                   min_votes: int = 2, allow_short: bool = False) -> np.ndarray:
+    """Trade on the net vote of every signal indicator.
+
+    Args:
+        high: High prices shaped ``(symbols, bars)``.
+        low: Low prices shaped like ``high``.
+        close: Close prices shaped like ``high``.
+        thresholds: Indicator name to ``(lower, upper, below, above)``, where
+            ``below`` and ``above`` are 1 for a buy vote and -1 for a sell vote.
+        min_votes: Net votes needed to hold a position.
+        allow_short: Go short on net sell votes instead of staying flat.
+
+    Returns:
+        Target positions shaped like ``close``.
+    """
+    values = compute_indicators(high, low, close)
+    votes = np.zeros(np.shape(close), dtype=np.int16)
+    for name in INDICATOR_NAMES:
+        lower, upper, below, above = thresholds[name]
+        votes += classify(values[name], lower, upper, below, above)
+
+    positions = (votes >= min_votes).astype(np.float64)
+    if allow_short:
+        positions -= votes <= -min_votes
+    return positions
+
+
+# Arrays shared with sweep workers, set once per process
+_sweep_data: Dict[str, Any] = {}
+
+
+def _init_sweep_worker(high: np.ndarray, low: np.ndarray, close: np.ndarray, backtest_kwargs: Dict[str, Any]) -> None:
+    _sweep_data.update(high=high, low=low, close=close, backtest_kwargs=backtest_kwargs)
+
+
+def _run_sweep_point(strategy: Strategy, params: Dict[str, Any]) -> Dict[str, float]:
+    positions = strategy(_sweep_data["high"], _sweep_data["low"], _sweep_data["close"], **params)
+    return run_backtest(_sweep_data["close"], positions, **_sweep_data["backtest_kwargs"]).summary()
+
+
+def parameter_sweep(high: np.ndarray, low: np.ndarray, close: np.ndarray, strategy: Strategy,
+                    grid: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                    **backtest_kwargs) -> List[Tuple[Dict[str, Any], Dict[str, float]]]:
+    """Backtest a strategy for every parameter set across a process pool.
+
+    Prices are sent to each worker once, when it starts, and only parameters
+    and scalar metrics cross process boundaries per backtest.
+
+    Args:
+        high: High prices shaped ``(symbols, bars)``.
+        low: Low prices shaped like ``high``.
+        close: Close prices shaped like ``high``.
+        strategy: Module-level strategy function, so it can be pickled.
+        grid: Parameter sets passed to ``strategy`` as keyword arguments.
+        max_workers: Worker processes; defaults to the CPU count.
+        **backtest_kwargs: Arguments for ``run_backtest``.
+
+    Returns:
+        ``(params, metrics summary)`` for every parameter set, in grid order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                             initargs=(high, low, close, backtest_kwargs)) as executor:
+        summaries = list(executor.map(_run_sweep_point, [strategy] * len(grid), grid))
+    return list(zip(grid, summaries))
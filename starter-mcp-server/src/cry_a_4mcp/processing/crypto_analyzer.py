@@ -14,6 +14,12 @@ from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
 from ..config import Settings
+from .indicators import MA_PERIOD, bollinger_bands, macd, rsi, sma
+from .ohlcv_store import OHLCVStore
+
+# Daily bars behind market data and technical indicators
+DAILY_TIMEFRAME = "1d"
+LONG_MA_PERIOD = 200
 
 
 class AnalysisType(str, Enum):
@@ -109,6 +115,9 @@ class CryptoAnalyzer:
             "LTC": "Litecoin",
             "LINK": "Chainlink",
         }
+        
+        # Local OHLCV history; symbols without stored daily bars use mock data
+        self.market_data = OHLCVStore(settings.market_data_dir)
     
     async def initialize(self) -> None:
         """Initialize the analyzer."""
@@ -211,6 +220,25 @@ class CryptoAnalyzer:
         Returns:
             Market data
         """
+        bars = self.market_data.tail(symbol, DAILY_TIMEFRAME, 31)
+        if len(bars) >= 2:
+            close = bars.close
+            
+            def change(days: int) -> float:
+                previous = close[max(len(close) - 1 - days, 0)]
+                return float(100.0 * (close[-1] / previous - 1.0))
+            
+            return MarketData(
+                price=float(close[-1]),
+                # Market cap needs the circulating supply, which the store does not hold
+                market_cap=1000000000.0 if symbol == "BTC" else 500000000.0 if symbol == "ETH" else 10000000.0,
+                volume_24h=float(bars.volume[-1]),
+                price_change_24h=change(1),
+                price_change_7d=change(7),
+                price_change_30d=change(30),
+                timestamp=datetime.now(),
+            )
+        
         # In a real implementation, this would call an external API
         # For now, generate mock data
         return MarketData(
@@ -254,6 +282,22 @@ class CryptoAnalyzer:
         Returns:
             Technical data
         """
+        bars = self.market_data.tail(symbol, DAILY_TIMEFRAME, max(days_back, LONG_MA_PERIOD))
+        if len(bars) >= LONG_MA_PERIOD:
+            close = bars.close
+            lower, _, upper = bollinger_bands(close)
+            line, signal_line, _ = macd(close)
+            return TechnicalData(
+                rsi_14=float(rsi(close)[-1]),
+                ma_50=float(sma(close, MA_PERIOD)[-1]),
+                ma_200=float(sma(close, LONG_MA_PERIOD)[-1]),
+                bollinger_upper=float(upper[-1]),
+                bollinger_lower=float(lower[-1]),
+                macd=float(line[-1]),
+                macd_signal=float(signal_line[-1]),
+                timestamp=datetime.now(),
+            )
+        
         # In a real implementation, this would calculate technical indicators
         # For now, generate mock data
         return TechnicalData(
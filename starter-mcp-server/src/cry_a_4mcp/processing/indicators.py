@@ -0,0 +1,353 @@
+"""Vectorized technical indicators for CRY-A-4MCP.
+
+Indicators take price series as NumPy arrays whose last axis is time, so a
+``(symbols, bars)`` array computes the indicator for every symbol at once.
+Rolling windows use cumulative sums and exponential averages use a
+first-order recursive filter, so no indicator loops over bars per symbol.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+
+# Indicator parameters
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+BOLLINGER_PERIOD = 20
+BOLLINGER_STD = 2.0
+MA_PERIOD = 50
+STOCHASTIC_PERIOD = 14
+
+# Indicators computed by compute_indicators, in the order they are reported
+INDICATOR_NAMES = ("RSI", "MACD", "Bollinger Bands", "Moving Average", "Stochastic")
+
+# Bars needed before every indicator has a value
+MIN_HISTORY_BARS = max(RSI_PERIOD + 1, MACD_SLOW + MACD_SIGNAL, BOLLINGER_PERIOD, MA_PERIOD, STOCHASTIC_PERIOD)
+
+
+def as_series(values) -> np.ndarray:
+    """Convert values to a C-contiguous float64 array."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over the last axis.
+
+    Args:
+        values: Series with time on the last axis.
+        window: Number of bars averaged.
+
+    Returns:
+        Array shaped like ``values``; the first ``window - 1`` bars are NaN.
+    """
+    values = as_series(values)
+    out = np.full(values.shape, np.nan)
+    if window > values.shape[-1]:
+        return out
+
+    csum = np.cumsum(values, axis=-1)
+    out[..., window - 1] = csum[..., window - 1]
+    out[..., window:] = csum[..., window:] - csum[..., :-window]
+    out[..., window - 1:] /= window
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling population standard deviation over the last axis.
+
+    Args:
+        values: Series with time on the last axis.
+        window: Number of bars in each window.
+
+    Returns:
+        Array shaped like ``values``; the first ``window - 1`` bars are NaN.
+    """
+    values = as_series(values)
+    # Offsetting by the first bar keeps the sums of squares small, which
+    # avoids cancellation when prices are large and their variance small
+    centered = values - values[..., :1]
+    mean = sma(centered, window)
+    mean_sq = sma(centered * centered, window)
+    return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+
+def _smooth(values: np.ndarray, alpha: float, start: int, seed: np.ndarray) -> np.ndarray:
+    """Exponential smoothing ``y[t] = alpha * x[t] + (1 - alpha) * y[t - 1]``.
+
+    Args:
+        values: Series with time on the last axis.
+        alpha: Smoothing factor.
+        start: Bar holding the seed; earlier bars are NaN.
+        seed: Smoothed value at ``start``, one per series.
+
+    Returns:
+        Smoothed array shaped like ``values``.
+    """
+    out = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if start >= n:
+        return out
+
+    seed = np.asarray(seed, dtype=np.float64)
+    out[..., start] = seed
+    if start + 1 == n:
+        return out
+
+    decay = 1.0 - alpha
+    if lfilter is not None:
+        zi = (decay * seed)[..., np.newaxis]
+        out[..., start + 1:], _ = lfilter([alpha], [1.0, -decay], values[..., start + 1:], axis=-1, zi=zi)
+    else:
+        out[..., start + 1:] = _blocked_smooth(values[..., start + 1:], alpha, seed)
+    return out
+
+
+def _blocked_smooth(values: np.ndarray, alpha: float, seed: np.ndarray) -> np.ndarray:
+    """Exponential smoothing without SciPy.
+
+    Within a block of ``L`` bars the recursion has the closed form
+    ``y[k] = decay**k * (y[0] + alpha * sum(x[j] / decay**j for j <= k))``,
+    which is a cumulative sum over every block at once. Blocks are short
+    enough that ``decay**-L`` stays below 1e6, keeping the sums accurate, and
+    only the carry between blocks is a Python loop.
+    """
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        return values.copy()
+
+    n = values.shape[-1]
+    length = int(min(n, max(1, np.log(1e-6) / np.log(decay))))
+    blocks = -(-n // length)
+    padded = np.zeros(values.shape[:-1] + (blocks * length,))
+    padded[..., :n] = values
+    padded = padded.reshape(values.shape[:-1] + (blocks, length))
+
+    powers = decay ** np.arange(1, length + 1)
+    # Smoothed values within each block, starting from zero
+    local = powers * np.cumsum(padded * (alpha / powers), axis=-1)
+
+    # Carry the last value of each block into the next
+    carry = np.empty(values.shape[:-1] + (blocks,))
+    prev = np.asarray(seed, dtype=np.float64)
+    block_decay = powers[-1]
+    for b in range(blocks):
+        carry[..., b] = prev
+        prev = block_decay * prev + local[..., b, -1]
+
+    out = local + carry[..., np.newaxis] * powers
+    return out.reshape(values.shape[:-1] + (blocks * length,))[..., :n]
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the first bar.
+
+    Args:
+        values: Series with time on the last axis.
+        period: EMA span; the smoothing factor is ``2 / (period + 1)``.
+
+    Returns:
+        Array shaped like ``values``.
+    """
+    values = as_series(values)
+    return _smooth(values, 2.0 / (period + 1), 0, values[..., 0])
+
+
+def wilder_average(values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """Wilder's moving average seeded with a simple average.
+
+    Args:
+        values: Series with time on the last axis.
+        period: Averaging period; the smoothing factor is ``1 / period``.
+        start: First bar of ``values`` to average.
+
+    Returns:
+        Array shaped like ``values``; bars before ``start + period - 1`` are NaN.
+    """
+    values = as_series(values)
+    first = start + period - 1
+    if first >= values.shape[-1]:
+        return np.full(values.shape, np.nan)
+    seed = values[..., start:first + 1].mean(axis=-1)
+    return _smooth(values, 1.0 / period, first, seed)
+
+
+def rsi(close: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """Relative Strength Index with Wilder smoothing.
+
+    Args:
+        close: Close prices with time on the last axis.
+        period: RSI period.
+
+    Returns:
+        RSI from 0 to 100; the first ``period`` bars are NaN.
+    """
+    close = as_series(close)
+    delta = np.zeros(close.shape)
+    delta[..., 1:] = np.diff(close, axis=-1)
+    avg_gain = wilder_average(np.maximum(delta, 0.0), period, start=1)
+    avg_loss = wilder_average(np.maximum(-delta, 0.0), period, start=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    # No losses means RSI 100, and a flat window is neutral
+    out = np.where(avg_loss == 0.0, np.where(avg_gain == 0.0, 50.0, 100.0), out)
+    out[np.isnan(avg_gain)] = np.nan
+    return out
+
+
+def macd(close: np.ndarray, fast: int = MACD_FAST, slow: int = MACD_SLOW,
+         signal: int = MACD_SIGNAL) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Moving Average Convergence Divergence.
+
+    Args:
+        close: Close prices with time on the last axis.
+        fast: Fast EMA period.
+        slow: Slow EMA period.
+        signal: Signal line EMA period.
+
+    Returns:
+        Tuple of (MACD line, signal line, histogram).
+    """
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger_bands(close: np.ndarray, period: int = BOLLINGER_PERIOD,
+                    num_std: float = BOLLINGER_STD) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands.
+
+    Args:
+        close: Close prices with time on the last axis.
+        period: Moving average period.
+        num_std: Band width in standard deviations.
+
+    Returns:
+        Tuple of (lower band, middle band, upper band).
+    """
+    middle = sma(close, period)
+    width = num_std * rolling_std(close, period)
+    return middle - width, middle, middle + width
+
+
+def percent_b(close: np.ndarray, period: int = BOLLINGER_PERIOD, num_std: float = BOLLINGER_STD) -> np.ndarray:
+    """Position of the close within the Bollinger Bands.
+
+    Returns:
+        0 at the lower band, 1 at the upper band and 0.5 for a flat window.
+    """
+    close = as_series(close)
+    lower, _, upper = bollinger_bands(close, period, num_std)
+    width = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(width > 0.0, (close - lower) / width, np.where(np.isnan(width), np.nan, 0.5))
+
+
+def _rolling_extreme(values: np.ndarray, window: int, op: np.ufunc, identity: float) -> np.ndarray:
+    """Rolling maximum or minimum in O(n) per series.
+
+    The series is split into blocks of ``window`` bars. Every window spans at
+    most two blocks, so its extreme combines a suffix accumulation of the
+    first block with a prefix accumulation of the second.
+    """
+    values = as_series(values)
+    out = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if window > n:
+        return out
+
+    pad = (-n) % window
+    padded = np.concatenate([values, np.full(values.shape[:-1] + (pad,), identity)], axis=-1)
+    blocks = padded.reshape(values.shape[:-1] + (-1, window))
+    prefix = op.accumulate(blocks, axis=-1).reshape(padded.shape)
+    suffix = op.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    out[..., window - 1:] = op(suffix[..., :n - window + 1], prefix[..., window - 1:n])
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum over the last axis; the first ``window - 1`` bars are NaN."""
+    return _rolling_extreme(values, window, np.maximum, -np.inf)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum over the last axis; the first ``window - 1`` bars are NaN."""
+    return _rolling_extreme(values, window, np.minimum, np.inf)
+
+
+def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               period: int = STOCHASTIC_PERIOD) -> np.ndarray:
+    """Stochastic oscillator %K.
+
+    Returns:
+        %K from 0 to 100, or 50 when the high and low of the window are equal.
+    """
+    highest = rolling_max(high, period)
+    lowest = rolling_min(low, period)
+    span = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(span > 0.0, 100.0 * (as_series(close) - lowest) / span,
+                        np.where(np.isnan(span), np.nan, 50.0))
+
+
+def compute_indicators(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       last_only: bool = False) -> Dict[str, np.ndarray]:
+    """Compute every signal indicator for a batch of price series.
+
+    Values are scaled so the same thresholds apply to any price level:
+
+    - RSI: 0 to 100,
+    - MACD: MACD line as a percentage of the close,
+    - Bollinger Bands: position within the bands (%B),
+    - Moving Average: close relative to its moving average,
+    - Stochastic: %K from 0 to 100.
+
+    Args:
+        high: High prices, shaped ``(..., bars)``.
+        low: Low prices, shaped like ``high``.
+        close: Close prices, shaped like ``high``.
+        last_only: Return only the latest bar of each indicator.
+
+    Returns:
+        Dictionary of indicator name to values, keyed by ``INDICATOR_NAMES``.
+    """
+    close = as_series(close)
+    line, _, _ = macd(close)
+
+    indicators = {
+        "RSI": rsi(close),
+        "MACD": 100.0 * line / close,
+        "Bollinger Bands": percent_b(close),
+        "Moving Average": close / sma(close, MA_PERIOD),
+        "Stochastic": stochastic(high, low, close),
+    }
+    if last_only:
+        return {name: values[..., -1] for name, values in indicators.items()}
+    return indicators
+
+
+def classify(values: np.ndarray, lower: float, upper: float,
+             below: int = 1, above: int = -1) -> np.ndarray:
+    """Map indicator values to signal codes.
+
+    Args:
+        values: Indicator values.
+        lower: Values below this give ``below``.
+        upper: Values above this give ``above``.
+        below: Code for values under ``lower``.
+        above: Code for values over ``upper``.
+
+    Returns:
+        Integer array of codes, 0 where neither threshold is crossed.
+    """
+    values = np.asarray(values)
+    return np.select([values < lower, values > upper], [below, above], default=0).astype(np.int8)
+
@@ -0,0 +1,323 @@
+"""Local OHLCV market data store for CRY-A-4MCP.
+
+Bars are kept per symbol and timeframe as one raw binary file per column,
+appended to as new bars arrive and read through memory maps. Timestamps are
+UTC epoch milliseconds in a sorted ``time`` column, so range queries are a
+binary search and return slices of the maps without copying.
+
+Layout::
+
+    <root>/<SYMBOL>/<timeframe>/time.i8
+    <root>/<SYMBOL>/<timeframe>/open.f8
+    ...
+"""
+
+import csv
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import structlog
+
+try:
+    import pyarrow.parquet as pq
+    import pyarrow.types as pa_types
+except ImportError:
+    pq = None
+    pa_types = None
+
+# Columns and their on-disk dtypes; time is written last and marks committed rows
+COLUMNS = {
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+    "time": np.dtype("<i8"),
+}
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Header names accepted for the time column of CSV and Parquet files
+TIME_HEADERS = ("time", "timestamp", "date", "datetime", "open_time")
+
+# Numeric timestamps below this are seconds rather than milliseconds
+_SECONDS_CUTOFF = 100_000_000_000
+
+Timestamp = Union[datetime, int]
+
+
+def to_millis(value: Timestamp) -> int:
+    """Convert a datetime (naive means UTC) or epoch milliseconds to milliseconds."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
+def _parse_time(value: str) -> int:
+    """Parse a CSV timestamp: epoch seconds, epoch milliseconds or ISO 8601."""
+    try:
+        number = float(value)
+    except ValueError:
+        return to_millis(datetime.fromisoformat(value.strip().replace("Z", "+00:00")))
+    return int(number * 1000) if abs(number) < _SECONDS_CUTOFF else int(number)
+
+
+def _timeframe_name(timeframe) -> str:
+    return getattr(timeframe, "value", timeframe)
+
+
+@dataclass
+class OHLCVSeries:
+    """Bars of one symbol and timeframe, as parallel arrays."""
+    time: np.ndarray  # Epoch milliseconds, UTC
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+class OHLCVStore:
+    """Append-only, memory-mapped columnar store of OHLCV bars."""
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the data; created on first write.
+        """
+        self.root = Path(root)
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        # Memory maps per series, reopened when the series grows
+        self._maps: Dict[Tuple[str, str], OHLCVSeries] = {}
+
+    def _series_dir(self, symbol: str, timeframe) -> Path:
+        return self.root / symbol.upper() / _timeframe_name(timeframe)
+
+    def _committed_rows(self, directory: Path) -> int:
+        path = directory / "time.i8"
+        return path.stat().st_size // COLUMNS["time"].itemsize if path.exists() else 0
+
+    def has(self, symbol: str, timeframe) -> bool:
+        """Whether any bars are stored for a symbol and timeframe."""
+        return self._committed_rows(self._series_dir(symbol, timeframe)) > 0
+
+    def list_series(self) -> List[Tuple[str, str]]:
+        """All stored ``(symbol, timeframe)`` pairs."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            (directory.parent.name, directory.name)
+            for directory in self.root.glob("*/*")
+            if self._committed_rows(directory) > 0
+        )
+
+    def _open(self, symbol: str, timeframe) -> OHLCVSeries:
+        """Memory-map every column of a series.
+
+        Maps are reused until the committed row count changes, so bars
+        appended by other stores or processes are picked up on the next read.
+        """
+        key = (symbol.upper(), _timeframe_name(timeframe))
+        directory = self._series_dir(symbol, timeframe)
+        rows = self._committed_rows(directory)
+        series = self._maps.get(key)
+        if series is not None and len(series) == rows:
+            return series
+
+        columns = {}
+        for name, dtype in COLUMNS.items():
+            if rows:
+                columns[name] = np.memmap(directory / f"{name}.{dtype.kind}{dtype.itemsize}",
+                                          dtype=dtype, mode="r", shape=(rows,))
+            else:
+                columns[name] = np.empty(0, dtype=dtype)
+        series = OHLCVSeries(**columns)
+        self._maps[key] = series
+        return series
+
+    def append(self, symbol: str, timeframe, time: np.ndarray, open: np.ndarray, high: np.ndarray,
+               low: np.ndarray, close: np.ndarray, volume: Optional[np.ndarray] = None) -> int:
+        """Append bars to a series.
+
+        Bars at or before the last stored bar are skipped, so reloading the
+        same data is a no-op.
+
+        Args:
+            symbol: Cryptocurrency symbol.
+            timeframe: Bar time frame, e.g. ``"1h"``.
+            time: Bar open times in epoch milliseconds, strictly increasing.
+            open: Open prices.
+            high: High prices.
+            low: Low prices.
+            close: Close prices.
+            volume: Volumes; zeros if omitted.
+
+        Returns:
+            Number of bars written.
+
+        Raises:
+            ValueError: If columns differ in length or times are not increasing.
+        """
+        time = np.asarray(time, dtype=COLUMNS["time"])
+        if volume is None:
+            volume = np.zeros(len(time))
+        columns = {"open": open, "high": high, "low": low, "close": close, "volume": volume}
+        columns = {name: np.asarray(values, dtype=COLUMNS[name]) for name, values in columns.items()}
+        if any(len(values) != len(time) for values in columns.values()):
+            raise ValueError("All OHLCV columns must have the same length")
+        if len(time) > 1 and not np.all(np.diff(time) > 0):
+            raise ValueError("Bar times must be strictly increasing")
+
+        directory = self._series_dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+        rows = self._committed_rows(directory)
+        if rows:
+            last_time = self._open(symbol, timeframe).time[-1]
+            keep = time > last_time
+            time = time[keep]
+            columns = {name: values[keep] for name, values in columns.items()}
+        if not len(time):
+            return 0
+
+        columns["time"] = time
+        for name, dtype in COLUMNS.items():
+            path = directory / f"{name}.{dtype.kind}{dtype.itemsize}"
+            with path.open("ab") as f:
+                # Drop rows a failed append wrote past the committed time column
+                if f.tell() > rows * dtype.itemsize:
+                    f.truncate(rows * dtype.itemsize)
+                f.write(columns[name].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        return len(time)
+
+    def read(self, symbol: str, timeframe, start: Optional[Timestamp] = None,
+             end: Optional[Timestamp] = None) -> OHLCVSeries:
+        """Read the bars of a series between two times, inclusive.
+
+        The returned arrays are views of the memory maps; they are read-only
+        and copy nothing.
+
+        Args:
+            symbol: Cryptocurrency symbol.
+            timeframe: Bar time frame.
+            start: First bar time (datetime or epoch milliseconds).
+            end: Last bar time (datetime or epoch milliseconds).
+
+        Returns:
+            Bars in the range, possibly empty.
+        """
+        series = self._open(symbol, timeframe)
+        first = 0 if start is None else int(np.searchsorted(series.time, to_millis(start), side="left"))
+        last = len(series) if end is None else int(np.searchsorted(series.time, to_millis(end), side="right"))
+        return OHLCVSeries(**{name: getattr(series, name)[first:last] for name in COLUMNS})
+
+    def tail(self, symbol: str, timeframe, bars: int) -> OHLCVSeries:
+        """Read the latest ``bars`` bars of a series, without copying."""
+        series = self._open(symbol, timeframe)
+        first = max(len(series) - bars, 0)
+        return OHLCVSeries(**{name: getattr(series, name)[first:] for name in COLUMNS})
+
+    def read_aligned(self, symbols: List[str], timeframe, start: Optional[Timestamp] = None,
+                     end: Optional[Timestamp] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Read several symbols on the bar times they all share.
+
+        Args:
+            symbols: Cryptocurrency symbols.
+            timeframe: Bar time frame.
+            start: First bar time, inclusive.
+            end: Last bar time, inclusive.
+
+        Returns:
+            Tuple of (shared bar times, columns shaped ``(len(symbols), bars)``).
+        """
+        series = [self.read(symbol, timeframe, start, end) for symbol in symbols]
+        times = series[0].time
+        for other in series[1:]:
+            if len(other.time) != len(times) or not np.array_equal(other.time, times):
+                times = np.intersect1d(times, other.time, assume_unique=True)
+
+        columns = {name: np.empty((len(series), len(times))) for name in PRICE_COLUMNS}
+        for row, data in enumerate(series):
+            index = np.searchsorted(data.time, times)
+            for name in PRICE_COLUMNS:
+                columns[name][row] = getattr(data, name)[index]
+        return np.asarray(times), columns
+
+    def load_csv(self, path: Union[str, Path], symbol: str, timeframe) -> int:
+        """Append the bars in a CSV file.
+
+        The file needs a header with a time column (see ``TIME_HEADERS``) and
+        open, high, low and close columns; volume is optional. Times may be
+        epoch seconds, epoch milliseconds or ISO 8601.
+
+        Returns:
+            Number of bars written.
+        """
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            headers = {name.strip().lower(): name for name in reader.fieldnames or []}
+            time_header = next((headers[name] for name in TIME_HEADERS if name in headers), None)
+            if time_header is None:
+                raise ValueError(f"{path} has no time column; expected one of {TIME_HEADERS}")
+            columns: Dict[str, List] = {"time": []}
+            columns.update({name: [] for name in PRICE_COLUMNS if name in headers})
+            for row in reader:
+                columns["time"].append(_parse_time(row[time_header]))
+                for name in columns:
+                    if name != "time":
+                        columns[name].append(float(row[headers[name]]))
+
+        return self._append_loaded(path, symbol, timeframe, columns)
+
+    def load_parquet(self, path: Union[str, Path], symbol: str, timeframe) -> int:
+        """Append the bars in a Parquet file, with the columns ``load_csv`` expects.
+
+        Returns:
+            Number of bars written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pq is None:
+            raise ImportError("Loading Parquet files requires pyarrow")
+        table = pq.read_table(path)
+        headers = {name.lower(): name for name in table.column_names}
+        time_header = next((headers[name] for name in TIME_HEADERS if name in headers), None)
+        if time_header is None:
+            raise ValueError(f"{path} has no time column; expected one of {TIME_HEADERS}")
+
+        time_column = table.column(time_header)
+        if pa_types.is_timestamp(time_column.type):
+            times = time_column.cast("timestamp[ms]").cast("int64").to_numpy()
+        else:
+            times = time_column.to_numpy()
+            times = np.where(np.abs(times) < _SECONDS_CUTOFF, times * 1000, times)
+        columns = {"time": times}
+        columns.update({
+            name: table.column(headers[name]).to_numpy()
+            for name in PRICE_COLUMNS if name in headers
+        })
+        return self._append_loaded(path, symbol, timeframe, columns)
+
+    def _append_loaded(self, path, symbol: str, timeframe, columns: Dict[str, List]) -> int:
+        """Sort loaded columns by time and append them."""
+        missing = [name for name in ("open", "high", "low", "close") if name not in columns]
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+        order = np.argsort(np.asarray(columns["time"], dtype=np.int64), kind="stable")
+        sorted_columns = {name: np.asarray(values)[order] for name, values in columns.items()}
+        written = self.append(symbol, timeframe, **sorted_columns)
+        self.logger.info("Loaded OHLCV bars", path=str(path), symbol=symbol.upper(),
+                         timeframe=_timeframe_name(timeframe), bars=written)
+        return written
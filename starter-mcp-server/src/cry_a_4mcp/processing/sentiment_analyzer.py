@@ -1,11 +1,12 @@
 """Sentiment analyzer for CRY-A-4MCP.
 
 This module provides sentiment analysis capabilities for cryptocurrency
-news and social media content using FinBERT model.
+news and social media content, scored with a lexicon or a FinBERT model.
 """
 
 import asyncio
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -13,6 +14,11 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import structlog
 
 from ..config import Settings
+from .sentiment_scoring import LexiconScorer, ModelScorer, SentimentScores, count_words, tokenize
+
+# Lexicon batches up to this size are scored on the event loop rather than in an executor;
+# model inference always runs in the executor
+INLINE_BATCH_SIZE = 64
 
 
 class ContentSource(str, Enum):
@@ -107,15 +113,28 @@ class SentimentAnalyzer:
             "doge": "Dogecoin",
         }
         
-        # FinBERT model will be loaded during initialization
+        # Entity lookup by first token; multi-word names are matched from there
+        self.entity_phrases: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for name, value in self.crypto_entities.items():
+            phrase = tuple(tokenize([name])[0])
+            self.entity_phrases.setdefault(phrase[0], []).append((phrase, value))
+        
+        # Lexicon scoring until a FinBERT model is loaded during initialization
+        self.scorer: Union[LexiconScorer, ModelScorer] = LexiconScorer()
         self.model = None
     
     async def initialize(self) -> None:
         """Initialize the sentiment analyzer."""
         self.logger.info("Initializing sentiment analyzer")
-        # In a real implementation, this would load the FinBERT model
-        # For now, we'll simulate model loading
-        await asyncio.sleep(0.5)  # Simulate model loading time
+        model_path = self.settings.sentiment_model_path
+        if model_path is not None:
+            loop = asyncio.get_running_loop()
+            self.model = await loop.run_in_executor(None, partial(
+                ModelScorer.from_onnx, model_path, self.settings.sentiment_tokenizer,
+                max_batch_tokens=self.settings.sentiment_max_batch_tokens,
+            ))
+            self.scorer = self.model
+            self.logger.info("Loaded sentiment model", path=str(model_path))
         self.logger.info("Sentiment analyzer initialized")
     
     async def analyze_text(self, text: str, source: ContentSource = ContentSource.NEWS) -> SentimentResult:
@@ -130,39 +149,7 @@ class SentimentAnalyzer:
         """
         self.logger.debug("Analyzing text sentiment", text_length=len(text), source=source)
         
-        # In a real implementation, this would use the FinBERT model
-        # For now, generate mock sentiment based on simple heuristics
-        
-        # Extract potential entity
-        entity = self._extract_entity(text)
-        
-        # Simple sentiment heuristics
-        positive_words = ["bullish", "surge", "gain", "rise", "up", "high", "growth", "profit", "success"]
-        negative_words = ["bearish", "crash", "drop", "fall", "down", "low", "loss", "fail", "risk"]
-        
-        positive_count = sum(1 for word in positive_words if word in text.lower())
-        negative_count = sum(1 for word in negative_words if word in text.lower())
-        
-        # Calculate mock sentiment score (-1.0 to 1.0)
-        if positive_count > negative_count:
-            score = min(0.5 + (positive_count - negative_count) * 0.1, 1.0)
-            confidence = 0.5 + (positive_count / (len(text.split()) + 1)) * 0.5
-        elif negative_count > positive_count:
-            score = max(-0.5 - (negative_count - positive_count) * 0.1, -1.0)
-            confidence = 0.5 + (negative_count / (len(text.split()) + 1)) * 0.5
-        else:
-            score = 0.0
-            confidence = 0.5
-        
-        return SentimentResult(
-            text=text,
-            score=score,
-            confidence=confidence,
-            source=source,
-            entity=entity,
-            timestamp=datetime.now(),
-            metadata={"word_count": len(text.split())}
-        )
+        return self._build_results([text], source, *await self._score_texts_async([text]))[0]
     
     async def analyze_batch(self, texts: List[str], source: ContentSource = ContentSource.NEWS) -> List[SentimentResult]:
         """Analyze sentiment of multiple texts in batch.
@@ -176,12 +163,63 @@ class SentimentAnalyzer:
         """
         self.logger.info("Analyzing batch sentiment", count=len(texts), source=source)
         
-        # In a real implementation, this would batch process through the model
-        # For now, process each text individually
-        tasks = [self.analyze_text(text, source) for text in texts]
-        results = await asyncio.gather(*tasks)
+        return self._build_results(texts, source, *await self._score_texts_async(texts))
+    
+    async def _score_texts_async(self, texts: List[str]) -> Tuple[SentimentScores, List[Optional[str]], List[int]]:
+        """Score texts, off the event loop unless it is a small lexicon batch.
         
-        return results
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Tuple of (sentiment scores, entity of each text, word count of each text)
+        """
+        if isinstance(self.scorer, LexiconScorer) and len(texts) <= INLINE_BATCH_SIZE:
+            return self._score_texts(texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._score_texts, texts)
+    
+    def _score_texts(self, texts: List[str]) -> Tuple[SentimentScores, List[Optional[str]], List[int]]:
+        """Tokenize texts once, then score them and find their entities.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Tuple of (sentiment scores, entity of each text, word count of each text)
+        """
+        tokens = tokenize(texts)
+        scores = self.scorer.score(texts, tokens)
+        return scores, self._extract_entities(tokens), count_words(tokens).tolist()
+    
+    def _build_results(self, texts: List[str], source: ContentSource, scores: SentimentScores,
+                       entities: List[Optional[str]], word_counts: List[int]) -> List[SentimentResult]:
+        """Wrap batch scores in sentiment results.
+        
+        Args:
+            texts: Analyzed texts
+            source: Source of the content
+            scores: Sentiment scores of the texts
+            entities: Entity of each text
+            word_counts: Word count of each text
+            
+        Returns:
+            Sentiment result for each text
+        """
+        timestamp = datetime.now()
+        return [
+            SentimentResult(
+                text=text,
+                score=score,
+                confidence=confidence,
+                source=source,
+                entity=entity,
+                timestamp=timestamp,
+                metadata={"word_count": word_count},
+            )
+            for text, score, confidence, entity, word_count in zip(
+                texts, scores.score.tolist(), scores.confidence.tolist(), entities, word_counts)
+        ]
     
     async def get_entity_sentiment(self, entity: str, timeframe: TimeFrame = TimeFrame.DAY_1, 
                                  sources: List[ContentSource] = None) -> AggregatedSentiment:
@@ -422,27 +460,30 @@ class SentimentAnalyzer:
         # No match found
         return None
     
-    def _extract_entity(self, text: str) -> Optional[str]:
-        """Extract cryptocurrency entity from text.
+    def _extract_entities(self, tokens: List[List[str]]) -> List[Optional[str]]:
+        """Extract the first cryptocurrency entity mentioned in each text.
         
         Args:
-            text: Text to extract entity from
+            tokens: Tokens of each text
             
         Returns:
-            Extracted entity or None if not found
+            Extracted entity of each text, or None if not found
         """
-        if not text:
-            return None
-        
         # In a real implementation, this would use NER or a more sophisticated approach
-        # For now, use simple keyword matching
-        text_lower = text.lower()
-        
-        for key, value in self.crypto_entities.items():
-            if key.lower() in text_lower:
-                return value
-        
-        return None
+        # For now, match known names token by token
+        first_words = self.entity_phrases.keys()
+        entities = []
+        for words in tokens:
+            entity = None
+            if not first_words.isdisjoint(words):
+                entity = next((
+                    value
+                    for i, word in enumerate(words) if word in self.entity_phrases
+                    for phrase, value in self.entity_phrases[word]
+                    if tuple(words[i:i + len(phrase)]) == phrase
+                ), None)
+            entities.append(entity)
+        return entities
     
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for sentiment analysis.
@@ -0,0 +1,270 @@
+"""Batch sentiment scoring for CRY-A-4MCP.
+
+Texts are tokenized once and scored together. ``LexiconScorer`` looks each
+token up in a compiled lexicon and does the counting, negation and scoring
+as array operations over the whole batch. ``ModelScorer`` runs a
+three-class sentiment model such as FinBERT, grouping texts of similar
+length into batches; ``ModelScorer.from_onnx`` builds one from an exported
+ONNX model for CPU inference.
+"""
+
+import re
+from dataclasses import dataclass
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    from transformers import AutoTokenizer
+except ImportError:
+    AutoTokenizer = None
+
+# Words, the punctuation that ends a negation, and emoji
+TOKEN_PATTERN = re.compile(r"[\w']+|[.,;:!?]|[\u2600-\u27bf\U0001f300-\U0001faff]")
+
+POSITIVE_WORDS = (
+    "bullish", "surge", "gain", "rise", "up", "high", "growth", "profit", "success",
+    "rose", "rally", "soar", "jump", "climb", "record", "breakout", "recover", "rebound", "strong",
+    "beat", "upgrade", "outperform", "approve", "adopt", "adoption", "partnership", "moon",
+)
+NEGATIVE_WORDS = (
+    "bearish", "crash", "drop", "fall", "down", "low", "loss", "fail", "risk",
+    "fell", "plunge", "slump", "sink", "sank", "tumble", "dump", "weak", "downgrade", "underperform",
+    "hack", "exploit", "scam", "fraud", "ban", "lawsuit", "liquidate", "liquidation", "bankrupt", "fear",
+)
+EMOJI_POLARITY = {
+    "🚀": 1.0, "💎": 1.0, "🙌": 1.0, "📈": 1.0, "🔥": 1.0,
+    "📉": -1.0, "😱": -1.0, "😢": -1.0,
+}
+
+# Negations flip sentiment words (not emoji) up to NEGATION_WINDOW tokens later, within a clause
+NEGATIONS = (
+    "not", "no", "never", "neither", "nor", "without", "hardly", "barely",
+    "isn't", "aren't", "wasn't", "weren't", "don't", "doesn't", "didn't", "won't", "can't", "cannot",
+    "isnt", "arent", "wasnt", "dont", "doesnt", "didnt", "wont", "cant",
+)
+PUNCTUATION = (".", ",", ";", ":", "!", "?")
+CLAUSE_BREAKS = PUNCTUATION + ("but", "however")
+NEGATION_WINDOW = 3
+
+# FinBERT's output order
+FINBERT_LABELS = ("positive", "negative", "neutral")
+
+
+def tokenize(texts: Iterable[str]) -> List[List[str]]:
+    """Split each text into lowercase tokens."""
+    findall = TOKEN_PATTERN.findall
+    return [findall(text.lower()) for text in texts]
+
+
+def count_words(tokens: Sequence[List[str]]) -> np.ndarray:
+    """Number of word tokens in each tokenized text, ignoring punctuation and emoji."""
+    symbols = frozenset(PUNCTUATION) | frozenset(EMOJI_POLARITY)
+    return np.fromiter(
+        (len(words) - sum(map(symbols.__contains__, words)) for words in tokens),
+        dtype=np.int64, count=len(tokens),
+    )
+
+
+def inflections(word: str) -> List[str]:
+    """Common inflected forms of an English word, including the word."""
+    forms = [word, word + "s", word + "es", word + "ed", word + "ing", word + "er", word + "est"]
+    if word.endswith("e"):
+        forms += [word + "d", word[:-1] + "ing", word + "r", word + "st"]
+    if word.endswith("y") and len(word) > 2 and word[-2] not in "aeiou":
+        forms += [word[:-1] + "ies", word[:-1] + "ied"]
+    vowels = "aeiou"
+    if len(word) >= 3 and word[-1] not in vowels + "wxy" and word[-2] in vowels and word[-3] not in vowels:
+        forms += [word + word[-1] + "ed", word + word[-1] + "ing"]
+    return forms
+
+
+@dataclass
+class SentimentScores:
+    """Sentiment of a batch of texts, one element per text."""
+    score: np.ndarray  # -1.0 to 1.0 (negative to positive)
+    confidence: np.ndarray  # 0.0 to 1.0
+
+
+class LexiconScorer:
+    """Scores texts by counting positive and negative lexicon words."""
+
+    def __init__(self, positive_words: Iterable[str] = POSITIVE_WORDS,
+                 negative_words: Iterable[str] = NEGATIVE_WORDS) -> None:
+        """Compile the lexicon.
+
+        Every token the scorer cares about gets an id; id 0 is any other
+        token. Per-id tables then hold its polarity and role.
+
+        Args:
+            positive_words: Base forms of positive words.
+            negative_words: Base forms of negative words.
+        """
+        entries = {}
+        for words, polarity in ((positive_words, 1.0), (negative_words, -1.0)):
+            for word in words:
+                for form in inflections(word):
+                    entries.setdefault(form, polarity)
+        entries.update(EMOJI_POLARITY)
+
+        vocabulary = list(dict.fromkeys(chain(entries, NEGATIONS, CLAUSE_BREAKS)))
+        self.vocabulary = {token: i for i, token in enumerate(vocabulary, start=1)}
+        size = len(vocabulary) + 1
+        self.polarity = np.zeros(size)
+        self.negation = np.zeros(size, dtype=bool)
+        self.clause_break = np.zeros(size, dtype=bool)
+        self.emoji = np.zeros(size, dtype=bool)
+        for token, i in self.vocabulary.items():
+            self.polarity[i] = entries.get(token, 0.0)
+            self.negation[i] = token in NEGATIONS
+            self.clause_break[i] = token in CLAUSE_BREAKS
+            self.emoji[i] = token in EMOJI_POLARITY
+
+    def score(self, texts: Sequence[str], tokens: Sequence[List[str]]) -> SentimentScores:
+        """Score tokenized texts.
+
+        Args:
+            texts: Texts, unused beyond their count.
+            tokens: Tokens of each text, from ``tokenize``.
+
+        Returns:
+            Sentiment scores of each text.
+        """
+        n = len(tokens)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=n)
+        flat = list(chain.from_iterable(tokens))
+        ids = np.fromiter(map(self.vocabulary.get, flat, repeat(0)), dtype=np.int64, count=len(flat))
+        text_index = np.repeat(np.arange(n), lengths)
+        position = np.arange(len(flat))
+
+        # Latest negation and latest scope reset (clause break or text start) at each token
+        last_negation = np.maximum.accumulate(np.where(self.negation[ids], position, -1))
+        reset = np.where(self.clause_break[ids], position, -1)
+        starts = np.cumsum(lengths) - lengths
+        starts = starts[lengths > 0]
+        reset[starts] = np.maximum(reset[starts], starts - 1)
+        last_reset = np.maximum.accumulate(reset)
+        negated = (last_negation > last_reset) & (position - last_negation <= NEGATION_WINDOW)
+        negated &= ~self.emoji[ids]
+
+        polarity = np.where(negated, -1.0, 1.0) * self.polarity[ids]
+        positive = np.bincount(text_index, weights=polarity > 0, minlength=n)
+        negative = np.bincount(text_index, weights=polarity < 0, minlength=n)
+        words = count_words(tokens)
+
+        # Each net word moves the score 0.1 beyond +/-0.5
+        net = positive - negative
+        score = np.where(net > 0, np.minimum(0.5 + 0.1 * net, 1.0),
+                         np.where(net < 0, np.maximum(-0.5 + 0.1 * net, -1.0), 0.0))
+        dominant = np.where(net > 0, positive, negative)
+        confidence = np.where(net != 0, 0.5 + 0.5 * dominant / (words + 1), 0.5)
+        return SentimentScores(score=score, confidence=confidence)
+
+
+class ModelScorer:
+    """Scores texts with a negative/neutral/positive sentiment model.
+
+    Texts are sorted by length and packed into batches whose padded size
+    stays under ``max_batch_tokens``, so short texts share large batches and
+    long ones are not padded against each other.
+    """
+
+    def __init__(self, predict: Callable[[List[str]], np.ndarray], max_batch_size: int = 64,
+                 max_batch_tokens: int = 8192) -> None:
+        """Initialize the scorer.
+
+        Args:
+            predict: Returns class probabilities shaped ``(len(texts), 3)``,
+                ordered negative, neutral, positive.
+            max_batch_size: Most texts per ``predict`` call.
+            max_batch_tokens: Most padded tokens per ``predict`` call.
+        """
+        self.predict = predict
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+
+    def batches(self, tokens: Sequence[List[str]]) -> List[np.ndarray]:
+        """Group texts into batches by length.
+
+        Args:
+            tokens: Tokens of each text, used as its length.
+
+        Returns:
+            Indices of the texts in each batch.
+        """
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        order = np.argsort(lengths, kind="stable")
+        batches = []
+        start = 0
+        while start < len(order):
+            end = start + 1
+            # Sorted by length, so the newest text sets the padded length
+            while (end < len(order) and end - start < self.max_batch_size
+                   and (end - start + 1) * max(lengths[order[end]], 1) <= self.max_batch_tokens):
+                end += 1
+            batches.append(order[start:end])
+            start = end
+        return batches
+
+    def score(self, texts: Sequence[str], tokens: Sequence[List[str]]) -> SentimentScores:
+        """Score texts with the model.
+
+        Args:
+            texts: Texts to score.
+            tokens: Tokens of each text, from ``tokenize``.
+
+        Returns:
+            Sentiment scores of each text.
+        """
+        probabilities = np.empty((len(texts), 3))
+        for batch in self.batches(tokens):
+            probabilities[batch] = self.predict([texts[i] for i in batch.tolist()])
+        return SentimentScores(
+            score=probabilities[:, 2] - probabilities[:, 0],
+            confidence=probabilities.max(axis=1),
+        )
+
+    @classmethod
+    def from_onnx(cls, model_path: Union[str, Path], tokenizer_name: str,
+                  labels: Tuple[str, ...] = FINBERT_LABELS, max_length: int = 128,
+                  threads: Optional[int] = None, **kwargs) -> "ModelScorer":
+        """Build a scorer from an ONNX sequence classification model.
+
+        Args:
+            model_path: Path of the exported ``.onnx`` model.
+            tokenizer_name: Hugging Face tokenizer name or path.
+            labels: Model output labels in order.
+            max_length: Tokens kept per text.
+            threads: Intra-op threads for ONNX Runtime; None uses its default.
+            **kwargs: Batching options for ``ModelScorer``.
+
+        Raises:
+            ImportError: If onnxruntime or transformers is not installed.
+        """
+        if ort is None or AutoTokenizer is None:
+            raise ImportError("ONNX sentiment models require onnxruntime and transformers")
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        session = ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+        input_names = {model_input.name for model_input in session.get_inputs()}
+        tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+        order = [labels.index(label) for label in ("negative", "neutral", "positive")]
+
+        def predict(texts: List[str]) -> np.ndarray:
+            encoded = tokenizer(texts, padding=True, truncation=True, max_length=max_length, return_tensors="np")
+            logits = session.run(None, {name: value for name, value in encoded.items() if name in input_names})[0]
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            return probabilities[:, order]
+
+        return cls(predict, **kwargs)
@@ -0,0 +1,343 @@
+"""Incremental technical indicator state for CRY-A-4MCP.
+
+``StreamingIndicators`` keeps the state behind ``compute_indicators`` for
+many price streams, e.g. one per symbol and timeframe, so a new bar costs
+O(1) work instead of a pass over the whole history. State is held in NumPy
+arrays with one row per stream and can be saved to and loaded from disk.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .indicators import (
+    BOLLINGER_PERIOD,
+    BOLLINGER_STD,
+    MA_PERIOD,
+    MACD_FAST,
+    MACD_SLOW,
+    RSI_PERIOD,
+    STOCHASTIC_PERIOD,
+    as_series,
+    ema,
+    wilder_average,
+)
+
+# Width of the ring of recent closes, shared by Bollinger Bands and the moving average
+CLOSE_WINDOW = max(BOLLINGER_PERIOD, MA_PERIOD)
+
+# Periods a snapshot was written with; loading checks they still match
+PERIODS = np.array([RSI_PERIOD, MACD_FAST, MACD_SLOW, BOLLINGER_PERIOD, MA_PERIOD, STOCHASTIC_PERIOD])
+
+
+class StreamingIndicators:
+    """Incremental indicator state for many price streams.
+
+    Each stream keeps running EMAs for MACD, Wilder averages of gains and
+    losses for RSI, running sums over a ring of recent closes for Bollinger
+    Bands and the moving average, and monotonic deques of recent highs and
+    lows for the stochastic oscillator. Values match ``compute_indicators``
+    on the full history.
+    """
+
+    # Per-stream scalars and their dtypes
+    _SCALARS = {
+        "bars": np.int64,
+        "last_time": np.int64,
+        "offset": np.float64,
+        "prev_close": np.float64,
+        "ema_fast": np.float64,
+        "ema_slow": np.float64,
+        "avg_gain": np.float64,
+        "avg_loss": np.float64,
+        "bb_sum": np.float64,
+        "bb_sumsq": np.float64,
+        "ma_sum": np.float64,
+        "max_head": np.int64,
+        "max_size": np.int64,
+        "min_head": np.int64,
+        "min_size": np.int64,
+    }
+    # Per-stream rings: name, width and dtype
+    _RINGS = {
+        "closes": (CLOSE_WINDOW, np.float64),
+        "highs": (STOCHASTIC_PERIOD, np.float64),
+        "lows": (STOCHASTIC_PERIOD, np.float64),
+        "max_deque": (STOCHASTIC_PERIOD, np.int64),
+        "min_deque": (STOCHASTIC_PERIOD, np.int64),
+    }
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Initialize empty state.
+
+        Args:
+            capacity: Number of streams to allocate room for; grows as needed.
+        """
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._capacity = max(1, capacity)
+        for name, dtype in self._SCALARS.items():
+            setattr(self, name, np.zeros(self._capacity, dtype=dtype))
+        for name, (width, dtype) in self._RINGS.items():
+            setattr(self, name, np.zeros((self._capacity, width), dtype=dtype))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rows
+
+    def _fields(self) -> Iterable[str]:
+        return list(self._SCALARS) + list(self._RINGS)
+
+    def _grow(self, size: int) -> None:
+        """Reallocate arrays to hold at least ``size`` streams."""
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+        for name in self._fields():
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._capacity] = old
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def get_rows(self, keys: List[str], create: bool = False) -> np.ndarray:
+        """Look up the rows of streams.
+
+        Args:
+            keys: Stream keys.
+            create: Add unknown streams instead of raising.
+
+        Returns:
+            Row index of each key.
+
+        Raises:
+            KeyError: If a key is unknown and ``create`` is False.
+        """
+        rows = []
+        for key in keys:
+            row = self.rows.get(key)
+            if row is None:
+                if not create:
+                    raise KeyError(key)
+                row = len(self.keys)
+                if row >= self._capacity:
+                    self._grow(row + 1)
+                self.keys.append(key)
+                self.rows[key] = row
+            rows.append(row)
+        return np.array(rows, dtype=np.int64)
+
+    def seed(self, keys: List[str], high: np.ndarray, low: np.ndarray, close: np.ndarray,
+             last_time: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Reset streams to the state after a history of bars.
+
+        Args:
+            keys: Stream keys, one per row of the price arrays.
+            high: High prices shaped ``(len(keys), bars)``.
+            low: Low prices shaped like ``high``.
+            close: Close prices shaped like ``high``.
+            last_time: Timestamp of each stream's last bar.
+
+        Returns:
+            Latest indicator values, as returned by ``compute_indicators``
+            with ``last_only=True``.
+        """
+        high, low, close = as_series(high), as_series(low), as_series(close)
+        rows = self.get_rows(keys, create=True)
+        n = close.shape[1]
+        if n == 0:
+            raise ValueError("History must contain at least one bar")
+
+        self.bars[rows] = n
+        self.last_time[rows] = 0 if last_time is None else last_time
+        self.offset[rows] = close[:, 0]
+        self.prev_close[rows] = close[:, -1]
+        self.ema_fast[rows] = ema(close, MACD_FAST)[:, -1]
+        self.ema_slow[rows] = ema(close, MACD_SLOW)[:, -1]
+
+        # Before RSI_PERIOD changes the averages hold partial sums
+        delta = np.zeros(close.shape)
+        delta[:, 1:] = np.diff(close, axis=1)
+        for name, moves in (("avg_gain", np.maximum(delta, 0.0)), ("avg_loss", np.maximum(-delta, 0.0))):
+            if n - 1 >= RSI_PERIOD:
+                getattr(self, name)[rows] = wilder_average(moves, RSI_PERIOD, start=1)[:, -1]
+            else:
+                getattr(self, name)[rows] = moves[:, 1:].sum(axis=1) / RSI_PERIOD
+
+        # Rings hold each bar at position bar % width
+        centered = close - close[:, :1]
+        positions = np.arange(n)
+        tail = positions[-CLOSE_WINDOW:]
+        self.closes[rows[:, np.newaxis], tail % CLOSE_WINDOW] = centered[:, tail]
+        bb_tail = centered[:, -BOLLINGER_PERIOD:]
+        self.bb_sum[rows] = bb_tail.sum(axis=1)
+        self.bb_sumsq[rows] = (bb_tail * bb_tail).sum(axis=1)
+        self.ma_sum[rows] = centered[:, -MA_PERIOD:].sum(axis=1)
+
+        self.max_head[rows] = self.max_size[rows] = 0
+        self.min_head[rows] = self.min_size[rows] = 0
+        for bar in positions[-STOCHASTIC_PERIOD:].tolist():
+            for i, row in enumerate(rows.tolist()):
+                self._push_extremes(row, bar, high[i, bar], low[i, bar])
+
+        return self._values(rows)
+
+    def update(self, keys: List[str], high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               time: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Add one bar to each stream.
+
+        Unknown streams are created and start from this bar.
+
+        Args:
+            keys: Stream keys, one per bar; each key at most once.
+            high: High price of each bar.
+            low: Low price of each bar.
+            close: Close price of each bar.
+            time: Timestamp of each bar.
+
+        Returns:
+            Latest indicator values, as returned by ``compute_indicators``
+            with ``last_only=True``.
+        """
+        high, low, close = as_series(high), as_series(low), as_series(close)
+        rows = self.get_rows(keys, create=True)
+        bar = self.bars[rows]
+        first = bar == 0
+        if time is not None:
+            self.last_time[rows] = time
+
+        # Exponential averages
+        self.offset[rows] = np.where(first, close, self.offset[rows])
+        for name, period in (("ema_fast", MACD_FAST), ("ema_slow", MACD_SLOW)):
+            previous = getattr(self, name)[rows]
+            getattr(self, name)[rows] = np.where(first, close, previous + 2.0 / (period + 1) * (close - previous))
+
+        # Wilder averages sum the first RSI_PERIOD changes, then smooth
+        delta = np.where(first, 0.0, close - self.prev_close[rows])
+        warming = bar <= RSI_PERIOD
+        for name, move in (("avg_gain", np.maximum(delta, 0.0)), ("avg_loss", np.maximum(-delta, 0.0))):
+            previous = getattr(self, name)[rows]
+            getattr(self, name)[rows] = np.where(warming, previous + move / RSI_PERIOD,
+                                                 previous + (move - previous) / RSI_PERIOD)
+        self.prev_close[rows] = close
+
+        # Running sums over the ring of closes
+        x = close - self.offset[rows]
+        bb_out = np.where(bar >= BOLLINGER_PERIOD, self.closes[rows, (bar - BOLLINGER_PERIOD) % CLOSE_WINDOW], 0.0)
+        ma_out = np.where(bar >= MA_PERIOD, self.closes[rows, (bar - MA_PERIOD) % CLOSE_WINDOW], 0.0)
+        self.bb_sum[rows] += x - bb_out
+        self.bb_sumsq[rows] += x * x - bb_out * bb_out
+        self.ma_sum[rows] += x - ma_out
+        self.closes[rows, bar % CLOSE_WINDOW] = x
+
+        bar += 1
+        self.bars[rows] = bar
+        self._resync_sums(rows[bar % CLOSE_WINDOW == 0])
+
+        for i, row in enumerate(rows.tolist()):
+            self._push_extremes(row, int(bar[i]) - 1, high[i], low[i])
+
+        return self._values(rows)
+
+    def _resync_sums(self, rows: np.ndarray) -> None:
+        """Recompute running sums from the ring to stop rounding drift."""
+        if not len(rows):
+            return
+        bar = self.bars[rows]
+        positions = (bar[:, np.newaxis] - np.arange(1, CLOSE_WINDOW + 1)) % CLOSE_WINDOW
+        recent = np.take_along_axis(self.closes[rows], positions, axis=1)
+        bb_recent = recent[:, :BOLLINGER_PERIOD]
+        self.bb_sum[rows] = bb_recent.sum(axis=1)
+        self.bb_sumsq[rows] = (bb_recent * bb_recent).sum(axis=1)
+        self.ma_sum[rows] = recent[:, :MA_PERIOD].sum(axis=1)
+
+    def _push_extremes(self, row: int, bar: int, high: float, low: float) -> None:
+        """Add a bar to the stochastic monotonic deques of one stream."""
+        self.highs[row, bar % STOCHASTIC_PERIOD] = high
+        self.lows[row, bar % STOCHASTIC_PERIOD] = low
+        for deque, head, size, values, keep in (
+            (self.max_deque, self.max_head, self.max_size, self.highs, float.__gt__),
+            (self.min_deque, self.min_head, self.min_size, self.lows, float.__lt__),
+        ):
+            ring = deque[row]
+            start, count = int(head[row]), int(size[row])
+            # Drop the oldest bar once it leaves the window
+            if count and ring[start] <= bar - STOCHASTIC_PERIOD:
+                start = (start + 1) % STOCHASTIC_PERIOD
+                count -= 1
+            # Drop newer bars the new one dominates
+            value = float(values[row, bar % STOCHASTIC_PERIOD])
+            while count:
+                back = ring[(start + count - 1) % STOCHASTIC_PERIOD]
+                if keep(float(values[row, back % STOCHASTIC_PERIOD]), value):
+                    break
+                count -= 1
+            ring[(start + count) % STOCHASTIC_PERIOD] = bar
+            head[row], size[row] = start, count + 1
+
+    def _values(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """Indicator values for the latest bar of each stream."""
+        bar = self.bars[rows]
+        close = self.prev_close[rows]
+        offset = self.offset[rows]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_gain, avg_loss = self.avg_gain[rows], self.avg_loss[rows]
+            rsi = np.where(avg_loss == 0.0, np.where(avg_gain == 0.0, 50.0, 100.0),
+                           100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+            mean = self.bb_sum[rows] / BOLLINGER_PERIOD
+            std = np.sqrt(np.maximum(self.bb_sumsq[rows] / BOLLINGER_PERIOD - mean * mean, 0.0))
+            width = 2.0 * BOLLINGER_STD * std
+            percent_b = np.where(width > 0.0, (close - offset - mean + BOLLINGER_STD * std) / width, 0.5)
+
+            ma_ratio = close / (offset + self.ma_sum[rows] / MA_PERIOD)
+
+            highest = self.highs[rows, self.max_deque[rows, self.max_head[rows]] % STOCHASTIC_PERIOD]
+            lowest = self.lows[rows, self.min_deque[rows, self.min_head[rows]] % STOCHASTIC_PERIOD]
+            span = highest - lowest
+            stochastic = np.where(span > 0.0, 100.0 * (close - lowest) / span, 50.0)
+
+        return {
+            "RSI": np.where(bar > RSI_PERIOD, rsi, np.nan),
+            "MACD": 100.0 * (self.ema_fast[rows] - self.ema_slow[rows]) / close,
+            "Bollinger Bands": np.where(bar >= BOLLINGER_PERIOD, percent_b, np.nan),
+            "Moving Average": np.where(bar >= MA_PERIOD, ma_ratio, np.nan),
+            "Stochastic": np.where(bar >= STOCHASTIC_PERIOD, stochastic, np.nan),
+        }
+
+    def values(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Latest indicator values of existing streams."""
+        return self._values(self.get_rows(keys))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write a snapshot of every stream to an ``.npz`` file."""
+        size = len(self.keys)
+        arrays = {name: getattr(self, name)[:size] for name in self._fields()}
+        np.savez(path, keys=np.array(self.keys, dtype=str), periods=PERIODS, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StreamingIndicators":
+        """Read a snapshot written by ``save``.
+
+        Raises:
+            ValueError: If the snapshot was written with other indicator periods.
+        """
+        with np.load(path) as snapshot:
+            if not np.array_equal(snapshot["periods"], PERIODS):
+                raise ValueError(f"Snapshot {path} was written with different indicator periods")
+            keys = snapshot["keys"].tolist()
+            state = cls(capacity=len(keys))
+            state.get_rows(keys, create=True)
+            for name in state._fields():
+                getattr(state, name)[:len(keys)] = snapshot[name]
+        return state
+
+
+def stream_key(symbol: str, timeframe: str) -> str:
+    """Key of the stream for a symbol and timeframe."""
+    return f"{symbol}:{timeframe}"
+
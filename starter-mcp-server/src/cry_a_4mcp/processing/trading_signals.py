@@ -6,13 +6,19 @@ for cryptocurrency markets using technical and sentiment analysis.
 
 import asyncio
 from dataclasses import dataclass, field
+from functools import partial
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import structlog
 
 from ..config import Settings
+from .backtest import BacktestMetrics, Strategy, indicator_vote, ma_crossover, rsi_reversion, run_backtest
+from .indicators import INDICATOR_NAMES, MIN_HISTORY_BARS, classify
+from .ohlcv_store import OHLCVStore, to_millis
+from .streaming_indicators import StreamingIndicators, stream_key
 
 
 class SignalType(str, Enum):
@@ -53,6 +59,45 @@ class SignalStrength(str, Enum):
     VERY_STRONG = "very_strong"
 
 
+# Thresholds mapping indicator values to signals: values below the lower
+# bound give the first signal and values above the upper bound the second
+INDICATOR_THRESHOLDS: Dict[str, Tuple[float, float, SignalType, SignalType]] = {
+    "RSI": (30.0, 70.0, SignalType.BUY, SignalType.SELL),
+    "MACD": (-2.0, 2.0, SignalType.SELL, SignalType.BUY),
+    "Bollinger Bands": (0.2, 0.8, SignalType.BUY, SignalType.SELL),
+    "Moving Average": (0.98, 1.02, SignalType.BUY, SignalType.SELL),
+    "Stochastic": (20.0, 80.0, SignalType.BUY, SignalType.SELL),
+}
+
+
+# Votes cast by each indicator signal in backtests
+_VOTES = {SignalType.BUY: 1, SignalType.SELL: -1}
+VOTE_THRESHOLDS = {
+    name: (lower, upper, _VOTES[below], _VOTES[above])
+    for name, (lower, upper, below, above) in INDICATOR_THRESHOLDS.items()
+}
+
+# Duration of one bar of each time frame
+TIMEFRAME_DURATIONS = {
+    TimeFrame.MINUTE_1: timedelta(minutes=1),
+    TimeFrame.MINUTE_5: timedelta(minutes=5),
+    TimeFrame.MINUTE_15: timedelta(minutes=15),
+    TimeFrame.MINUTE_30: timedelta(minutes=30),
+    TimeFrame.HOUR_1: timedelta(hours=1),
+    TimeFrame.HOUR_4: timedelta(hours=4),
+    TimeFrame.HOUR_12: timedelta(hours=12),
+    TimeFrame.DAY_1: timedelta(days=1),
+    TimeFrame.WEEK_1: timedelta(weeks=1),
+}
+
+# Backtest strategy used for unknown strategy names
+DEFAULT_STRATEGY = "indicator_vote"
+
+# Limits on the per-bar detail kept in backtest results
+MAX_EQUITY_POINTS = 1000
+MAX_BACKTEST_SIGNALS = 100
+
+
 @dataclass
 class TechnicalIndicator:
     """Technical indicator data."""
@@ -174,13 +219,34 @@ class TradingSignalsGenerator:
             "MATIC": "Polygon",
         }
         
-        # Initialize technical indicators
-        self.technical_indicators = {
-            "RSI": self._calculate_rsi,
-            "MACD": self._calculate_macd,
-            "Bollinger Bands": self._calculate_bollinger_bands,
-            "Moving Average": self._calculate_moving_average,
-            "Stochastic": self._calculate_stochastic,
+        # Mock prices for common cryptocurrencies
+        self.mock_prices = {
+            "BTC": 50000.0,
+            "ETH": 3000.0,
+            "BNB": 400.0,
+            "ADA": 1.2,
+            "SOL": 150.0,
+            "XRP": 0.8,
+            "DOGE": 0.15,
+            "DOT": 20.0,
+            "AVAX": 80.0,
+            "MATIC": 1.5,
+        }
+        
+        # Bars of price history the indicators are computed from
+        self.history_bars = max(MIN_HISTORY_BARS, 200)
+        
+        # Indicator state per symbol and timeframe, updated bar by bar
+        self.indicator_state = StreamingIndicators()
+        
+        # Local OHLCV history; pairs without stored bars use mock prices
+        self.market_data = OHLCVStore(settings.market_data_dir)
+        
+        # Backtest strategies by name
+        self.strategies: Dict[str, Strategy] = {
+            "indicator_vote": partial(indicator_vote, thresholds=VOTE_THRESHOLDS),
+            "ma_crossover": ma_crossover,
+            "rsi_reversion": rsi_reversion,
         }
     
     async def initialize(self) -> None:
@@ -207,39 +273,8 @@ class TradingSignalsGenerator:
         # Normalize symbol
         symbol = symbol.upper()
         
-        # In a real implementation, this would fetch market data and apply technical analysis
-        # For now, generate mock trading signal
-        
-        # Get mock price
-        price = await self._get_mock_price(symbol)
-        
-        # Generate technical indicators
-        indicators = await self._generate_indicators(symbol, timeframe)
-        
-        # Determine signal type and strength based on indicators
-        signal_type, strength, confidence = self._determine_signal(indicators, source)
-        
-        # Generate risk assessment
-        risk_assessment = await self._generate_risk_assessment(symbol, signal_type, price)
-        
-        # Create trading signal
-        signal = TradingSignal(
-            symbol=symbol,
-            signal_type=signal_type,
-            source=source,
-            strength=strength,
-            timeframe=timeframe,
-            price=price,
-            confidence=confidence,
-            indicators=indicators,
-            risk_assessment=risk_assessment,
-            metadata={
-                "generated_by": "TradingSignalsGenerator",
-                "version": "1.0.0",
-            }
-        )
-        
-        return signal
+        signals = await self._generate_signals([symbol], [timeframe], [source])
+        return signals[0]
     
     async def get_signals(self, symbols: List[str] = None, timeframes: List[TimeFrame] = None,
                         signal_types: List[SignalType] = None, sources: List[SignalSource] = None,
@@ -271,21 +306,11 @@ class TradingSignalsGenerator:
             sources = [SignalSource.HYBRID]
         
         # In a real implementation, this would query a database of signals
-        # For now, generate mock signals
-        
-        signals = []
-        tasks = []
-        
-        # Generate signals for each symbol and timeframe combination
-        for symbol in symbols[:min(5, len(symbols))]:  # Limit to 5 symbols for mock data
-            for timeframe in timeframes[:min(2, len(timeframes))]:  # Limit to 2 timeframes for mock data
-                for source in sources[:min(1, len(sources))]:  # Limit to 1 source for mock data
-                    tasks.append(self.generate_signal(symbol, timeframe, source))
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
+        # For now, generate signals from mock market data
+        results = await self._generate_signals(symbols, timeframes, sources)
         
         # Filter signals
+        signals = []
         for signal in results:
             if signal.confidence >= min_confidence and signal.signal_type in signal_types:
                 signals.append(signal)
@@ -314,87 +339,43 @@ class TradingSignalsGenerator:
         self.logger.info("Backtesting trading strategy", strategy_name=strategy_name, symbols=symbols,
                         timeframe=timeframe, start_date=start_date, end_date=end_date)
         
-        # In a real implementation, this would run a full backtest with historical data
-        # For now, generate mock backtest result
-        
-        # Generate mock signals for the backtest period
-        signals = []
-        current_date = start_date
-        while current_date <= end_date:
-            # Generate a signal every few days/hours depending on timeframe
-            if timeframe in [TimeFrame.MINUTE_1, TimeFrame.MINUTE_5, TimeFrame.MINUTE_15, TimeFrame.MINUTE_30]:
-                step = timedelta(hours=1)
-            elif timeframe in [TimeFrame.HOUR_1, TimeFrame.HOUR_4, TimeFrame.HOUR_12]:
-                step = timedelta(days=1)
-            else:  # DAY_1, WEEK_1
-                step = timedelta(days=7)
-            
-            # Only generate signals on some intervals (not every step)
-            if current_date.day % 3 == 0 or current_date.day % 7 == 0:
-                for symbol in symbols[:min(2, len(symbols))]:  # Limit to 2 symbols for mock data
-                    # Create a mock signal with the historical date
-                    mock_signal = await self.generate_signal(symbol, timeframe)
-                    mock_signal.timestamp = current_date
-                    mock_signal.expiration = current_date + step * 3
-                    signals.append(mock_signal)
-            
-            current_date += step
-        
-        # Generate mock equity curve
-        equity_curve = []
-        current_capital = initial_capital
-        current_date = start_date
-        while current_date <= end_date:
-            # Add some randomness to the equity curve
-            import random
-            change_percent = random.uniform(-0.02, 0.03)  # -2% to +3%
-            current_capital *= (1 + change_percent)
-            equity_curve.append((current_date, current_capital))
-            
-            # Step forward in time
-            if timeframe in [TimeFrame.MINUTE_1, TimeFrame.MINUTE_5, TimeFrame.MINUTE_15, TimeFrame.MINUTE_30]:
-                current_date += timedelta(hours=4)
-            elif timeframe in [TimeFrame.HOUR_1, TimeFrame.HOUR_4, TimeFrame.HOUR_12]:
-                current_date += timedelta(days=1)
-            else:  # DAY_1, WEEK_1
-                current_date += timedelta(days=3)
-        
-        # Calculate mock performance metrics
-        final_capital = equity_curve[-1][1]
-        total_return = (final_capital - initial_capital) / initial_capital * 100
-        
-        # Calculate annualized return
-        days = (end_date - start_date).days
-        if days > 0:
-            annualized_return = ((final_capital / initial_capital) ** (365 / days) - 1) * 100
-        else:
-            annualized_return = 0.0
-        
-        # Calculate max drawdown
-        max_drawdown = 0.0
-        peak_value = initial_capital
-        for _, value in equity_curve:
-            if value > peak_value:
-                peak_value = value
-            drawdown = (peak_value - value) / peak_value * 100
-            max_drawdown = max(max_drawdown, drawdown)
-        
-        # Generate mock trade statistics
-        total_trades = len(signals)
-        winning_trades = int(total_trades * 0.6)  # 60% win rate
-        losing_trades = total_trades - winning_trades
-        
-        avg_profit_per_trade = total_return / total_trades if total_trades > 0 else 0.0
-        avg_loss_per_trade = -avg_profit_per_trade * 0.7  # Average loss is 70% of average profit
-        
-        # Calculate Sharpe ratio (simplified)
-        sharpe_ratio = 1.5  # Mock value
-        
-        # Calculate profit factor
-        profit_factor = abs(winning_trades * avg_profit_per_trade) / abs(losing_trades * avg_loss_per_trade) if losing_trades > 0 and avg_loss_per_trade != 0 else 0.0
-        
-        # Calculate average holding period
-        avg_holding_period = timedelta(days=3) if timeframe in [TimeFrame.DAY_1, TimeFrame.WEEK_1] else timedelta(hours=8)
+        symbols = [symbol.upper() for symbol in symbols]
+        step = TIMEFRAME_DURATIONS[timeframe]
+        
+        strategy_key = strategy_name if strategy_name in self.strategies else DEFAULT_STRATEGY
+        if strategy_key != strategy_name:
+            self.logger.warning("Unknown strategy, using default", strategy_name=strategy_name,
+                                default=DEFAULT_STRATEGY)
+        
+        # Use stored bars when every symbol has them, otherwise mock price history
+        data_source = "mock"
+        if all(self.market_data.has(symbol, timeframe.value) for symbol in symbols):
+            times, columns = self.market_data.read_aligned(symbols, timeframe.value, start_date, end_date)
+            if len(times) >= 2:
+                data_source = "market_data"
+                high, low, close = columns["high"], columns["low"], columns["close"]
+                offsets = times - to_millis(start_date)
+        if data_source == "mock":
+            bars = max(int((end_date - start_date) / step) + 1, 2)
+            high, low, close = self._get_mock_ohlcv(symbols, bars)
+            offsets = np.arange(bars, dtype=np.int64) * int(step / timedelta(milliseconds=1))
+        bars = close.shape[1]
+        
+        # The backtest is CPU-bound, so it runs off the event loop
+        loop = asyncio.get_running_loop()
+        metrics = await loop.run_in_executor(None, partial(
+            self._run_backtest, self.strategies[strategy_key], high, low, close,
+            initial_capital, timedelta(days=365) / step,
+        ))
+        
+        # Sample the equity curve rather than returning every bar
+        points = np.unique(np.linspace(0, bars - 1, min(bars, MAX_EQUITY_POINTS)).astype(np.int64))
+        equity_curve = [
+            (start_date + timedelta(milliseconds=int(offsets[i])), float(metrics.equity[i]))
+            for i in points.tolist()
+        ]
+        
+        signals, total_signals = self._backtest_signals(metrics, symbols, close, timeframe, start_date, offsets)
         
         return BacktestResult(
             symbol=",".join(symbols),
@@ -403,248 +384,282 @@ class TradingSignalsGenerator:
             start_date=start_date,
             end_date=end_date,
             initial_capital=initial_capital,
-            final_capital=final_capital,
-            total_return=total_return,
-            annualized_return=annualized_return,
-            max_drawdown=max_drawdown,
-            sharpe_ratio=sharpe_ratio,
-            win_rate=winning_trades / total_trades * 100 if total_trades > 0 else 0.0,
-            profit_factor=profit_factor,
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            avg_profit_per_trade=avg_profit_per_trade,
-            avg_loss_per_trade=avg_loss_per_trade,
-            avg_holding_period=avg_holding_period,
+            final_capital=metrics.final_capital,
+            total_return=metrics.total_return,
+            annualized_return=metrics.annualized_return,
+            max_drawdown=metrics.max_drawdown,
+            sharpe_ratio=metrics.sharpe_ratio,
+            win_rate=metrics.win_rate,
+            profit_factor=metrics.profit_factor,
+            total_trades=metrics.total_trades,
+            winning_trades=metrics.winning_trades,
+            losing_trades=metrics.losing_trades,
+            avg_profit_per_trade=metrics.avg_win,
+            avg_loss_per_trade=metrics.avg_loss,
+            avg_holding_period=step * metrics.avg_holding_bars,
             signals=signals,
             equity_curve=equity_curve,
             metadata={
                 "backtest_engine": "TradingSignalsGenerator",
-                "version": "1.0.0",
+                "version": "2.0.0",
+                "strategy": strategy_key,
+                "data_source": data_source,
+                "bars": bars,
+                "total_signals": total_signals,
+                "total_costs": metrics.total_costs,
             }
         )
     
-    async def _get_mock_price(self, symbol: str) -> float:
-        """Get mock price for a cryptocurrency.
+    @staticmethod
+    def _run_backtest(strategy: Strategy, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      initial_capital: float, periods_per_year: float) -> BacktestMetrics:
+        """Compute a strategy's positions and backtest them."""
+        positions = strategy(high, low, close)
+        return run_backtest(close, positions, initial_capital=initial_capital, periods_per_year=periods_per_year)
+    
+    def _backtest_signals(self, metrics: BacktestMetrics, symbols: List[str], close: np.ndarray,
+                          timeframe: TimeFrame, start_date: datetime,
+                          offsets: np.ndarray) -> Tuple[List[TradingSignal], int]:
+        """Turn the latest position changes of a backtest into trading signals.
         
         Args:
-            symbol: Cryptocurrency symbol
+            metrics: Backtest metrics
+            symbols: Symbols, one per row of ``close``
+            close: Close prices
+            timeframe: Time frame of the bars
+            start_date: Start date of the backtest
+            offsets: Milliseconds from ``start_date`` to each bar
             
         Returns:
-            Mock price
+            Tuple of (signals for the last ``MAX_BACKTEST_SIGNALS`` changes, total changes)
         """
-        # Mock prices for common cryptocurrencies
-        prices = {
-            "BTC": 50000.0,
-            "ETH": 3000.0,
-            "BNB": 400.0,
-            "ADA": 1.2,
-            "SOL": 150.0,
-            "XRP": 0.8,
-            "DOGE": 0.15,
-            "DOT": 20.0,
-            "AVAX": 80.0,
-            "MATIC": 1.5,
-        }
+        step = TIMEFRAME_DURATIONS[timeframe]
+        changes = np.diff(metrics.positions, axis=1, prepend=0.0)
+        rows, bars = np.nonzero(changes)
+        latest = np.argsort(bars, kind="stable")[-MAX_BACKTEST_SIGNALS:]
         
-        # Add some randomness to the price
-        import random
-        base_price = prices.get(symbol, 100.0)  # Default to 100.0 if symbol not found
-        return base_price * random.uniform(0.98, 1.02)  # +/- 2%
+        signals = []
+        for row, bar in zip(rows[latest].tolist(), bars[latest].tolist()):
+            timestamp = start_date + timedelta(milliseconds=int(offsets[bar]))
+            signals.append(TradingSignal(
+                symbol=symbols[row],
+                signal_type=SignalType.BUY if changes[row, bar] > 0 else SignalType.SELL,
+                source=SignalSource.TECHNICAL,
+                strength=SignalStrength.MODERATE,
+                timeframe=timeframe,
+                price=float(close[row, bar]),
+                confidence=1.0,
+                timestamp=timestamp,
+                expiration=timestamp + step,
+            ))
+        return signals, len(rows)
     
-    async def _generate_indicators(self, symbol: str, timeframe: TimeFrame) -> List[TechnicalIndicator]:
-        """Generate technical indicators for a cryptocurrency.
+    async def _generate_signals(self, symbols: List[str], timeframes: List[TimeFrame],
+                                sources: List[SignalSource]) -> List[TradingSignal]:
+        """Generate trading signals for every symbol, timeframe and source.
+        
+        Indicators for all symbol/timeframe pairs are updated together. Pairs
+        seen before only process the bars since the previous call; new pairs
+        are seeded from their price history. Pairs with bars in the market
+        data store use them; the others use mock prices.
         
         Args:
-            symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicators
+            symbols: Cryptocurrency symbols
+            timeframes: Time frames for the signals
+            sources: Sources of the signals
             
         Returns:
-            List of technical indicators
+            Trading signals, ordered by symbol, then timeframe, then source
         """
-        # In a real implementation, this would calculate actual technical indicators
-        # For now, generate mock indicators
-        
-        indicators = []
+        pairs = list(dict.fromkeys((symbol.upper(), timeframe) for symbol in symbols for timeframe in timeframes))
+        if not pairs:
+            return []
         
-        # Generate RSI
-        rsi = await self._calculate_rsi(symbol, timeframe)
-        indicators.append(rsi)
+        prices, values = self._update_indicators(pairs)
+        indicator_sets = self._build_indicators(pairs, values)
         
-        # Generate MACD
-        macd = await self._calculate_macd(symbol, timeframe)
-        indicators.append(macd)
-        
-        # Generate Bollinger Bands
-        bb = await self._calculate_bollinger_bands(symbol, timeframe)
-        indicators.append(bb)
-        
-        # Generate Moving Average
-        ma = await self._calculate_moving_average(symbol, timeframe)
-        indicators.append(ma)
-        
-        # Generate Stochastic
-        stoch = await self._calculate_stochastic(symbol, timeframe)
-        indicators.append(stoch)
-        
-        return indicators
+        signals = []
+        for (symbol, timeframe), price, indicators in zip(pairs, prices.tolist(), indicator_sets):
+            for source in sources:
+                # Determine signal type and strength based on indicators
+                signal_type, strength, confidence = self._determine_signal(indicators, source)
+                
+                # Generate risk assessment
+                risk_assessment = await self._generate_risk_assessment(symbol, signal_type, price)
+                
+                signals.append(TradingSignal(
+                    symbol=symbol,
+                    signal_type=signal_type,
+                    source=source,
+                    strength=strength,
+                    timeframe=timeframe,
+                    price=price,
+                    confidence=confidence,
+                    indicators=indicators,
+                    risk_assessment=risk_assessment,
+                    metadata={
+                        "generated_by": "TradingSignalsGenerator",
+                        "version": "1.0.0",
+                    }
+                ))
+        
+        return signals
     
-    async def _calculate_rsi(self, symbol: str, timeframe: TimeFrame) -> TechnicalIndicator:
-        """Calculate RSI technical indicator.
+    def _update_indicators(self, pairs: List[Tuple[str, TimeFrame]]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Bring the indicator state of each pair up to date.
         
         Args:
-            symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicator
+            pairs: Symbol/timeframe pairs
             
         Returns:
-            RSI technical indicator
+            Tuple of (latest price of each pair, latest indicator values)
         """
-        # In a real implementation, this would calculate actual RSI
-        # For now, generate mock RSI
-        
-        import random
-        rsi_value = random.uniform(30.0, 70.0)
-        
-        # Determine signal based on RSI value
-        if rsi_value < 30.0:
-            signal = SignalType.BUY
-        elif rsi_value > 70.0:
-            signal = SignalType.SELL
-        else:
-            signal = SignalType.HOLD
-        
-        return TechnicalIndicator(
-            name="RSI",
-            value=rsi_value,
-            signal=signal,
-            timeframe=timeframe
-        )
+        keys = [stream_key(symbol, timeframe.value) for symbol, timeframe in pairs]
+        stored = [i for i, (symbol, timeframe) in enumerate(pairs) if self.market_data.has(symbol, timeframe.value)]
+        stored_set = set(stored)
+        known = [i for i, key in enumerate(keys) if key in self.indicator_state and i not in stored_set]
+        new = [i for i, key in enumerate(keys) if key not in self.indicator_state and i not in stored_set]
+        
+        prices = np.empty(len(pairs))
+        values = {name: np.empty(len(pairs)) for name in INDICATOR_NAMES}
+        
+        for i in stored:
+            symbol, timeframe = pairs[i]
+            prices[i], stored_values = self._update_stored_indicators(symbol, timeframe.value, keys[i])
+            for name in INDICATOR_NAMES:
+                values[name][i] = stored_values[name][0]
+        
+        if new:
+            # Mock price history for pairs without stored bars
+            high, low, close = self._get_mock_ohlcv([pairs[i][0] for i in new], self.history_bars)
+            seeded = self.indicator_state.seed([keys[i] for i in new], high, low, close)
+            prices[new] = close[:, -1]
+            for name in INDICATOR_NAMES:
+                values[name][new] = seeded[name]
+        
+        if known:
+            # One mock bar per pair without stored bars
+            known_keys = [keys[i] for i in known]
+            high, low, close = self._next_mock_bar(self.indicator_state.prev_close[self.indicator_state.get_rows(known_keys)])
+            updated = self.indicator_state.update(known_keys, high, low, close)
+            prices[known] = close
+            for name in INDICATOR_NAMES:
+                values[name][known] = updated[name]
+        
+        return prices, values
     
-    async def _calculate_macd(self, symbol: str, timeframe: TimeFrame) -> TechnicalIndicator:
-        """Calculate MACD technical indicator.
+    def _update_stored_indicators(self, symbol: str, timeframe: str, key: str) -> Tuple[float, Dict[str, np.ndarray]]:
+        """Bring one pair's indicator state up to date from the market data store.
+        
+        Streams not yet fed from the store, or more than ``history_bars``
+        behind it, are reseeded from the latest stored bars.
         
         Args:
             symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicator
+            timeframe: Time frame value, e.g. ``"1h"``
+            key: Stream key of the pair
             
         Returns:
-            MACD technical indicator
+            Tuple of (latest close, latest indicator values)
         """
-        # In a real implementation, this would calculate actual MACD
-        # For now, generate mock MACD
+        state = self.indicator_state
+        last_time = int(state.last_time[state.get_rows([key])][0]) if key in state else 0
+        bars = self.market_data.read(symbol, timeframe, start=last_time + 1) if last_time else None
+        
+        if bars is None or len(bars) > self.history_bars:
+            bars = self.market_data.tail(symbol, timeframe, self.history_bars)
+            result = state.seed([key], bars.high[np.newaxis], bars.low[np.newaxis], bars.close[np.newaxis],
+                                last_time=bars.time[-1:])
+        else:
+            result = state.values([key])
+            for i in range(len(bars)):
+                result = state.update([key], bars.high[i:i + 1], bars.low[i:i + 1], bars.close[i:i + 1],
+                                      time=bars.time[i:i + 1])
         
-        import random
-        macd_value = random.uniform(-10.0, 10.0)
+        return float(state.prev_close[state.get_rows([key])][0]), result
+    
+    def save_indicator_state(self, path: str) -> None:
+        """Save the indicator state of every symbol and timeframe.
         
-        # Determine signal based on MACD value
-        if macd_value > 2.0:
-            signal = SignalType.BUY
-        elif macd_value < -2.0:
-            signal = SignalType.SELL
-        else:
-            signal = SignalType.HOLD
+        Args:
+            path: Snapshot file path (``.npz``)
+        """
+        self.indicator_state.save(path)
+        self.logger.info("Saved indicator state", path=path, streams=len(self.indicator_state))
+    
+    def load_indicator_state(self, path: str) -> None:
+        """Restore indicator state saved by ``save_indicator_state``.
         
-        return TechnicalIndicator(
-            name="MACD",
-            value=macd_value,
-            signal=signal,
-            timeframe=timeframe
-        )
+        Args:
+            path: Snapshot file path (``.npz``)
+        """
+        self.indicator_state = StreamingIndicators.load(path)
+        self.logger.info("Loaded indicator state", path=path, streams=len(self.indicator_state))
     
-    async def _calculate_bollinger_bands(self, symbol: str, timeframe: TimeFrame) -> TechnicalIndicator:
-        """Calculate Bollinger Bands technical indicator.
+    def _get_mock_ohlcv(self, symbols: List[str], bars: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get mock price history for cryptocurrencies.
         
         Args:
-            symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicator
+            symbols: Cryptocurrency symbols, one row each
+            bars: Number of bars per symbol
             
         Returns:
-            Bollinger Bands technical indicator
+            Tuple of (high, low, close) arrays shaped ``(len(symbols), bars)``
         """
-        # In a real implementation, this would calculate actual Bollinger Bands
-        # For now, generate mock Bollinger Bands
+        rng = np.random.default_rng()
         
-        import random
-        # Value represents the position within the bands (0 = lower band, 1 = upper band, 0.5 = middle band)
-        bb_value = random.uniform(0.0, 1.0)
-        
-        # Determine signal based on Bollinger Bands value
-        if bb_value < 0.2:
-            signal = SignalType.BUY
-        elif bb_value > 0.8:
-            signal = SignalType.SELL
-        else:
-            signal = SignalType.HOLD
+        # Random walks ending within 2% of the mock price
+        base_prices = np.array([self.mock_prices.get(symbol, 100.0) for symbol in symbols])
+        base_prices *= rng.uniform(0.98, 1.02, size=len(symbols))
+        log_returns = np.cumsum(rng.normal(0.0, 0.01, size=(len(symbols), bars)), axis=1)
+        close = base_prices[:, np.newaxis] * np.exp(log_returns - log_returns[:, -1:])
         
-        return TechnicalIndicator(
-            name="Bollinger Bands",
-            value=bb_value,
-            signal=signal,
-            timeframe=timeframe
-        )
+        spread = np.abs(rng.normal(0.0, 0.005, size=close.shape))
+        return close * (1.0 + spread), close * (1.0 - spread), close
     
-    async def _calculate_moving_average(self, symbol: str, timeframe: TimeFrame) -> TechnicalIndicator:
-        """Calculate Moving Average technical indicator.
+    def _next_mock_bar(self, prev_close: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the next mock bar after each previous close.
         
         Args:
-            symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicator
+            prev_close: Previous close of each series
             
         Returns:
-            Moving Average technical indicator
+            Tuple of (high, low, close) arrays shaped like ``prev_close``
         """
-        # In a real implementation, this would calculate actual Moving Average
-        # For now, generate mock Moving Average
-        
-        import random
-        # Value represents the price relative to the moving average (< 1 = below MA, > 1 = above MA)
-        ma_value = random.uniform(0.9, 1.1)
-        
-        # Determine signal based on Moving Average value
-        if ma_value > 1.02:
-            signal = SignalType.SELL
-        elif ma_value < 0.98:
-            signal = SignalType.BUY
-        else:
-            signal = SignalType.HOLD
-        
-        return TechnicalIndicator(
-            name="Moving Average",
-            value=ma_value,
-            signal=signal,
-            timeframe=timeframe
-        )
+        rng = np.random.default_rng()
+        close = prev_close * np.exp(rng.normal(0.0, 0.01, size=prev_close.shape))
+        spread = np.abs(rng.normal(0.0, 0.005, size=close.shape))
+        return close * (1.0 + spread), close * (1.0 - spread), close
     
-    async def _calculate_stochastic(self, symbol: str, timeframe: TimeFrame) -> TechnicalIndicator:
-        """Calculate Stochastic technical indicator.
+    def _build_indicators(self, pairs: List[Tuple[str, TimeFrame]],
+                          values: Dict[str, np.ndarray]) -> List[List[TechnicalIndicator]]:
+        """Turn the latest indicator values into technical indicators.
         
         Args:
-            symbol: Cryptocurrency symbol
-            timeframe: Time frame for the indicator
+            pairs: Symbol/timeframe pairs, one per row of ``values``
+            values: Latest value of each indicator, keyed by indicator name
             
         Returns:
-            Stochastic technical indicator
+            Technical indicators for each pair, in ``INDICATOR_NAMES`` order
         """
-        # In a real implementation, this would calculate actual Stochastic
-        # For now, generate mock Stochastic
-        
-        import random
-        stoch_value = random.uniform(0.0, 100.0)
-        
-        # Determine signal based on Stochastic value
-        if stoch_value < 20.0:
-            signal = SignalType.BUY
-        elif stoch_value > 80.0:
-            signal = SignalType.SELL
-        else:
-            signal = SignalType.HOLD
-        
-        return TechnicalIndicator(
-            name="Stochastic",
-            value=stoch_value,
-            signal=signal,
-            timeframe=timeframe
-        )
+        timestamp = datetime.now()
+        columns = []
+        for name in INDICATOR_NAMES:
+            lower, upper, below, above = INDICATOR_THRESHOLDS[name]
+            signal_by_code = {1: below, 0: SignalType.HOLD, -1: above}
+            codes = classify(values[name], lower, upper)
+            columns.append([
+                (value, signal_by_code[code])
+                for value, code in zip(values[name].tolist(), codes.tolist())
+            ])
+        
+        return [
+            [
+                TechnicalIndicator(name=name, value=value, signal=signal, timeframe=timeframe, timestamp=timestamp)
+                for name, (value, signal) in zip(INDICATOR_NAMES, row)
+            ]
+            for (_, timeframe), row in zip(pairs, zip(*columns))
+        ]
     
     def _determine_signal(self, indicators: List[TechnicalIndicator], source: SignalSource) -> Tuple[SignalType, SignalStrength, float]:
         """Determine overall signal type and strength based on indicators.
@@ -3,6 +3,6 @@
 This module provides retrieval capabilities for cryptocurrency data.
 """
 
-from .hybrid_search import HybridSearchEngine, SearchMode, SearchResult
+from .hybrid_search import HybridSearchEngine, SearchMode, SearchResult, reciprocal_rank_fusion
 
-__all__ = ["HybridSearchEngine", "SearchMode", "SearchResult"]
\ No newline at end of file
+__all__ = ["HybridSearchEngine", "SearchMode", "SearchResult", "reciprocal_rank_fusion"]
\ No newline at end of file
@@ -6,7 +6,10 @@ with knowledge graph traversal for comprehensive cryptocurrency analysis.
 """
 
 import asyncio
-from dataclasses import dataclass
+import hashlib
+import re
+import time
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -15,6 +18,7 @@ import structlog
 from ..config import Settings
 from ..storage.vector_store import VectorStore
 from ..storage.graph_store import GraphStore
+from ..utils.cache import LRUCache, data_generation, normalize_query
 
 
 class SearchMode(str, Enum):
@@ -33,6 +37,76 @@ class SearchResult:
     source_type: str
     sources: List[Dict[str, Any]]
     reasoning_path: Optional[List[str]] = None
+    # Set on fused hybrid results: the RRF score used for ranking and the
+    # rank and score the result had in each backend
+    fusion_score: Optional[float] = None
+    provenance: Optional[List[Dict[str, Any]]] = None
+
+
+# Damping constant of reciprocal rank fusion; 60 is the value from the
+# original RRF paper and works well without tuning
+DEFAULT_RRF_K = 60
+
+
+def content_key(content: str) -> str:
+    """Hash content for deduplication, ignoring case, punctuation and spacing.
+    
+    Args:
+        content: Result content
+        
+    Returns:
+        Hex digest identifying the normalized content
+    """
+    normalized = " ".join(re.sub(r"[^\w\s]", " ", content.casefold()).split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def reciprocal_rank_fusion(ranked_lists: Dict[str, List[SearchResult]], k: int = DEFAULT_RRF_K,
+                           weights: Optional[Dict[str, float]] = None) -> List[SearchResult]:
+    """Fuse ranked result lists with reciprocal rank fusion.
+    
+    Each result scores ``weight / (k + rank)`` in every list it appears in,
+    so fusion depends only on ranks and not on how each backend scales its
+    scores. Results with the same normalized content are merged; the merged
+    result keeps the sources of every copy and the highest confidence.
+    
+    Args:
+        ranked_lists: Results per backend name, best first
+        k: RRF damping constant
+        weights: Optional weight per backend name, defaulting to 1.0
+        
+    Returns:
+        Fused results ordered by fusion score, with provenance
+    """
+    weights = weights or {}
+    fused: Dict[str, SearchResult] = {}
+    for source, results in ranked_lists.items():
+        weight = weights.get(source, 1.0)
+        seen: Set[str] = set()
+        for result in results:
+            key = content_key(result.content)
+            # A duplicate within one list only counts at its best rank
+            if key in seen:
+                continue
+            seen.add(key)
+            rank = len(seen)
+            score = weight / (k + rank)
+            provenance = {"source": source, "rank": rank, "score": result.confidence}
+            
+            existing = fused.get(key)
+            if existing is None:
+                fused[key] = replace(result, sources=list(result.sources), fusion_score=score,
+                                     provenance=[provenance])
+                continue
+            existing.fusion_score += score
+            existing.provenance.append(provenance)
+            existing.sources.extend(result.sources)
+            existing.confidence = max(existing.confidence, result.confidence)
+            existing.source_type = "hybrid"
+            if existing.reasoning_path is None:
+                existing.reasoning_path = result.reasoning_path
+    
+    return sorted(fused.values(), key=lambda result: result.fusion_score, reverse=True)
 
 
 class HybridSearchEngine:
@@ -45,6 +119,15 @@ class HybridSearchEngine:
         self.vector_store: Optional[VectorStore] = None
         self.graph_store: Optional[GraphStore] = None
         self.entity_extractor = None
+        # Recent result lists, dropped after any document or graph write
+        self.result_cache = LRUCache(
+            settings.search_result_cache_size,
+            ttl=settings.search_result_cache_ttl,
+            track_writes=True,
+        )
+        # Each backend returns this many times max_results candidates for fusion
+        self.overfetch_factor = settings.search_overfetch_factor
+        self.rrf_k = settings.search_rrf_k
     
     async def initialize(self) -> None:
         """Initialize the search engine components."""
@@ -78,6 +161,15 @@ class HybridSearchEngine:
         # Validate search mode
         search_mode = SearchMode(mode)
         
+        cache_key = (search_mode, normalize_query(query), max_results, confidence_threshold)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Hybrid search served from cache", results_count=len(cached))
+            return list(cached)
+        
+        started = time.perf_counter()
+        generation = data_generation()
+        
         # Determine search strategy
         if search_mode == SearchMode.AUTO:
             search_mode = self._determine_search_mode(query)
@@ -92,8 +184,9 @@ class HybridSearchEngine:
         else:
             raise ValueError(f"Invalid search mode: {search_mode}")
         
-        # Sort results by confidence
-        results.sort(key=lambda x: x.confidence, reverse=True)
+        # Fused results are already ranked; other results rank by confidence
+        if search_mode != SearchMode.HYBRID:
+            results.sort(key=lambda x: x.confidence, reverse=True)
         
         # Apply confidence threshold
         results = [r for r in results if r.confidence >= confidence_threshold]
@@ -101,9 +194,24 @@ class HybridSearchEngine:
         # Limit results
         results = results[:max_results]
         
+        # Results computed while data was being written may already be stale
+        if data_generation() == generation:
+            self.result_cache.put(cache_key, results, cost=time.perf_counter() - started)
+        
         self.logger.info("Hybrid search completed", results_count=len(results))
         
-        return results
+        return list(results)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit rates and latency saved by the search caches.
+        
+        Returns:
+            Statistics of the result cache and the query embedding cache
+        """
+        return {
+            "results": self.result_cache.get_stats(),
+            "query_embeddings": self.vector_store.query_embeddings.get_stats() if self.vector_store else None,
+        }
     
     def _determine_search_mode(self, query: str) -> SearchMode:
         """Determine the best search mode for the query.
@@ -203,6 +311,10 @@ class HybridSearchEngine:
                            confidence_threshold: float) -> List[SearchResult]:
         """Perform hybrid search combining vector and graph approaches.
         
+        Both backends are queried concurrently for ``overfetch_factor`` times
+        more results than requested, so a result ranked moderately by both
+        can still make the fused top results.
+        
         Args:
             query: Search query
             max_results: Maximum number of results
@@ -211,62 +323,36 @@ class HybridSearchEngine:
         Returns:
             List of search results
         """
+        fetch_limit = max_results * self.overfetch_factor
+        
         # Run both search methods concurrently
-        vector_task = asyncio.create_task(
-            self._vector_search(query, max_results, confidence_threshold)
-        )
-        graph_task = asyncio.create_task(
-            self._graph_search(query, max_results, confidence_threshold)
+        vector_results, graph_results = await asyncio.gather(
+            self._vector_search(query, fetch_limit, confidence_threshold),
+            self._graph_search(query, fetch_limit, confidence_threshold),
         )
         
-        # Wait for both to complete
-        vector_results, graph_results = await asyncio.gather(vector_task, graph_task)
-        
         # Combine results
-        combined_results = self._merge_results(vector_results, graph_results, max_results)
-        
-        return combined_results
+        return self._merge_results(vector_results, graph_results, max_results, confidence_threshold)
     
     def _merge_results(self, vector_results: List[SearchResult], 
                       graph_results: List[SearchResult], 
-                      max_results: int) -> List[SearchResult]:
-        """Merge and deduplicate results from vector and graph search.
+                      max_results: int,
+                      confidence_threshold: float = 0.0) -> List[SearchResult]:
+        """Fuse and deduplicate results from vector and graph search.
         
         Args:
             vector_results: Results from vector search
             graph_results: Results from graph search
             max_results: Maximum number of results
+            confidence_threshold: Minimum confidence score
             
         Returns:
-            Merged and deduplicated results
+            Top fused results with per-source provenance
         """
-        # Simple interleaving strategy - can be improved with more sophisticated ranking
-        merged = []
-        seen_content = set()
-        
-        # Interleave results, starting with highest confidence from each source
-        vector_idx, graph_idx = 0, 0
-        while len(merged) < max_results and (vector_idx < len(vector_results) or graph_idx < len(graph_results)):
-            # Add vector result if available and not seen
-            if vector_idx < len(vector_results):
-                result = vector_results[vector_idx]
-                if result.content not in seen_content:
-                    merged.append(result)
-                    seen_content.add(result.content)
-                vector_idx += 1
-            
-            # Add graph result if available and not seen
-            if graph_idx < len(graph_results) and len(merged) < max_results:
-                result = graph_results[graph_idx]
-                if result.content not in seen_content:
-                    merged.append(result)
-                    seen_content.add(result.content)
-                graph_idx += 1
-        
-        # Sort by confidence
-        merged.sort(key=lambda x: x.confidence, reverse=True)
-        
-        return merged
+        fused = reciprocal_rank_fusion(
+            {"vector": vector_results, "graph": graph_results}, k=self.rrf_k
+        )
+        return [r for r in fused if r.confidence >= confidence_threshold][:max_results]
     
     async def _extract_entities(self, query: str) -> List[str]:
         """Extract cryptocurrency entities from query.
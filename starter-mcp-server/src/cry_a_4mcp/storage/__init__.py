@@ -3,21 +3,27 @@
 This module provides storage capabilities for cryptocurrency data.
 """
 
-from .vector_store import VectorStore
+from .vector_store import VectorStore, VectorIngestQueue, IngestStats
 from .graph_store import GraphStore
-from .knowledge_graph_manager import KnowledgeGraphManager, EntityType, RelationshipType, GraphEntity, GraphRelationship, GraphPath
+from .knowledge_graph_manager import KnowledgeGraphManager, EntityType, RelationshipType, GraphEntity, GraphRelationship, GraphPath, BulkWriteResult
 from .url_mappings_db import URLMappingsDatabase
 from .url_configuration_db import URLConfigurationDatabase
+from .sqlite_pool import SQLitePool, close_pools
 
 __all__ = [
     'VectorStore',
+    'VectorIngestQueue',
+    'IngestStats',
     'GraphStore', 
     'KnowledgeGraphManager',
     'GraphEntity',
     'GraphRelationship',
     'GraphPath',
+    'BulkWriteResult',
     'EntityType',
     'RelationshipType',
     'URLMappingsDatabase',
-    'URLConfigurationDatabase'
+    'URLConfigurationDatabase',
+    'SQLitePool',
+    'close_pools'
 ]
\ No newline at end of file
@@ -1,10 +1,11 @@
 import sqlite3
 import json
 import logging
-import aiosqlite
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from .sqlite_pool import acquire_pool, release_pool
+
 
 class CrawlerDatabase:
     """Database manager for crawler configurations."""
@@ -18,6 +19,8 @@ class CrawlerDatabase:
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         self.initialize_db()
+        self.pool = acquire_pool(db_path)
+        self._released = False
     
     def initialize_db(self) -> None:
         """Initialize the database schema."""
@@ -64,7 +67,7 @@ class CrawlerDatabase:
             List of crawler configuration dictionaries
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.read() as db:
                 async with db.execute("SELECT * FROM crawlers ORDER BY created_at DESC") as cursor:
                     rows = await cursor.fetchall()
                     
@@ -110,7 +113,7 @@ class CrawlerDatabase:
             Crawler configuration dictionary or None if not found
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.read() as db:
                 async with db.execute("SELECT * FROM crawlers WHERE id = ?", (crawler_id,)) as cursor:
                     row = await cursor.fetchone()
                     
@@ -160,7 +163,7 @@ class CrawlerDatabase:
             if not crawler_id:
                 raise ValueError("Crawler ID is required")
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.write() as db:
                 await db.execute("""
                     INSERT INTO crawlers (
                         id, name, description, url_mapping_id, target_urls,
@@ -189,7 +192,6 @@ class CrawlerDatabase:
                     json.dumps(crawler_data.get("stats", {}))
                 ))
                 
-                await db.commit()
                 self.logger.info(f"Created crawler {crawler_id}")
                 return crawler_id
                 
@@ -208,8 +210,8 @@ class CrawlerDatabase:
             True if updated successfully, False if crawler not found
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
+            async with self.pool.write() as db:
+                cursor = await db.execute("""
                     UPDATE crawlers SET
                         name = ?, description = ?, url_mapping_id = ?, target_urls = ?,
                         crawler_type = ?, timeout = ?, max_retries = ?, concurrent_limit = ?,
@@ -238,13 +240,8 @@ class CrawlerDatabase:
                     crawler_id
                 ))
                 
-                await db.commit()
-                
                 # Check if any rows were affected
-                cursor = await db.execute("SELECT changes()")
-                changes = await cursor.fetchone()
-                
-                if changes[0] > 0:
+                if cursor.rowcount > 0:
                     self.logger.info(f"Updated crawler {crawler_id}")
                     return True
                 else:
@@ -265,15 +262,11 @@ class CrawlerDatabase:
             True if deleted successfully, False if crawler not found
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("DELETE FROM crawlers WHERE id = ?", (crawler_id,))
-                await db.commit()
+            async with self.pool.write() as db:
+                cursor = await db.execute("DELETE FROM crawlers WHERE id = ?", (crawler_id,))
                 
                 # Check if any rows were affected
-                cursor = await db.execute("SELECT changes()")
-                changes = await cursor.fetchone()
-                
-                if changes[0] > 0:
+                if cursor.rowcount > 0:
                     self.logger.info(f"Deleted crawler {crawler_id}")
                     return True
                 else:
@@ -292,7 +285,7 @@ class CrawlerDatabase:
     async def seed_sample_data(self) -> None:
         """Seed the database with sample crawler data if empty."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.write() as db:
                 # Check if database is empty
                 async with db.execute("SELECT COUNT(*) FROM crawlers") as cursor:
                     row = await cursor.fetchone()
@@ -381,9 +374,14 @@ class CrawlerDatabase:
                             json.dumps(crawler["stats"])
                         ))
                     
-                    await db.commit()
                     self.logger.info(f"Seeded database with {len(sample_crawlers)} sample crawlers")
                     
         except Exception as e:
             self.logger.error(f"Error seeding sample data: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    async def close(self) -> None:
+        """Release this instance's hold on the shared connection pool."""
+        if not self._released:
+            self._released = True
+            await release_pool(self.pool)
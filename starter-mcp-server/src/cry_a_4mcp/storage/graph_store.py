@@ -13,6 +13,11 @@ from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
 from neo4j.exceptions import Neo4jError
 
 from ..config import Settings
+from ..utils.cache import notify_data_changed
+
+
+# Score of relationships stored without a confidence
+DEFAULT_RELATION_CONFIDENCE = 0.9
 
 
 class GraphStore:
@@ -108,10 +113,16 @@ class GraphStore:
             MATCH path = (c:Cryptocurrency)-[r]-(related)
             WHERE c.symbol IN $entities
             RETURN path, c, r, related
+            ORDER BY coalesce(r.confidence, $default_confidence) DESC
             LIMIT $limit
             """
             
-            result = await session.run(query, entities=entities, limit=limit)
+            result = await session.run(
+                query,
+                entities=entities,
+                limit=limit,
+                default_confidence=DEFAULT_RELATION_CONFIDENCE,
+            )
             
             async for record in result:
                 path = record["path"]
@@ -125,7 +136,7 @@ class GraphStore:
                 # Create result dict
                 result_dict = {
                     "content": path_description,
-                    "score": 0.9,  # Fixed score for now, can be improved
+                    "score": relation.get("confidence", DEFAULT_RELATION_CONFIDENCE),
                     "entities": [crypto["symbol"]],
                     "path": [str(node) for node in path.nodes],
                     "relation_type": type(relation).__name__,
@@ -206,6 +217,8 @@ class GraphStore:
                 properties = {"id": properties.get("id", "unknown"), "properties": properties}
             
             await session.run(query, **properties)
+        
+        notify_data_changed()
     
     async def add_relationship(self, from_entity: Dict[str, Any], 
                              relation_type: str,
@@ -259,6 +272,8 @@ class GraphStore:
                 to_id_value=params["to_id_value"],
                 properties=params["properties"],
             )
+        
+        notify_data_changed()
     
     async def close(self) -> None:
         """Close the graph store connection."""
@@ -5,16 +5,19 @@ This module provides a Neo4j-based knowledge graph manager for storing and
 querying cryptocurrency entities and their relationships.
 """
 
-from dataclasses import dataclass
+import re
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import structlog
 from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
 from neo4j.exceptions import Neo4jError
 
 from ..config import Settings
+from ..utils.cache import notify_data_changed
 
 
 class EntityType(str, Enum):
@@ -56,17 +59,138 @@ class GraphEntity:
 
 @dataclass
 class GraphRelationship:
-    """Relationship in the knowledge graph."""
+    """Relationship in the knowledge graph.
+    
+    ``source_type`` and ``target_type`` are optional; when set, the endpoints
+    are looked up through their label's id index without an extra query.
+    """
     source_id: str
     target_id: str
     type: RelationshipType
     properties: Dict[str, Any] = None
+    source_type: Optional[EntityType] = None
+    target_type: Optional[EntityType] = None
 
     def __post_init__(self):
         if self.properties is None:
             self.properties = {}
 
 
+@dataclass
+class BulkWriteResult:
+    """Outcome and throughput of a bulk knowledge graph write."""
+    entities_added: int = 0
+    entities_updated: int = 0
+    entities_skipped: int = 0
+    relationships_added: int = 0
+    relationships_updated: int = 0
+    relationships_skipped: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def entities_written(self) -> int:
+        return self.entities_added + self.entities_updated
+
+    @property
+    def relationships_written(self) -> int:
+        return self.relationships_added + self.relationships_updated
+
+    @property
+    def entities_per_second(self) -> float:
+        return self.entities_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def relationships_per_second(self) -> float:
+        return self.relationships_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def merge(self, other: "BulkWriteResult") -> None:
+        """Add the counts of another result to this one."""
+        self.entities_added += other.entities_added
+        self.entities_updated += other.entities_updated
+        self.entities_skipped += other.entities_skipped
+        self.relationships_added += other.relationships_added
+        self.relationships_updated += other.relationships_updated
+        self.relationships_skipped += other.relationships_skipped
+        self.batches += other.batches
+        self.failed_batches += other.failed_batches
+        self.elapsed_seconds += other.elapsed_seconds
+        self.errors.extend(other.errors)
+
+
+# Entity and relationship type names used by the crawlers and MCP tools
+ENTITY_TYPE_ALIASES = {
+    "token": EntityType.CRYPTOCURRENCY,
+    "coin": EntityType.CRYPTOCURRENCY,
+    "cryptocurrency": EntityType.CRYPTOCURRENCY,
+    "exchange": EntityType.EXCHANGE,
+    "person": EntityType.PERSON,
+    "organization": EntityType.ORGANIZATION,
+    "dao": EntityType.ORGANIZATION,
+    "protocol": EntityType.TECHNOLOGY,
+    "defi": EntityType.TECHNOLOGY,
+    "technology": EntityType.TECHNOLOGY,
+    "event": EntityType.EVENT,
+    "metric": EntityType.CONCEPT,
+    "concept": EntityType.CONCEPT,
+}
+
+# Existing nodes are only updated in "merge" and "replace" modes; "replace"
+# keeps the original creation time
+WRITE_MODES = {
+    "merge": "n += properties, n.updated_at = $now",
+    "replace": "n = properties {.*, created_at: coalesce(n.created_at, properties.created_at)}, n.updated_at = $now",
+    "append": "n.updated_at = $now",
+}
+
+# Creation time is only set when the node or relationship is created
+ON_CREATE_SET = "n = properties, n.created_at = coalesce(properties.created_at, $now), n._created = true"
+
+
+def parse_entity_type(value: Union[str, EntityType]) -> EntityType:
+    """Convert an entity type name (e.g. "token" or "Exchange") to an EntityType.
+    
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if isinstance(value, EntityType):
+        return value
+    try:
+        return EntityType(value)
+    except ValueError:
+        pass
+    try:
+        return ENTITY_TYPE_ALIASES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown entity type: {value}")
+
+
+def parse_relationship_type(value: Union[str, RelationshipType]) -> RelationshipType:
+    """Convert a relationship type name (e.g. "trades_on") to a RelationshipType.
+    
+    Unknown names map to ``RELATED_TO``.
+    """
+    if isinstance(value, RelationshipType):
+        return value
+    try:
+        return RelationshipType(value.upper())
+    except ValueError:
+        return RelationshipType.RELATED_TO
+
+
+def entity_id_for(name: str, entity_type: EntityType) -> str:
+    """Build a stable entity id from a type and name, e.g. "exchange:binance"."""
+    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    return f"{entity_type.value.lower()}:{slug}"
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 @dataclass
 class GraphPath:
     """Path in the knowledge graph."""
@@ -87,6 +211,7 @@ class KnowledgeGraphManager:
         self.settings = settings
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.driver: Optional[AsyncDriver] = None
+        self.batch_size = settings.neo4j_batch_size
     
     async def initialize(self) -> None:
         """Initialize the knowledge graph manager."""
@@ -155,6 +280,8 @@ class KnowledgeGraphManager:
     async def add_entity(self, entity: GraphEntity) -> bool:
         """Add an entity to the knowledge graph.
         
+        Existing entities only get their ``updated_at`` timestamp refreshed.
+        
         Args:
             entity: Entity to add
             
@@ -165,33 +292,8 @@ class KnowledgeGraphManager:
             self.logger.error("Knowledge graph manager not initialized")
             return False
         
-        try:
-            async with self.driver.session(database=self.settings.neo4j_database) as session:
-                # Prepare properties
-                properties = {"id": entity.id, "name": entity.name}
-                if entity.properties:
-                    properties.update(entity.properties)
-                
-                # Add timestamp if not present
-                if "created_at" not in properties:
-                    properties["created_at"] = datetime.now().isoformat()
-                
-                # Create entity
-                result = await session.run(
-                    f"MERGE (n:{entity.type.value} {{id: $id}}) "
-                    "ON CREATE SET n = $properties "
-                    "ON MATCH SET n += $updated_properties "
-                    "RETURN n",
-                    id=entity.id,
-                    properties=properties,
-                    updated_properties={"updated_at": datetime.now().isoformat()}
-                )
-                
-                record = await result.single()
-                return record is not None
-        except Exception as e:
-            self.logger.error("Failed to add entity", error=str(e), entity_id=entity.id)
-            return False
+        result = await self.add_entities([entity], mode="append")
+        return result.entities_written == 1
     
     async def add_relationship(self, relationship: GraphRelationship) -> bool:
         """Add a relationship to the knowledge graph.
@@ -206,36 +308,276 @@ class KnowledgeGraphManager:
             self.logger.error("Knowledge graph manager not initialized")
             return False
         
-        try:
-            async with self.driver.session(database=self.settings.neo4j_database) as session:
-                # Prepare properties
-                properties = {}
-                if relationship.properties:
-                    properties.update(relationship.properties)
-                
-                # Add timestamp if not present
-                if "created_at" not in properties:
-                    properties["created_at"] = datetime.now().isoformat()
-                
-                # Create relationship
-                result = await session.run(
-                    "MATCH (a {id: $source_id}), (b {id: $target_id}) "
-                    f"MERGE (a)-[r:{relationship.type.value}]->(b) "
-                    "ON CREATE SET r = $properties "
-                    "ON MATCH SET r += $updated_properties "
-                    "RETURN r",
-                    source_id=relationship.source_id,
-                    target_id=relationship.target_id,
-                    properties=properties,
-                    updated_properties={"updated_at": datetime.now().isoformat()}
+        result = await self.add_relationships([relationship], mode="append")
+        return result.relationships_written == 1
+    
+    async def add_entities(self, entities: Iterable[GraphEntity], mode: str = "merge",
+                           batch_size: Optional[int] = None) -> BulkWriteResult:
+        """Write many entities with batched UNWIND queries.
+        
+        Entities are grouped by label and each group is written in batches of
+        ``batch_size`` rows, one transaction per batch.
+        
+        Args:
+            entities: Entities to add or update
+            mode: How existing entities are updated: "merge" adds the new
+                properties, "replace" overwrites them and "append" keeps them
+            batch_size: Rows per transaction (defaults to ``neo4j_batch_size``)
+            
+        Returns:
+            Counts and throughput of the write
+        """
+        result = BulkWriteResult()
+        if not self.driver:
+            self.logger.error("Knowledge graph manager not initialized")
+            return result
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Unknown write mode: {mode}")
+        
+        started = time.perf_counter()
+        now = datetime.now().isoformat()
+        groups: Dict[EntityType, Dict[str, Dict[str, Any]]] = {}
+        for entity in entities:
+            properties = dict(entity.properties or {})
+            properties["id"] = entity.id
+            properties["name"] = entity.name
+            # Later duplicates win, as with consecutive single writes
+            groups.setdefault(entity.type, {})[entity.id] = {"id": entity.id, "properties": properties}
+        
+        async with self.driver.session(database=self.settings.neo4j_database) as session:
+            for entity_type, rows in groups.items():
+                query = (
+                    "UNWIND $rows AS row "
+                    "WITH row, row.properties AS properties "
+                    f"MERGE (n:{entity_type.value} {{id: row.id}}) "
+                    f"ON CREATE SET {ON_CREATE_SET} "
+                    f"ON MATCH SET {WRITE_MODES[mode]} "
+                    "WITH n, coalesce(n._created, false) AS created "
+                    "REMOVE n._created "
+                    "RETURN sum(CASE WHEN created THEN 1 ELSE 0 END) AS added, count(n) AS written"
                 )
-                
-                record = await result.single()
-                return record is not None
+                for batch in _chunks(list(rows.values()), batch_size or self.batch_size):
+                    counts = await self._write_batch(session, query, batch, now, result)
+                    if counts:
+                        result.entities_added += counts["added"]
+                        result.entities_updated += counts["written"] - counts["added"]
+        
+        result.elapsed_seconds = time.perf_counter() - started
+        self.logger.info("Bulk entity write completed", entities=result.entities_written,
+                         batches=result.batches, failed_batches=result.failed_batches,
+                         entities_per_second=round(result.entities_per_second, 1))
+        return result
+    
+    async def add_relationships(self, relationships: Iterable[GraphRelationship], mode: str = "merge",
+                                batch_size: Optional[int] = None,
+                                entity_types: Optional[Dict[str, EntityType]] = None) -> BulkWriteResult:
+        """Write many relationships with batched UNWIND queries.
+        
+        Relationships are grouped by type and endpoint labels so both
+        endpoints are found through the label's unique id index. Endpoint
+        labels come from the relationship, from ``entity_types`` or, for the
+        remaining ids, from one indexed lookup query.
+        
+        Args:
+            relationships: Relationships to add or update
+            mode: How existing relationships are updated (see ``add_entities``)
+            batch_size: Rows per transaction (defaults to ``neo4j_batch_size``)
+            entity_types: Known entity id to type mapping
+            
+        Returns:
+            Counts and throughput of the write; relationships whose endpoints
+            do not exist are counted as skipped
+        """
+        result = BulkWriteResult()
+        if not self.driver:
+            self.logger.error("Knowledge graph manager not initialized")
+            return result
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Unknown write mode: {mode}")
+        
+        started = time.perf_counter()
+        now = datetime.now().isoformat()
+        relationships = list(relationships)
+        known = dict(entity_types or {})
+        for relationship in relationships:
+            if relationship.source_type:
+                known[relationship.source_id] = relationship.source_type
+            if relationship.target_type:
+                known[relationship.target_id] = relationship.target_type
+        
+        async with self.driver.session(database=self.settings.neo4j_database) as session:
+            unknown = {
+                entity_id
+                for relationship in relationships
+                for entity_id in (relationship.source_id, relationship.target_id)
+                if entity_id not in known
+            }
+            if unknown:
+                known.update(await self._resolve_entity_types(session, unknown))
+            
+            groups: Dict[Tuple[RelationshipType, EntityType, EntityType], Dict[Tuple[str, str], Dict[str, Any]]] = {}
+            for relationship in relationships:
+                source_type = known.get(relationship.source_id)
+                target_type = known.get(relationship.target_id)
+                if source_type is None or target_type is None:
+                    result.relationships_skipped += 1
+                    continue
+                properties = dict(relationship.properties or {})
+                key = (relationship.type, source_type, target_type)
+                groups.setdefault(key, {})[(relationship.source_id, relationship.target_id)] = {
+                    "source_id": relationship.source_id,
+                    "target_id": relationship.target_id,
+                    "properties": properties,
+                }
+            
+            for (rel_type, source_type, target_type), rows in groups.items():
+                query = (
+                    "UNWIND $rows AS row "
+                    "WITH row, row.properties AS properties "
+                    f"MATCH (a:{source_type.value} {{id: row.source_id}}) "
+                    f"MATCH (b:{target_type.value} {{id: row.target_id}}) "
+                    f"MERGE (a)-[n:{rel_type.value}]->(b) "
+                    f"ON CREATE SET {ON_CREATE_SET} "
+                    f"ON MATCH SET {WRITE_MODES[mode]} "
+                    "WITH n, coalesce(n._created, false) AS created "
+                    "REMOVE n._created "
+                    "RETURN sum(CASE WHEN created THEN 1 ELSE 0 END) AS added, count(n) AS written"
+                )
+                for batch in _chunks(list(rows.values()), batch_size or self.batch_size):
+                    counts = await self._write_batch(session, query, batch, now, result)
+                    if counts:
+                        result.relationships_added += counts["added"]
+                        result.relationships_updated += counts["written"] - counts["added"]
+                        # Rows whose endpoints were not found produce no relationship
+                        result.relationships_skipped += len(batch) - counts["written"]
+        
+        result.elapsed_seconds = time.perf_counter() - started
+        self.logger.info("Bulk relationship write completed", relationships=result.relationships_written,
+                         skipped=result.relationships_skipped, batches=result.batches,
+                         failed_batches=result.failed_batches,
+                         relationships_per_second=round(result.relationships_per_second, 1))
+        return result
+    
+    async def bulk_ingest(self, entities: Iterable[GraphEntity] = (),
+                          relationships: Iterable[GraphRelationship] = (),
+                          mode: str = "merge", batch_size: Optional[int] = None) -> BulkWriteResult:
+        """Write entities and then the relationships between them.
+        
+        Args:
+            entities: Entities to add or update
+            relationships: Relationships to add or update
+            mode: How existing data is updated (see ``add_entities``)
+            batch_size: Rows per transaction (defaults to ``neo4j_batch_size``)
+            
+        Returns:
+            Combined counts and throughput
+        """
+        entities = list(entities)
+        result = await self.add_entities(entities, mode=mode, batch_size=batch_size)
+        result.merge(await self.add_relationships(
+            relationships, mode=mode, batch_size=batch_size,
+            entity_types={entity.id: entity.type for entity in entities}
+        ))
+        return result
+    
+    async def update(self, entities: List[Dict[str, Any]], relationships: Optional[List[Dict[str, Any]]] = None,
+                     source_url: Optional[str] = None, mode: str = "merge") -> BulkWriteResult:
+        """Update the graph from plain entity and relationship dictionaries.
+        
+        This is the entry point used by ``UpdateKnowledgeGraphTool``.
+        Entities are ``{"name", "type", "properties"}`` dictionaries (an
+        ``id`` is derived from the type and name unless given). Relationships
+        are ``{"source", "target", "type", "properties"}`` dictionaries whose
+        endpoints are entity names from the same update or entity ids.
+        Entities with an unknown type are logged and counted as skipped.
+        
+        Args:
+            entities: Entities to add or update
+            relationships: Relationships to add or update
+            source_url: Provenance recorded on every written entity and relationship
+            mode: How existing data is updated: "merge", "replace" or "append"
+            
+        Returns:
+            Combined counts and throughput
+        """
+        graph_entities = []
+        ids_by_name: Dict[str, str] = {}
+        skipped = 0
+        for item in entities:
+            try:
+                entity_type = parse_entity_type(item["type"])
+            except ValueError:
+                self.logger.warning("Skipping entity with unknown type", name=item.get("name"), type=item["type"])
+                skipped += 1
+                continue
+            properties = dict(item.get("properties") or {})
+            entity_id = item.get("id") or properties.pop("id", None) or entity_id_for(item["name"], entity_type)
+            if source_url:
+                properties["source_url"] = source_url
+            graph_entities.append(GraphEntity(id=entity_id, name=item["name"], type=entity_type, properties=properties))
+            ids_by_name.setdefault(item["name"].lower(), entity_id)
+        
+        graph_relationships = []
+        for item in relationships or []:
+            properties = dict(item.get("properties") or {})
+            if source_url:
+                properties["source_url"] = source_url
+            graph_relationships.append(GraphRelationship(
+                source_id=ids_by_name.get(item["source"].lower(), item["source"]),
+                target_id=ids_by_name.get(item["target"].lower(), item["target"]),
+                type=parse_relationship_type(item["type"]),
+                properties=properties
+            ))
+        
+        result = await self.bulk_ingest(graph_entities, graph_relationships, mode=mode)
+        result.entities_skipped += skipped
+        return result
+    
+    async def _write_batch(self, session: AsyncSession, query: str, rows: List[Dict[str, Any]],
+                           now: str, result: BulkWriteResult) -> Optional[Dict[str, int]]:
+        """Run one UNWIND batch in its own write transaction.
+        
+        Returns:
+            The ``added`` and ``written`` counts, or None if the batch failed
+        """
+        async def work(tx):
+            records = await tx.run(query, rows=rows, now=now)
+            record = await records.single()
+            return {"added": record["added"] or 0, "written": record["written"] or 0}
+        
+        result.batches += 1
+        try:
+            counts = await session.execute_write(work)
+            notify_data_changed()
+            return counts
         except Exception as e:
-            self.logger.error("Failed to add relationship", error=str(e), 
-                            source=relationship.source_id, target=relationship.target_id)
-            return False
+            result.failed_batches += 1
+            result.errors.append(str(e))
+            self.logger.error("Failed to write batch", error=str(e), rows=len(rows))
+            return None
+    
+    async def _resolve_entity_types(self, session: AsyncSession, entity_ids: Set[str]) -> Dict[str, EntityType]:
+        """Look up the types of existing entities using the per-label id indexes.
+        
+        Args:
+            session: Open Neo4j session
+            entity_ids: Ids to resolve
+            
+        Returns:
+            Mapping of found entity ids to their type
+        """
+        query = " UNION ALL ".join(
+            f"MATCH (n:{entity_type.value}) WHERE n.id IN $ids RETURN n.id AS id, '{entity_type.value}' AS label"
+            for entity_type in EntityType
+        )
+        resolved = {}
+        try:
+            records = await session.run(query, ids=list(entity_ids))
+            async for record in records:
+                resolved.setdefault(record["id"], EntityType(record["label"]))
+        except Exception as e:
+            self.logger.error("Failed to resolve entity types", error=str(e), count=len(entity_ids))
+        return resolved
     
     async def get_entity(self, entity_id: str) -> Optional[GraphEntity]:
         """Get an entity from the knowledge graph.
@@ -369,6 +369,10 @@ class UnifiedSchemaMigration:
         
         self.logger.info(f"Migration completed successfully: {migration_result}")
         return migration_result
+    
+    async def close(self) -> None:
+        """Release the unified database's connection pool."""
+        await self.unified_db.close()
 
 
 async def main():
@@ -402,6 +406,8 @@ async def main():
     except Exception as e:
         print(f"\nMIGRATION FAILED: {e}")
         raise
+    finally:
+        await migration.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,395 @@
+"""Shared SQLite connection pools for the storage package.
+
+The SQLite-backed databases used to open a new aiosqlite connection, and
+with it a new thread, for every query. ``SQLitePool`` keeps connections
+open instead:
+
+- one writer connection behind a FIFO lock, so writes queue up in order
+  instead of contending for the database lock,
+- a few read-only connections that run queries concurrently with each other
+  and with the writer, which WAL journaling allows,
+- tuned pragmas and a per-connection prepared statement cache.
+
+Statements run on a small thread pool and fetch their rows in the same hop.
+Databases get their pool from ``acquire_pool``, which shares one pool per
+database file across every instance in the process.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generator, Iterable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_READERS = 4
+STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+PRAGMAS: Dict[str, Any] = {
+    "synchronous": "NORMAL",  # Durable with WAL, without an fsync per commit
+    "mmap_size": 268435456,  # Memory-map up to 256 MiB of the database file
+    "cache_size": -65536,  # 64 MiB page cache per connection
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+logger = logging.getLogger(__name__)
+
+
+class QueryResult:
+    """Fetched rows and row count of an executed statement.
+
+    Mirrors the parts of the aiosqlite cursor the databases use, with the
+    rows already fetched on the worker thread.
+    """
+
+    def __init__(self, rows: List[sqlite3.Row], rowcount: int, lastrowid: Optional[int]) -> None:
+        self.rows = rows
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+        self._position = 0
+
+    async def fetchone(self) -> Optional[sqlite3.Row]:
+        """Get the next row, or None when all rows were read."""
+        if self._position >= len(self.rows):
+            return None
+        row = self.rows[self._position]
+        self._position += 1
+        return row
+
+    async def fetchall(self) -> List[sqlite3.Row]:
+        """Get the remaining rows."""
+        rows = self.rows[self._position:]
+        self._position = len(self.rows)
+        return rows
+
+
+class _QueryContext:
+    """Statement that can be awaited or used as ``async with``, like aiosqlite's."""
+
+    def __init__(self, query: Awaitable[QueryResult]) -> None:
+        self._query = query
+
+    def __await__(self) -> Generator[Any, None, QueryResult]:
+        return self._query.__await__()
+
+    async def __aenter__(self) -> QueryResult:
+        return await self._query
+
+    async def __aexit__(self, *args: Any) -> bool:
+        return False
+
+
+class PooledConnection:
+    """Connection checked out of a pool for one ``read`` or ``write`` block."""
+
+    def __init__(self, pool: "SQLitePool", connection: sqlite3.Connection, transaction: bool = False) -> None:
+        self._pool = pool
+        self._connection = connection
+        # Write blocks open their transaction with the first statement,
+        # saving a thread hop
+        self._begin = transaction
+        self.in_transaction = False
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> _QueryContext:
+        """Execute a statement and fetch its rows.
+
+        Args:
+            sql: SQL statement
+            parameters: Statement parameters
+
+        Returns:
+            Awaitable, or async context manager, giving the fetched rows and row count
+        """
+        return _QueryContext(self._pool._run(self._execute, sql, parameters))
+
+    async def executemany(self, sql: str, parameters: Iterable[Sequence[Any]]) -> QueryResult:
+        """Execute a statement once per parameter set.
+
+        Args:
+            sql: SQL statement
+            parameters: Parameter sets
+
+        Returns:
+            The total row count
+        """
+        return await self._pool._run(self._executemany, sql, list(parameters))
+
+    async def run(self, function: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a function taking the raw connection on the worker thread.
+
+        Use this to issue several statements in a single hop.
+
+        Args:
+            function: Function called with the ``sqlite3.Connection``
+
+        Returns:
+            The function's return value
+        """
+        return await self._pool._run(self._call, function)
+
+    def _start(self) -> None:
+        if self._begin:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._begin = False
+            self.in_transaction = True
+
+    def _execute(self, sql: str, parameters: Sequence[Any]) -> QueryResult:
+        self._start()
+        cursor = self._connection.execute(sql, parameters)
+        try:
+            return QueryResult(cursor.fetchall(), cursor.rowcount, cursor.lastrowid)
+        finally:
+            cursor.close()
+
+    def _executemany(self, sql: str, parameters: List[Sequence[Any]]) -> QueryResult:
+        self._start()
+        cursor = self._connection.executemany(sql, parameters)
+        try:
+            return QueryResult([], cursor.rowcount, cursor.lastrowid)
+        finally:
+            cursor.close()
+
+    def _call(self, function: Callable[[sqlite3.Connection], T]) -> T:
+        self._start()
+        return function(self._connection)
+
+    def _finish(self, commit: bool) -> None:
+        if self.in_transaction and self._connection.in_transaction:
+            self._connection.execute("COMMIT" if commit else "ROLLBACK")
+        self.in_transaction = False
+
+
+class SQLitePool:
+    """Pool of SQLite connections to one database file.
+
+    Example:
+        pool = SQLitePool("crawlers.db")
+        async with pool.read() as db:
+            cursor = await db.execute("SELECT * FROM crawlers")
+            rows = await cursor.fetchall()
+        async with pool.write() as db:
+            await db.execute("DELETE FROM crawlers WHERE id = ?", (crawler_id,))
+    """
+
+    def __init__(self, db_path: str, readers: int = DEFAULT_READERS,
+                 pragmas: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the pool. Connections are opened on first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            readers: Maximum number of read-only connections
+            pragmas: Pragmas overriding the defaults
+        """
+        self.db_path = db_path
+        # Every connection to ":memory:" is a separate database, so reads
+        # have to share the writer connection
+        self.readers = 0 if db_path == ":memory:" else max(0, readers)
+        self.pragmas = dict(PRAGMAS, **(pragmas or {}))
+        self.users = 0
+        self.reads = 0
+        self.writes = 0
+        self.failed_writes = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._open_readers = 0
+        self._epoch = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._reader_slots: Optional[asyncio.Semaphore] = None
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[PooledConnection]:
+        """Check out a read-only connection.
+
+        Yields:
+            Connection for the length of the block
+        """
+        await self._open()
+        if not self.readers:
+            async with self._write_lock:
+                self.reads += 1
+                yield PooledConnection(self, self._writer)
+            return
+
+        async with self._reader_slots:
+            epoch = self._epoch
+            if self._idle_readers:
+                connection = self._idle_readers.pop()
+            else:
+                connection = await self._run(self._connect, True)
+                self._open_readers += 1
+            self.reads += 1
+            try:
+                yield PooledConnection(self, connection)
+            finally:
+                if epoch == self._epoch:
+                    self._idle_readers.append(connection)
+                else:
+                    # The pool was closed while the connection was out
+                    connection.close()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[PooledConnection]:
+        """Check out the writer connection inside a transaction.
+
+        Writers are served one at a time in arrival order. The transaction
+        is committed when the block exits and rolled back if it raises.
+
+        Yields:
+            Connection for the length of the block
+        """
+        await self._open()
+        async with self._write_lock:
+            connection = PooledConnection(self, self._writer, transaction=True)
+            try:
+                yield connection
+            except BaseException:
+                self.failed_writes += 1
+                if connection.in_transaction:
+                    await self._run(connection._finish, False)
+                raise
+            if connection.in_transaction:
+                await self._run(connection._finish, True)
+            self.writes += 1
+
+    async def close(self) -> None:
+        """Close every connection. The pool reopens on next use."""
+        if self._executor is None:
+            return
+        self._bind_loop()
+        async with self._write_lock:
+            connections = self._idle_readers + ([self._writer] if self._writer else [])
+            executor = self._executor
+            self._writer = None
+            self._idle_readers = []
+            self._open_readers = 0
+            self._executor = None
+            self._epoch += 1
+            for connection in connections:
+                connection.close()
+            executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Connection counts and the number of reads and writes served
+        """
+        return {
+            "db_path": self.db_path,
+            "open": self._writer is not None,
+            "readers": self.readers,
+            "open_readers": self._open_readers,
+            "idle_readers": len(self._idle_readers),
+            "reads": self.reads,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+            "statement_cache_size": STATEMENT_CACHE_SIZE,
+        }
+
+    async def _open(self) -> None:
+        """Open the writer connection if needed."""
+        self._bind_loop()
+        if self._writer is not None:
+            return
+        async with self._write_lock:
+            if self._writer is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.readers + 1,
+                        thread_name_prefix="sqlite-pool",
+                    )
+                self._writer = await self._run(self._connect, False)
+                logger.debug(f"Opened SQLite pool for {self.db_path}")
+
+    def _bind_loop(self) -> None:
+        """Create the asyncio primitives for the running event loop.
+
+        A pool is shared across instances and may outlive the loop it was
+        first used on, as in tests running one loop per test.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._write_lock = asyncio.Lock()
+            self._reader_slots = asyncio.Semaphore(self.readers) if self.readers else None
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Open and configure a connection on a worker thread."""
+        connection = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,  # Transactions are managed by ``write``
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.row_factory = sqlite3.Row
+        if not read_only:
+            connection.execute("PRAGMA journal_mode = WAL")
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        if read_only:
+            connection.execute("PRAGMA query_only = 1")
+        return connection
+
+
+_pools: Dict[str, SQLitePool] = {}
+_registry_lock = threading.Lock()
+
+
+def acquire_pool(db_path: str) -> SQLitePool:
+    """Get the shared pool for a database file.
+
+    Each call must be matched by a ``release_pool`` call once the caller is
+    done with the pool.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        The pool shared by every user of the file
+    """
+    if db_path == ":memory:":
+        pool = SQLitePool(db_path)
+        pool.users = 1
+        return pool
+
+    key = os.path.abspath(db_path)
+    with _registry_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(key)
+        pool.users += 1
+        return pool
+
+
+async def release_pool(pool: SQLitePool) -> None:
+    """Release a pool, closing it when its last user releases it.
+
+    Args:
+        pool: Pool returned by ``acquire_pool``
+    """
+    with _registry_lock:
+        pool.users -= 1
+        last_user = pool.users <= 0
+        if last_user and _pools.get(pool.db_path) is pool:
+            del _pools[pool.db_path]
+    if last_user:
+        await pool.close()
+
+
+async def close_pools() -> None:
+    """Close every shared pool."""
+    with _registry_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.users = 0
+        await pool.close()
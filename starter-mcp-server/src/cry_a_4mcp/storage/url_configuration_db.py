@@ -11,14 +11,16 @@ The URL Configuration system focuses purely on business metadata:
 - Business rationale and priorities
 """
 
-import aiosqlite
 import json
+import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 import logging
 
+from .sqlite_pool import acquire_pool, release_pool
+
 
 class URLConfigurationDatabase:
     """Database manager for URL configurations with business metadata.
@@ -29,6 +31,7 @@ class URLConfigurationDatabase:
     
     Attributes:
         db_path (str): Path to the SQLite database file
+        pool (SQLitePool): Connection pool shared by every user of the file
         logger (logging.Logger): Logger instance for this class
     """
     
@@ -39,12 +42,14 @@ class URLConfigurationDatabase:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        self.pool = acquire_pool(db_path)
+        self._released = False
         self.logger = logging.getLogger(__name__)
     
     async def initialize(self) -> None:
         """Initialize the database and create the business-focused table schema."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.write() as db:
                 # Create the business-focused url_configurations table
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS url_configurations (
@@ -98,7 +103,6 @@ class URLConfigurationDatabase:
                     ON url_configurations(url)
                 """)
                 
-                await db.commit()
                 self.logger.info("URL configuration database initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize URL configuration database: {e}")
@@ -185,7 +189,7 @@ class URLConfigurationDatabase:
         config_id = self._generate_id()
         timestamp = self._get_timestamp()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             await db.execute("""
                 INSERT INTO url_configurations (
                     id, name, description, url, profile_type, category,
@@ -207,7 +211,6 @@ class URLConfigurationDatabase:
                 timestamp, timestamp
             ))
             
-            await db.commit()
             self.logger.info(f"Created URL configuration: {name} (ID: {config_id})")
             return config_id
     
@@ -220,8 +223,7 @@ class URLConfigurationDatabase:
         Returns:
             Dictionary containing the configuration data, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.read() as db:
             cursor = await db.execute(
                 "SELECT * FROM url_configurations WHERE id = ?", (config_id,)
             )
@@ -240,9 +242,7 @@ class URLConfigurationDatabase:
         Returns:
             List of dictionaries containing configuration data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_configurations WHERE is_active = 1 ORDER BY business_priority DESC, name ASC"
@@ -265,9 +265,7 @@ class URLConfigurationDatabase:
         Returns:
             List of dictionaries containing configuration data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_configurations WHERE profile_type = ? AND is_active = 1 ORDER BY business_priority DESC, name ASC",
@@ -292,9 +290,7 @@ class URLConfigurationDatabase:
         Returns:
             List of dictionaries containing configuration data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_configurations WHERE category = ? AND is_active = 1 ORDER BY business_priority DESC, name ASC",
@@ -343,13 +339,12 @@ class URLConfigurationDatabase:
         values.append(self._get_timestamp())
         values.append(config_id)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 f"UPDATE url_configurations SET {', '.join(set_clauses)} WHERE id = ?",
                 values
             )
             
-            await db.commit()
             updated = cursor.rowcount > 0
             
             if updated:
@@ -366,12 +361,11 @@ class URLConfigurationDatabase:
         Returns:
             True if the configuration was deleted, False if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 "DELETE FROM url_configurations WHERE id = ?", (config_id,)
             )
             
-            await db.commit()
             deleted = cursor.rowcount > 0
             
             if deleted:
@@ -409,8 +403,7 @@ class URLConfigurationDatabase:
         if active_only:
             where_clause += " AND is_active = 1"
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.read() as db:
             cursor = await db.execute(
                 f"SELECT * FROM url_configurations WHERE {where_clause} ORDER BY business_priority DESC, name ASC",
                 search_values
@@ -419,7 +412,7 @@ class URLConfigurationDatabase:
             rows = await cursor.fetchall()
             return [self._row_to_dict(row) for row in rows]
     
-    def _row_to_dict(self, row: aiosqlite.Row) -> Dict[str, Any]:
+    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         """Convert a database row to a dictionary with proper JSON deserialization."""
         data = dict(row)
         
@@ -446,7 +439,7 @@ class URLConfigurationDatabase:
         Returns:
             Dictionary with database statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             # Total configurations
             cursor = await db.execute("SELECT COUNT(*) FROM url_configurations")
             total_count = (await cursor.fetchone())[0]
@@ -473,4 +466,10 @@ class URLConfigurationDatabase:
                 'inactive_configurations': total_count - active_count,
                 'configurations_by_profile': profile_counts,
                 'configurations_by_category': category_counts
-            }
\ No newline at end of file
+            }
+    
+    async def close(self) -> None:
+        """Release this instance's hold on the shared connection pool."""
+        if not self._released:
+            self._released = True
+            await release_pool(self.pool)
@@ -11,7 +11,6 @@ The URL Mapping system focuses purely on technical configuration:
 - Crawler-specific settings
 """
 
-import aiosqlite
 import json
 import uuid
 from datetime import datetime
@@ -19,6 +18,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 
+from .sqlite_pool import acquire_pool, release_pool
+
 
 class URLMappingDatabase:
     """Database manager for URL mappings with technical configurations.
@@ -30,6 +31,7 @@ class URLMappingDatabase:
     
     Attributes:
         db_path (str): Path to the SQLite database file
+        pool (SQLitePool): Connection pool shared by every user of the file
         logger (logging.Logger): Logger instance for this class
     """
     
@@ -40,12 +42,14 @@ class URLMappingDatabase:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        self.pool = acquire_pool(db_path)
+        self._released = False
         self.logger = logging.getLogger(__name__)
     
     async def initialize(self) -> None:
         """Initialize the database and create tables if they don't exist."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.write() as db:
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS url_mappings (
                         id TEXT PRIMARY KEY,
@@ -72,7 +76,6 @@ class URLMappingDatabase:
                 await db.execute("CREATE INDEX IF NOT EXISTS idx_url_mappings_is_active ON url_mappings(is_active)")
                 await db.execute("CREATE INDEX IF NOT EXISTS idx_url_mappings_url ON url_mappings(url)")
                 
-                await db.commit()
                 self.logger.info("URL mappings database initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize URL mappings database: {e}")
@@ -144,7 +147,7 @@ class URLMappingDatabase:
         mapping_id = self._generate_id()
         timestamp = self._get_timestamp()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             await db.execute("""
                 INSERT INTO url_mappings (
                     id, name, url, url_config_id, extractor_id, priority,
@@ -159,7 +162,6 @@ class URLMappingDatabase:
                 is_active, self._serialize_json_field(metadata),
                 timestamp, timestamp
             ))
-            await db.commit()
         
         self.logger.info(f"Created URL mapping: {mapping_id}")
         return mapping_id
@@ -173,7 +175,7 @@ class URLMappingDatabase:
         Returns:
             Dictionary containing the mapping data, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             async with db.execute(
                 "SELECT * FROM url_mappings WHERE id = ?", (mapping_id,)
             ) as cursor:
@@ -188,7 +190,7 @@ class URLMappingDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             async with db.execute(
                 "SELECT * FROM url_mappings ORDER BY created_at DESC"
             ) as cursor:
@@ -204,7 +206,7 @@ class URLMappingDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             async with db.execute(
                 "SELECT * FROM url_mappings WHERE url_config_id = ? ORDER BY priority DESC",
                 (url_config_id,)
@@ -221,7 +223,7 @@ class URLMappingDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             async with db.execute(
                 "SELECT * FROM url_mappings WHERE json_extract(extractor_ids, '$') LIKE ? ORDER BY priority DESC",
                 (f'%"{extractor_id}"%',)
@@ -255,12 +257,11 @@ class URLMappingDatabase:
         set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
         values = list(kwargs.values()) + [mapping_id]
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 f"UPDATE url_mappings SET {set_clause} WHERE id = ?",
                 values
             )
-            await db.commit()
             return cursor.rowcount > 0
     
     async def delete_mapping(self, mapping_id: str) -> bool:
@@ -272,11 +273,10 @@ class URLMappingDatabase:
         Returns:
             True if deletion was successful, False otherwise
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 "DELETE FROM url_mappings WHERE id = ?", (mapping_id,)
             )
-            await db.commit()
             return cursor.rowcount > 0
     
     async def delete_mappings_by_url_config(self, url_config_id: str) -> int:
@@ -288,11 +288,10 @@ class URLMappingDatabase:
         Returns:
             Number of mappings deleted
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 "DELETE FROM url_mappings WHERE url_config_id = ?", (url_config_id,)
             )
-            await db.commit()
             return cursor.rowcount
     
     def _row_to_dict(self, row) -> Dict[str, Any]:
@@ -326,7 +325,7 @@ class URLMappingDatabase:
         Returns:
             Dictionary containing database statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             # Total mappings
             async with db.execute("SELECT COUNT(*) FROM url_mappings") as cursor:
                 total_mappings = (await cursor.fetchone())[0]
@@ -349,4 +348,10 @@ class URLMappingDatabase:
                 "active_mappings": active_mappings,
                 "inactive_mappings": total_mappings - active_mappings,
                 "extractor_distribution": dict(extractor_stats)
-            }
\ No newline at end of file
+            }
+    
+    async def close(self) -> None:
+        """Release this instance's hold on the shared connection pool."""
+        if not self._released:
+            self._released = True
+            await release_pool(self.pool)
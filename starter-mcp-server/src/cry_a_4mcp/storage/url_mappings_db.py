@@ -31,12 +31,13 @@ Version: 1.0.0
 
 import json
 import logging
+import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-import aiosqlite
+from .sqlite_pool import acquire_pool, release_pool
 
 
 class URLMappingsDatabase:
@@ -49,6 +50,7 @@ class URLMappingsDatabase:
     
     Attributes:
         db_path (str): Path to the SQLite database file
+        pool (SQLitePool): Connection pool shared by every user of the file
         logger (logging.Logger): Logger instance for this class
     """
     
@@ -59,6 +61,8 @@ class URLMappingsDatabase:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        self.pool = acquire_pool(db_path)
+        self._released = False
         self.logger = logging.getLogger(__name__)
         
     async def initialize(self) -> None:
@@ -67,7 +71,7 @@ class URLMappingsDatabase:
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             # Create url_mappings table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS url_mappings (
@@ -102,7 +106,6 @@ class URLMappingsDatabase:
             )
             await db.execute("CREATE INDEX IF NOT EXISTS idx_url_mappings_url ON url_mappings(url)")
             
-            await db.commit()
             self.logger.info(f"URL Mappings database initialized at {self.db_path}")
     
     def _get_timestamp(self) -> str:
@@ -164,7 +167,7 @@ class URLMappingsDatabase:
         mapping_id = str(uuid.uuid4())
         timestamp = self._get_timestamp()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             await db.execute("""
                 INSERT INTO url_mappings (
                     id, name, url_config_id, url, extractor_ids, rate_limit, priority,
@@ -190,7 +193,6 @@ class URLMappingsDatabase:
                 timestamp
             ))
             
-            await db.commit()
             self.logger.info(f"Created URL mapping: {mapping_id} for config {url_config_id}")
             return mapping_id
     
@@ -203,8 +205,7 @@ class URLMappingsDatabase:
         Returns:
             Dictionary containing the mapping data, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.read() as db:
             cursor = await db.execute(
                 "SELECT * FROM url_mappings WHERE id = ?", (mapping_id,)
             )
@@ -223,9 +224,7 @@ class URLMappingsDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_mappings WHERE is_active = 1 ORDER BY created_at DESC"
@@ -248,9 +247,7 @@ class URLMappingsDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_mappings WHERE url_config_id = ? AND is_active = 1 ORDER BY created_at DESC",
@@ -275,9 +272,7 @@ class URLMappingsDatabase:
         Returns:
             List of dictionaries containing mapping data
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self.pool.read() as db:
             if active_only:
                 cursor = await db.execute(
                     "SELECT * FROM url_mappings WHERE json_extract(extractor_ids, '$') LIKE ? AND is_active = 1 ORDER BY created_at DESC",
@@ -324,13 +319,12 @@ class URLMappingsDatabase:
         values.append(self._get_timestamp())
         values.append(mapping_id)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 f"UPDATE url_mappings SET {', '.join(set_clauses)} WHERE id = ?",
                 values
             )
             
-            await db.commit()
             updated = cursor.rowcount > 0
             
             if updated:
@@ -347,12 +341,11 @@ class URLMappingsDatabase:
         Returns:
             True if the mapping was deleted, False if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 "DELETE FROM url_mappings WHERE id = ?", (mapping_id,)
             )
             
-            await db.commit()
             deleted = cursor.rowcount > 0
             
             if deleted:
@@ -369,12 +362,11 @@ class URLMappingsDatabase:
         Returns:
             Number of mappings deleted
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.write() as db:
             cursor = await db.execute(
                 "DELETE FROM url_mappings WHERE url_config_id = ?", (url_config_id,)
             )
             
-            await db.commit()
             deleted_count = cursor.rowcount
             
             if deleted_count > 0:
@@ -382,7 +374,7 @@ class URLMappingsDatabase:
             
             return deleted_count
     
-    def _row_to_dict(self, row: aiosqlite.Row) -> Dict[str, Any]:
+    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         """Convert a database row to a dictionary with proper JSON deserialization."""
         data = dict(row)
         
@@ -405,7 +397,7 @@ class URLMappingsDatabase:
         Returns:
             Dictionary with database statistics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.read() as db:
             # Total mappings
             cursor = await db.execute("SELECT COUNT(*) FROM url_mappings")
             total_count = (await cursor.fetchone())[0]
@@ -425,4 +417,10 @@ class URLMappingsDatabase:
                 'active_mappings': active_count,
                 'inactive_mappings': total_count - active_count,
                 'mappings_by_extractor': extractor_counts
-            }
\ No newline at end of file
+            }
+    
+    async def close(self) -> None:
+        """Release this instance's hold on the shared connection pool."""
+        if not self._released:
+            self._released = True
+            await release_pool(self.pool)
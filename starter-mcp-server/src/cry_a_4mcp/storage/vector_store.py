@@ -6,7 +6,10 @@ storing and retrieving cryptocurrency document embeddings.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import structlog
 from qdrant_client import QdrantClient
@@ -14,6 +17,94 @@ from qdrant_client.http import models as qdrant_models
 from sentence_transformers import SentenceTransformer
 
 from ..config import Settings
+from ..utils.cache import LRUCache, normalize_query, notify_data_changed
+
+# Texts per encode call when ``embedding_batch_size`` is not set. Larger
+# batches only pay off on accelerators; on CPU they mostly add padding.
+DEFAULT_ENCODE_BATCH_SIZE = {"cpu": 32}
+ACCELERATOR_ENCODE_BATCH_SIZE = 128
+
+# Search fetches this many times ``limit`` chunk hits so enough distinct
+# documents remain after collapsing chunks of the same document
+SEARCH_OVERFETCH_FACTOR = 3
+
+# (content, metadata) pair accepted by the ingestion methods
+Document = Tuple[str, Dict[str, Any]]
+
+
+@dataclass
+class IngestStats:
+    """Progress and throughput of document ingestion."""
+    documents: int = 0
+    chunks: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    failed_chunks: int = 0
+    encode_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def merge(self, other: "IngestStats") -> None:
+        """Add the counts of another result to this one."""
+        self.documents += other.documents
+        self.chunks += other.chunks
+        self.batches += other.batches
+        self.failed_batches += other.failed_batches
+        self.failed_chunks += other.failed_chunks
+        self.encode_seconds += other.encode_seconds
+        self.upsert_seconds += other.upsert_seconds
+        self.elapsed_seconds += other.elapsed_seconds
+        self.errors.extend(other.errors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the counts and rates."""
+        return {
+            "documents": self.documents,
+            "chunks": self.chunks,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "failed_chunks": self.failed_chunks,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "encode_seconds": round(self.encode_seconds, 3),
+            "upsert_seconds": round(self.upsert_seconds, 3),
+            "documents_per_second": round(self.documents_per_second, 1),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+        }
+
+
+def chunk_text(text: str, max_words: int, overlap: int = 0) -> List[str]:
+    """Split a text into overlapping word windows.
+
+    Texts that fit in one window are returned unchanged.
+
+    Args:
+        text: Text to split
+        max_words: Maximum words per chunk
+        overlap: Words repeated at the start of the next chunk
+
+    Returns:
+        List of chunks
+    """
+    words = text.split()
+    if len(words) <= max_words:
+        return [text]
+
+    step = max(1, max_words - overlap)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start:start + max_words]))
+        if start + max_words >= len(words):
+            break
+    return chunks
 
 
 class VectorStore:
@@ -27,6 +118,17 @@ class VectorStore:
         self.embedding_model: Optional[SentenceTransformer] = None
         self.collection_name = settings.qdrant_collection_name
         self.vector_size = settings.qdrant_vector_size
+        self.encode_batch_size = settings.embedding_batch_size or DEFAULT_ENCODE_BATCH_SIZE.get(
+            settings.embedding_device, ACCELERATOR_ENCODE_BATCH_SIZE
+        )
+        self.upsert_batch_size = settings.qdrant_upsert_batch_size
+        self.max_inflight_upserts = settings.qdrant_max_inflight_upserts
+        self.chunk_words = settings.embedding_chunk_words
+        self.chunk_overlap = settings.embedding_chunk_overlap
+        # Totals over every ingestion call
+        self.ingest_stats = IngestStats()
+        # Embeddings of recent queries, keyed by normalized query text
+        self.query_embeddings = LRUCache(settings.query_embedding_cache_size)
     
     async def initialize(self) -> None:
         """Initialize the vector store."""
@@ -87,13 +189,18 @@ class VectorStore:
                     filter_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Search for documents similar to the query.
         
+        Chunks of the same document are collapsed into one result: the
+        result ``id`` is the document id and ``content`` is the text of its
+        best matching chunk, whose position is given by ``chunk_index`` and
+        ``chunk_count``.
+        
         Args:
             query: Search query
-            limit: Maximum number of results
+            limit: Maximum number of documents
             filter_params: Optional filter parameters
             
         Returns:
-            List of search results with content and metadata
+            List of search results with content and metadata, best first
         """
         if not self.client or not self.embedding_model:
             raise RuntimeError("Vector store not initialized")
@@ -102,9 +209,7 @@ class VectorStore:
         
         # Generate query embedding
         loop = asyncio.get_event_loop()
-        query_embedding = await loop.run_in_executor(
-            None, lambda: self.embedding_model.encode(query).tolist()
-        )
+        query_embedding = await self.embed_query(query)
         
         # Convert filter params to Qdrant filter
         qdrant_filter = None
@@ -117,35 +222,71 @@ class VectorStore:
             lambda: self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
-                limit=limit,
+                limit=limit * SEARCH_OVERFETCH_FACTOR,
                 query_filter=qdrant_filter,
                 with_payload=True,
             ),
         )
         
-        # Format results
+        # Format results, keeping the best hit of each document
         results = []
+        seen: Set[str] = set()
         for result in search_results:
             # Extract payload
             payload = result.payload or {}
+            document_id = str(payload.get("document_id") or result.id)
+            if document_id in seen:
+                continue
+            seen.add(document_id)
             
             # Create result dict
             result_dict = {
-                "id": str(result.id),
+                "id": document_id,
                 "score": result.score,
                 "content": payload.get("content", ""),
                 "title": payload.get("title", ""),
                 "url": payload.get("url", ""),
                 "timestamp": payload.get("timestamp"),
                 "source": payload.get("source", ""),
+                "chunk_index": payload.get("chunk_index", 0),
+                "chunk_count": payload.get("chunk_count", 1),
             }
             
             results.append(result_dict)
+            if len(results) == limit:
+                break
         
         self.logger.info("Vector search completed", results_count=len(results))
         
         return results
     
+    async def embed_query(self, query: str) -> List[float]:
+        """Embed a search query, reusing the embedding of an earlier equal query.
+        
+        Queries are compared after collapsing whitespace, and that normalized
+        text is what gets encoded, so a cached embedding always matches its key.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Query embedding
+        """
+        if not self.embedding_model:
+            raise RuntimeError("Vector store not initialized")
+        
+        key = normalize_query(query)
+        embedding = self.query_embeddings.get(key)
+        if embedding is None:
+            started = time.perf_counter()
+            loop = asyncio.get_event_loop()
+            embedding = await loop.run_in_executor(
+                None, lambda: self.embedding_model.encode(key).tolist()
+            )
+            self.query_embeddings.put(key, embedding, cost=time.perf_counter() - started)
+        
+        return embedding
+    
     async def add_document(self, content: str, metadata: Dict[str, Any]) -> str:
         """Add a document to the vector store.
         
@@ -156,34 +297,130 @@ class VectorStore:
         Returns:
             Document ID
         """
+        document_id = metadata.get("id") or str(uuid.uuid4())
+        stats = await self.add_documents([(content, {**metadata, "id": document_id})])
+        if stats.failed_batches:
+            raise RuntimeError(f"Failed to add document {document_id}: {stats.errors[0]}")
+        
+        return str(document_id)
+    
+    async def add_documents(self, documents: Iterable[Document],
+                            progress: Optional[Callable[[IngestStats], None]] = None) -> IngestStats:
+        """Embed and store documents in batches.
+        
+        Long documents are split into overlapping chunks, each stored as its
+        own point with ``document_id``, ``chunk_index`` and ``chunk_count`` in
+        its payload; ``search`` collapses them back into one result per
+        document. Chunks are encoded ``upsert_batch_size`` at a time and
+        every batch is upserted as one request. Up to ``max_inflight_upserts``
+        requests run while the next batch is being encoded. A failed upsert
+        is recorded in the result and ingestion continues.
+        
+        Args:
+            documents: (content, metadata) pairs. ``metadata["id"]`` is used
+                as the document ID when present.
+            progress: Optional callback receiving the running stats after
+                every upsert
+            
+        Returns:
+            Counts and throughput of this call
+        """
         if not self.client or not self.embedding_model:
             raise RuntimeError("Vector store not initialized")
         
-        # Generate document embedding
-        loop = asyncio.get_event_loop()
-        embedding = await loop.run_in_executor(
-            None, lambda: self.embedding_model.encode(content).tolist()
-        )
+        stats = IngestStats()
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_inflight_upserts)
+        in_flight: Set[asyncio.Task] = set()
         
-        # Prepare payload
-        payload = {"content": content, **metadata}
+        async def upsert(points: List[qdrant_models.PointStruct]) -> None:
+            upsert_started = time.perf_counter()
+            try:
+                await loop.run_in_executor(
+                    None,
+                    lambda: self.client.upsert(collection_name=self.collection_name, points=points),
+                )
+                stats.chunks += len(points)
+            except Exception as e:
+                self.logger.error("Vector upsert failed", points=len(points), error=str(e))
+                stats.failed_batches += 1
+                stats.failed_chunks += len(points)
+                stats.errors.append(str(e))
+            finally:
+                slots.release()
+            stats.batches += 1
+            stats.upsert_seconds += time.perf_counter() - upsert_started
+            if progress:
+                progress(stats)
         
-        # Add to Qdrant
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.client.upsert(
-                collection_name=self.collection_name,
-                points=[
-                    qdrant_models.PointStruct(
-                        id=metadata.get("id", self.client.http.generate_uuid()),
-                        vector=embedding,
-                        payload=payload,
-                    )
-                ],
-            ),
-        )
+        try:
+            for batch in self._chunk_batches(documents, stats):
+                texts = [text for _, text, _ in batch]
+                encode_started = time.perf_counter()
+                vectors = await loop.run_in_executor(
+                    None,
+                    lambda: self.embedding_model.encode(
+                        texts, batch_size=self.encode_batch_size, show_progress_bar=False
+                    ),
+                )
+                stats.encode_seconds += time.perf_counter() - encode_started
+                
+                points = [
+                    qdrant_models.PointStruct(id=point_id, vector=vector.tolist(), payload=payload)
+                    for (point_id, _, payload), vector in zip(batch, vectors)
+                ]
+                await slots.acquire()
+                task = asyncio.create_task(upsert(points))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight)
+            stats.elapsed_seconds = time.perf_counter() - started
+            self.ingest_stats.merge(stats)
+            if stats.batches:
+                notify_data_changed()
+        
+        self.logger.info("Documents added", **stats.to_dict())
+        
+        return stats
+    
+    def _chunk_batches(self, documents: Iterable[Document],
+                       stats: IngestStats) -> Iterator[List[Tuple[Union[str, int], str, Dict[str, Any]]]]:
+        """Split documents into chunks and group them into upsert batches.
         
-        return str(result.upserted_count)
+        Args:
+            documents: (content, metadata) pairs
+            stats: Stats whose document count is updated
+            
+        Yields:
+            Lists of (point ID, text, payload) tuples
+        """
+        batch = []
+        for content, metadata in documents:
+            stats.documents += 1
+            document_id = metadata.get("id") or str(uuid.uuid4())
+            chunks = chunk_text(content, self.chunk_words, self.chunk_overlap)
+            for index, chunk in enumerate(chunks):
+                # Single-chunk documents keep their own ID; chunk IDs are
+                # derived from it so re-ingesting a document overwrites them
+                point_id = document_id if len(chunks) == 1 else str(
+                    uuid.uuid5(uuid.NAMESPACE_URL, f"{document_id}#{index}")
+                )
+                payload = {
+                    "content": chunk,
+                    **metadata,
+                    "document_id": str(document_id),
+                    "chunk_index": index,
+                    "chunk_count": len(chunks),
+                }
+                batch.append((point_id, chunk, payload))
+                if len(batch) >= self.upsert_batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
     
     def _build_filter(self, filter_params: Dict[str, Any]) -> qdrant_models.Filter:
         """Build a Qdrant filter from filter parameters.
@@ -234,4 +471,128 @@ class VectorStore:
                 must=conditions
             )
         
-        return None
\ No newline at end of file
+        return None
+
+
+class VectorIngestQueue:
+    """Streams documents into a vector store in batches.
+    
+    Producers such as crawlers put documents on a bounded queue and a
+    background worker hands them to ``VectorStore.add_documents`` in batches
+    of up to ``batch_size`` documents, or whatever has arrived after
+    ``flush_interval`` seconds. ``put`` waits while the queue is full, so a
+    slow vector store throttles its producers instead of buffering without
+    limit.
+    
+    Example:
+        queue = VectorIngestQueue(vector_store)
+        await queue.start()
+        await queue.put(result.markdown, {"url": url, "source": "crawler"})
+        ...
+        await queue.close()
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, vector_store: VectorStore, batch_size: Optional[int] = None,
+                 max_pending: Optional[int] = None, flush_interval: float = 1.0) -> None:
+        """Initialize the queue.
+        
+        Args:
+            vector_store: Initialized vector store to write to
+            batch_size: Documents per ingestion batch, defaults to the
+                store's upsert batch size
+            max_pending: Queued documents before ``put`` waits, defaults to
+                four batches
+            flush_interval: Seconds to wait for a batch to fill up
+        """
+        self.vector_store = vector_store
+        self.batch_size = batch_size or vector_store.upsert_batch_size
+        self.flush_interval = flush_interval
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self.stats = IngestStats()
+        self.submitted = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending or self.batch_size * 4)
+        self._worker: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+    
+    async def start(self) -> None:
+        """Start the background worker."""
+        if self._worker is None:
+            self._started_at = time.perf_counter()
+            self._worker = asyncio.create_task(self._run())
+    
+    async def put(self, content: str, metadata: Dict[str, Any]) -> None:
+        """Queue a document, waiting while the queue is full.
+        
+        Args:
+            content: Document content
+            metadata: Document metadata
+        """
+        if self._worker is None:
+            raise RuntimeError("Ingest queue not started")
+        await self._queue.put((content, metadata))
+        self.submitted += 1
+    
+    async def flush(self) -> None:
+        """Wait until every queued document has been written."""
+        await self._queue.join()
+    
+    async def close(self) -> None:
+        """Write the remaining documents and stop the worker."""
+        if self._worker is None:
+            return
+        await self._queue.put(self._STOP)
+        await self._worker
+        self._worker = None
+    
+    async def _run(self) -> None:
+        """Collect documents into batches and ingest them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                break
+            
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is self._STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                self.stats.merge(await self.vector_store.add_documents(batch))
+            except Exception as e:
+                self.logger.error("Vector ingestion failed", documents=len(batch), error=str(e))
+                self.stats.failed_batches += 1
+                self.stats.errors.append(str(e))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get progress and throughput of the queue.
+        
+        Returns:
+            Counts, rates and the current queue depth. ``wall_documents_per_second``
+            is measured since the queue was started.
+        """
+        uptime = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            **self.stats.to_dict(),
+            "submitted": self.submitted,
+            "pending": self._queue.qsize(),
+            "wall_documents_per_second": round(self.stats.documents / uptime, 1) if uptime else 0.0,
+        }
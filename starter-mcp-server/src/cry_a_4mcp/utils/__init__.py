@@ -3,6 +3,13 @@
 This module provides utility functions for the CRY-A-4MCP server.
 """
 
+from .cache import LRUCache, data_generation, normalize_query, notify_data_changed
 from .logging import setup_logging
 
-__all__ = ["setup_logging"]
\ No newline at end of file
+__all__ = [
+    "setup_logging",
+    "LRUCache",
+    "data_generation",
+    "normalize_query",
+    "notify_data_changed",
+]
@@ -0,0 +1,153 @@
+"""Caching utilities for CRY-A-4MCP.
+
+This module provides in-process LRU caches with optional expiry and hit
+statistics, and a process-wide write generation. Stores call
+``notify_data_changed`` after every write; caches created with
+``track_writes=True`` drop their entries when the generation changes, so
+cached search results never outlive a write made through any store instance.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_data_generation = 0
+
+
+def notify_data_changed() -> None:
+    """Record that stored documents or graph data changed."""
+    global _data_generation
+    _data_generation += 1
+
+
+def data_generation() -> int:
+    """Get the current write generation."""
+    return _data_generation
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for use as a cache key.
+
+    Only whitespace is collapsed. Case is kept because cased embedding
+    models encode "Apple" and "apple" differently.
+
+    Args:
+        query: Raw query text
+
+    Returns:
+        Query with collapsed whitespace
+    """
+    return " ".join(query.split())
+
+
+class LRUCache:
+    """Bounded least-recently-used cache.
+
+    Every entry records how long its value took to compute, so hits can
+    report the latency they saved.
+
+    Example:
+        cache = LRUCache(maxsize=1024, ttl=30.0, track_writes=True)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value, cost=elapsed)
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, track_writes: bool = False) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries, 0 disables the cache
+            ttl: Seconds an entry stays valid, None for no expiry
+            track_writes: Whether to drop every entry after a data write
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.track_writes = track_writes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, float]]" = OrderedDict()
+        self._generation = data_generation()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.saved_seconds = 0.0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        self._check_generation()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, stored_at, cost = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.saved_seconds += cost
+        return value
+
+    def put(self, key: Hashable, value: Any, cost: float = 0.0) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            cost: Seconds it took to compute the value
+        """
+        if self.maxsize <= 0:
+            return
+        self._check_generation()
+        self._entries[key] = (value, time.monotonic(), cost)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def _check_generation(self) -> None:
+        """Drop every entry if data was written since they were stored."""
+        if self.track_writes and self._generation != data_generation():
+            self._generation = data_generation()
+            self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit statistics.
+
+        Returns:
+            Size, hit and miss counts, hit rate and latency saved by hits
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "saved_seconds": round(self.saved_seconds, 3),
+        }
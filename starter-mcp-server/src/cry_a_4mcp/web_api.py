@@ -302,6 +302,11 @@ class WebAPIServer:
         @self.app.on_event("startup")
         async def startup_event():
             await self.initialize()
+        
+        # Close the shared database connections on shutdown
+        @self.app.on_event("shutdown")
+        async def shutdown_event():
+            await self.close()
     
 
     
@@ -377,6 +382,12 @@ class WebAPIServer:
             self._api_router_setup_pending = False
             logging.info("API router with adaptive crawling capabilities initialized")
     
+    async def close(self):
+        """Closes the database connection pools."""
+        await self.url_configuration_db.close()
+        await self.url_mappings_db.close()
+        await self.crawler_db.close()
+    
     async def run(self, host: str = "0.0.0.0", port: int = 4000):
         """Runs the FastAPI web server using Uvicorn.
 
@@ -18,6 +18,8 @@ from prometheus_client import start_http_server
 import uvicorn
 
 from .database import init_db, db_manager
+from .url_mapping_service.async_database import initialize_async_database, close_async_database
+from .api.url_mappings import router as url_mapping_service_router
 from .cry_a_4mcp.api.endpoints.url_mappings import setup_url_mapping_routes
 from .exceptions import URLMappingBaseError
 from .cry_a_4mcp.api.endpoints.extractors import router as extractors_router
@@ -69,6 +71,14 @@ async def lifespan(app: FastAPI):
         print(f"Failed to initialize database: {e}")
         raise
     
+    # Initialize the async URL mapping service database
+    try:
+        await initialize_async_database()
+        print("Async URL mapping database initialized successfully")
+    except Exception as e:
+        print(f"Failed to initialize async URL mapping database: {e}")
+        raise
+    
     # Initialize URL Configuration Database
     try:
         await url_config_db.initialize()
@@ -112,6 +122,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("Shutting down URL Mapping Service...")
+    await close_async_database()
+    await url_config_db.close()
+    await url_mappings_db.close()
 
 # Create FastAPI application
 app = FastAPI(
@@ -184,6 +197,9 @@ app.include_router(openrouter_router, prefix="/api")
 url_mappings_router = setup_url_mapping_routes(url_mappings_db, url_config_db)
 app.include_router(url_mappings_router)
 
+# Include the async URL mapping service router (/api/url-mappings)
+app.include_router(url_mapping_service_router)
+
 # Setup URL configuration routes with database dependency
 url_config_router = setup_url_configuration_routes(url_config_db)
 app.include_router(url_config_router)
@@ -47,4 +47,17 @@ __all__ = [
     "URLMappingListResponse",
     "URLMappingStats",
     "URLMappingService",
-]
\ No newline at end of file
+    "AsyncURLMappingService",
+]
+
+
+def __getattr__(name):
+    """Import the async service on first use.
+
+    It needs SQLAlchemy's asyncio extras (greenlet and aiosqlite or asyncpg),
+    which the synchronous service does not.
+    """
+    if name == "AsyncURLMappingService":
+        from .async_service import AsyncURLMappingService
+        return AsyncURLMappingService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""Async database engine and session management for URL Mapping Service.
+
+This module mirrors ``database`` on SQLAlchemy's asyncio engine, so FastAPI
+handlers can query without blocking the event loop. SQLite URLs are served
+by the aiosqlite driver and PostgreSQL URLs by asyncpg.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from .config import Settings, get_settings
+from .exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+# Async driver used for each database backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+SYNC_DRIVERS = {"pysqlite", "psycopg2", "pymysql", "mysqldb"}
+
+
+def to_async_url(database_url: str) -> URL:
+    """Switch a database URL to the async driver for its backend.
+
+    Args:
+        database_url: Database URL, e.g. ``sqlite:///./url_mappings.db``.
+
+    Returns:
+        URL using the async driver, e.g. ``sqlite+aiosqlite:///./url_mappings.db``.
+    """
+    url = make_url(database_url)
+    backend, _, driver = url.drivername.partition("+")
+    if backend in ASYNC_DRIVERS and (not driver or driver in SYNC_DRIVERS):
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url
+
+
+class AsyncDatabaseManager:
+    """Async database connection and session manager."""
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize database manager.
+
+        Args:
+            settings: Application settings. If None, uses global settings.
+        """
+        self.settings = settings or get_settings()
+        self.engine: Optional[AsyncEngine] = None
+        self.SessionLocal: Optional[async_sessionmaker] = None
+        self._initialize_engine()
+
+    def _initialize_engine(self) -> None:
+        """Initialize async database engine and session factory."""
+        try:
+            url = to_async_url(self.settings.database_url)
+
+            if url.get_backend_name() == "sqlite":
+                if url.database in (None, "", ":memory:"):
+                    # Every connection to an in-memory database is a new
+                    # database, so all sessions must share one connection
+                    self.engine = create_async_engine(
+                        url,
+                        echo=self.settings.database_echo,
+                        poolclass=StaticPool,
+                    )
+                else:
+                    # Each pooled aiosqlite connection runs on its own
+                    # thread, so reads proceed concurrently under WAL
+                    self.engine = create_async_engine(
+                        url,
+                        echo=self.settings.database_echo,
+                        connect_args={"timeout": self.settings.db_pool_timeout},
+                        pool_size=self.settings.db_pool_size,
+                        max_overflow=self.settings.db_max_overflow,
+                        pool_timeout=self.settings.db_pool_timeout,
+                    )
+                    event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
+            else:
+                # PostgreSQL/MySQL configuration
+                self.engine = create_async_engine(
+                    url,
+                    echo=self.settings.database_echo,
+                    pool_size=self.settings.db_pool_size,
+                    max_overflow=self.settings.db_max_overflow,
+                    pool_timeout=self.settings.db_pool_timeout,
+                    pool_recycle=self.settings.db_pool_recycle,
+                    pool_pre_ping=True,
+                )
+
+            # Objects stay usable after commit, as responses are built from them
+            self.SessionLocal = async_sessionmaker(
+                bind=self.engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+
+            logger.info(f"Async database engine initialized: {url.render_as_string(hide_password=True)}")
+
+        except Exception as e:
+            logger.error(f"Failed to initialize async database engine: {e}")
+            raise DatabaseError(f"Database initialization failed: {e}") from e
+
+    async def create_tables(self) -> None:
+        """Create all database tables."""
+        try:
+            from .models import Base  # Import here to avoid circular imports
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create database tables: {e}")
+            raise DatabaseError(f"Table creation failed: {e}") from e
+
+    async def drop_tables(self) -> None:
+        """Drop all database tables."""
+        try:
+            from .models import Base  # Import here to avoid circular imports
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            logger.info("Database tables dropped successfully")
+        except Exception as e:
+            logger.error(f"Failed to drop database tables: {e}")
+            raise DatabaseError(f"Table drop failed: {e}") from e
+
+    async def health_check(self) -> bool:
+        """Check database connection health.
+
+        Returns:
+            bool: True if database is healthy, False otherwise.
+        """
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"Database health check failed: {e}")
+            return False
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get async database session with automatic cleanup.
+
+        The session is committed when the block exits and rolled back if it
+        raises. Exceptions are re-raised unchanged, so callers can tell
+        integrity errors from other database errors.
+
+        Yields:
+            AsyncSession: SQLAlchemy async database session.
+
+        Raises:
+            DatabaseError: If the database is not initialized.
+        """
+        if not self.SessionLocal:
+            raise DatabaseError("Database not initialized")
+
+        session = self.SessionLocal()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def get_pool_status(self) -> str:
+        """Describe the connection pool's checked-out and idle connections."""
+        return self.engine.pool.status()
+
+    async def close(self) -> None:
+        """Close database connections."""
+        if self.engine:
+            await self.engine.dispose()
+            logger.info("Async database connections closed")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable WAL so readers do not wait for writers on SQLite files."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+# Global async database manager instance
+_async_db_manager: Optional[AsyncDatabaseManager] = None
+
+
+def get_async_database_manager() -> AsyncDatabaseManager:
+    """Get global async database manager instance.
+
+    Returns:
+        AsyncDatabaseManager: Global async database manager.
+    """
+    global _async_db_manager
+    if _async_db_manager is None:
+        _async_db_manager = AsyncDatabaseManager()
+    return _async_db_manager
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for async database sessions.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session.
+    """
+    async with get_async_database_manager().get_session() as session:
+        yield session
+
+
+async def initialize_async_database() -> None:
+    """Initialize database and create tables."""
+    await get_async_database_manager().create_tables()
+    logger.info("Async database initialized successfully")
+
+
+async def close_async_database() -> None:
+    """Close async database connections."""
+    global _async_db_manager
+    if _async_db_manager:
+        await _async_db_manager.close()
+        _async_db_manager = None
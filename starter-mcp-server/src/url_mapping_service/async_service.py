@@ -0,0 +1,471 @@
+"""Async URL Mapping Service implementation.
+
+This module provides the URL mapping business logic of ``service`` on
+SQLAlchemy's asyncio engine. FastAPI handlers await it instead of calling
+the synchronous service, which blocked the event loop for every request
+while a query ran.
+
+Author: CRY-A-4MCP Development Team
+Version: 1.0.0
+"""
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import desc, func, or_, select, text, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .async_database import AsyncDatabaseManager, get_async_database_manager
+from .exceptions import (
+    DatabaseError,
+    URLMappingDuplicateError,
+    URLMappingNotFoundError,
+    URLMappingValidationError,
+)
+from .models import (
+    BulkStatusUpdate,
+    BulkStatusUpdateResponse,
+    HealthCheckResponse,
+    URLConfiguration,
+    URLMapping,
+    URLMappingCreate,
+    URLMappingListResponse,
+    URLMappingResponse,
+    URLMappingStats,
+    URLMappingStatus,
+    URLMappingUpdate,
+)
+from .service import URLMappingService
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class AsyncURLMappingService:
+    """Async service class for managing URL mappings.
+
+    Offers the operations of ``URLMappingService`` as coroutines, each
+    running in its own session from the async connection pool.
+    """
+
+    def __init__(self, db_manager: Optional[AsyncDatabaseManager] = None):
+        """Initialize the async URL mapping service.
+
+        Args:
+            db_manager: Optional async database manager. If not provided,
+                       the global async database manager is used.
+        """
+        self._db_manager = db_manager
+
+    @property
+    def db_manager(self) -> AsyncDatabaseManager:
+        """Async database manager used for every operation."""
+        return self._db_manager or get_async_database_manager()
+
+    async def create_mapping(self, mapping_data: URLMappingCreate) -> URLMappingResponse:
+        """Create a new URL mapping.
+
+        Args:
+            mapping_data: URL mapping creation data.
+
+        Returns:
+            Created URL mapping response.
+
+        Raises:
+            URLMappingValidationError: If validation fails.
+            URLMappingDuplicateError: If mapping already exists.
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                # Validate that the URL configuration exists
+                url_config = await session.get(URLConfiguration, mapping_data.url_config_id)
+
+                if not url_config:
+                    raise URLMappingValidationError(
+                        f"URL configuration with ID {mapping_data.url_config_id} not found"
+                    )
+
+                # Check for duplicate mapping (same url_config_id + extractor_id)
+                existing = await session.scalar(
+                    select(URLMapping.id).where(
+                        URLMapping.url_config_id == mapping_data.url_config_id,
+                        URLMapping.extractor_id == mapping_data.extractor_id,
+                    ).limit(1)
+                )
+
+                if existing:
+                    raise URLMappingDuplicateError(
+                        f"URL mapping already exists for configuration {mapping_data.url_config_id} "
+                        f"with extractor {mapping_data.extractor_id}"
+                    )
+
+                # Create new mapping
+                mapping = URLMapping(
+                    url_config_id=mapping_data.url_config_id,
+                    extractor_id=mapping_data.extractor_id,
+                    rate_limit=mapping_data.rate_limit,
+                    crawler_settings=mapping_data.crawler_settings,
+                    validation_rules=mapping_data.validation_rules,
+                    is_active=mapping_data.is_active,
+                    technical_metadata=mapping_data.technical_metadata,
+                )
+
+                session.add(mapping)
+                await session.commit()
+                await session.refresh(mapping)
+
+                logger.info(f"Created URL mapping {mapping.id} for config {mapping.url_config_id}")
+
+                return self._mapping_to_response(mapping)
+
+        except IntegrityError as e:
+            logger.error(f"Integrity error creating URL mapping: {e}")
+            raise URLMappingDuplicateError("URL mapping already exists") from e
+        except SQLAlchemyError as e:
+            logger.error(f"Database error creating URL mapping: {e}")
+            raise DatabaseError(f"Failed to create URL mapping: {e}") from e
+
+    async def get_mapping(self, mapping_id: str) -> URLMappingResponse:
+        """Get a URL mapping by ID.
+
+        Args:
+            mapping_id: URL mapping ID.
+
+        Returns:
+            URL mapping response.
+
+        Raises:
+            URLMappingNotFoundError: If mapping not found.
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                mapping = await session.get(URLMapping, mapping_id)
+
+                if not mapping:
+                    raise URLMappingNotFoundError(f"URL mapping with ID {mapping_id} not found")
+
+                return self._mapping_to_response(mapping)
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting URL mapping {mapping_id}: {e}")
+            raise DatabaseError(f"Failed to get URL mapping: {e}") from e
+
+    async def update_mapping(self, mapping_id: str, mapping_data: URLMappingUpdate) -> URLMappingResponse:
+        """Update a URL mapping.
+
+        Args:
+            mapping_id: URL mapping ID.
+            mapping_data: URL mapping update data.
+
+        Returns:
+            Updated URL mapping response.
+
+        Raises:
+            URLMappingNotFoundError: If mapping not found.
+            URLMappingValidationError: If validation fails.
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                mapping = await session.get(URLMapping, mapping_id)
+
+                if not mapping:
+                    raise URLMappingNotFoundError(f"URL mapping with ID {mapping_id} not found")
+
+                # Validate URL configuration if being updated
+                if mapping_data.url_config_id and mapping_data.url_config_id != mapping.url_config_id:
+                    url_config = await session.get(URLConfiguration, mapping_data.url_config_id)
+
+                    if not url_config:
+                        raise URLMappingValidationError(
+                            f"URL configuration with ID {mapping_data.url_config_id} not found"
+                        )
+
+                # Update fields
+                update_data = mapping_data.model_dump(exclude_unset=True)
+                for field, value in update_data.items():
+                    setattr(mapping, field, value)
+
+                mapping.updated_at = datetime.utcnow()
+
+                await session.commit()
+                await session.refresh(mapping)
+
+                logger.info(f"Updated URL mapping {mapping_id}")
+
+                return self._mapping_to_response(mapping)
+
+        except IntegrityError as e:
+            logger.error(f"Integrity error updating URL mapping {mapping_id}: {e}")
+            raise URLMappingDuplicateError("URL mapping already exists") from e
+        except SQLAlchemyError as e:
+            logger.error(f"Database error updating URL mapping {mapping_id}: {e}")
+            raise DatabaseError(f"Failed to update URL mapping: {e}") from e
+
+    async def delete_mapping(self, mapping_id: str) -> bool:
+        """Delete a URL mapping.
+
+        Args:
+            mapping_id: URL mapping ID.
+
+        Returns:
+            True if deleted successfully.
+
+        Raises:
+            URLMappingNotFoundError: If mapping not found.
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                mapping = await session.get(URLMapping, mapping_id)
+
+                if not mapping:
+                    raise URLMappingNotFoundError(f"URL mapping with ID {mapping_id} not found")
+
+                await session.delete(mapping)
+
+                logger.info(f"Deleted URL mapping {mapping_id}")
+
+                return True
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error deleting URL mapping {mapping_id}: {e}")
+            raise DatabaseError(f"Failed to delete URL mapping: {e}") from e
+
+    async def list_mappings(
+        self,
+        page: int = 1,
+        size: int = 10,
+        url_config_id: Optional[str] = None,
+        extractor_id: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> URLMappingListResponse:
+        """List URL mappings with filtering and pagination.
+
+        Args:
+            page: Page number (1-based).
+            size: Items per page.
+            url_config_id: Filter by URL configuration ID.
+            extractor_id: Filter by extractor ID.
+            is_active: Filter by active status.
+            search: Search term for extractor ID.
+
+        Returns:
+            Paginated list of URL mappings.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                query = select(URLMapping)
+
+                # Apply filters
+                if url_config_id:
+                    query = query.where(URLMapping.url_config_id == url_config_id)
+
+                if extractor_id:
+                    query = query.where(URLMapping.extractor_id == extractor_id)
+
+                if is_active is not None:
+                    query = query.where(URLMapping.is_active == is_active)
+
+                if search:
+                    query = query.where(
+                        or_(
+                            URLMapping.extractor_id.ilike(f"%{search}%"),
+                            URLMapping.url_config_id.ilike(f"%{search}%")
+                        )
+                    )
+
+                # Get total count
+                total = await session.scalar(select(func.count()).select_from(query.subquery()))
+
+                # Apply pagination
+                offset = (page - 1) * size
+                mappings = (await session.scalars(
+                    query.order_by(desc(URLMapping.created_at)).offset(offset).limit(size)
+                )).all()
+
+                # Calculate pagination info
+                pages = (total + size - 1) // size
+
+                return URLMappingListResponse(
+                    items=[self._mapping_to_response(mapping) for mapping in mappings],
+                    total=total,
+                    page=page,
+                    size=size,
+                    pages=pages,
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error listing URL mappings: {e}")
+            raise DatabaseError(f"Failed to list URL mappings: {e}") from e
+
+    async def get_mappings_by_extractor(self, extractor_id: str) -> List[URLMappingResponse]:
+        """Get all URL mappings using an extractor.
+
+        Args:
+            extractor_id: Extractor ID.
+
+        Returns:
+            URL mappings using the extractor, newest first.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        return await self._get_mappings_where(URLMapping.extractor_id == extractor_id)
+
+    async def get_mappings_by_url_config(self, url_config_id: str) -> List[URLMappingResponse]:
+        """Get all URL mappings of a URL configuration.
+
+        Args:
+            url_config_id: URL configuration ID.
+
+        Returns:
+            URL mappings of the configuration, newest first.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        return await self._get_mappings_where(URLMapping.url_config_id == url_config_id)
+
+    async def get_stats(self) -> URLMappingStats:
+        """Get URL mapping statistics.
+
+        Returns:
+            URL mapping statistics.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                # One grouped query gives every count
+                rows = (await session.execute(
+                    select(URLMapping.extractor_id, URLMapping.is_active, func.count(URLMapping.id))
+                    .group_by(URLMapping.extractor_id, URLMapping.is_active)
+                )).all()
+
+                extractor_counts = {}
+                total_mappings = active_mappings = 0
+                for extractor_id, is_active, count in rows:
+                    extractor_counts[extractor_id] = extractor_counts.get(extractor_id, 0) + count
+                    total_mappings += count
+                    if is_active:
+                        active_mappings += count
+
+                return URLMappingStats(
+                    total_mappings=total_mappings,
+                    active_mappings=active_mappings,
+                    inactive_mappings=total_mappings - active_mappings,
+                    extractors_count=extractor_counts,
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting URL mapping stats: {e}")
+            raise DatabaseError(f"Failed to get URL mapping stats: {e}") from e
+
+    async def bulk_update_status(self, bulk_update: BulkStatusUpdate) -> BulkStatusUpdateResponse:
+        """Bulk update status of multiple URL mappings.
+
+        Args:
+            bulk_update: Bulk status update data.
+
+        Returns:
+            Bulk update response.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                found_ids = set((await session.scalars(
+                    select(URLMapping.id).where(URLMapping.id.in_(bulk_update.mapping_ids))
+                )).all())
+
+                if found_ids:
+                    await session.execute(
+                        update(URLMapping)
+                        .where(URLMapping.id.in_(found_ids))
+                        .values(
+                            is_active=bulk_update.status == URLMappingStatus.ACTIVE,
+                            updated_at=datetime.utcnow(),
+                        )
+                    )
+
+                failed_ids = [mapping_id for mapping_id in bulk_update.mapping_ids if mapping_id not in found_ids]
+
+                logger.info(f"Bulk updated {len(found_ids)} URL mappings, {len(failed_ids)} failed")
+
+                return BulkStatusUpdateResponse(
+                    updated_count=len(found_ids),
+                    failed_ids=failed_ids,
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in bulk status update: {e}")
+            raise DatabaseError(f"Failed to bulk update status: {e}") from e
+
+    async def health_check(self) -> HealthCheckResponse:
+        """Perform health check.
+
+        Returns:
+            Health check response.
+
+        Raises:
+            DatabaseError: If database is not accessible.
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                # Test database connection
+                await session.execute(text("SELECT 1"))
+
+                return HealthCheckResponse(
+                    status="healthy",
+                    timestamp=datetime.utcnow().isoformat(),
+                    version="1.0.0",
+                    database="connected",
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database health check failed: {e}")
+            raise DatabaseError(f"Database health check failed: {e}") from e
+
+    async def _get_mappings_where(self, condition) -> List[URLMappingResponse]:
+        """Get every URL mapping matching a condition, newest first."""
+        try:
+            async with self.db_manager.get_session() as session:
+                mappings = (await session.scalars(
+                    select(URLMapping).where(condition).order_by(desc(URLMapping.created_at))
+                )).all()
+                return [self._mapping_to_response(mapping) for mapping in mappings]
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting URL mappings: {e}")
+            raise DatabaseError(f"Failed to get URL mappings: {e}") from e
+
+    # Responses are built exactly as by the synchronous service
+    _mapping_to_response = URLMappingService._mapping_to_response
+
+
+# Global async service instance
+_async_service_instance: Optional[AsyncURLMappingService] = None
+
+
+def get_async_service() -> AsyncURLMappingService:
+    """Get async URL mapping service instance.
+
+    Returns:
+        AsyncURLMappingService instance.
+    """
+    global _async_service_instance
+
+    if _async_service_instance is None:
+        _async_service_instance = AsyncURLMappingService()
+
+    return _async_service_instance
@@ -0,0 +1,145 @@
+"""Unit tests for the async URL mapping service.
+
+These tests run the service against in-memory and file SQLite databases
+through SQLAlchemy's asyncio engine.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.url_mapping_service.async_database import AsyncDatabaseManager, to_async_url
+from src.url_mapping_service.async_service import AsyncURLMappingService
+from src.url_mapping_service.config import Settings
+from src.url_mapping_service.exceptions import (
+    URLMappingDuplicateError,
+    URLMappingNotFoundError,
+    URLMappingValidationError,
+)
+from src.url_mapping_service.models import (
+    BulkStatusUpdate,
+    URLConfiguration,
+    URLMappingCreate,
+    URLMappingStatus,
+    URLMappingUpdate,
+)
+
+
+async def make_service(database_url):
+    manager = AsyncDatabaseManager(Settings(database_url=database_url, backup_location="/tmp"))
+    await manager.create_tables()
+    async with manager.get_session() as session:
+        for config_id in ("config-1", "config-2"):
+            session.add(URLConfiguration(
+                id=config_id, name=config_id, url=f"https://{config_id}.example.com",
+                profile_type="trader", category="prices",
+            ))
+    return manager, AsyncURLMappingService(manager)
+
+
+@pytest.fixture
+async def service():
+    manager, service = await make_service("sqlite:///:memory:")
+    yield service
+    await manager.close()
+
+
+def test_to_async_url():
+    """Synchronous driver URLs are switched to async drivers."""
+    assert to_async_url("sqlite:///./url_mappings.db").drivername == "sqlite+aiosqlite"
+    assert to_async_url("postgresql://u:p@db/app").drivername == "postgresql+asyncpg"
+    assert to_async_url("postgresql+psycopg2://u:p@db/app").drivername == "postgresql+asyncpg"
+    assert to_async_url("sqlite+aiosqlite:///x.db").drivername == "sqlite+aiosqlite"
+
+
+def test_package_import_leaves_async_service_unloaded():
+    """The synchronous service imports without the asyncio extras."""
+    code = (
+        "import sys\n"
+        "from src.url_mapping_service import URLMappingService\n"
+        "assert 'src.url_mapping_service.async_service' not in sys.modules\n"
+        "from src.url_mapping_service import AsyncURLMappingService\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
+
+
+async def test_crud_round_trip(service):
+    """Mappings can be created, read, updated and deleted."""
+    created = await service.create_mapping(URLMappingCreate(url_config_id="config-1", extractor_id="crawl4ai"))
+    assert created.created_at
+
+    fetched = await service.get_mapping(created.id)
+    assert fetched.extractor_id == "crawl4ai"
+
+    updated = await service.update_mapping(created.id, URLMappingUpdate(rate_limit=5))
+    assert updated.rate_limit == 5
+    assert updated.extractor_id == "crawl4ai"
+
+    assert await service.delete_mapping(created.id)
+    with pytest.raises(URLMappingNotFoundError):
+        await service.get_mapping(created.id)
+
+
+async def test_create_validates_and_rejects_duplicates(service):
+    """Unknown configurations and duplicate extractor mappings are rejected."""
+    with pytest.raises(URLMappingValidationError):
+        await service.create_mapping(URLMappingCreate(url_config_id="missing", extractor_id="crawl4ai"))
+
+    await service.create_mapping(URLMappingCreate(url_config_id="config-1", extractor_id="crawl4ai"))
+    with pytest.raises(URLMappingDuplicateError):
+        await service.create_mapping(URLMappingCreate(url_config_id="config-1", extractor_id="crawl4ai"))
+
+
+async def test_list_stats_and_bulk_update(service):
+    """Listing filters and paginates, stats and bulk updates count mappings."""
+    ids = []
+    for config_id in ("config-1", "config-2"):
+        for extractor_id in ("crawl4ai", "scrapy", "playwright"):
+            mapping = await service.create_mapping(
+                URLMappingCreate(url_config_id=config_id, extractor_id=extractor_id)
+            )
+            ids.append(mapping.id)
+
+    page = await service.list_mappings(page=2, size=2, url_config_id="config-1")
+    assert (page.total, page.pages, len(page.items)) == (3, 2, 1)
+    assert len(await service.get_mappings_by_extractor("scrapy")) == 2
+
+    result = await service.bulk_update_status(
+        BulkStatusUpdate(mapping_ids=ids[:2] + ["missing"], status=URLMappingStatus.INACTIVE)
+    )
+    assert result.updated_count == 2
+    assert result.failed_ids == ["missing"]
+
+    stats = await service.get_stats()
+    assert (stats.total_mappings, stats.active_mappings, stats.inactive_mappings) == (6, 4, 2)
+    assert stats.extractors_count == {"crawl4ai": 2, "scrapy": 2, "playwright": 2}
+    assert (await service.list_mappings(is_active=False)).total == 2
+
+
+async def test_requests_do_not_block_event_loop(tmp_path):
+    """Queries leave the event loop free for other coroutines."""
+    manager, service = await make_service(f"sqlite:///{tmp_path / 'mappings.db'}")
+    await service.create_mapping(URLMappingCreate(url_config_id="config-1", extractor_id="crawl4ai"))
+
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(service.list_mappings() for _ in range(20)))
+    done.set()
+    await task
+
+    assert ticks > 20
+    assert time.perf_counter() - started < 10
+    await manager.close()
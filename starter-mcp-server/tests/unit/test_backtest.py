@@ -0,0 +1,108 @@
+"""Unit tests for the vectorized backtest engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.config import Settings
+from src.cry_a_4mcp.processing.backtest import (
+    forward_fill,
+    ma_crossover,
+    parameter_sweep,
+    rsi_reversion,
+    run_backtest,
+)
+from src.cry_a_4mcp.processing.trading_signals import TimeFrame, TradingSignalsGenerator
+
+
+def loop_equity(close, positions, initial_capital, cost_rate):
+    """Per-bar reference for run_backtest."""
+    symbols, bars = close.shape
+    equity, held = [initial_capital], [0.0] * symbols
+    for t in range(bars):
+        total = 0.0
+        for s in range(symbols):
+            ret = held[s] * (close[s, t] / close[s, t - 1] - 1) if t else 0.0
+            if positions[s, t] != held[s]:
+                ret -= (abs(held[s]) + abs(positions[s, t])) * cost_rate
+            held[s] = positions[s, t]
+            total += ret / symbols
+        equity.append(equity[-1] * (1 + total))
+    return equity[1:]
+
+
+def test_equity_matches_loop():
+    rng = np.random.default_rng(5)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(3, 500)), axis=1))
+    positions = rng.choice([-1.0, 0.0, 1.0], size=close.shape, p=[0.05, 0.8, 0.15])
+    positions = forward_fill(np.where(rng.random(close.shape) < 0.05, positions, np.nan))
+
+    metrics = run_backtest(close, positions, initial_capital=1000.0, fee_rate=0.001, slippage=0.0005)
+    np.testing.assert_allclose(metrics.equity, loop_equity(close, positions, 1000.0, 0.0015), rtol=1e-12)
+    assert metrics.total_costs > 0
+    assert 0 <= metrics.max_drawdown <= 100
+
+
+def test_trade_statistics():
+    close = np.array([[100.0, 110.0, 121.0, 100.0, 90.0, 94.5]])
+    positions = np.array([[1.0, 1.0, 0.0, 1.0, 1.0, 1.0]])
+
+    metrics = run_backtest(close, positions, fee_rate=0.0, slippage=0.0)
+    # First trade earns +10% twice; the second loses 10% then gains 5%
+    assert metrics.total_trades == 2
+    assert (metrics.winning_trades, metrics.losing_trades) == (1, 1)
+    assert metrics.avg_win == pytest.approx(20.0)
+    assert metrics.avg_loss == pytest.approx(-5.0)
+    assert metrics.avg_holding_bars == pytest.approx(2.5)
+    assert metrics.final_capital == pytest.approx(10000 * 1.1 * 1.1 * 0.9 * 1.05)
+
+
+def test_costs_are_charged_on_both_legs_of_a_flip():
+    close = np.full((1, 4), 100.0)
+    positions = np.array([[1.0, -1.0, -1.0, 0.0]])
+    metrics = run_backtest(close, positions, fee_rate=0.001, slippage=0.0)
+    assert metrics.final_capital == pytest.approx(10000 * 0.999 * 0.998 * 0.999)
+    assert metrics.total_trades == 2
+    assert metrics.profit_factor == 0.0
+
+
+def test_forward_fill_holds_events():
+    events = np.array([[np.nan, 1.0, np.nan, 0.0, np.nan], [1.0, np.nan, np.nan, np.nan, -1.0]])
+    assert forward_fill(events).tolist() == [[0.0, 1.0, 1.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0, -1.0]]
+
+
+def test_strategies_only_hold_known_positions():
+    rng = np.random.default_rng(9)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(2, 300)), axis=1))
+    for positions in (ma_crossover(close, close, close), rsi_reversion(close, close, close)):
+        assert positions.shape == close.shape
+        assert set(np.unique(positions)) <= {0.0, 1.0}
+
+
+def test_parameter_sweep_matches_direct_runs():
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(2, 400)), axis=1))
+    grid = [{"fast": 5, "slow": 20}, {"fast": 10, "slow": 50}]
+
+    results = parameter_sweep(close, close, close, ma_crossover, grid, max_workers=2, fee_rate=0.0)
+
+    assert [params for params, _ in results] == grid
+    for params, summary in results:
+        expected = run_backtest(close, ma_crossover(close, close, close, **params), fee_rate=0.0)
+        assert summary["final_capital"] == pytest.approx(expected.final_capital)
+
+
+async def test_generator_backtest_samples_results():
+    generator = TradingSignalsGenerator(Settings())
+    start = datetime(2024, 1, 1)
+    result = await generator.backtest("ma_crossover", ["btc", "eth"], TimeFrame.MINUTE_1,
+                                      start, start + timedelta(days=3))
+
+    assert result.symbol == "BTC,ETH"
+    assert result.metadata["bars"] == 3 * 24 * 60 + 1
+    assert len(result.equity_curve) == 1000
+    assert result.equity_curve[0][0] == start
+    assert result.equity_curve[-1][0] == start + timedelta(days=3)
+    assert len(result.signals) <= 100
+    assert result.final_capital == pytest.approx(result.equity_curve[-1][1])
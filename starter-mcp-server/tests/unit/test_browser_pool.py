@@ -0,0 +1,192 @@
+"""Unit tests for the browser pool.
+
+These tests cover warming, reuse, health checks, recycling and closing of
+pooled browsers using a fake crawler.
+"""
+
+import asyncio
+
+import pytest
+
+from src.cry_a_4mcp.crypto_crawler.browser_pool import BrowserPool, BrowserPoolClosedError
+
+
+class FakeCrawler:
+    """Crawler stand-in that records its lifecycle."""
+
+    instances = []
+
+    def __init__(self):
+        self.ready = False
+        self.closed = False
+        self.pages = 0
+        FakeCrawler.instances.append(self)
+
+    async def start(self):
+        await asyncio.sleep(0)
+        self.ready = True
+
+    async def close(self):
+        self.ready = False
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    FakeCrawler.instances = []
+
+
+async def test_browsers_are_warmed_and_reused():
+    """Browsers start once and serve many crawls."""
+    pool = BrowserPool(FakeCrawler, size=2)
+    await pool.start()
+    assert len(FakeCrawler.instances) == 2
+    assert all(crawler.ready for crawler in FakeCrawler.instances)
+
+    for _ in range(10):
+        async with pool.acquire() as crawler:
+            crawler.pages += 1
+
+    assert len(FakeCrawler.instances) == 2
+    assert pool.get_stats()["pages_served"] == 10
+    await pool.close()
+    assert all(crawler.closed for crawler in FakeCrawler.instances)
+
+
+async def test_checkout_waits_when_all_browsers_busy():
+    """No more crawls run at once than there are browsers."""
+    pool = BrowserPool(FakeCrawler, size=2)
+    active = 0
+    peak = 0
+
+    async def crawl():
+        nonlocal active, peak
+        async with pool.acquire():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(crawl() for _ in range(6)))
+    assert peak == 2
+    assert pool.get_stats()["in_use"] == 0
+    await pool.close()
+
+
+async def test_recycled_after_max_pages():
+    """A browser is replaced after serving its page quota."""
+    pool = BrowserPool(FakeCrawler, size=1, max_pages_per_browser=3)
+    for _ in range(7):
+        async with pool.acquire():
+            pass
+
+    assert len(FakeCrawler.instances) == 3
+    assert FakeCrawler.instances[0].closed
+    assert pool.get_stats()["recycled_pages"] == 2
+    await pool.close()
+
+
+async def test_unhealthy_browser_replaced_on_checkout():
+    """A browser that is no longer ready is replaced before use."""
+    pool = BrowserPool(FakeCrawler, size=1)
+    await pool.start()
+    FakeCrawler.instances[0].ready = False
+
+    async with pool.acquire() as crawler:
+        assert crawler is FakeCrawler.instances[1]
+    assert pool.get_stats()["recycled_unhealthy"] == 1
+    await pool.close()
+
+
+async def test_browser_error_recycles_browser():
+    """A browser whose crawl lost its connection is not handed out again."""
+    pool = BrowserPool(FakeCrawler, size=1)
+    with pytest.raises(ConnectionError):
+        async with pool.acquire():
+            raise ConnectionResetError("browser crashed")
+
+    async with pool.acquire() as crawler:
+        assert crawler is not FakeCrawler.instances[0]
+    assert FakeCrawler.instances[0].closed
+    await pool.close()
+
+
+async def test_caller_error_keeps_browser():
+    """Errors unrelated to the browser propagate without a restart."""
+    pool = BrowserPool(FakeCrawler, size=1)
+    with pytest.raises(ValueError):
+        async with pool.acquire():
+            raise ValueError("bad selector")
+
+    async with pool.acquire() as crawler:
+        assert crawler is FakeCrawler.instances[0]
+    assert pool.get_stats()["recycled_unhealthy"] == 0
+    await pool.close()
+
+
+async def test_page_timeout_keeps_browser():
+    """A page timeout does not recycle the browser, although it is a browser error."""
+
+    class FakeBrowserError(Exception):
+        pass
+
+    class FakeTimeoutError(FakeBrowserError):
+        pass
+
+    pool = BrowserPool(FakeCrawler, size=1, browser_errors=(FakeBrowserError,),
+                       timeout_errors=(FakeTimeoutError,))
+    with pytest.raises(FakeTimeoutError):
+        async with pool.acquire():
+            raise FakeTimeoutError("page timed out")
+
+    async with pool.acquire() as crawler:
+        assert crawler is FakeCrawler.instances[0]
+    assert len(FakeCrawler.instances) == 1
+    assert pool.get_stats()["recycled_unhealthy"] == 0
+    await pool.close()
+
+
+async def test_close_wakes_waiting_checkouts():
+    """Checkouts waiting for a browser fail once the pool closes."""
+    pool = BrowserPool(FakeCrawler, size=1)
+    async with pool.acquire():
+        waiters = [asyncio.create_task(pool.acquire().__aenter__()) for _ in range(2)]
+        await asyncio.sleep(0)
+        await pool.close()
+        results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+
+    assert all(isinstance(result, BrowserPoolClosedError) for result in results)
+    assert FakeCrawler.instances[0].closed
+    with pytest.raises(BrowserPoolClosedError):
+        async with pool.acquire():
+            pass
+
+
+async def test_recycled_on_memory_growth():
+    """A browser is replaced when memory grows past the limit."""
+    memory = [100.0]
+    pool = BrowserPool(FakeCrawler, size=1, max_memory_growth_mb=50, memory_probe=lambda: memory[0],
+                       memory_check_interval=1)
+    async with pool.acquire():
+        memory[0] = 120.0
+    assert len(FakeCrawler.instances) == 1
+
+    async with pool.acquire():
+        memory[0] = 200.0
+    assert len(FakeCrawler.instances) == 2
+    assert pool.get_stats()["recycled_memory"] == 1
+    await pool.close()
+
+
+async def test_memory_probed_every_interval():
+    """Memory is only measured on every memory_check_interval-th release."""
+    probes = []
+    pool = BrowserPool(FakeCrawler, size=1, max_memory_growth_mb=50,
+                       memory_probe=lambda: probes.append(1) or 100.0, memory_check_interval=5)
+    for _ in range(10):
+        async with pool.acquire():
+            pass
+
+    # One baseline at start, then two checks
+    assert len(probes) == 3
+    await pool.close()
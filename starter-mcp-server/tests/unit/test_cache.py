@@ -0,0 +1,72 @@
+"""Unit tests for the in-process caches."""
+
+from src.cry_a_4mcp.utils import cache as cache_module
+from src.cry_a_4mcp.utils.cache import LRUCache, normalize_query, notify_data_changed
+
+
+def test_normalize_query():
+    """Whitespace does not change the key, case does."""
+    assert normalize_query("  BTC   Price ") == normalize_query("BTC Price") == "BTC Price"
+    assert normalize_query("btc price") != normalize_query("BTC Price")
+
+
+def test_least_recently_used_entry_is_evicted():
+    """The cache keeps its most recently used entries."""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_entries_expire(monkeypatch):
+    """Entries older than the TTL are misses."""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=10, ttl=30.0)
+    cache.put("a", 1)
+    now[0] += 31
+    assert cache.get("a") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_writes_invalidate_tracking_caches():
+    """A data write clears caches that track writes and no others."""
+    tracking = LRUCache(maxsize=10, track_writes=True)
+    plain = LRUCache(maxsize=10)
+    tracking.put("a", 1)
+    plain.put("a", 1)
+
+    notify_data_changed()
+
+    assert tracking.get("a") is None
+    assert plain.get("a") == 1
+    assert tracking.get_stats()["invalidations"] == 1
+
+
+def test_stats_report_hit_rate_and_saved_latency():
+    """Hits add up the compute time of the values they return."""
+    cache = LRUCache(maxsize=10)
+    cache.put("a", 1, cost=0.25)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.667
+    assert stats["saved_seconds"] == 0.5
+
+
+def test_zero_size_disables_cache():
+    """A cache of size zero never stores anything."""
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -0,0 +1,131 @@
+"""Unit tests for the crawl frontier.
+
+These tests cover priority ordering, the global and per-host concurrency
+limits, per-host politeness delays and streaming of results.
+"""
+
+import asyncio
+import time
+
+from src.cry_a_4mcp.crypto_crawler.frontier import CrawlFrontier, host_of, priority_rank
+
+
+class RecordingFetcher:
+    """Fetch function that records concurrency per host."""
+
+    def __init__(self, delay=0.02, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.started = []
+        self.active = {}
+        self.max_active = {}
+        self.max_total = 0
+        self.starts_by_host = {}
+
+    async def __call__(self, url, item):
+        host = host_of(url)
+        self.started.append(url)
+        self.starts_by_host.setdefault(host, []).append(time.monotonic())
+        self.active[host] = self.active.get(host, 0) + 1
+        self.max_active[host] = max(self.max_active.get(host, 0), self.active[host])
+        self.max_total = max(self.max_total, sum(self.active.values()))
+        try:
+            await asyncio.sleep(self.delay)
+            if url in self.fail:
+                raise RuntimeError(f"failed {url}")
+            return f"content of {url}"
+        finally:
+            self.active[host] -= 1
+
+
+async def collect(frontier, fetch):
+    return [outcome async for outcome in frontier.run(fetch)]
+
+
+def test_priority_rank():
+    """Named priorities sort before unknown ones."""
+    assert priority_rank("high") < priority_rank("medium") < priority_rank("low")
+    assert priority_rank(None) == priority_rank("medium")
+    assert priority_rank("HIGH") == priority_rank("high")
+
+
+async def test_priority_order_with_single_worker():
+    """With one worker URLs are crawled strictly by priority."""
+    frontier = CrawlFrontier(max_concurrent=1)
+    frontier.add("https://a.com/1", "low")
+    frontier.add("https://b.com/1", "high")
+    frontier.add("https://c.com/1", "medium")
+    frontier.add("https://d.com/1", "high")
+
+    fetch = RecordingFetcher(delay=0)
+    await collect(frontier, fetch)
+    assert fetch.started == ["https://b.com/1", "https://d.com/1", "https://c.com/1", "https://a.com/1"]
+
+
+async def test_hosts_crawled_in_parallel_within_limits():
+    """Hosts run in parallel up to the global cap, one request per host."""
+    frontier = CrawlFrontier(max_concurrent=4, max_per_host=1)
+    for host in range(6):
+        for page in range(3):
+            frontier.add(f"https://site{host}.com/{page}", "high")
+
+    fetch = RecordingFetcher(delay=0.02)
+    start = time.monotonic()
+    outcomes = await collect(frontier, fetch)
+    elapsed = time.monotonic() - start
+
+    assert len(outcomes) == 18
+    assert fetch.max_total <= 4
+    assert max(fetch.max_active.values()) == 1
+    # 18 sequential fetches would take at least 0.36s
+    assert elapsed < 0.3
+
+
+async def test_host_delay_is_respected():
+    """Requests to the same host are spaced by the politeness delay."""
+    frontier = CrawlFrontier(max_concurrent=3, host_delay=0.05)
+    for page in range(3):
+        frontier.add(f"https://slow.com/{page}")
+    frontier.add("https://other.com/")
+
+    fetch = RecordingFetcher(delay=0)
+    await collect(frontier, fetch)
+
+    starts = fetch.starts_by_host["slow.com"]
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    # The other host does not wait behind the slow one
+    assert fetch.starts_by_host["other.com"][0] - starts[0] < 0.04
+
+
+async def test_results_stream_and_errors_are_reported():
+    """Results arrive as they finish and failures carry their error."""
+    frontier = CrawlFrontier(max_concurrent=2)
+    frontier.add("https://fast.com/", item={"name": "fast"})
+    frontier.add("https://broken.com/", item={"name": "broken"})
+
+    fetch = RecordingFetcher(delay=0, fail={"https://broken.com/"})
+    outcomes = {outcome.url: outcome for outcome in await collect(frontier, fetch)}
+
+    assert outcomes["https://fast.com/"].result == "content of https://fast.com/"
+    assert outcomes["https://fast.com/"].item == {"name": "fast"}
+    assert isinstance(outcomes["https://broken.com/"].error, RuntimeError)
+
+
+async def test_leaving_early_cancels_workers():
+    """Breaking out of the stream cancels the remaining crawls."""
+    frontier = CrawlFrontier(max_concurrent=2)
+    for page in range(10):
+        frontier.add(f"https://site{page}.com/")
+
+    fetch = RecordingFetcher(delay=0.01)
+    async for _ in frontier.run(fetch):
+        break
+
+    await asyncio.sleep(0.05)
+    assert len(fetch.started) < 10
+
+
+async def test_empty_frontier():
+    """Running an empty frontier yields nothing."""
+    assert await collect(CrawlFrontier(), RecordingFetcher()) == []
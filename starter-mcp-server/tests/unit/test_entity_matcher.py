@@ -0,0 +1,160 @@
+"""Unit tests for the compiled crypto entity matcher.
+
+These tests cover word-boundary matching, symbol rules, overlap resolution,
+positions and counts, the CryptoEntityExtractor built on the matcher and
+sentence-scoped triple generation.
+"""
+
+import json
+
+import pytest
+
+from src.cry_a_4mcp.crypto_crawler.entity_matcher import EntityMatcher, get_entity_matcher
+from src.cry_a_4mcp.crypto_crawler.extractors import CryptoEntityExtractor, CryptoTripleExtractor
+from src.cry_a_4mcp.crypto_crawler.models import CryptoEntity
+
+
+@pytest.fixture
+def matcher():
+    matcher = EntityMatcher()
+    matcher.load_dict({
+        "ambiguous_symbols": ["ONE"],
+        "tokens": [
+            {"name": "Bitcoin", "symbol": "BTC"},
+            {"name": "Bitcoin Cash", "symbol": "BCH"},
+            {"name": "Ethereum", "symbol": "ETH", "aliases": ["Ether"]},
+            {"name": "Solana", "symbol": "SOL"},
+            {"name": "Harmony", "symbol": "ONE", "case_sensitive": True},
+        ],
+        "exchanges": [{"name": "Binance"}],
+        "metrics": [{"name": "Altcoin Season Index", "aliases": ["altseason"]}],
+    })
+    matcher.compile()
+    return matcher
+
+
+def names(mentions):
+    return [mention.entity.name for mention in mentions]
+
+
+def test_no_matches_inside_words(matcher):
+    """Symbols and names only match on word boundaries."""
+    assert matcher.find("This method is a solution for Etherscan users") == []
+
+
+def test_names_are_case_insensitive(matcher):
+    """Names and aliases match in any case unless marked case sensitive."""
+    assert names(matcher.find("ETHEREUM and ether, binance")) == ["Ethereum", "Ethereum", "Binance"]
+    assert names(matcher.find("in harmony with Harmony")) == ["Harmony"]
+
+
+def test_symbol_rules(matcher):
+    """Symbols match in upper case or with a dollar prefix."""
+    assert names(matcher.find("BTC and sol and $sol")) == ["Bitcoin", "Solana"]
+    # Ambiguous symbols need the prefix
+    assert names(matcher.find("ONE more thing about $ONE")) == ["Harmony"]
+
+
+@pytest.mark.parametrize("text", [
+    "Investor optimism returned after the yield curve inverted.",
+    "Analysts reported stellar earnings.",
+    "The ripple effect of rate cuts hit the cosmos of small caps.",
+    "Optimism returned to markets as the polygon of support held.",
+])
+def test_ambiguous_names_ignored_in_plain_prose(text):
+    """Names that are ordinary words do not match without crypto context."""
+    assert get_entity_matcher().find(text) == []
+
+
+def test_ambiguous_names_match_with_context():
+    """Ambiguous names match next to their ticker or a crypto context word."""
+    matcher = get_entity_matcher()
+    assert names(matcher.find("Stellar (XLM) rose 4%.")) == ["Stellar", "Stellar"]
+    assert names(matcher.find("The Optimism token rallied.")) == ["Optimism"]
+    assert names(matcher.find("Curve pools lost DeFi liquidity. The yield curve inverted.")) == ["Curve Finance"]
+
+
+def test_positions_and_longest_match(matcher):
+    """Overlapping names resolve to the longest match with exact positions."""
+    text = "Bitcoin Cash, then Bitcoin."
+    mentions = matcher.find(text)
+    assert names(mentions) == ["Bitcoin Cash", "Bitcoin"]
+    assert [text[m.start:m.end] for m in mentions] == ["Bitcoin Cash", "Bitcoin"]
+    assert mentions[1].confidence > 0
+
+
+def test_counts(matcher):
+    """Counts are per entity across names, aliases and symbols."""
+    assert matcher.count("ETH, Ether and Ethereum; altseason") == {"Ethereum": 3, "Altcoin Season Index": 1}
+
+
+def test_bundled_dictionary_is_shared():
+    """The bundled dictionary is compiled once and has broad coverage."""
+    matcher = get_entity_matcher()
+    assert matcher is get_entity_matcher()
+    assert len(matcher.entities) > 300
+
+
+def test_extractor_groups_mentions(tmp_path):
+    """The extractor returns one entity per name with its mentions."""
+    extra = tmp_path / "extra.json"
+    extra.write_text(json.dumps({"tokens": [{"name": "Example Coin", "symbol": "EXC"}]}))
+    extractor = CryptoEntityExtractor({"entity_dictionaries": [str(extra)]})
+
+    entities = extractor.extract("Bitcoin hit a high. BTC traders bought EXC on Binance.")
+    by_name = {entity.name: entity for entity in entities}
+
+    assert list(by_name) == ["Bitcoin", "Example Coin", "Binance"]
+    assert by_name["Bitcoin"].properties["mention_count"] == 2
+    assert by_name["Bitcoin"].confidence == pytest.approx(0.9)
+    assert by_name["Example Coin"].properties["symbol_only"] is True
+    assert by_name["Binance"].entity_type == "exchange"
+
+
+def test_triples_reuse_entities():
+    """Triples can be built from entities that were already extracted."""
+    text = "Solana trades on Coinbase."
+    entities = CryptoEntityExtractor().extract(text)
+    triples = CryptoTripleExtractor().extract(text, entities=entities)
+    assert [(t.subject, t.predicate, t.object) for t in triples] == [("Solana", "trades_on", "Coinbase")]
+
+
+def test_trades_on_requires_same_sentence():
+    """Tokens and exchanges in different sentences are not linked."""
+    text = "Bitcoin rallied. Kraken reported record volume. Solana is listed on Kraken."
+    triples = CryptoTripleExtractor().extract(text)
+    assert [(t.subject, t.object) for t in triples] == [("Solana", "Kraken")]
+
+
+def test_repeated_cooccurrence_raises_confidence():
+    """Pairs seen together in several sentences are more confident."""
+    text = "Solana is listed on Kraken. Kraken lists Solana perpetuals. Kraken supports SOL staking."
+    (triple,) = CryptoTripleExtractor().extract(text)
+    assert triple.properties["cooccurrences"] == 3
+    assert triple.confidence == pytest.approx(0.8)
+
+
+def test_sentence_window():
+    """A sentence window links entities in neighbouring sentences."""
+    text = "Bitcoin rallied. Kraken reported record volume."
+    assert CryptoTripleExtractor().extract(text) == []
+    triples = CryptoTripleExtractor({"triple_sentence_window": 1}).extract(text)
+    assert [(t.subject, t.object) for t in triples] == [("Bitcoin", "Kraken")]
+
+
+def test_entities_without_positions():
+    """Entities from other sources are located in the text."""
+    text = "Dogecoin jumped on Binance."
+    entities = [
+        CryptoEntity(name="Dogecoin", entity_type="token", symbol="DOGE", confidence=0.9, context="external"),
+        CryptoEntity(name="Binance", entity_type="exchange", confidence=0.9, context="external"),
+    ]
+    triples = CryptoTripleExtractor().extract(text, entities=entities)
+    assert [(t.subject, t.object) for t in triples] == [("Dogecoin", "Binance")]
+
+
+def test_non_alphabetic_ticker_kept_as_property():
+    """Tickers the entity model cannot hold are kept in the properties."""
+    (entity,) = CryptoEntityExtractor().extract("Swapped on 1inch today")
+    assert entity.symbol is None
+    assert entity.properties["ticker"] == "1INCH"
@@ -0,0 +1,108 @@
+"""Unit tests for reciprocal rank fusion in hybrid search.
+
+These tests cover deduplication, provenance and ranking of fused results,
+and the over-fetching hybrid search path with fake backends.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.cry_a_4mcp.retrieval.hybrid_search import (
+    HybridSearchEngine,
+    SearchResult,
+    content_key,
+    reciprocal_rank_fusion,
+)
+
+
+def result(content, confidence, source_type="vector", url=None):
+    return SearchResult(
+        content=content,
+        confidence=confidence,
+        source_type=source_type,
+        sources=[{"url": url}] if url else [{"entity": "BTC"}],
+    )
+
+
+def test_content_key_ignores_case_punctuation_and_spacing():
+    """Trivially different copies of a text share a key."""
+    assert content_key("Bitcoin  trades on Binance.") == content_key("bitcoin trades on binance")
+    assert content_key("Bitcoin trades on Binance") != content_key("Bitcoin trades on Kraken")
+
+
+def test_results_in_both_lists_are_merged_with_provenance():
+    """A result found by both backends is merged and ranked first."""
+    fused = reciprocal_rank_fusion({
+        "vector": [result("Only vector", 0.95, url="a"), result("Shared result", 0.8, url="b")],
+        "graph": [result("Shared result.", 0.9, "graph"), result("Only graph", 0.9, "graph")],
+    })
+
+    assert [r.content for r in fused] == ["Shared result", "Only vector", "Only graph"]
+    shared = fused[0]
+    assert shared.source_type == "hybrid"
+    assert shared.confidence == 0.9
+    assert shared.fusion_score == pytest.approx(1 / 62 + 1 / 61)
+    assert shared.provenance == [
+        {"source": "vector", "rank": 2, "score": 0.8},
+        {"source": "graph", "rank": 1, "score": 0.9},
+    ]
+    assert shared.sources == [{"url": "b"}, {"entity": "BTC"}]
+
+
+def test_fusion_ignores_score_scales():
+    """Ranks, not raw scores, decide the order across backends."""
+    fused = reciprocal_rank_fusion({
+        "vector": [result("Vector top", 0.31)],
+        "graph": [result("Graph top", 0.99, "graph"), result("Graph second", 0.98, "graph")],
+    }, weights={"vector": 2.0})
+
+    assert [r.content for r in fused] == ["Vector top", "Graph top", "Graph second"]
+
+
+def test_duplicates_within_a_list_count_once():
+    """Repeated content in one backend keeps only its best rank."""
+    fused = reciprocal_rank_fusion({"vector": [result("Same", 0.9), result("same!", 0.8), result("Other", 0.7)]})
+
+    assert [r.content for r in fused] == ["Same", "Other"]
+    assert fused[1].provenance[0]["rank"] == 2
+
+
+def test_inputs_are_not_modified():
+    """Fusion works on copies of the backend results."""
+    vector = [result("Shared", 0.8, url="a")]
+    reciprocal_rank_fusion({"vector": vector, "graph": [result("Shared", 0.9, "graph")]})
+
+    assert vector[0].sources == [{"url": "a"}]
+    assert vector[0].fusion_score is None
+
+
+async def test_hybrid_search_overfetches_and_fuses():
+    """Both backends are asked for more candidates than the final result count."""
+    settings = SimpleNamespace(
+        search_result_cache_size=0,
+        search_result_cache_ttl=30.0,
+        search_overfetch_factor=3,
+        search_rrf_k=60,
+    )
+    engine = HybridSearchEngine(settings)
+    limits = {}
+
+    async def vector_search(query, max_results, confidence_threshold):
+        limits["vector"] = max_results
+        return [result(f"Doc {i}", 0.9 - i / 100) for i in range(max_results)]
+
+    async def graph_search(query, max_results, confidence_threshold):
+        limits["graph"] = max_results
+        return [result("Doc 5", 0.9, "graph"), result("Low confidence path", 0.2, "graph")]
+
+    engine._vector_search = vector_search
+    engine._graph_search = graph_search
+
+    results = await engine.search("bitcoin etf flows and exchange listings", mode="hybrid",
+                                  max_results=2, confidence_threshold=0.5)
+
+    assert limits == {"vector": 6, "graph": 6}
+    # Found by both backends, rank 6 in vector search beats the top vector-only hit
+    assert [r.content for r in results] == ["Doc 5", "Doc 0"]
+    assert [p["source"] for p in results[0].provenance] == ["vector", "graph"]
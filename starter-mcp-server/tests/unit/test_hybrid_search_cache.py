@@ -0,0 +1,97 @@
+"""Unit tests for the hybrid search caches.
+
+These tests use fake vector and graph stores that count their calls and check
+that repeated queries are served from the caches until data is written.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.retrieval.hybrid_search import HybridSearchEngine
+from src.cry_a_4mcp.storage.vector_store import VectorStore
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            self.encoded.append(texts)
+            return np.ones(4, dtype=np.float32)
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+class FakeClient:
+    def __init__(self):
+        self.searches = 0
+        self.upserts = 0
+
+    def search(self, **kwargs):
+        self.searches += 1
+        payload = {"content": "Bitcoin is a decentralized digital currency.", "url": "https://example.com"}
+        return [SimpleNamespace(id=1, score=0.9, payload=payload)]
+
+    def upsert(self, collection_name, points):
+        self.upserts += 1
+
+
+SETTINGS = SimpleNamespace(
+    qdrant_collection_name="test",
+    qdrant_vector_size=4,
+    qdrant_upsert_batch_size=8,
+    qdrant_max_inflight_upserts=1,
+    embedding_batch_size=None,
+    embedding_device="cpu",
+    embedding_chunk_words=200,
+    embedding_chunk_overlap=40,
+    query_embedding_cache_size=16,
+    search_result_cache_size=16,
+    search_result_cache_ttl=30.0,
+    search_overfetch_factor=3,
+    search_rrf_k=60,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = HybridSearchEngine(SETTINGS)
+    engine.vector_store = VectorStore(SETTINGS)
+    engine.vector_store.client = FakeClient()
+    engine.vector_store.embedding_model = FakeModel()
+    return engine
+
+
+async def test_repeated_queries_use_result_cache(engine):
+    """Equal queries after normalization run the search once."""
+    first = await engine.search("Bitcoin adoption", mode="vector_only", confidence_threshold=0.5)
+    second = await engine.search("  Bitcoin   adoption ", mode="vector_only", confidence_threshold=0.5)
+
+    assert first == second
+    assert engine.vector_store.client.searches == 1
+    stats = engine.get_cache_stats()
+    assert stats["results"]["hits"] == 1
+    assert stats["results"]["saved_seconds"] >= 0
+
+
+async def test_result_cache_keyed_by_parameters(engine):
+    """Different limits or thresholds are separate searches sharing the embedding."""
+    await engine.search("bitcoin adoption", mode="vector_only", max_results=5)
+    await engine.search("bitcoin adoption", mode="vector_only", max_results=10)
+
+    assert engine.vector_store.client.searches == 2
+    assert engine.vector_store.embedding_model.encoded == ["bitcoin adoption"]
+    assert engine.get_cache_stats()["query_embeddings"]["hits"] == 1
+
+
+async def test_document_write_invalidates_results(engine):
+    """Adding a document drops cached results but keeps query embeddings."""
+    await engine.search("bitcoin adoption", mode="vector_only")
+    await engine.vector_store.add_document("Bitcoin ETFs launched.", {"id": "doc"})
+    await engine.search("bitcoin adoption", mode="vector_only")
+
+    assert engine.vector_store.client.searches == 2
+    assert engine.vector_store.embedding_model.encoded == ["bitcoin adoption"]
+    assert engine.get_cache_stats()["results"]["invalidations"] == 1
@@ -0,0 +1,193 @@
+"""Unit tests for bulk knowledge graph writes.
+
+These tests use a fake Neo4j driver that records the queries it receives and
+check grouping by label, batching, endpoint resolution and the dictionary
+based ``update`` entry point.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.cry_a_4mcp.storage.knowledge_graph_manager import (
+    EntityType,
+    GraphEntity,
+    GraphRelationship,
+    KnowledgeGraphManager,
+    RelationshipType,
+)
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    async def single(self):
+        return self.records[0] if self.records else None
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self.records:
+            yield record
+
+
+class FakeTransaction:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def run(self, query, rows, now):
+        self.driver.batches.append((query, rows))
+        return FakeResult([{"added": len(rows), "written": len(rows)}])
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        self.driver.sessions += 1
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute_write(self, work):
+        return await work(FakeTransaction(self.driver))
+
+    async def run(self, query, ids):
+        self.driver.lookups.append(ids)
+        return FakeResult([
+            {"id": entity_id, "label": label}
+            for entity_id, label in self.driver.existing.items()
+            if entity_id in ids
+        ])
+
+
+class FakeDriver:
+    def __init__(self, existing=None):
+        self.existing = existing or {}
+        self.batches = []
+        self.lookups = []
+        self.sessions = 0
+
+    def session(self, database=None):
+        return FakeSession(self)
+
+
+@pytest.fixture
+def manager():
+    settings = SimpleNamespace(neo4j_database="neo4j", neo4j_batch_size=2)
+    manager = KnowledgeGraphManager(settings)
+    manager.driver = FakeDriver(existing={"exchange:kraken": "Exchange"})
+    return manager
+
+
+async def test_entities_grouped_by_label_and_batched(manager):
+    """Entities are written per label in UNWIND batches within one session."""
+    entities = [GraphEntity(id=f"c{i}", name=f"Coin {i}", type=EntityType.CRYPTOCURRENCY) for i in range(5)]
+    entities.append(GraphEntity(id="e1", name="Binance", type=EntityType.EXCHANGE))
+
+    result = await manager.add_entities(entities)
+
+    assert manager.driver.sessions == 1
+    assert [len(rows) for _, rows in manager.driver.batches] == [2, 2, 1, 1]
+    assert all(query.startswith("UNWIND $rows AS row") for query, _ in manager.driver.batches)
+    assert "MERGE (n:Cryptocurrency {id: row.id})" in manager.driver.batches[0][0]
+    assert "MERGE (n:Exchange {id: row.id})" in manager.driver.batches[-1][0]
+    assert result.entities_added == 6
+    assert result.batches == 4
+
+
+async def test_relationships_use_label_qualified_lookups(manager):
+    """Endpoints are matched through their labels, resolving unknown ids once."""
+    entities = [GraphEntity(id="c1", name="Bitcoin", type=EntityType.CRYPTOCURRENCY)]
+    relationships = [
+        GraphRelationship(source_id="c1", target_id="exchange:kraken", type=RelationshipType.TRADES_ON),
+        GraphRelationship(source_id="c1", target_id="unknown", type=RelationshipType.TRADES_ON),
+    ]
+
+    result = await manager.bulk_ingest(entities, relationships)
+
+    assert len(manager.driver.lookups) == 1
+    assert sorted(manager.driver.lookups[0]) == ["exchange:kraken", "unknown"]
+    query, rows = manager.driver.batches[-1]
+    assert "MATCH (a:Cryptocurrency {id: row.source_id})" in query
+    assert "MATCH (b:Exchange {id: row.target_id})" in query
+    assert "MERGE (a)-[n:TRADES_ON]->(b)" in query
+    assert rows == [{"source_id": "c1", "target_id": "exchange:kraken", "properties": rows[0]["properties"]}]
+    assert result.relationships_added == 1
+    assert result.relationships_skipped == 1
+
+
+async def test_update_from_dictionaries(manager):
+    """The tool entry point maps names, types and provenance."""
+    result = await manager.update(
+        entities=[{"name": "Solana", "type": "token"}, {"name": "Coinbase", "type": "exchange"}],
+        relationships=[
+            {"source": "Solana", "target": "Coinbase", "type": "trades_on"},
+            {"source": "Solana", "target": "missing", "type": "listed_on"},
+        ],
+        source_url="https://example.com",
+        mode="merge",
+    )
+
+    entity_rows = [row for query, rows in manager.driver.batches if "MERGE (n:" in query for row in rows]
+    assert {row["id"] for row in entity_rows} == {"cryptocurrency:solana", "exchange:coinbase"}
+    assert all(row["properties"]["source_url"] == "https://example.com" for row in entity_rows)
+    rel_queries = [query for query, _ in manager.driver.batches if "MERGE (a)" in query]
+    assert len(rel_queries) == 1
+    assert result.relationships_added == 1
+    assert result.relationships_skipped == 1
+    assert result.entities_per_second > 0
+
+
+async def test_unknown_write_mode_rejected(manager):
+    """Only merge, replace and append modes are accepted."""
+    with pytest.raises(ValueError):
+        await manager.add_entities([], mode="upsert")
+
+
+async def test_failed_batch_is_reported(manager, monkeypatch):
+    """A failing batch is counted and the others are still written."""
+    calls = []
+
+    async def flaky_execute_write(self, work):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("deadlock")
+        return await work(FakeTransaction(self.driver))
+
+    monkeypatch.setattr(FakeSession, "execute_write", flaky_execute_write)
+    entities = [GraphEntity(id=f"c{i}", name=f"Coin {i}", type=EntityType.CRYPTOCURRENCY) for i in range(4)]
+    result = await manager.add_entities(entities)
+
+    assert result.failed_batches == 1
+    assert result.entities_added == 2
+    assert result.errors == ["deadlock"]
+
+
+async def test_replace_mode_keeps_creation_time(manager):
+    """Creation time is only set on create, also when replacing properties."""
+    await manager.add_entities([GraphEntity(id="c1", name="Bitcoin", type=EntityType.CRYPTOCURRENCY)],
+                               mode="replace")
+
+    query, rows = manager.driver.batches[0]
+    assert "created_at" not in rows[0]["properties"]
+    assert "ON CREATE SET n = properties, n.created_at = coalesce(properties.created_at, $now)" in query
+    assert "created_at: coalesce(n.created_at, properties.created_at)" in query
+
+
+async def test_update_skips_unknown_entity_types(manager):
+    """An entity with an unknown type is skipped instead of failing the update."""
+    result = await manager.update(
+        entities=[{"name": "Solana", "type": "token"}, {"name": "Mystery", "type": "gadget"}],
+        relationships=[{"source": "Mystery", "target": "Solana", "type": "related_to"}],
+    )
+
+    entity_rows = [row for query, rows in manager.driver.batches if "MERGE (n:" in query for row in rows]
+    assert [row["id"] for row in entity_rows] == ["cryptocurrency:solana"]
+    assert result.entities_added == 1
+    assert result.entities_skipped == 1
+    assert result.relationships_skipped == 1
@@ -0,0 +1,160 @@
+"""Unit tests for the local OHLCV market data store."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.config import Settings
+from src.cry_a_4mcp.processing.crypto_analyzer import CryptoAnalyzer
+from src.cry_a_4mcp.processing.indicators import compute_indicators
+from src.cry_a_4mcp.processing.ohlcv_store import OHLCVStore, to_millis
+from src.cry_a_4mcp.processing.trading_signals import TimeFrame, TradingSignalsGenerator
+
+START = datetime(2024, 1, 1)
+HOUR_MS = 3600 * 1000
+
+
+def make_bars(bars: int, start: datetime = START, step_ms: int = HOUR_MS, seed: int = 3):
+    """Random-walk bars as keyword arguments for OHLCVStore.append."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, size=bars)))
+    return {
+        "time": to_millis(start) + step_ms * np.arange(bars),
+        "open": close,
+        "high": close * 1.01,
+        "low": close * 0.99,
+        "close": close,
+        "volume": np.full(bars, 10.0),
+    }
+
+
+def test_range_queries_return_memory_mapped_views(tmp_path):
+    store = OHLCVStore(tmp_path)
+    bars = make_bars(100)
+    assert store.append("btc", "1h", **bars) == 100
+
+    series = store.read("BTC", "1h", START + timedelta(hours=10), START + timedelta(hours=19))
+    assert len(series) == 10
+    np.testing.assert_array_equal(series.close, bars["close"][10:20])
+    assert isinstance(series.close.base, np.memmap) or isinstance(series.close, np.memmap)
+    assert not series.close.flags.writeable
+
+    # Bounds between bars and outside the data
+    assert len(store.read("BTC", "1h", START + timedelta(minutes=30), START + timedelta(minutes=90))) == 1
+    assert len(store.read("BTC", "1h", START - timedelta(days=1), START - timedelta(hours=1))) == 0
+    np.testing.assert_array_equal(store.tail("BTC", "1h", 5).time, bars["time"][-5:])
+    assert store.list_series() == [("BTC", "1h")]
+
+
+def test_appends_skip_stored_bars_and_reject_unordered_times(tmp_path):
+    store = OHLCVStore(tmp_path)
+    bars = make_bars(50)
+    store.append("ETH", "1h", **{name: values[:30] for name, values in bars.items()})
+    assert len(store.read("ETH", "1h")) == 30
+
+    # Overlapping appends only add the new bars, and reopening sees them
+    assert store.append("ETH", "1h", **bars) == 20
+    assert store.append("ETH", "1h", **bars) == 0
+    reopened = OHLCVStore(tmp_path).read("ETH", "1h")
+    np.testing.assert_array_equal(reopened.time, bars["time"])
+    np.testing.assert_array_equal(reopened.high, bars["high"])
+
+    with pytest.raises(ValueError):
+        store.append("ETH", "1h", **{name: values[::-1] for name, values in bars.items()})
+
+
+def test_reads_see_bars_appended_by_another_store(tmp_path):
+    reader, writer = OHLCVStore(tmp_path), OHLCVStore(tmp_path)
+    bars = make_bars(6)
+
+    # First read while the series does not exist yet
+    assert len(reader.read("BTC", "1h")) == 0
+    writer.append("BTC", "1h", **{name: values[:3] for name, values in bars.items()})
+    assert reader.has("BTC", "1h")
+    assert len(reader.read("BTC", "1h")) == 3
+
+    writer.append("BTC", "1h", **bars)
+    np.testing.assert_array_equal(reader.read("BTC", "1h").time, bars["time"])
+    np.testing.assert_array_equal(reader.tail("BTC", "1h", 2).close, bars["close"][-2:])
+
+
+def test_partial_append_is_discarded(tmp_path):
+    store = OHLCVStore(tmp_path)
+    bars = make_bars(20)
+    store.append("SOL", "1h", **{name: values[:10] for name, values in bars.items()})
+
+    # A write that stopped before the time column leaves stray rows behind
+    with open(tmp_path / "SOL" / "1h" / "close.f8", "ab") as f:
+        f.write(np.zeros(3).tobytes())
+
+    store = OHLCVStore(tmp_path)
+    assert len(store.read("SOL", "1h")) == 10
+    store.append("SOL", "1h", **bars)
+    np.testing.assert_array_equal(store.read("SOL", "1h").close, bars["close"])
+
+
+def test_load_csv_fixture(tmp_path):
+    path = tmp_path / "btc.csv"
+    path.write_text(
+        "Timestamp,Open,High,Low,Close,Volume\n"
+        "2024-01-01T02:00:00Z,3,4,2,3.5,30\n"
+        "1704067200,1,2,0.5,1.5,10\n"
+        "1704070800000,2,3,1,2.5,20\n"
+    )
+    store = OHLCVStore(tmp_path / "store")
+
+    assert store.load_csv(path, "BTC", "1h") == 3
+    series = store.read("BTC", "1h")
+    assert series.time.tolist() == [to_millis(START + timedelta(hours=hour)) for hour in range(3)]
+    assert series.close.tolist() == [1.5, 2.5, 3.5]
+    assert series.volume.tolist() == [10.0, 20.0, 30.0]
+
+    # Reloading the fixture adds nothing
+    assert store.load_csv(path, "BTC", "1h") == 0
+
+
+def test_read_aligned_keeps_shared_times(tmp_path):
+    store = OHLCVStore(tmp_path)
+    btc, eth = make_bars(10), make_bars(10, start=START + timedelta(hours=3), seed=4)
+    store.append("BTC", "1h", **btc)
+    store.append("ETH", "1h", **eth)
+
+    times, columns = store.read_aligned(["BTC", "ETH"], "1h")
+    np.testing.assert_array_equal(times, btc["time"][3:])
+    np.testing.assert_array_equal(columns["close"][0], btc["close"][3:])
+    np.testing.assert_array_equal(columns["close"][1], eth["close"][:7])
+
+
+async def test_generator_uses_stored_bars(tmp_path):
+    bars = make_bars(300)
+    generator = TradingSignalsGenerator(Settings(market_data_dir=tmp_path))
+    generator.market_data.append("BTC", "1h", **{name: values[:250] for name, values in bars.items()})
+
+    signal = await generator.generate_signal("BTC", TimeFrame.HOUR_1)
+    assert signal.price == bars["close"][249]
+
+    # Later calls consume the bars stored since, even by another store, matching a full recomputation
+    OHLCVStore(tmp_path).append("BTC", "1h", **bars)
+    signal = await generator.generate_signal("BTC", TimeFrame.HOUR_1)
+    assert signal.price == bars["close"][-1]
+    expected = compute_indicators(bars["high"], bars["low"], bars["close"], last_only=True)
+    actual = generator.indicator_state.values(["BTC:1h"])
+    for name, value in expected.items():
+        assert actual[name][0] == pytest.approx(value, rel=1e-6)
+
+
+async def test_backtest_and_analysis_use_stored_bars(tmp_path):
+    settings = Settings(market_data_dir=tmp_path)
+    generator = TradingSignalsGenerator(settings)
+    generator.market_data.append("BTC", "1d", **make_bars(400, step_ms=24 * HOUR_MS))
+
+    end = START + timedelta(days=99)
+    result = await generator.backtest("ma_crossover", ["BTC"], TimeFrame.DAY_1, START, end)
+    assert result.metadata["data_source"] == "market_data"
+    assert result.metadata["bars"] == 100
+    assert result.equity_curve[-1][0] == end
+
+    technical = await CryptoAnalyzer(settings)._get_technical_data("BTC", 30)
+    close = generator.market_data.read("BTC", "1d").close
+    assert technical.ma_200 == pytest.approx(close[-200:].mean())
@@ -0,0 +1,91 @@
+"""Unit tests for batch sentiment scoring."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.config import Settings
+from src.cry_a_4mcp.processing.sentiment_analyzer import ContentSource, SentimentAnalyzer
+from src.cry_a_4mcp.processing.sentiment_scoring import LexiconScorer, ModelScorer, tokenize
+
+
+def lexicon_scores(*texts):
+    return LexiconScorer().score(list(texts), tokenize(texts)).score.tolist()
+
+
+def test_lexicon_matches_whole_tokens_and_inflections():
+    assert lexicon_scores("Bitcoin surged and gains kept rising") == [pytest.approx(0.8)]
+    # "update" and "enterprise" no longer count as "up" and "rise"
+    assert lexicon_scores("Enterprise update released") == [0.0]
+    assert lexicon_scores("Prices dropped 📉") == [pytest.approx(-0.7)]
+
+
+def test_negation_flips_words_within_its_clause():
+    assert lexicon_scores("ETH is not bullish") == [pytest.approx(-0.6)]
+    assert lexicon_scores("No crash today") == [pytest.approx(0.6)]
+    # The clause break and the window both end the negation
+    assert lexicon_scores("Not today, bitcoin is bullish") == [pytest.approx(0.6)]
+    assert lexicon_scores("never said that the market looks bullish") == [pytest.approx(0.6)]
+    # Negations do not carry into the next text
+    assert lexicon_scores("markets did not", "rally continues") == [0.0, pytest.approx(0.6)]
+    # Emoji keep their own polarity after a negation
+    assert lexicon_scores("not down 🚀") == [pytest.approx(0.7)]
+    assert lexicon_scores("not bullish 📉") == [pytest.approx(-0.7)]
+
+
+async def test_batch_matches_single_texts():
+    analyzer = SentimentAnalyzer(Settings())
+    texts = ["Bitcoin rally 🚀", "", "Binance coin hack sparks fear", "Solution for stablecoins"] * 30
+
+    results = await analyzer.analyze_batch(texts, ContentSource.TWITTER)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts[:4], results):
+        single = await analyzer.analyze_text(text, ContentSource.TWITTER)
+        assert (result.score, result.confidence, result.entity) == (single.score, single.confidence, single.entity)
+        assert result.source == ContentSource.TWITTER
+    assert [result.entity for result in results[:4]] == ["Bitcoin", None, "Binance Coin", None]
+    assert results[2].score < 0 < results[0].score
+    assert results[0].metadata == {"word_count": 2}
+
+
+def test_model_scorer_batches_by_padded_length():
+    calls = []
+
+    def predict(texts):
+        calls.append(texts)
+        # Longer texts are more positive
+        positive = np.array([min(len(text.split()) / 10, 1.0) for text in texts])
+        return np.column_stack([np.zeros(len(texts)), 1 - positive, positive])
+
+    texts = ["word " * n for n in (9, 1, 5, 2, 8, 1, 3)]
+    tokens = tokenize(texts)
+    scorer = ModelScorer(predict, max_batch_size=3, max_batch_tokens=12)
+
+    scores = scorer.score(texts, tokens)
+
+    np.testing.assert_allclose(scores.score, [0.9, 0.1, 0.5, 0.2, 0.8, 0.1, 0.3])
+    assert sorted(text for batch in calls for text in batch) == sorted(texts)
+    for batch in calls:
+        lengths = [len(text.split()) for text in batch]
+        assert len(batch) <= 3
+        assert len(batch) == 1 or len(batch) * max(lengths) <= 12
+
+
+async def test_model_scoring_runs_off_the_event_loop():
+    threads = []
+
+    def predict(texts):
+        threads.append(threading.get_ident())
+        return np.tile([0.1, 0.2, 0.7], (len(texts), 1))
+
+    analyzer = SentimentAnalyzer(Settings())
+    analyzer.scorer = ModelScorer(predict)
+
+    single = await analyzer.analyze_text("Bitcoin rally")
+    results = await analyzer.analyze_batch(["ETH news", "SOL news"])
+
+    assert single.score == pytest.approx(0.6)
+    assert [result.confidence for result in results] == [pytest.approx(0.7)] * 2
+    assert threads and threading.get_ident() not in threads
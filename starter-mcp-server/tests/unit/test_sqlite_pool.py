@@ -0,0 +1,153 @@
+"""Unit tests for the shared SQLite connection pool.
+
+These tests run against temporary database files and check pragmas,
+transactions, the single writer, read-only readers and pool sharing.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from src.cry_a_4mcp.core.dependencies import get_url_config_db
+from src.cry_a_4mcp.storage.crawler_db import CrawlerDatabase
+from src.cry_a_4mcp.storage.sqlite_pool import SQLitePool, acquire_pool, release_pool
+from src.cry_a_4mcp.storage.url_configuration_db import URLConfigurationDatabase
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"), readers=2)
+    async with pool.write() as db:
+        await db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield pool
+    await pool.close()
+
+
+async def test_connections_use_wal_and_pragmas(pool):
+    """The writer switches the file to WAL and every connection is tuned."""
+    async with pool.read() as db:
+        cursor = await db.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+        cursor = await db.execute("PRAGMA synchronous")
+        assert (await cursor.fetchone())[0] == 1  # NORMAL
+        cursor = await db.execute("PRAGMA query_only")
+        assert (await cursor.fetchone())[0] == 1
+
+
+async def test_reads_see_committed_writes(pool):
+    """Rows are fetched with column access and row counts are reported."""
+    async with pool.write() as db:
+        cursor = await db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+        assert cursor.rowcount == 1
+        await db.executemany("INSERT INTO items (name) VALUES (?)", [("b",), ("c",)])
+
+    async with pool.read() as db:
+        async with db.execute("SELECT * FROM items ORDER BY id") as cursor:
+            rows = await cursor.fetchall()
+    assert [dict(row) for row in rows] == [
+        {"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}
+    ]
+
+
+async def test_failed_write_is_rolled_back(pool):
+    """A block that raises leaves no partial writes behind."""
+    with pytest.raises(RuntimeError):
+        async with pool.write() as db:
+            await db.execute("INSERT INTO items (name) VALUES ('lost')")
+            raise RuntimeError("boom")
+
+    async with pool.read() as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM items")
+        assert (await cursor.fetchone())[0] == 0
+    assert pool.get_stats()["failed_writes"] == 1
+
+
+async def test_readers_cannot_write(pool):
+    """Read connections are query only."""
+    with pytest.raises(sqlite3.OperationalError):
+        async with pool.read() as db:
+            await db.execute("INSERT INTO items (name) VALUES ('x')")
+
+
+async def test_concurrent_writes_are_serialized(pool):
+    """Concurrent writers queue on the single writer without lock errors."""
+    async def insert(i):
+        async with pool.write() as db:
+            await db.execute("INSERT INTO items (name) VALUES (?)", (str(i),))
+
+    async def count():
+        async with pool.read() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM items")
+            return (await cursor.fetchone())[0]
+
+    await asyncio.gather(*(insert(i) for i in range(20)), *(count() for _ in range(10)))
+
+    assert await count() == 20
+    stats = pool.get_stats()
+    assert stats["writes"] == 21
+    assert stats["open_readers"] <= 2
+
+
+async def test_memory_database_reads_through_writer():
+    """An in-memory database keeps one connection, so its data persists."""
+    pool = SQLitePool(":memory:")
+    async with pool.write() as db:
+        await db.execute("CREATE TABLE t (x)")
+        await db.execute("INSERT INTO t VALUES (1)")
+    async with pool.read() as db:
+        cursor = await db.execute("SELECT x FROM t")
+        assert (await cursor.fetchone())[0] == 1
+    await pool.close()
+
+
+async def test_pools_are_shared_per_file(tmp_path):
+    """Instances on one file share a pool, closed when the last releases it."""
+    path = str(tmp_path / "shared.db")
+    first = acquire_pool(path)
+    second = acquire_pool(path)
+    assert first is second
+    other = acquire_pool(str(tmp_path / "other.db"))
+    assert other is not first
+    await release_pool(other)
+
+    async with first.write() as db:
+        await db.execute("CREATE TABLE t (x)")
+    await release_pool(first)
+    assert first.get_stats()["open"]
+    await release_pool(second)
+    assert not first.get_stats()["open"]
+
+
+async def test_request_dependency_releases_pool(tmp_path, monkeypatch):
+    """The per-request database gives its pool back when the request ends."""
+    monkeypatch.chdir(tmp_path)
+    dependency = get_url_config_db()
+    db = await dependency.__anext__()
+    assert db.pool.users == 1
+
+    await dependency.aclose()
+    assert db.pool.users == 0
+    assert not db.pool.get_stats()["open"]
+
+
+async def test_databases_use_pool(tmp_path):
+    """The storage classes work on top of the pool."""
+    configs = URLConfigurationDatabase(str(tmp_path / "configs.db"))
+    await configs.initialize()
+    config_id = await configs.create_configuration(
+        name="CoinGecko", url="https://coingecko.com", profile_type="trader", category="prices"
+    )
+    assert await configs.update_configuration(config_id, business_priority=5)
+    assert (await configs.get_configuration(config_id))["business_priority"] == 5
+    assert (await configs.get_database_stats())["total_configurations"] == 1
+    assert await configs.delete_configuration(config_id)
+    assert not await configs.delete_configuration(config_id)
+    await configs.close()
+
+    crawlers = CrawlerDatabase(str(tmp_path / "crawlers.db"))
+    await crawlers.seed_sample_data()
+    assert len(await crawlers.get_all_crawlers()) == 2
+    assert await crawlers.update_crawler("crawler-1", {"name": "Renamed"})
+    assert not await crawlers.delete_crawler("missing")
+    await crawlers.close()
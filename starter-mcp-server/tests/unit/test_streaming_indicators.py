@@ -0,0 +1,79 @@
+"""Unit tests for the incremental indicator state.
+
+Streaming values are checked against ``compute_indicators`` run over the
+full history up to each bar.
+"""
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.config import Settings
+from src.cry_a_4mcp.processing.indicators import INDICATOR_NAMES, compute_indicators
+from src.cry_a_4mcp.processing.streaming_indicators import StreamingIndicators, stream_key
+from src.cry_a_4mcp.processing.trading_signals import TimeFrame, TradingSignalsGenerator
+
+KEYS = ["BTC:1h", "ETH:1h", "SOL:1d"]
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(3)
+    close = np.array([[50000.0], [3000.0], [150.0]]) * np.exp(
+        np.cumsum(rng.normal(0.0, 0.01, size=(3, 260)), axis=1)
+    )
+    spread = np.abs(rng.normal(0.0, 0.005, size=close.shape))
+    return close * (1 + spread), close * (1 - spread), close
+
+
+def assert_matches_batch(values, high, low, close):
+    expected = compute_indicators(high, low, close, last_only=True)
+    for name in INDICATOR_NAMES:
+        np.testing.assert_allclose(values[name], expected[name], rtol=1e-7, atol=1e-9, equal_nan=True,
+                                   err_msg=name)
+
+
+def test_bar_by_bar_updates_match_batch(prices):
+    high, low, close = prices
+    state = StreamingIndicators(capacity=1)
+    for t in range(close.shape[1]):
+        values = state.update(KEYS, high[:, t], low[:, t], close[:, t])
+        if t in (0, 5, 14, 15, 19, 34, 49, 50, 99, 100, 150, 259):
+            assert_matches_batch(values, high[:, :t + 1], low[:, :t + 1], close[:, :t + 1])
+    assert state.bars[:3].tolist() == [260, 260, 260]
+
+
+@pytest.mark.parametrize("history", [1, 10, 30, 120])
+def test_seed_then_update_matches_batch(prices, history):
+    high, low, close = prices
+    state = StreamingIndicators()
+    values = state.seed(KEYS, high[:, :history], low[:, :history], close[:, :history])
+    assert_matches_batch(values, high[:, :history], low[:, :history], close[:, :history])
+
+    for t in range(history, history + 60):
+        values = state.update(KEYS, high[:, t], low[:, t], close[:, t])
+    assert_matches_batch(values, high[:, :history + 60], low[:, :history + 60], close[:, :history + 60])
+
+
+def test_snapshot_round_trip(prices, tmp_path):
+    high, low, close = prices
+    state = StreamingIndicators()
+    state.seed(KEYS, high[:, :100], low[:, :100], close[:, :100])
+    state.save(tmp_path / "indicators.npz")
+
+    restored = StreamingIndicators.load(tmp_path / "indicators.npz")
+    assert restored.keys == KEYS
+    # Streams can be updated in any order after loading
+    order = [2, 0, 1]
+    values = restored.update([KEYS[i] for i in order], high[order, 100], low[order, 100], close[order, 100])
+    assert_matches_batch(values, high[order, :101], low[order, :101], close[order, :101])
+
+
+async def test_generator_updates_known_pairs_by_one_bar():
+    generator = TradingSignalsGenerator(Settings())
+    await generator.get_signals(symbols=["BTC", "ETH"], timeframes=[TimeFrame.HOUR_1], min_confidence=0.0)
+    rows = generator.indicator_state.get_rows([stream_key("BTC", "1h"), stream_key("ETH", "1h")])
+    assert generator.indicator_state.bars[rows].tolist() == [generator.history_bars] * 2
+
+    signal = await generator.generate_signal("btc", TimeFrame.HOUR_1)
+    assert generator.indicator_state.bars[rows].tolist() == [generator.history_bars + 1, generator.history_bars]
+    assert signal.price == generator.indicator_state.prev_close[rows[0]]
@@ -0,0 +1,109 @@
+"""Unit tests for the vectorized technical indicators.
+
+Each indicator is checked against a straightforward per-bar loop over a
+batch of random price series.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.config import Settings
+from src.cry_a_4mcp.processing import indicators
+from src.cry_a_4mcp.processing.trading_signals import SignalType, TimeFrame, TradingSignalsGenerator
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(42)
+    close = 50000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, size=(3, 120)), axis=1))
+    spread = np.abs(rng.normal(0.0, 0.005, size=close.shape))
+    return close * (1 + spread), close * (1 - spread), close
+
+
+def loop_sma(values, window):
+    return [sum(values[i - window + 1:i + 1]) / window if i >= window - 1 else math.nan
+            for i in range(len(values))]
+
+
+def loop_ema(values, period):
+    alpha = 2.0 / (period + 1)
+    out = [values[0]]
+    for value in values[1:]:
+        out.append(alpha * value + (1 - alpha) * out[-1])
+    return out
+
+
+def loop_rsi(close, period):
+    out = [math.nan] * len(close)
+    gains = [max(close[i] - close[i - 1], 0.0) for i in range(1, len(close))]
+    losses = [max(close[i - 1] - close[i], 0.0) for i in range(1, len(close))]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for i in range(period, len(close)):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+def test_moving_averages_match_loops(prices):
+    _, _, close = prices
+    for row in close:
+        np.testing.assert_allclose(indicators.sma(row, 20), loop_sma(row.tolist(), 20), rtol=1e-10)
+        np.testing.assert_allclose(indicators.ema(row, 12), loop_ema(row.tolist(), 12), rtol=1e-10)
+
+    # Rows of a batch are computed independently
+    np.testing.assert_allclose(indicators.ema(close, 26)[1], indicators.ema(close[1], 26))
+
+
+def test_rolling_std_matches_numpy(prices):
+    _, _, close = prices
+    expected = [np.std(close[0, i - 19:i + 1]) for i in range(19, close.shape[1])]
+    np.testing.assert_allclose(indicators.rolling_std(close, 20)[0, 19:], expected, rtol=1e-6)
+
+
+def test_rsi_matches_wilder_loop(prices):
+    _, _, close = prices
+    for row in close:
+        np.testing.assert_allclose(indicators.rsi(row, 14), loop_rsi(row.tolist(), 14), rtol=1e-10)
+
+
+def test_stochastic_matches_loop(prices):
+    high, low, close = prices
+    result = indicators.stochastic(high, low, close, 14)
+    for i in range(13, close.shape[1]):
+        highest = high[2, i - 13:i + 1].max()
+        lowest = low[2, i - 13:i + 1].min()
+        assert result[2, i] == pytest.approx(100 * (close[2, i] - lowest) / (highest - lowest))
+    assert np.isnan(result[:, :13]).all()
+
+
+def test_flat_prices_are_neutral():
+    flat = np.full((2, 60), 10.0)
+    values = indicators.compute_indicators(flat, flat, flat, last_only=True)
+    assert values["RSI"].tolist() == [50.0, 50.0]
+    assert values["Bollinger Bands"].tolist() == [0.5, 0.5]
+    assert values["Stochastic"].tolist() == [50.0, 50.0]
+    assert values["Moving Average"].tolist() == [1.0, 1.0]
+    assert values["MACD"].tolist() == [0.0, 0.0]
+
+
+async def test_get_signals_covers_every_symbol_and_timeframe():
+    generator = TradingSignalsGenerator(Settings())
+    symbols = [f"SYM{i}" for i in range(300)]
+    signals = await generator.get_signals(
+        symbols=symbols,
+        timeframes=[TimeFrame.HOUR_1, TimeFrame.DAY_1],
+        signal_types=list(SignalType),
+        min_confidence=0.0,
+        limit=1000,
+    )
+
+    assert len(signals) == 600
+    assert {signal.symbol for signal in signals} == set(symbols)
+    for signal in signals[:10]:
+        assert [indicator.name for indicator in signal.indicators] == list(indicators.INDICATOR_NAMES)
+        assert all(math.isfinite(indicator.value) for indicator in signal.indicators)
@@ -0,0 +1,168 @@
+"""Unit tests for batched vector store ingestion.
+
+These tests use a fake embedding model and Qdrant client that record their
+calls and check batching, chunking, bounded upserts, the ingest queue, the
+query embedding cache and collapsing of chunk hits in search.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.cry_a_4mcp.storage.vector_store import VectorIngestQueue, VectorStore, chunk_text
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+        self.queries = []
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        if isinstance(texts, str):
+            self.queries.append(texts)
+            return np.full(4, len(self.queries), dtype=np.float32)
+        self.calls.append((len(texts), batch_size))
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+class FakeClient:
+    def __init__(self, fail_first=False):
+        self.upserts = []
+        self.active = 0
+        self.max_active = 0
+        self.fail_first = fail_first
+        self.hits = []
+        self.search_limits = []
+
+    def upsert(self, collection_name, points):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.fail_first and not self.upserts:
+                self.upserts.append([])
+                raise RuntimeError("timeout")
+            self.upserts.append(points)
+        finally:
+            self.active -= 1
+
+    def search(self, collection_name, query_vector, limit, query_filter=None, with_payload=True):
+        self.search_limits.append(limit)
+        return self.hits[:limit]
+
+
+@pytest.fixture
+def store():
+    settings = SimpleNamespace(
+        qdrant_collection_name="test",
+        qdrant_vector_size=4,
+        qdrant_upsert_batch_size=3,
+        qdrant_max_inflight_upserts=2,
+        embedding_batch_size=None,
+        embedding_device="cpu",
+        embedding_chunk_words=5,
+        embedding_chunk_overlap=1,
+        query_embedding_cache_size=16,
+    )
+    store = VectorStore(settings)
+    store.client = FakeClient()
+    store.embedding_model = FakeModel()
+    return store
+
+
+def test_chunk_text():
+    """Long texts are split into overlapping word windows."""
+    assert chunk_text("a b c", 5, 1) == ["a b c"]
+    assert chunk_text("a b c d e f g h", 5, 1) == ["a b c d e", "e f g h"]
+
+
+async def test_documents_encoded_and_upserted_in_batches(store):
+    """Chunks are encoded and upserted a batch at a time."""
+    documents = [(f"doc {i}", {"id": f"d{i}", "source": "news"}) for i in range(7)]
+    stats = await store.add_documents(documents)
+
+    assert [len(points) for points in store.client.upserts] == [3, 3, 1]
+    assert store.embedding_model.calls == [(3, 32), (3, 32), (1, 32)]
+    assert store.client.max_active <= 2
+    assert stats.documents == 7
+    assert stats.chunks == 7
+    assert stats.batches == 3
+    assert stats.documents_per_second > 0
+    assert store.ingest_stats.documents == 7
+
+
+async def test_long_documents_are_chunked(store):
+    """Each chunk is its own point pointing back at the document."""
+    stats = await store.add_documents([("one two three four five six seven eight", {"id": "doc"})])
+
+    points = [point for batch in store.client.upserts for point in batch]
+    assert stats.chunks == 2
+    assert [point.payload["chunk_index"] for point in points] == [0, 1]
+    assert {point.payload["document_id"] for point in points} == {"doc"}
+    assert len({point.id for point in points}) == 2
+
+
+async def test_failed_upsert_is_reported(store):
+    """A failed upsert is counted and the other batches are still written."""
+    store.client = FakeClient(fail_first=True)
+    stats = await store.add_documents([(f"doc {i}", {}) for i in range(5)])
+
+    assert stats.failed_batches == 1
+    assert stats.failed_chunks == 3
+    assert stats.chunks == 2
+    assert stats.errors == ["timeout"]
+
+
+async def test_add_document_returns_id(store):
+    """The single document API keeps working on top of the batch path."""
+    assert await store.add_document("hello", {"id": "abc"}) == "abc"
+    assert store.client.upserts[0][0].id == "abc"
+
+
+async def test_ingest_queue_batches_documents(store):
+    """Queued documents are written in batches and flushed on close."""
+    queue = VectorIngestQueue(store, batch_size=4, flush_interval=0.05)
+    await queue.start()
+    for i in range(10):
+        await queue.put(f"doc {i}", {"id": f"d{i}"})
+    await queue.flush()
+    await queue.put("last", {"id": "last"})
+    await queue.close()
+
+    stats = queue.get_stats()
+    assert stats["submitted"] == 11
+    assert stats["documents"] == 11
+    assert stats["pending"] == 0
+    assert sum(len(points) for points in store.client.upserts) == 11
+
+
+async def test_put_requires_started_queue(store):
+    """Documents cannot be queued before the worker runs."""
+    with pytest.raises(RuntimeError):
+        await VectorIngestQueue(store).put("doc", {})
+
+
+async def test_query_embeddings_encode_their_cache_key(store):
+    """Queries differing only in whitespace share one embedding of the normalized text."""
+    first = await store.embed_query("  Bitcoin ETF")
+    second = await store.embed_query("Bitcoin   ETF ")
+    other_case = await store.embed_query("bitcoin etf")
+
+    assert store.embedding_model.queries == ["Bitcoin ETF", "bitcoin etf"]
+    assert first == second == [1.0] * 4
+    assert other_case == [2.0] * 4
+
+
+async def test_search_returns_one_result_per_document(store):
+    """Chunk hits of one document collapse into its best scoring chunk."""
+    store.client.hits = [
+        SimpleNamespace(id="p1", score=0.9, payload={"content": "chunk 1", "document_id": "doc", "chunk_index": 1, "chunk_count": 3}),
+        SimpleNamespace(id="p0", score=0.8, payload={"content": "chunk 0", "document_id": "doc", "chunk_index": 0, "chunk_count": 3}),
+        SimpleNamespace(id="short", score=0.7, payload={"content": "short doc"}),
+        SimpleNamespace(id="other", score=0.6, payload={"content": "other doc"}),
+    ]
+
+    results = await store.search("bitcoin", limit=2)
+
+    assert store.client.search_limits == [6]
+    assert [(r["id"], r["content"], r["chunk_index"]) for r in results] == [("doc", "chunk 1", 1), ("short", "short doc", 0)]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for token-aware chunking and map-reduce LLM extraction.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import LLMExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.chunking import (
+    chunk_content,
+    estimate_tokens,
+    merge_extraction_results,
+)
+
+
+def make_article(paragraphs: int) -> str:
+    """Build a long article with numbered paragraphs."""
+    return "\n\n".join(
+        f"Paragraph {i}. Bitcoin and Ethereum moved on the news of the day." * 3
+        for i in range(paragraphs)
+    )
+
+
+class TestChunkContent(unittest.TestCase):
+    """Test cases for chunk_content."""
+
+    def test_short_content_is_single_chunk(self):
+        """Content within the budget is returned unchanged."""
+        self.assertEqual(chunk_content("short text", 100), ["short text"])
+
+    def test_chunks_respect_budget_and_keep_all_content(self):
+        """Every chunk fits the budget and no paragraph is lost."""
+        text = make_article(60)
+        chunks = chunk_content(text, 300)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 300)
+        for i in range(60):
+            self.assertTrue(any(f"Paragraph {i}." in chunk for chunk in chunks))
+
+    def test_oversized_paragraph_is_split(self):
+        """A single paragraph longer than the budget is split."""
+        text = "word " * 2000
+        chunks = chunk_content(text, 200)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 200)
+
+
+class TestMergeExtractionResults(unittest.TestCase):
+    """Test cases for merge_extraction_results."""
+
+    def test_schema_aware_merge(self):
+        """Arrays are unioned, scores averaged and strings keep the first value."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "headline": {"type": "string"},
+                "key_points": {"type": "array", "items": {"type": "string"}},
+                "urgency_score": {"type": "number", "minimum": 0, "maximum": 10},
+                "market": {
+                    "type": "object",
+                    "properties": {"tokens": {"type": "array"}},
+                },
+            },
+        }
+        results = [
+            {"headline": "", "key_points": ["a", "b"], "urgency_score": 4,
+             "market": {"tokens": ["BTC"]}, "_metadata": {"model": "m"}},
+            {"headline": "Title", "key_points": ["B", "c"], "urgency_score": 8,
+             "market": {"tokens": ["ETH", "BTC"]}},
+        ]
+        merged = merge_extraction_results(results, schema)
+        self.assertEqual(merged["headline"], "Title")
+        self.assertEqual(merged["key_points"], ["a", "b", "c"])
+        self.assertEqual(merged["urgency_score"], 6)
+        self.assertEqual(merged["market"]["tokens"], ["BTC", "ETH"])
+        self.assertNotIn("_metadata", merged)
+
+    def test_merge_without_schema(self):
+        """Types are inferred from the values when no schema is given."""
+        merged = merge_extraction_results([{"tags": ["x"]}, {"tags": ["y"], "extra": 1}])
+        self.assertEqual(merged, {"tags": ["x", "y"], "extra": 1})
+
+
+class TestMapReduceExtraction(unittest.IsolatedAsyncioTestCase):
+    """Test cases for map-reduce extraction in LLMExtractionStrategy."""
+
+    def _make_strategy(self, **kwargs):
+        return LLMExtractionStrategy(
+            provider="openai",
+            api_token="test-token",
+            instruction="Extract key points",
+            schema={"type": "object", "properties": {"key_points": {"type": "array"}}},
+            use_cache=False,
+            **kwargs,
+        )
+
+    async def test_long_content_is_chunked_and_merged(self):
+        """Long content is extracted chunk by chunk with bounded concurrency."""
+        strategy = self._make_strategy(chunk_token_limit=300, max_concurrent_chunks=2)
+        in_flight = 0
+        peak = 0
+        calls = []
+
+        async def fake_single(url, content, instruction_text, schema_obj, system_message):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            calls.append(content)
+            return {"key_points": [f"chunk {len(calls)}"],
+                    "_metadata": {"usage": {"total_tokens": 10}, "cache_hit": False}}
+
+        with patch.object(strategy, "_extract_single", side_effect=fake_single):
+            result = await strategy.extract("https://example.com", make_article(60))
+
+        metadata = result["_metadata"]
+        self.assertEqual(metadata["extraction_mode"], "map_reduce")
+        self.assertEqual(metadata["chunk_count"], len(calls))
+        self.assertGreater(len(calls), 1)
+        self.assertLessEqual(peak, 2)
+        self.assertEqual(metadata["usage"]["total_tokens"], 10 * len(calls))
+        self.assertEqual(len(result["key_points"]), len(calls))
+        self.assertIn("Paragraph 59.", "".join(calls))
+
+    async def test_partial_chunk_failure_is_reported(self):
+        """Failed chunks are counted and the remaining results are merged."""
+        strategy = self._make_strategy(chunk_token_limit=300)
+        response = {"choices": [{"message": {"content": json.dumps({"key_points": ["p"]})}}]}
+        outcomes = [response] + [Exception("boom")] * 100
+
+        async def fake_retry(func, retries=3, exceptions=()):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("src.cry_a_4mcp.crawl4ai.extraction_strategies.base.retry_async", side_effect=fake_retry):
+            result = await strategy.extract("https://example.com", make_article(30))
+
+        self.assertEqual(result["key_points"], ["p"])
+        self.assertGreater(result["_metadata"]["chunks_failed"], 0)
+
+    async def test_truncate_mode_keeps_legacy_limit(self):
+        """extraction_mode='truncate' sends at most 15000 characters."""
+        strategy = self._make_strategy(extraction_mode="truncate")
+        captured = {}
+
+        async def fake_single(url, content, instruction_text, schema_obj, system_message):
+            captured["content"] = content
+            return {"_metadata": {}}
+
+        with patch.object(strategy, "_extract_single", side_effect=fake_single):
+            await strategy.extract("https://example.com", "x" * 20000)
+
+        self.assertEqual(len(captured["content"]), 15000)
+
+    def test_output_limit_equal_to_context_window_leaves_room_for_content(self):
+        """gpt-4's 8192 output tokens are capped so content and completion fit its window."""
+        strategy = self._make_strategy(model="gpt-4")
+        system_message = strategy.instruction
+
+        budget = strategy._get_chunk_token_budget("https://example.com", system_message)
+
+        self.assertEqual(strategy.max_tokens, 4096)
+        self.assertGreater(budget, 2048)
+        self.assertLessEqual(budget + strategy.max_tokens + estimate_tokens(system_message), 8192)
+
+    def test_explicit_max_tokens_is_capped_outside_truncate_mode(self):
+        """An explicit max_tokens is capped too, but truncate mode keeps the model limit."""
+        strategy = self._make_strategy(model="gpt-4", max_tokens=8000)
+        self.assertEqual(strategy.max_tokens, 4096)
+        self.assertEqual(self._make_strategy(model="gpt-4", extraction_mode="truncate").max_tokens, 8192)
+
+
+if __name__ == "__main__":
+    unittest.main()
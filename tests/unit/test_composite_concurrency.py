@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent execution in CompositeExtractionStrategy.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import ExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.factory import CompositeExtractionStrategy
+
+
+class DelayedStrategy(ExtractionStrategy):
+    """Strategy that returns a fixed result after a delay."""
+
+    def __init__(self, delay, result=None, error=None):
+        self.delay = delay
+        self.result = result or {}
+        self.error = error
+        self.cancelled = False
+
+    async def extract(self, url, content, **kwargs):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return dict(self.result)
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+class TestCompositeConcurrency(unittest.TestCase):
+    """Test cases for CompositeExtractionStrategy execution modes."""
+
+    def test_children_run_concurrently(self):
+        """Total time is bounded by the slowest child, not the sum."""
+        composite = CompositeExtractionStrategy([DelayedStrategy(0.2, {"a": 1}) for _ in range(5)])
+        start = time.perf_counter()
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertEqual(result["a"], 1)
+
+    def test_results_combined_in_strategy_order(self):
+        """A slow first strategy still takes precedence over a fast second one."""
+        composite = CompositeExtractionStrategy([
+            DelayedStrategy(0.1, {"title": "first", "tags": ["x", "y"]}),
+            DelayedStrategy(0.0, {"title": "second", "tags": ["z", "x"]}),
+        ])
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertEqual(result["title"], "first")
+        self.assertEqual(result["tags"], ["x", "y", "z"])
+
+    def test_child_timeout_and_errors(self):
+        """Slow and failing children are recorded and skipped."""
+        composite = CompositeExtractionStrategy([
+            DelayedStrategy(1.0, {"slow": True}),
+            DelayedStrategy(0.0, error=RuntimeError("boom")),
+            DelayedStrategy(0.0, {"ok": True}),
+        ], child_timeout=0.1)
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertNotIn("slow", result)
+        self.assertTrue(result["ok"])
+        statuses = [outcome["status"] for outcome in result["_metadata"]["execution"]]
+        self.assertEqual(statuses, ["timeout", "error", "success"])
+
+    def test_child_timeout_error_without_limits(self):
+        """A child raising TimeoutError with no timeout configured is marked "timeout"."""
+        composite = CompositeExtractionStrategy([
+            DelayedStrategy(0.0, error=asyncio.TimeoutError()),
+            DelayedStrategy(0.0, {"ok": True}),
+        ])
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertTrue(result["ok"])
+        execution = result["_metadata"]["execution"]
+        self.assertEqual([outcome["status"] for outcome in execution], ["timeout", "success"])
+
+    def test_failing_child_task_only_fails_that_child(self):
+        """An exception escaping a child task is recorded as that child's error."""
+        failing = DelayedStrategy(0.0, {"lost": True})
+
+        class FragileComposite(CompositeExtractionStrategy):
+            async def _run_child(self, strategy, url, content, time_left, **kwargs):
+                if strategy is failing:
+                    raise RuntimeError("outcome lost")
+                return await super()._run_child(strategy, url, content, time_left, **kwargs)
+
+        composite = FragileComposite([failing, DelayedStrategy(0.0, {"ok": True})])
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertTrue(result["ok"])
+        self.assertNotIn("lost", result)
+        self.assertEqual(result["_metadata"]["execution"][0]["status"], "error")
+
+    def test_deadline_cancels_stragglers(self):
+        """Children still running at the deadline are cancelled."""
+        slow = DelayedStrategy(5.0, {"slow": True})
+        composite = CompositeExtractionStrategy([DelayedStrategy(0.0, {"fast": True}), slow], deadline=0.1)
+        start = time.perf_counter()
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(slow.cancelled)
+        self.assertEqual(result["_metadata"]["execution"][1]["status"], "cancelled")
+
+    def test_min_successes_returns_early(self):
+        """Extraction returns once enough children have succeeded."""
+        slow = DelayedStrategy(5.0, {"slow": True})
+        composite = CompositeExtractionStrategy([
+            slow,
+            DelayedStrategy(0.0, error=ValueError("bad")),
+            DelayedStrategy(0.01, {"fast": True}),
+        ], min_successes=1)
+        result = run(composite.extract("https://example.com", "content"))
+        self.assertTrue(result["fast"])
+        self.assertTrue(slow.cancelled)
+
+    def test_sequential_mode(self):
+        """Sequential mode runs children one after another."""
+        order = []
+
+        class RecordingStrategy(ExtractionStrategy):
+            def __init__(self, name):
+                self.name = name
+
+            async def extract(self, url, content, **kwargs):
+                order.append(f"start-{self.name}")
+                await asyncio.sleep(0.01)
+                order.append(f"end-{self.name}")
+                return {self.name: True}
+
+        composite = CompositeExtractionStrategy(
+            [RecordingStrategy("a"), RecordingStrategy("b")], execution_mode="sequential"
+        )
+        run(composite.extract("https://example.com", "content"))
+        self.assertEqual(order, ["start-a", "end-a", "start-b", "end-b"])
+
+    def test_unknown_mode(self):
+        """Unknown execution modes are rejected."""
+        with self.assertRaises(ValueError):
+            CompositeExtractionStrategy([], execution_mode="parallel")
+
+    def test_no_results(self):
+        """An extraction where every child fails returns an empty result."""
+        composite = CompositeExtractionStrategy([DelayedStrategy(0.0, error=RuntimeError("x"))])
+        self.assertEqual(run(composite.extract("https://example.com", "content")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-parse ContentPreprocessor pipeline.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.content_preprocessor import (
+    LXML_AVAILABLE,
+    ContentPreprocessor,
+)
+
+SAMPLE_HTML = """
+<html>
+<head><script>var tracking = 1;</script><style>p { color: red; }</style></head>
+<body>
+  <!-- comment to remove -->
+  <h1>Bitcoin rallies</h1>
+  <p>Bitcoin rose 5% today as institutional demand increased across major exchanges.</p>
+  <div style="display:none">hidden text</div>
+  <table>
+    <caption>Prices</caption>
+    <thead><tr><th>Asset</th><th>Price</th></tr></thead>
+    <tr><td>BTC</td><td>$50,000</td></tr>
+    <tr><td>ETH</td><td>$3,000</td></tr>
+  </table>
+  <table><tr><td>Rank</td><td>Name</td></tr><tr><td>1</td><td>BTC</td></tr></table>
+  <ul>
+    <li>First <b>point</b></li>
+    <li>Second<ul><li>nested</li></ul></li>
+  </ul>
+  <ol><li>One</li><li>Two</li></ol>
+</body>
+</html>
+"""
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "samples", "html_content.html")
+
+
+class TestContentPreprocessor(unittest.TestCase):
+    """Test cases for ContentPreprocessor."""
+
+    def setUp(self):
+        """Create a preprocessor that does not depend on trafilatura heuristics."""
+        self.preprocessor = ContentPreprocessor(use_trafilatura=False)
+
+    def test_preprocess_extracts_tables_and_lists(self):
+        """Tables and lists are extracted from the parsed page."""
+        result = self.preprocessor.preprocess(SAMPLE_HTML, url="https://example.com")
+
+        self.assertEqual(len(result.tables), 2)
+        self.assertEqual(result.tables[0].caption, "Prices")
+        self.assertEqual(result.tables[0].headers, ["Asset", "Price"])
+        self.assertEqual(result.tables[0].rows, [["BTC", "$50,000"], ["ETH", "$3,000"]])
+        self.assertEqual(result.tables[1].headers, ["Rank", "Name"])
+
+        self.assertEqual(len(result.lists), 2)
+        self.assertEqual(result.lists[0].items, ["Firstpoint", "Second"])
+        self.assertTrue(result.lists[0].nested)
+        self.assertTrue(result.lists[1].ordered)
+        self.assertEqual(result.metadata["table_count"], 2)
+
+    def test_preprocess_cleans_page(self):
+        """Scripts, styles, comments and hidden elements are removed."""
+        result = self.preprocessor.preprocess(SAMPLE_HTML)
+        self.assertIn("Bitcoin rose 5%", result.text)
+        for unwanted in ("tracking", "color: red", "comment to remove", "hidden text"):
+            self.assertNotIn(unwanted, result.text)
+
+    def test_preprocess_parses_once(self):
+        """The full pipeline parses the HTML a single time."""
+        with patch.object(self.preprocessor.backend, "parse",
+                          wraps=self.preprocessor.backend.parse) as mock_parse:
+            self.preprocessor.preprocess(SAMPLE_HTML)
+        self.assertEqual(mock_parse.call_count, 1)
+
+    def test_string_helpers_still_work(self):
+        """The per-step string APIs remain available."""
+        cleaned = self.preprocessor.clean_html(SAMPLE_HTML)
+        self.assertNotIn("<script", cleaned)
+        self.assertEqual(len(self.preprocessor.extract_tables(cleaned)), 2)
+        self.assertEqual(len(self.preprocessor.extract_lists(cleaned)), 2)
+
+    def test_disabled_extractors(self):
+        """Table and list extraction can be switched off."""
+        preprocessor = ContentPreprocessor(extract_tables=False, extract_lists=False)
+        result = preprocessor.preprocess(SAMPLE_HTML)
+        self.assertEqual(result.tables, [])
+        self.assertEqual(result.lists, [])
+
+    def test_empty_html(self):
+        """Empty input produces empty content."""
+        result = self.preprocessor.preprocess("")
+        self.assertEqual(result.text.strip(), "")
+        self.assertEqual(result.tables, [])
+
+    @unittest.skipUnless(LXML_AVAILABLE, "lxml not installed")
+    def test_backends_agree(self):
+        """lxml and html.parser backends produce the same structured output."""
+        with open(SAMPLE_PATH) as f:
+            html = f.read()
+        lxml_result = ContentPreprocessor(parser="lxml").preprocess(html)
+        soup_result = ContentPreprocessor(parser="html.parser").preprocess(html)
+
+        self.assertEqual(lxml_result.metadata["parser"], "lxml")
+        self.assertEqual(soup_result.metadata["parser"], "html.parser")
+        self.assertEqual([t.to_dict() for t in lxml_result.tables], [t.to_dict() for t in soup_result.tables])
+        self.assertEqual([l.to_dict() for l in lxml_result.lists], [l.to_dict() for l in soup_result.lists])
+        self.assertEqual(lxml_result.text, soup_result.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed extraction result cache.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_cache import ExtractionCache, make_cache_key
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import LLMExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.metrics import default_metrics_registry
+
+
+class TestMakeCacheKey(unittest.TestCase):
+    """Test cases for cache key generation."""
+
+    def test_key_is_stable(self):
+        """Equal inputs produce equal keys regardless of schema key order."""
+        first = make_cache_key("m", "extract", {"a": 1, "b": 2}, "content")
+        second = make_cache_key("m", "extract", {"b": 2, "a": 1}, "content")
+        self.assertEqual(first, second)
+
+    def test_key_depends_on_every_field(self):
+        """Changing any input changes the key."""
+        base = make_cache_key("m", "extract", {"a": 1}, "content")
+        self.assertNotEqual(base, make_cache_key("m2", "extract", {"a": 1}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "extract!", {"a": 1}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "extract", {"a": 2}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "extract", {"a": 1}, "content2"))
+
+
+class TestExtractionCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ExtractionCache."""
+
+    async def test_memory_hit_returns_copy_with_metadata(self):
+        """Hits are marked and independent of the stored value."""
+        cache = ExtractionCache(max_entries=4)
+        await cache.set("k", {"headline": "h", "_metadata": {"usage": {"total_tokens": 42}}})
+
+        first = await cache.get("k")
+        self.assertTrue(first["_metadata"]["cache_hit"])
+        self.assertEqual(first["_metadata"]["cache_tier"], "memory")
+
+        first["headline"] = "mutated"
+        second = await cache.get("k")
+        self.assertEqual(second["headline"], "h")
+        self.assertEqual(cache.get_stats()["hits"], 2)
+
+    async def test_miss(self):
+        """Unknown keys miss and are counted."""
+        cache = ExtractionCache()
+        self.assertIsNone(await cache.get("missing"))
+        self.assertEqual(cache.misses, 1)
+
+    async def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = ExtractionCache(max_entries=2)
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")
+        await cache.set("c", {"v": 3})
+        self.assertIsNotNone(await cache.get("a"))
+        self.assertIsNone(await cache.get("b"))
+
+    async def test_ttl_expiry(self):
+        """Expired entries are not served."""
+        cache = ExtractionCache(ttl=10)
+        await cache.set("k", {"v": 1})
+        with patch("src.cry_a_4mcp.crawl4ai.extraction_cache.time.time", return_value=time.time() + 11):
+            self.assertIsNone(await cache.get("k"))
+
+    async def test_disk_tier_persists(self):
+        """Entries survive in SQLite and are served from a new cache instance."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "cache.db")
+            cache = ExtractionCache(db_path=db_path)
+            await cache.set("k", {"v": 1})
+            cache.close()
+
+            reopened = ExtractionCache(db_path=db_path)
+            result = await reopened.get("k")
+            self.assertEqual(result["v"], 1)
+            self.assertEqual(result["_metadata"]["cache_tier"], "disk")
+            # Promoted to memory on the first disk hit
+            result = await reopened.get("k")
+            self.assertEqual(result["_metadata"]["cache_tier"], "memory")
+            reopened.close()
+
+    async def test_disk_size_eviction(self):
+        """The SQLite tier is trimmed to its maximum size."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ExtractionCache(db_path=os.path.join(tmp, "cache.db"), max_db_entries=3)
+            for i in range(5):
+                await cache.set(f"k{i}", {"v": i})
+            self.assertEqual(cache.get_stats()["disk_entries"], 3)
+            cache.close()
+
+    async def test_metrics_exported(self):
+        """Hits and misses are exported through the metrics registry."""
+        cache = ExtractionCache(name="test_metrics")
+        await cache.get("k")
+        await cache.set("k", {"_metadata": {"usage": {"total_tokens": 7}}})
+        await cache.get("k")
+
+        summary = default_metrics_registry.get_metrics_summary()["cache"]
+        self.assertEqual(summary["misses"]["test_metrics"], 1)
+        self.assertEqual(summary["hits"]["test_metrics:memory"], 1)
+        self.assertEqual(summary["tokens_saved"]["test_metrics"], 7)
+
+
+class TestLLMExtractionCaching(unittest.IsolatedAsyncioTestCase):
+    """Test that LLMExtractionStrategy consults the cache."""
+
+    def _make_strategy(self, **kwargs):
+        return LLMExtractionStrategy(
+            provider="openai",
+            api_token="test-token",
+            instruction="Extract the headline",
+            cache=ExtractionCache(),
+            **kwargs,
+        )
+
+    async def test_second_extract_is_cache_hit(self):
+        """The second identical request does not reach the API."""
+        strategy = self._make_strategy()
+        response = {"choices": [{"message": {"content": '{"headline": "h"}'}}]}
+
+        with patch("src.cry_a_4mcp.crawl4ai.extraction_strategies.base.retry_async",
+                   return_value=response) as mock_retry:
+            first = await strategy.extract("https://example.com", "content")
+            second = await strategy.extract("https://example.com", "content")
+
+        self.assertEqual(mock_retry.call_count, 1)
+        self.assertFalse(first["_metadata"]["cache_hit"])
+        self.assertTrue(second["_metadata"]["cache_hit"])
+        self.assertEqual(second["headline"], "h")
+
+    async def test_cache_disabled(self):
+        """use_cache=False always calls the API."""
+        strategy = self._make_strategy(use_cache=False)
+        response = {"choices": [{"message": {"content": '{"headline": "h"}'}}]}
+
+        with patch("src.cry_a_4mcp.crawl4ai.extraction_strategies.base.retry_async",
+                   return_value=response) as mock_retry:
+            await strategy.extract("https://example.com", "content")
+            await strategy.extract("https://example.com", "content")
+
+        self.assertEqual(mock_retry.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
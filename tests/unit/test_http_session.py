@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled HTTP session manager.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+from aiohttp import web
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.http_session import (
+    HTTPSessionManager,
+    default_session_manager,
+    normalize_base_url,
+)
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import LLMExtractionStrategy
+
+
+class TestNormalizeBaseURL(unittest.TestCase):
+    """Test cases for pool key normalization."""
+
+    def test_endpoint_and_base_share_key(self):
+        """A full endpoint URL maps to the same key as its base URL."""
+        self.assertEqual(
+            normalize_base_url("https://OpenRouter.ai/api/v1"),
+            normalize_base_url("https://openrouter.ai/api/v1/chat/completions"),
+        )
+
+    def test_empty_url(self):
+        """Missing URLs fall back to a default key."""
+        self.assertEqual(normalize_base_url(None), "default")
+
+
+class TestHTTPSessionManager(unittest.IsolatedAsyncioTestCase):
+    """Test cases for HTTPSessionManager."""
+
+    async def asyncSetUp(self):
+        """Create an isolated manager for each test."""
+        self.manager = HTTPSessionManager(limit_per_host=5)
+
+    async def asyncTearDown(self):
+        """Close any sessions opened during the test."""
+        await self.manager.close_all()
+
+    async def test_session_reused_per_host(self):
+        """The same host on the same loop gets the same session."""
+        first = self.manager.get_session("https://api.openai.com/v1")
+        second = self.manager.get_session("https://api.openai.com/v1/chat/completions")
+        self.assertIs(first, second)
+        self.assertEqual(self.manager.sessions_created, 1)
+        self.assertEqual(self.manager.sessions_reused, 1)
+
+    async def test_different_hosts_get_different_sessions(self):
+        """Each host gets its own connection pool."""
+        first = self.manager.get_session("https://api.openai.com/v1")
+        second = self.manager.get_session("https://openrouter.ai/api/v1")
+        self.assertIsNot(first, second)
+
+    async def test_connector_configuration(self):
+        """Pool settings are applied to the session connector."""
+        session = self.manager.get_session("https://api.groq.com/openai/v1")
+        self.assertEqual(session.connector.limit_per_host, 5)
+
+    async def test_close_loop_sessions(self):
+        """Closing releases sessions and a new one is created afterwards."""
+        session = self.manager.get_session("https://api.openai.com/v1")
+        await self.manager.close_loop_sessions()
+        self.assertTrue(session.closed)
+        self.assertEqual(self.manager.get_stats()["open_sessions"], 0)
+        replacement = self.manager.get_session("https://api.openai.com/v1")
+        self.assertIsNot(session, replacement)
+
+    async def test_pool_overrides_get_their_own_session(self):
+        """Overrides are not dropped when a session for the host already exists."""
+        default = self.manager.get_session("https://api.openai.com/v1")
+        limited = self.manager.get_session("https://api.openai.com/v1", limit_per_host=2)
+        self.assertIsNot(default, limited)
+        self.assertEqual(limited.connector.limit_per_host, 2)
+        self.assertIs(self.manager.get_session("https://api.openai.com/v1", limit_per_host=2), limited)
+
+
+class TestClosedLoopSessions(unittest.TestCase):
+    """Test cases for sessions left behind by closed event loops."""
+
+    def test_sessions_of_closed_loops_are_closed(self):
+        """Sessions bound to a closed loop are closed when another loop asks for one."""
+        manager = HTTPSessionManager()
+
+        async def get_session():
+            return manager.get_session("https://api.openai.com/v1")
+
+        async def replace_session():
+            session = manager.get_session("https://api.openai.com/v1")
+            await asyncio.sleep(0)
+            await manager.close_loop_sessions()
+            return session
+
+        stale = asyncio.run(get_session())
+        self.assertFalse(stale.closed)
+        replacement = asyncio.run(replace_session())
+
+        self.assertIsNot(stale, replacement)
+        self.assertTrue(stale.closed)
+        self.assertEqual(manager.get_stats()["open_sessions"], 0)
+
+
+class TestLLMExtractionSessionReuse(unittest.IsolatedAsyncioTestCase):
+    """Test that LLM extraction reuses the pooled session across calls."""
+
+    async def asyncSetUp(self):
+        """Start a local chat completions endpoint."""
+        async def chat_completions(request):
+            body = {
+                "model": "test-model",
+                "choices": [{"message": {"content": json.dumps({"headline": "ok"})}}],
+            }
+            return web.json_response(body)
+
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", chat_completions)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+
+    async def asyncTearDown(self):
+        """Stop the local endpoint and release pooled sessions."""
+        await default_session_manager.close_loop_sessions()
+        await self.runner.cleanup()
+
+    async def test_extract_reuses_session(self):
+        """Repeated extractions share a single pooled session."""
+        strategy = LLMExtractionStrategy(
+            provider="openai",
+            api_token="test-token",
+            instruction="Extract the headline",
+            base_url=self.base_url,
+        )
+        created_before = default_session_manager.sessions_created
+
+        for i in range(3):
+            result = await strategy.extract("https://example.com", f"content {i}")
+            self.assertEqual(result["headline"], "ok")
+
+        self.assertEqual(default_session_manager.sessions_created - created_before, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
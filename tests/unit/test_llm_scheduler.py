@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for the central LLM request scheduler.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import LLMExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.llm_scheduler import (
+    LLMBudgetExceededError,
+    LLMScheduler,
+    TokenBucket,
+    llm_priority,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_refills_at_rate(self):
+        """An empty bucket refills at its per-minute rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        bucket.consume(60)
+        self.assertAlmostEqual(bucket.delay_for(1), 1.0)
+        clock.now = 1.0
+        self.assertEqual(bucket.delay_for(1), 0.0)
+
+    def test_oversized_requests_are_clamped(self):
+        """A request larger than the capacity waits for a full bucket."""
+        clock = FakeClock()
+        bucket = TokenBucket(100, clock)
+        self.assertEqual(bucket.delay_for(500), 0.0)
+
+    def test_refund(self):
+        """Unused reservations are returned."""
+        bucket = TokenBucket(100, FakeClock())
+        bucket.consume(80)
+        bucket.refund(50)
+        self.assertEqual(bucket.tokens, 70)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    """Test cases for Retry-After parsing."""
+
+    def test_seconds_and_invalid(self):
+        """Delay seconds are parsed; missing or invalid headers return None."""
+        self.assertEqual(parse_retry_after("2.5"), 2.5)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_http_date_in_past(self):
+        """HTTP dates in the past mean no wait."""
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+class TestLLMScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test cases for LLMScheduler."""
+
+    async def test_priority_order(self):
+        """Interactive requests are served before earlier batch requests."""
+        scheduler = LLMScheduler(max_concurrent=1)
+        order = []
+        gate = asyncio.Event()
+
+        async def request(name, priority):
+            async with scheduler.slot("openai", "gpt-4", priority=priority):
+                order.append(name)
+                await gate.wait()
+
+        first = asyncio.create_task(request("first", "batch"))
+        await asyncio.sleep(0)
+        batch = [asyncio.create_task(request(f"batch{i}", "batch")) for i in range(3)]
+        await asyncio.sleep(0)
+        with llm_priority("interactive"):
+            interactive = asyncio.create_task(request("interactive", None))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(scheduler.queue_depth("openai"), 4)
+        gate.set()
+        await asyncio.gather(first, interactive, *batch)
+        self.assertEqual(order, ["first", "interactive", "batch0", "batch1", "batch2"])
+        self.assertEqual(scheduler.queue_depth(), 0)
+
+    async def test_requests_per_minute(self):
+        """Requests beyond the bucket wait for it to refill."""
+        scheduler = LLMScheduler(requests_per_minute=600, max_concurrent=0)
+        lane = scheduler._lane("groq", "llama3-8b-8192")
+        lane.requests.consume(600)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with scheduler.slot("groq", "llama3-8b-8192"):
+            pass
+        self.assertGreaterEqual(loop.time() - start, 0.08)
+
+    async def test_retry_after_pauses_lane(self):
+        """A rate-limit response pauses the lane for the requested time."""
+        scheduler = LLMScheduler()
+        async with scheduler.slot("openrouter", "m") as slot:
+            slot.retry_after(0.1)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with scheduler.slot("openrouter", "m"):
+            pass
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+        self.assertEqual(scheduler.get_stats()["openrouter/m"]["rate_limited"], 1)
+
+    async def test_cost_budget(self):
+        """Requests are refused once the estimated spend reaches the budget."""
+        scheduler = LLMScheduler()
+        scheduler.configure("openai", "gpt-4", max_cost=0.05)
+        async with scheduler.slot("openai", "gpt-4") as slot:
+            slot.report_usage({"prompt_tokens": 1000, "completion_tokens": 500})
+
+        with self.assertRaises(LLMBudgetExceededError):
+            async with scheduler.slot("openai", "gpt-4"):
+                pass
+        scheduler.reset_budget("openai")
+        async with scheduler.slot("openai", "gpt-4"):
+            pass
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Cancelling a waiting request removes it and lets the next one through."""
+        scheduler = LLMScheduler(max_concurrent=1)
+        holder = await scheduler.acquire("openai", "m")
+        waiter = asyncio.create_task(scheduler.acquire("openai", "m", priority="interactive"))
+        follower = asyncio.create_task(scheduler.acquire("openai", "m"))
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        scheduler._release(holder)
+        lane = await asyncio.wait_for(follower, 1.0)
+        self.assertEqual(lane.in_flight, 1)
+        self.assertEqual(scheduler.queue_depth(), 0)
+
+    def test_unknown_limit(self):
+        """Unknown limit names are rejected."""
+        with self.assertRaises(ValueError):
+            LLMScheduler().configure("openai", rpm=10)
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def text(self):
+        return json.dumps(self.body)
+
+    async def json(self):
+        return self.body
+
+
+class TestStrategyScheduling(unittest.IsolatedAsyncioTestCase):
+    """Test that LLMExtractionStrategy requests go through the scheduler."""
+
+    async def test_rate_limited_request_is_retried(self):
+        """A 429 with Retry-After pauses the lane and the request is retried."""
+        scheduler = LLMScheduler()
+        strategy = LLMExtractionStrategy(
+            provider="openai", api_token="token", instruction="Extract",
+            use_cache=False, scheduler=scheduler,
+        )
+        success = {
+            "choices": [{"message": {"content": json.dumps({"title": "ok"})}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+        session = MagicMock()
+        session.post.side_effect = [
+            FakeResponse(429, {"error": "slow down"}, {"Retry-After": "0.05"}),
+            FakeResponse(200, success),
+        ]
+
+        with patch("src.cry_a_4mcp.crawl4ai.extraction_strategies.base.get_session", return_value=session):
+            result = await strategy.extract("https://example.com", "content")
+
+        self.assertEqual(result["title"], "ok")
+        self.assertEqual(session.post.call_count, 2)
+        stats = scheduler.get_stats()["openai/gpt-3.5-turbo"]
+        self.assertEqual(stats["rate_limited"], 1)
+        self.assertEqual(stats["granted"], 2)
+        self.assertEqual(stats["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
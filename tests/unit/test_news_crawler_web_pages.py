@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for UniversalNewsCrawler.crawl_web_pages and the crawler's website stream.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.universal_news_crawler import UniversalNewsCrawler
+
+CONFIG = {
+    "universal_news_crawler": {
+        "crawl4ai_configuration": {
+            "concurrent_crawlers": 4,
+            "rate_limiting": {"delay_between_requests": 0.05}
+        },
+        "tier_1_crypto_news": {
+            "sources": [
+                {"name": "Slow", "url": "https://a.example.com/news", "priority": "low", "content_type": "forum"},
+                {"name": "Fast", "url": "https://b.example.com/news", "priority": "high"}
+            ]
+        }
+    }
+}
+
+
+class StubCrawlResult:
+    """Minimal stand-in for a crawl result."""
+
+    class Metadata:
+        success = True
+
+    def __init__(self, url, content_type):
+        self.url = url
+        self.content_type = content_type
+        self.markdown = f"# {url}"
+        self.metadata = self.Metadata()
+
+
+class TestCrawlWebPages(unittest.TestCase):
+    """Test cases for crawling web pages through the crawler's stream."""
+
+    def setUp(self):
+        config_file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        with config_file:
+            json.dump(CONFIG, config_file)
+        self.addCleanup(os.remove, config_file.name)
+
+        self.news_crawler = UniversalNewsCrawler(config_file.name)
+        self.news_crawler.llm_strategy = None
+        self.calls = []
+
+        async def crawl_crypto_website(url, content_type, extract_entities=True, generate_triples=True):
+            self.calls.append((url, asyncio.get_running_loop().time()))
+            await asyncio.sleep(0.05 if "a.example.com" in url else 0.0)
+            return StubCrawlResult(url, content_type)
+
+        crawler = self.news_crawler.crawler
+        crawler.initialized = True
+        crawler.crawl_crypto_website = crawl_crypto_website
+
+    def test_results_come_back_in_url_order(self):
+        urls = ["https://a.example.com/news", "https://b.example.com/news", "https://a.example.com/other"]
+        results = asyncio.run(self.news_crawler.crawl_web_pages(urls))
+
+        self.assertEqual([result["crawl_result"].url for result in results], urls)
+        self.assertEqual([result["crawl_result"].content_type for result in results], ["forum", "news", "news"])
+        self.assertTrue(all(result["llm_extraction"] is None for result in results))
+        self.assertEqual(len(self.news_crawler.crawled_content), 3)
+
+    def test_priority_order_and_host_delay(self):
+        urls = ["https://a.example.com/news", "https://a.example.com/other", "https://b.example.com/news"]
+        asyncio.run(self.news_crawler.crawl_web_pages(urls))
+
+        # The high priority source starts first; requests to one host are spaced out
+        self.assertEqual(self.calls[0][0], "https://b.example.com/news")
+        host_a = [started for url, started in self.calls if "a.example.com" in url]
+        self.assertGreaterEqual(host_a[1] - host_a[0], 0.05 - 0.005)
+
+    def test_failed_page_is_skipped(self):
+        crawler = self.news_crawler.crawler
+
+        async def crawl_crypto_website(url, content_type):
+            if "a.example.com" in url:
+                raise RuntimeError("connection reset")
+            return StubCrawlResult(url, content_type)
+
+        crawler.crawl_crypto_website = crawl_crypto_website
+        websites = [{"url": "https://a.example.com/news"}, {"url": "https://b.example.com/news"}]
+
+        async def collect():
+            return [website["url"] async for website, _ in crawler.crawl_websites_stream(websites)]
+
+        self.assertEqual(asyncio.run(collect()), ["https://b.example.com/news"])
+
+
+if __name__ == "__main__":
+    unittest.main()
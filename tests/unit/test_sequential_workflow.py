@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency-graph scheduling in SequentialLLMExtractionStrategy.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import ExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.factory import StrategyFactory
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.workflow.sequential_llm import SequentialLLMExtractionStrategy
+
+
+class StepStrategy(ExtractionStrategy):
+    """Strategy that records the previous results it received."""
+
+    def __init__(self, name, delay, result, error=None):
+        self.name = name
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.received = None
+
+    async def extract(self, url, content, **kwargs):
+        self.received = kwargs.get("previous_results")
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return dict(self.result)
+
+
+def build_workflow(steps, **kwargs):
+    """Build a workflow whose factory returns the given step strategies."""
+    def create_strategy(name, **config):
+        return steps[name]
+
+    with patch.object(StrategyFactory, "create_strategy", side_effect=create_strategy, create=True):
+        return SequentialLLMExtractionStrategy(strategies=list(steps), **kwargs)
+
+
+class TestSequentialWorkflow(unittest.TestCase):
+    """Test cases for SequentialLLMExtractionStrategy scheduling."""
+
+    def test_default_is_a_sequence(self):
+        """Without dependencies each step receives all earlier results."""
+        steps = {
+            "A": StepStrategy("A", 0.0, {"a": 1}),
+            "B": StepStrategy("B", 0.0, {"b": 2}),
+            "C": StepStrategy("C", 0.0, {"c": 3}),
+        }
+        workflow = build_workflow(steps)
+        result = asyncio.run(workflow.extract("https://example.com", "content"))
+
+        self.assertIsNone(steps["A"].received)
+        self.assertEqual(steps["B"].received, {"a": 1})
+        self.assertEqual({k: v for k, v in steps["C"].received.items() if k != "_metadata"}, {"a": 1, "b": 2})
+        self.assertEqual(result["_metadata"]["critical_path"], ["A", "B", "C"])
+
+    def test_independent_steps_run_in_parallel(self):
+        """Steps that only depend on the first step run concurrently."""
+        steps = {
+            "General": StepStrategy("General", 0.1, {"title": "t"}),
+            "Crypto": StepStrategy("Crypto", 0.2, {"coin": "BTC"}),
+            "Financial": StepStrategy("Financial", 0.2, {"price": 1}),
+        }
+        workflow = build_workflow(steps, dependencies={"Crypto": ["General"], "Financial": ["General"]})
+        start = time.perf_counter()
+        result = asyncio.run(workflow.extract("https://example.com", "content"))
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.45)
+        self.assertEqual(steps["Financial"].received, {"title": "t"})
+        self.assertEqual(result["coin"], "BTC")
+        self.assertEqual(result["price"], 1)
+        self.assertEqual(result["_metadata"]["critical_path"][0], "General")
+        self.assertEqual(len(result["_metadata"]["critical_path"]), 2)
+
+    def test_step_waits_only_on_declared_inputs(self):
+        """A step depending on a fast step does not wait for a slow one."""
+        steps = {
+            "Slow": StepStrategy("Slow", 0.3, {"slow": True}),
+            "Fast": StepStrategy("Fast", 0.0, {"fast": True}),
+            "Uses": StepStrategy("Uses", 0.0, {"uses": True}),
+        }
+        workflow = build_workflow(steps, dependencies={"Fast": [], "Uses": ["Fast"]})
+        result = asyncio.run(workflow.extract("https://example.com", "content"))
+
+        schedule = {entry["strategy"]: entry for entry in result["_metadata"]["schedule"]}
+        self.assertLess(schedule["Uses"]["finished"], schedule["Slow"]["finished"])
+        self.assertEqual(steps["Uses"].received, {"fast": True})
+        self.assertEqual(result["_metadata"]["critical_path"], ["Slow"])
+
+    def test_merge_order_is_step_order(self):
+        """Later steps win conflicts even when they finish first."""
+        steps = {
+            "First": StepStrategy("First", 0.1, {"title": "first"}),
+            "Second": StepStrategy("Second", 0.0, {"title": "second"}),
+        }
+        workflow = build_workflow(steps, pass_results=False)
+        result = asyncio.run(workflow.extract("https://example.com", "content"))
+        self.assertEqual(result["title"], "second")
+
+    def test_failed_dependency_is_reported(self):
+        """A failed step is reported and its dependents still run."""
+        steps = {
+            "A": StepStrategy("A", 0.0, {}, error=RuntimeError("boom")),
+            "B": StepStrategy("B", 0.0, {"b": 1}),
+        }
+        workflow = build_workflow(steps)
+        result = asyncio.run(workflow.extract("https://example.com", "content"))
+        self.assertEqual(result["b"], 1)
+        self.assertEqual(result["_metadata"]["errors"], [{"strategy": "StepStrategy", "error": "boom"}])
+
+    def test_dependency_on_later_step_rejected(self):
+        """Dependencies must point at earlier steps."""
+        steps = {"A": StepStrategy("A", 0.0, {}), "B": StepStrategy("B", 0.0, {})}
+        with self.assertRaises(ValueError):
+            build_workflow(steps, dependencies={"A": ["B"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
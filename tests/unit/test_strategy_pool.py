@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the extraction strategy instance pool.
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.base import ExtractionStrategy
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.factory import StrategyFactory
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.instance_pool import (
+    StrategyInstancePool,
+    freeze_config,
+)
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.registry import StrategyRegistry
+
+
+def make_strategy_class(name):
+    """Create a strategy class that counts its constructions."""
+    class CountingStrategy(ExtractionStrategy):
+        created = 0
+
+        def __init__(self, **config):
+            type(self).created += 1
+            self.config = config
+
+        async def extract(self, url, content, **kwargs):
+            return {}
+
+    CountingStrategy.__name__ = name
+    return CountingStrategy
+
+
+class TestFreezeConfig(unittest.TestCase):
+    """Test cases for configuration keys."""
+
+    def test_order_independent(self):
+        """Dictionaries with the same items produce the same key."""
+        self.assertEqual(
+            freeze_config({"a": 1, "b": {"x": [1, 2]}}),
+            freeze_config({"b": {"x": [1, 2]}, "a": 1}),
+        )
+
+    def test_distinguishes_values(self):
+        """Different values and bool/int produce different keys."""
+        self.assertNotEqual(freeze_config({"a": 1}), freeze_config({"a": 2}))
+        self.assertNotEqual(freeze_config({"a": True}), freeze_config({"a": 1}))
+
+
+class TestStrategyInstancePool(unittest.TestCase):
+    """Test cases for StrategyInstancePool."""
+
+    def setUp(self):
+        """Register a counting strategy."""
+        self.name = f"PoolTestStrategy{id(self)}"
+        self.strategy_class = make_strategy_class(self.name)
+        StrategyRegistry.register(name=self.name)(self.strategy_class)
+        self.pool = StrategyInstancePool(max_size=2)
+
+    def tearDown(self):
+        """Unregister the counting strategy."""
+        StrategyRegistry.unregister(self.name)
+
+    def test_reuses_instance_for_same_config(self):
+        """The same name and config return one shared instance."""
+        first = self.pool.get(self.name, {"model": "m", "timeout": 30})
+        second = self.pool.get(self.name, {"timeout": 30, "model": "m"})
+        self.assertIs(first, second)
+        self.assertEqual(self.strategy_class.created, 1)
+        self.assertEqual(self.pool.get_stats()["hits"], 1)
+
+    def test_different_config_gets_new_instance(self):
+        """A different config builds a separate instance."""
+        first = self.pool.get(self.name, {"model": "a"})
+        second = self.pool.get(self.name, {"model": "b"})
+        self.assertIsNot(first, second)
+
+    def test_lru_eviction(self):
+        """The least recently used instance is evicted past max_size."""
+        a = self.pool.get(self.name, {"model": "a"})
+        self.pool.get(self.name, {"model": "b"})
+        self.pool.get(self.name, {"model": "a"})
+        self.pool.get(self.name, {"model": "c"})
+
+        self.assertIs(self.pool.get(self.name, {"model": "a"}), a)
+        self.assertEqual(self.pool.get_stats()["evictions"], 1)
+        self.assertEqual(self.strategy_class.created, 3)
+        self.pool.get(self.name, {"model": "b"})
+        self.assertEqual(self.strategy_class.created, 4)
+
+    def test_invalidated_on_unregister(self):
+        """Unregistering a strategy drops its pooled instances."""
+        self.pool.get(self.name, {})
+        StrategyRegistry.unregister(self.name)
+        self.assertEqual(self.pool.get_stats()["size"], 0)
+
+    def test_reregistered_class_rebuilds(self):
+        """Re-registering a strategy under the same name rebuilds instances."""
+        old = self.pool.get(self.name, {})
+        replacement = make_strategy_class(self.name)
+        StrategyRegistry.register(name=self.name)(replacement)
+
+        new = self.pool.get(self.name, {})
+        self.assertIsInstance(new, replacement)
+        self.assertIsNot(old, new)
+
+    def test_concurrent_callers_share_instance(self):
+        """Threads asking for the same strategy all get the same instance."""
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(self.pool.get(self.name, {"model": "shared"}))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(instance) for instance in results}), 1)
+
+    def test_factory_get_or_create(self):
+        """StrategyFactory.get_or_create goes through the default pool."""
+        first = StrategyFactory.get_or_create(self.name, {"model": "x"})
+        self.assertIs(StrategyFactory.get_or_create(self.name, {"model": "x"}), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
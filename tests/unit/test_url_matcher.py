@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled URL matching index.
+"""
+
+import os
+import random
+import re
+import sys
+import unittest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_matcher import (
+    AhoCorasickAutomaton,
+    DomainTrie,
+    URLMatcherIndex,
+)
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_mapping import (
+    ExtractorConfig,
+    URLExtractorMapping,
+    URLMappingManager,
+)
+from src.cry_a_4mcp.crawl4ai.extraction_strategies.custom_strategies.url_strategy_mapper import (
+    DomainMatcher,
+    _host_of,
+)
+
+
+class TestAhoCorasickAutomaton(unittest.TestCase):
+    """Test cases for the substring automaton."""
+
+    def test_finds_overlapping_patterns(self):
+        """Every contained pattern is reported, including overlapping ones."""
+        automaton = AhoCorasickAutomaton()
+        for value, pattern in enumerate(["he", "she", "his", "hers"]):
+            automaton.add(pattern, value)
+        self.assertEqual(automaton.search("ushers"), {0, 1, 3})
+
+    def test_matches_naive_search(self):
+        """Results agree with a plain ``in`` check on random input."""
+        rng = random.Random(7)
+        patterns = ["".join(rng.choice("ab/") for _ in range(rng.randint(1, 5))) for _ in range(40)]
+        automaton = AhoCorasickAutomaton()
+        for value, pattern in enumerate(patterns):
+            automaton.add(pattern, value)
+        for _ in range(100):
+            text = "".join(rng.choice("ab/") for _ in range(rng.randint(0, 30)))
+            expected = {value for value, pattern in enumerate(patterns) if pattern in text}
+            self.assertEqual(automaton.search(text), expected)
+
+    def test_remove(self):
+        """Removed patterns are no longer reported."""
+        automaton = AhoCorasickAutomaton()
+        automaton.add("/product/", 1)
+        automaton.add("/prod", 2)
+        self.assertEqual(automaton.search("https://x.com/product/1"), {1, 2})
+        automaton.remove("/product/", 1)
+        self.assertEqual(automaton.search("https://x.com/product/1"), {2})
+
+
+class TestDomainTrie(unittest.TestCase):
+    """Test cases for the reversed-label domain trie."""
+
+    def test_matches_domain_matcher(self):
+        """Trie results agree with DomainMatcher for exact and subdomain rules."""
+        rules = [("example.com", True), ("example.com", False), ("sub.example.com", False),
+                 ("example.org", True), ("ample.com", True)]
+        trie = DomainTrie()
+        for value, (domain, include_subdomains) in enumerate(rules):
+            trie.add(domain, value, include_subdomains)
+
+        for url in ["https://example.com", "https://sub.example.com:8080/x", "https://a.sub.example.com",
+                    "https://myexample.com", "https://example.org/path", "https://EXAMPLE.com"]:
+            expected = {value for value, (domain, include_subdomains) in enumerate(rules)
+                        if DomainMatcher(domain, include_subdomains).matches(url)}
+            self.assertEqual(trie.match(_host_of(url)), expected, url)
+
+    def test_remove_prunes_branch(self):
+        """Removing the last rule under a branch prunes it."""
+        trie = DomainTrie()
+        trie.add("a.example.com", 1)
+        trie.add("example.com", 2)
+        trie.remove("a.example.com", 1)
+        self.assertEqual(trie.match("a.example.com"), {2})
+        self.assertNotIn("a", trie._root["com"]["example"])
+
+
+class TestURLMatcherIndex(unittest.TestCase):
+    """Test cases for URLMatcherIndex."""
+
+    def test_priority_order_and_ties(self):
+        """Matches are ordered by priority, then registration order."""
+        index = URLMatcherIndex()
+        index.add("domain", "example.com", "low", priority=1)
+        index.add("substring", "/news/", "high", priority=10)
+        index.add("exact", "https://example.com/news/1", "tie-first", priority=5)
+        index.add("regex", re.compile(r"/news/\d+$"), "tie-second", priority=5)
+
+        url = "https://example.com/news/1"
+        self.assertEqual(index.match_all(url, "example.com"), ["high", "tie-first", "tie-second", "low"])
+        self.assertEqual(index.match_first(url, "example.com"), "high")
+
+    def test_match_first_skips_outranked_scans(self):
+        """Scanned rules below the best indexed match are not evaluated."""
+        calls = []
+        index = URLMatcherIndex()
+        index.add("exact", "https://example.com/", "exact", priority=10)
+        index.add("custom", lambda url, host: calls.append(url) or True, "custom", priority=1)
+
+        self.assertEqual(index.match_first("https://example.com/", "example.com"), "exact")
+        self.assertEqual(calls, [])
+        self.assertEqual(index.match_first("https://other.com/", "other.com"), "custom")
+
+    def test_remove(self):
+        """Removed rules no longer match."""
+        index = URLMatcherIndex()
+        handles = [index.add(kind, pattern, kind) for kind, pattern in [
+            ("exact", "https://a.com/"), ("domain", "a.com"), ("substring", "a.com"),
+            ("regex", re.compile("a")),
+        ]]
+        for handle in handles:
+            index.remove(handle)
+        self.assertEqual(index.match_all("https://a.com/", "a.com"), [])
+        self.assertEqual(len(index), 0)
+
+
+class TestURLMappingManagerIndex(unittest.TestCase):
+    """Test that the indexed manager agrees with per-mapping matching."""
+
+    def _mapping(self, pattern, pattern_type, priority, name):
+        return URLExtractorMapping(
+            url_pattern=pattern,
+            pattern_type=pattern_type,
+            extractors=[ExtractorConfig(extractor_id=name, target_group="test")],
+            priority=priority,
+        )
+
+    def test_agrees_with_linear_scan(self):
+        """Indexed lookups return the same extractors as scanning every mapping."""
+        rng = random.Random(3)
+        manager = URLMappingManager()
+        domains = ["coindesk.com", "example.com", "sub.example.com", "exam", "decrypt.co"]
+        for i in range(200):
+            pattern_type = rng.choice(["domain", "path", "exact", "unknown"])
+            if pattern_type == "domain":
+                pattern = rng.choice(domains)
+            elif pattern_type == "exact":
+                pattern = f"https://{rng.choice(domains)}/news/{i % 5}"
+            else:
+                pattern = rng.choice(["/news/", "/markets", "news/1", ""])
+            manager.add_mapping(self._mapping(pattern, pattern_type, rng.randint(0, 5), f"E{i}"))
+
+        for _ in range(100):
+            url = f"https://{rng.choice(['', 'www.', 'a.'])}{rng.choice(domains)}/{rng.choice(['news', 'markets'])}/{rng.randint(0, 5)}"
+            expected = [e for m in manager.mappings if m.matches(url) for e in m.extractors]
+            self.assertEqual(manager.get_extractors_for_url(url), expected, url)
+
+    def test_update_and_remove(self):
+        """Editing or removing a mapping updates the index."""
+        manager = URLMappingManager()
+        mapping = self._mapping("example.com", "domain", 1, "Domain")
+        manager.add_mapping(mapping)
+
+        mapping.url_pattern = "/product/"
+        mapping.pattern_type = "path"
+        manager.update_mapping(mapping)
+        self.assertEqual(manager.get_extractors_for_url("https://example.com/"), [])
+        self.assertEqual(len(manager.get_extractors_for_url("https://x.com/product/1")), 1)
+
+        manager.remove_mapping(mapping)
+        self.assertEqual(manager.get_extractors_for_url("https://x.com/product/1"), [])
+
+    def test_direct_list_changes_trigger_rebuild(self):
+        """Replacing the mapping list directly is picked up on the next lookup."""
+        manager = URLMappingManager()
+        manager.mappings = [self._mapping("example.com", "domain", 0, "Domain")]
+        self.assertEqual(len(manager.get_extractors_for_url("https://example.com")), 1)
+
+
+    def test_same_mapping_added_twice(self):
+        """Adding a mapping object twice indexes it twice without forcing rebuilds."""
+        manager = URLMappingManager()
+        mapping = self._mapping("example.com", "domain", 1, "Domain")
+        manager.add_mapping(self._mapping("/news/", "path", 2, "Path"))
+        manager.add_mapping(mapping)
+        manager.add_mapping(mapping)
+
+        rebuilds = []
+        rebuild = manager._rebuild_index
+        manager._rebuild_index = lambda: rebuilds.append(1) or rebuild()
+        url = "https://example.com/news/1"
+        self.assertEqual([e.extractor_id for e in manager.get_extractors_for_url(url)],
+                         ["Path", "Domain", "Domain"])
+        manager.remove_mapping(mapping)
+        self.assertEqual([e.extractor_id for e in manager.get_extractors_for_url(url)], ["Path", "Domain"])
+        self.assertEqual(rebuilds, [])
+
+    def test_direct_appends_are_sorted_on_rebuild(self):
+        """Mappings appended directly are indexed and ordered by priority."""
+        manager = URLMappingManager()
+        manager.add_mapping(self._mapping("example.com", "domain", 1, "Low"))
+        manager.mappings.append(self._mapping("example.com", "domain", 5, "High"))
+        manager.add_mapping(self._mapping("example.com", "domain", 3, "Mid"))
+
+        self.assertEqual([e.extractor_id for e in manager.get_extractors_for_url("https://example.com")],
+                         ["High", "Mid", "Low"])
+        self.assertEqual([m.priority for m in manager.mappings], [5, 3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()